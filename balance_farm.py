@@ -0,0 +1,393 @@
+"""
+Balance farm: simulate many headless runs in worker processes and collect per-wave results.
+
+Each worker applies config.balance overrides, builds a headless GameApp driven by a simple bot
+(aims at the nearest enemy, keeps its distance, holds fire) and plays N waves from a seeded wave-1
+start, stepping the simulation at FIXED_DT as fast as possible. Per-wave results (time to clear,
+damage taken, kills per weapon) come back through a queue; the parent writes them into one
+telemetry DB (telemetry/balance.py) and prints a summary.
+
+Run: python balance_farm.py --runs 200 --waves 3 --workers 8 --set player_bullet_damage=30
+"""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Printed once per worker otherwise
+
+import argparse  # noqa: E402
+import ast  # noqa: E402
+import math  # noqa: E402
+import multiprocessing as mp  # noqa: E402
+import queue  # noqa: E402
+import sqlite3  # noqa: E402
+import sys  # noqa: E402
+import traceback  # noqa: E402
+from dataclasses import dataclass, field  # noqa: E402
+from typing import Any, Callable, Optional, Sequence  # noqa: E402
+
+from input_source import InputSource  # noqa: E402
+
+# Bot distances (px): back off inside KEEP_AWAY, close in beyond ENGAGE, strafe in between
+BOT_KEEP_AWAY = 220
+BOT_ENGAGE = 450
+BOT_STRAFE_PERIOD = 2.0  # seconds between strafe direction flips
+DEFAULT_MAX_WAVE_SECONDS = 180.0  # a wave not cleared by then ends the run
+RESULT_POLL_S = 1.0  # parent waits this long on the results queue before checking for dead workers
+# Balance settings that GameState also holds per run (set from the player class at run start)
+STATE_OVERRIDE_FIELDS = frozenset({"player_bullet_damage", "player_shoot_cooldown", "shield_recharge_cooldown"})
+
+
+@dataclass
+class WaveResult:
+    seed: int
+    wave_number: int
+    weapon_mode: Optional[str]
+    cleared: bool
+    time_to_clear: Optional[float]  # sim seconds from wave start until no enemies were left
+    sim_seconds: float  # sim seconds spent in the wave (includes the next-wave countdown)
+    damage_taken: int
+    enemies_spawned: int  # enemies the wave started with (placed plus still queued for placement)
+    enemies_killed: int
+    kills_by_weapon: dict[str, int] = field(default_factory=dict)
+
+
+def check_balance_overrides(overrides: dict[str, Any]) -> None:
+    """Raise ValueError unless every name is a public config.balance setting."""
+    import config.balance as balance
+
+    unknown = [name for name in overrides if name.startswith("_") or not hasattr(balance, name)]
+    if unknown:
+        raise ValueError(f"Unknown balance setting(s): {', '.join(unknown)}")
+
+
+def apply_balance_overrides(overrides: dict[str, Any]) -> None:
+    """Set config.balance values (and their constants re-exports) for this process.
+
+    Most modules bind balance values with `from constants import ...` at import time, so this must
+    run before game is imported; workers call it first thing.
+    """
+    import config.balance as balance
+    import constants
+
+    check_balance_overrides(overrides)
+    for name, value in overrides.items():
+        setattr(balance, name, value)
+        if hasattr(constants, name):
+            setattr(constants, name, value)
+
+
+class _BotKeys:
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed: frozenset):
+        self.pressed = pressed
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class BotInput(InputSource):
+    """Scripted player: aims at and shoots the nearest enemy, backs off or closes in to stay at range."""
+
+    def __init__(self, state: Any, controls: dict[str, int], width: int, height: int):
+        import pygame
+
+        self.state = state
+        self.width = width
+        self.height = height
+        self._dirs = {
+            "left": controls.get("move_left", pygame.K_a),
+            "right": controls.get("move_right", pygame.K_d),
+            "up": controls.get("move_up", pygame.K_w),
+            "down": controls.get("move_down", pygame.K_s),
+        }
+        self._keys = _BotKeys(frozenset())
+        self._mouse_pos = (width // 2, height // 2)
+        self._buttons = (False, False, False)
+        self._t = 0.0
+
+    def begin_frame(self, dt: float, events: list) -> list:
+        self._t += dt
+        player = self.state.player_rect
+        px, py = player.center
+        target = None
+        best = math.inf
+        for enemy in self.state.enemies:
+            ex, ey = enemy.rect.center
+            d2 = (ex - px) * (ex - px) + (ey - py) * (ey - py)
+            if d2 < best:
+                best, target = d2, (ex, ey)
+        if target is None:
+            self._keys = _BotKeys(frozenset())
+            self._buttons = (False, False, False)
+            return []
+
+        dist = math.sqrt(best)
+        dx, dy = (target[0] - px) / (dist or 1.0), (target[1] - py) / (dist or 1.0)
+        if dist < BOT_KEEP_AWAY:
+            mx, my = -dx, -dy
+        elif dist > BOT_ENGAGE:
+            mx, my = dx, dy
+        else:
+            sign = 1 if int(self._t / BOT_STRAFE_PERIOD) % 2 == 0 else -1
+            mx, my = -dy * sign, dx * sign
+        margin = 60
+        pressed = set()
+        if mx < -0.3 and player.left > margin:
+            pressed.add(self._dirs["left"])
+        elif mx > 0.3 and player.right < self.width - margin:
+            pressed.add(self._dirs["right"])
+        if my < -0.3 and player.top > margin:
+            pressed.add(self._dirs["up"])
+        elif my > 0.3 and player.bottom < self.height - margin:
+            pressed.add(self._dirs["down"])
+        self._keys = _BotKeys(frozenset(pressed))
+        self._mouse_pos = (int(target[0]), int(target[1]))
+        self._buttons = (True, False, False)
+        return []
+
+    def get_pressed(self) -> Any:
+        return self._keys
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return self._mouse_pos
+
+    def get_mouse_pressed(self) -> tuple[bool, bool, bool]:
+        return self._buttons
+
+
+def simulate_run(
+    seed: int,
+    waves: int,
+    weapons: Sequence[str] = (),
+    max_wave_seconds: float = DEFAULT_MAX_WAVE_SECONDS,
+    overrides: Optional[dict[str, Any]] = None,
+    lives: Optional[int] = None,
+) -> list[WaveResult]:
+    """Play up to `waves` waves of a seeded run with the bot; returns one result per wave played.
+
+    The player starts with the configured class stats, like a run started from the menu. overrides
+    are the balance overrides already applied to this process; the ones that are also GameState
+    fields (player_bullet_damage, player_shoot_cooldown, ...) are set on the state as well, since
+    the run reads those from the state. weapons: weapon mode per wave (cycled); empty keeps the
+    default weapon. lives replaces the starting lives (a large value keeps a weak bot playing so
+    clear times can be measured; damage taken is still counted). The run stops early when the
+    player runs out of lives, the game is won, or a wave takes longer than max_wave_seconds.
+    """
+    import game
+    from constants import STATE_PLAYING
+    from game_app import GameApp
+    from step_controller import STEP_POLICY_CLAMP_DROP
+    from systems.spawn_system import queued_enemies, wave_spawning
+
+    app = GameApp(headless=True)
+    app.use_step_policy(STEP_POLICY_CLAMP_DROP)  # adaptive budgets follow wall-clock cost: not reproducible
+    gs = app.game_state
+    app.ctx.config.aim_mode = "mouse"
+    app.ctx.input_source = BotInput(gs, app.ctx.controls, app.ctx.width, app.ctx.height)
+    game._apply_player_class_stats(app.ctx, gs)
+    for name, value in (overrides or {}).items():
+        if name in STATE_OVERRIDE_FIELDS:
+            setattr(gs, name, value)
+    game._start_seeded_run(app.ctx, gs, app.scene_stack, seed)
+    if lives is not None:
+        gs.lives = lives
+    dt = app.fixed_dt
+
+    results: list[WaveResult] = []
+    while len(results) < waves:
+        weapon = weapons[len(results) % len(weapons)] if weapons else None
+        if weapon is not None:
+            gs.unlocked_weapons.add(weapon)
+            gs.current_weapon_mode = weapon
+        wave = gs.wave_number
+        start_t = gs.run_time
+        damage0, killed0 = gs.damage_taken, gs.enemies_killed
+        spawned = len(gs.enemies) + queued_enemies(gs)  # regular waves are placed over several steps
+        kills: dict[str, int] = {}
+        clear_t: Optional[float] = None
+        ended = False
+        while gs.wave_number == wave:
+            killed = gs.enemies_killed
+            if not app.update(dt) or gs.current_screen != STATE_PLAYING:
+                ended = True
+                break
+            if gs.enemies_killed != killed:
+                mode = gs.current_weapon_mode
+                kills[mode] = kills.get(mode, 0) + gs.enemies_killed - killed
+            if clear_t is None and not gs.enemies and not wave_spawning(gs):
+                clear_t = gs.run_time - start_t
+            if gs.run_time - start_t > max_wave_seconds:
+                ended = True
+                break
+        results.append(WaveResult(
+            seed=seed,
+            wave_number=wave,
+            weapon_mode=weapon or gs.current_weapon_mode,
+            cleared=clear_t is not None,
+            time_to_clear=clear_t,
+            sim_seconds=gs.run_time - start_t,
+            damage_taken=gs.damage_taken - damage0,
+            enemies_spawned=spawned,
+            enemies_killed=gs.enemies_killed - killed0,
+            kills_by_weapon=kills,
+        ))
+        if ended:
+            break
+    return results
+
+
+def _worker(jobs: Any, results: Any, overrides: dict[str, Any], waves: int, weapons: Sequence[str],
+            max_wave_seconds: float, lives: Optional[int], quiet: bool) -> None:
+    """Worker process: apply overrides, then simulate seeds from jobs until the None sentinel.
+
+    Always ends with a "done" message, also when setup fails (reported as an error with seed None).
+    """
+    try:
+        if quiet:
+            sys.stdout = open(os.devnull, "w")
+        apply_balance_overrides(overrides)
+        while True:
+            seed = jobs.get()
+            if seed is None:
+                break
+            try:
+                results.put(("run", seed, simulate_run(seed, waves, weapons, max_wave_seconds, overrides, lives)))
+            except Exception:
+                results.put(("error", seed, traceback.format_exc()))
+    except Exception:
+        results.put(("error", None, traceback.format_exc()))
+    finally:
+        results.put(("done", os.getpid(), None))
+
+
+def _collect_results(results: Any, procs: Sequence[Any], on_run: Callable[[list], None]) -> set[int]:
+    """Read worker messages until every worker has posted "done" or exited; returns the seeds reported.
+
+    The queue is polled with a timeout so a worker that dies without "done" (crash, OOM kill) is noticed
+    via is_alive() and reported instead of hanging the parent.
+    """
+    finished: set[int] = set()
+    seeds: set[int] = set()
+    while len(finished) < len(procs):
+        try:
+            kind, key, payload = results.get(timeout=RESULT_POLL_S)
+        except queue.Empty:
+            for p in procs:
+                if p.pid not in finished and not p.is_alive():
+                    finished.add(p.pid)
+                    print(f"[balance_farm] worker {p.pid} exited (code {p.exitcode}) without finishing",
+                          file=sys.stderr)
+            continue
+        if kind == "run":
+            seeds.add(key)
+            on_run(payload)
+        elif kind == "error":
+            if key is None:
+                print(f"[balance_farm] worker setup failed:\n{payload}", file=sys.stderr)
+            else:
+                seeds.add(key)
+                print(f"[balance_farm] seed {key} failed:\n{payload}", file=sys.stderr)
+        else:
+            finished.add(key)
+    return seeds
+
+
+def run_farm(
+    runs: int,
+    waves: int,
+    overrides: Optional[dict[str, Any]] = None,
+    workers: int = 0,
+    db_path: str = "game_telemetry.db",
+    base_seed: int = 1,
+    weapons: Sequence[str] = (),
+    max_wave_seconds: float = DEFAULT_MAX_WAVE_SECONDS,
+    lives: Optional[int] = None,
+    quiet: bool = True,
+) -> int:
+    """Simulate seeds base_seed..base_seed+runs-1 across worker processes; returns the batch id in db_path.
+
+    workers <= 0 uses os.cpu_count(). Workers are spawned (not forked) so each imports the game after
+    its overrides are applied. Failed runs, and seeds lost with a worker that died, are reported on
+    stderr and skipped.
+    """
+    from telemetry import balance as balance_db
+
+    overrides = dict(overrides or {})
+    check_balance_overrides(overrides)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        batch_id = balance_db.start_batch(conn, overrides, runs, waves, base_seed)
+        workers = max(1, min(runs, workers if workers > 0 else (os.cpu_count() or 1)))
+        ctx = mp.get_context("spawn")
+        jobs = ctx.Queue()
+        results = ctx.Queue()
+        for seed in range(base_seed, base_seed + runs):
+            jobs.put(seed)
+        for _ in range(workers):
+            jobs.put(None)
+        procs = [
+            ctx.Process(target=_worker, args=(jobs, results, overrides, waves, tuple(weapons), max_wave_seconds, lives, quiet))
+            for _ in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        seeds = _collect_results(results, procs, lambda played: balance_db.insert_waves(conn, batch_id, played))
+        missing = [seed for seed in range(base_seed, base_seed + runs) if seed not in seeds]
+        if missing:
+            print(f"[balance_farm] no result for seed(s) {missing}", file=sys.stderr)
+        for p in procs:
+            p.join()
+        return batch_id
+    finally:
+        conn.close()
+
+
+def _parse_override(text: str) -> tuple[str, Any]:
+    name, sep, raw = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    try:
+        value = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        value = raw
+    return name.strip(), value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=8, help="number of seeded runs")
+    parser.add_argument("--waves", type=int, default=3, help="waves per run")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (default: CPU count)")
+    parser.add_argument("--db", default="game_telemetry.db", help="telemetry DB to write the batch into")
+    parser.add_argument("--seed", type=int, default=1, help="first seed")
+    parser.add_argument("--weapons", default="", help="comma-separated weapon per wave, cycled (e.g. basic,triple)")
+    parser.add_argument("--max-wave-seconds", type=float, default=DEFAULT_MAX_WAVE_SECONDS)
+    parser.add_argument("--lives", type=int, default=None, help="starting lives for the bot (default: normal run)")
+    parser.add_argument("--set", dest="overrides", action="append", type=_parse_override, default=[],
+                        metavar="NAME=VALUE", help="override a config.balance value (repeatable)")
+    parser.add_argument("--verbose", action="store_true", help="keep worker stdout")
+    args = parser.parse_args()
+
+    from telemetry import balance as balance_db
+
+    weapons = tuple(w.strip() for w in args.weapons.split(",") if w.strip())
+    batch_id = run_farm(args.runs, args.waves, dict(args.overrides), args.workers, args.db, args.seed,
+                        weapons, args.max_wave_seconds, args.lives, quiet=not args.verbose)
+    conn = sqlite3.connect(args.db)
+    try:
+        print(f"batch {batch_id} -> {args.db}")
+        print(f"{'wave':>4} {'runs':>5} {'cleared':>8} {'clear s':>8} {'dmg taken':>10} {'kills':>7}")
+        for wave, n, cleared, clear_s, dmg, kills in balance_db.wave_summary(conn, batch_id):
+            print(f"{wave:>4} {n:>5} {cleared * 100:>7.0f}% {clear_s or 0:>8.1f} {dmg:>10.0f} {kills:>7.1f}")
+        print("kills per weapon:", ", ".join(f"{w}={k}" for w, k in balance_db.weapon_kill_totals(conn, batch_id)))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Standalone micro-benchmarks for hot simulation paths. Run a module with python -m benchmarks.<name>."""
@@ -0,0 +1,128 @@
+"""
+Per-tick enemy field access: slotted Enemy attributes vs the legacy dict wrapper (Python __getitem__/get).
+Mirrors the reads/writes of ai_system._update_enemy_ai and movement_system._update_enemies per enemy.
+Run: python -m benchmarks.enemy_access
+"""
+from __future__ import annotations
+
+import random
+import timeit
+from typing import Any
+
+import pygame
+
+from config_enemies import ENEMY_TEMPLATES
+from enemies import make_enemy_from_template
+
+COUNTS = (20, 60, 200)
+
+
+class LegacyEnemy:
+    """The previous Enemy: a dict wrapped by Python-level __getitem__/__setitem__/get."""
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+
+def make_enemies(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    random.seed(seed)
+    pool = [t for t in ENEMY_TEMPLATES if not t.get("is_ambient")]
+    enemies = []
+    for _ in range(n):
+        e = make_enemy_from_template(rng.choice(pool), 1.0, 1.0)
+        e.rect.topleft = (rng.randint(0, 1800), rng.randint(0, 1000))
+        enemies.append(e)
+    return enemies
+
+
+def legacy_tick(enemies: list, dt: float = 1 / 60) -> int:
+    n = 0
+    for enemy in enemies:
+        # movement_system._update_enemies
+        if enemy.get("hp", 1) <= 0 or enemy.get("is_ambient"):
+            continue
+        pos = enemy["rect"].center
+        last = enemy.get("last_pos", pos)
+        enemy["stuck_timer"] = enemy.get("stuck_timer", 0.0) + dt
+        enemy["last_pos"] = pos
+        if not enemy.get("is_boss") and not enemy.get("is_patrol"):
+            n += 1
+        speed = enemy.get("speed", 80) * dt
+        phase = enemy.get("bait_phase", "approach")
+        enemy["bait_phase"] = phase
+        enemy["rect"].x += int(speed) if last else 0
+        # ai_system._update_enemy_ai
+        if enemy.get("type") == "queen" and enemy.get("has_shield"):
+            n += 1
+        if enemy.get("is_suicide") or enemy.get("has_reflective_shield") or enemy.get("is_ambient"):
+            n += 1
+        if enemy.get("fires_rockets") or enemy.get("can_use_grenades_player_allies_only"):
+            n += 1
+        if enemy.get("fires_laser") or enemy.get("fires_triple_laser"):
+            n += 1
+        if not enemy.get("has_reflective_shield") and enemy.get("is_predictive", False):
+            n += 1
+    return n
+
+
+def slotted_tick(enemies: list, dt: float = 1 / 60) -> int:
+    n = 0
+    for enemy in enemies:
+        if enemy.hp <= 0 or enemy.is_ambient:
+            continue
+        pos = enemy.rect.center
+        last = enemy.last_pos
+        if last is None:
+            last = pos
+        enemy.stuck_timer = (enemy.stuck_timer or 0.0) + dt
+        enemy.last_pos = pos
+        if not enemy.is_boss and not enemy.is_patrol:
+            n += 1
+        speed = enemy.speed * dt
+        enemy.bait_phase = enemy.bait_phase or "approach"
+        enemy.rect.x += int(speed) if last else 0
+        if enemy.type == "queen" and enemy.has_shield:
+            n += 1
+        if enemy.is_suicide or enemy.has_reflective_shield or enemy.is_ambient:
+            n += 1
+        if enemy.fires_rockets or enemy.can_use_grenades_player_allies_only:
+            n += 1
+        if enemy.fires_laser or enemy.fires_triple_laser:
+            n += 1
+        if not enemy.has_reflective_shield and enemy.is_predictive:
+            n += 1
+    return n
+
+
+def main() -> None:
+    print(f"{'enemies':>8} {'legacy us':>10} {'item us':>9} {'slots us':>9} {'speedup':>8}")
+    for n in COUNTS:
+        enemies = make_enemies(n)
+        legacy = [LegacyEnemy(e.to_dict()) for e in enemies]
+        # Reset the scratch fields so both variants start from the same data
+        for e in enemies:
+            e.last_pos = e.stuck_timer = e.bait_phase = None
+        for le in legacy:
+            for k in ("last_pos", "stuck_timer", "bait_phase"):
+                le._data.pop(k, None)
+        assert legacy_tick(legacy) == slotted_tick(enemies)
+        number = max(50, 20000 // n)
+        t_legacy = min(timeit.repeat(lambda: legacy_tick(legacy), number=number, repeat=5)) / number
+        t_item = min(timeit.repeat(lambda: legacy_tick(enemies), number=number, repeat=5)) / number
+        t_slots = min(timeit.repeat(lambda: slotted_tick(enemies), number=number, repeat=5)) / number
+        print(f"{n:>8} {t_legacy * 1e6:>10.1f} {t_item * 1e6:>9.1f} {t_slots * 1e6:>9.1f} {t_legacy / t_slots:>7.1f}x")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    main()
@@ -0,0 +1,65 @@
+"""
+Enemy-vs-enemy overlap detection for clustered enemies: all-pairs scan (what _check_enemy_collision
+does per enemy without a world) vs the CollisionWorld grid. Density is fixed, so the grid should scale
+linearly while all-pairs grows quadratically.
+Run: python -m benchmarks.enemy_separation
+"""
+from __future__ import annotations
+
+import random
+import timeit
+
+import pygame
+
+from config_enemies import ENEMY_TEMPLATES
+from enemies import make_enemy_from_template
+from state import GameState
+from systems.collision_world import CollisionWorld
+
+COUNTS = (50, 200, 400)
+W, H = 1920, 1080
+
+
+def make_state(n: int, seed: int = 0) -> GameState:
+    rng = random.Random(seed)
+    random.seed(seed)
+    state = GameState()
+    state.player_rect = pygame.Rect(W // 2 - 14, H // 2 - 14, 28, 28)
+    grunt = next(t for t in ENEMY_TEMPLATES if t.get("type") == "grunt")
+    spread = int(25 * n ** 0.5)
+    for _ in range(n):
+        e = make_enemy_from_template(grunt, 1.0, 1.0)
+        e.rect.center = (W // 2 + rng.randint(-spread, spread), H // 2 + rng.randint(-spread, spread))
+        state.enemies.append(e)
+    return state
+
+
+def all_pairs(state: GameState) -> int:
+    rects = [e.rect for e in state.enemies]
+    hits = 0
+    for r in rects:
+        for other in rects:
+            if other is not r and r.colliderect(other):
+                hits += 1
+    return hits
+
+
+def grid(state: GameState) -> int:
+    world = CollisionWorld.from_state(state)
+    return sum(len(world.enemy_overlaps(e.rect)) for e in state.enemies)
+
+
+def main() -> None:
+    print(f"{'enemies':>8} {'all-pairs us':>13} {'grid us':>9} {'speedup':>8}")
+    for n in COUNTS:
+        state = make_state(n)
+        assert all_pairs(state) == grid(state)
+        number = max(5, 2000 // n)
+        t_pairs = min(timeit.repeat(lambda: all_pairs(state), number=number, repeat=5)) / number
+        t_grid = min(timeit.repeat(lambda: grid(state), number=number, repeat=5)) / number
+        print(f"{n:>8} {t_pairs * 1e6:>13.1f} {t_grid * 1e6:>9.1f} {t_pairs / t_grid:>7.1f}x")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    main()
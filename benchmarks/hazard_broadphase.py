@@ -0,0 +1,66 @@
+"""
+Hazard-vs-hazard collision cost: sweep-and-prune broadphase vs the old O(n^2) pairwise loop.
+Run: python -m benchmarks.hazard_broadphase
+"""
+from __future__ import annotations
+
+import math
+import random
+import timeit
+
+import pygame
+
+from hazards import check_hazard_collision, hazard_candidate_pairs, update_hazard_geometry
+
+WIDTH = 1920
+HEIGHT = 1080
+COUNTS = (4, 16, 64, 256)
+
+
+def make_hazards(n: int, seed: int = 0) -> list[dict]:
+    """n small hazards scattered over the playfield (custom-mode sized), geometry up to date."""
+    rng = random.Random(seed)
+    size = max(40, int(250 / math.sqrt(max(1, n / 4))))
+    hazard_list = []
+    for i in range(n):
+        hz = {
+            "center": pygame.Vector2(rng.uniform(size, WIDTH - size), rng.uniform(size, HEIGHT - size)),
+            "width": size,
+            "height": size,
+            "rotation_angle": rng.uniform(0, 2 * math.pi),
+            "shape": "paraboloid" if i % 2 else "trapezoid",
+            "points": [],
+            "bounding_rect": pygame.Rect(0, 0, 0, 0),
+        }
+        update_hazard_geometry(hz)
+        hazard_list.append(hz)
+    return hazard_list
+
+
+def pairwise(hazard_list: list[dict]) -> list[tuple[int, int]]:
+    return [
+        (i, j)
+        for i in range(len(hazard_list))
+        for j in range(i + 1, len(hazard_list))
+        if check_hazard_collision(hazard_list[i], hazard_list[j])
+    ]
+
+
+def sweep_and_prune(hazard_list: list[dict]) -> list[tuple[int, int]]:
+    return [(i, j) for i, j in hazard_candidate_pairs(hazard_list)
+            if check_hazard_collision(hazard_list[i], hazard_list[j])]
+
+
+def main() -> None:
+    print(f"{'hazards':>8} {'pairwise us':>12} {'sweep us':>10} {'speedup':>8} {'pairs':>6}")
+    for n in COUNTS:
+        hazard_list = make_hazards(n)
+        assert pairwise(hazard_list) == sweep_and_prune(hazard_list)
+        number = max(10, 20000 // (n * n // 4 + 1))
+        t_pair = min(timeit.repeat(lambda: pairwise(hazard_list), number=number, repeat=5)) / number
+        t_sap = min(timeit.repeat(lambda: sweep_and_prune(hazard_list), number=number, repeat=5)) / number
+        print(f"{n:>8} {t_pair * 1e6:>12.1f} {t_sap * 1e6:>10.1f} {t_pair / t_sap:>7.1f}x {len(pairwise(hazard_list)):>6}")
+
+
+if __name__ == "__main__":
+    main()
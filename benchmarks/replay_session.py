@@ -0,0 +1,68 @@
+"""
+Headless replay of a recorded gameplay session at maximum speed (dummy video/audio drivers).
+Record with GAME_RECORD_INPUT=session.jsonl python game.py; the replay restarts the same seeded run
+and feeds the recorded per-frame input and dt, so a collision/AI change can be timed against the
+exact combat that was captured. The final digest should not change between runs of the same build.
+Run: python -m benchmarks.replay_session session.jsonl [--render] [--repeat N]
+"""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse  # noqa: E402
+import time  # noqa: E402
+
+from input_source import ReplayInput  # noqa: E402
+from step_controller import STEP_POLICY_CLAMP_DROP  # noqa: E402
+
+
+def replay(path: str, render: bool = False) -> dict:
+    """Replay one recording; returns timing and a digest of the final state."""
+    import game
+    from game_app import GameApp
+
+    source = ReplayInput(path)
+    app = GameApp(headless=True, input_source=source)
+    app.use_step_policy(STEP_POLICY_CLAMP_DROP)  # adaptive budgets follow wall-clock cost: not reproducible
+    app.ctx.config.aim_mode = source.header.get("aim_mode", app.ctx.config.aim_mode)
+    game._start_seeded_run(app.ctx, app.game_state, app.scene_stack, source.seed)
+    for name, value in source.header.get("player", {}).items():
+        setattr(app.game_state, name, value)
+
+    frames = 0
+    start = time.perf_counter()
+    while not source.done and app.run_in_progress():  # frames are only consumed during gameplay
+        if not app.update(source.next_dt):
+            break
+        if render:
+            app.render()
+        frames += 1
+    elapsed = time.perf_counter() - start
+    gs = app.game_state
+    return {
+        "frames": frames,
+        "seconds": elapsed,
+        "steps": app.step_controller.metrics.steps,
+        "digest": (gs.wave_number, gs.score, gs.enemies_killed, gs.shots_fired, gs.player_hp, len(gs.enemies),
+                   tuple(gs.player_rect.topleft)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("recording")
+    parser.add_argument("--render", action="store_true", help="also render every frame (to the dummy display)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(f"{'run':>4} {'frames':>7} {'steps':>7} {'wall s':>8} {'steps/s':>9}  digest")
+    for i in range(args.repeat):
+        r = replay(args.recording, render=args.render)
+        rate = r["steps"] / r["seconds"] if r["seconds"] else 0.0
+        print(f"{i:>4} {r['frames']:>7} {r['steps']:>7} {r['seconds']:>8.3f} {rate:>9.0f}  {r['digest']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,16 @@ and provides get_enemy_def() / clear_enemy_def_cache(). Each definition is the s
 dict shape as ENEMY_TEMPLATES / BOSS_TEMPLATE for make_enemy_from_template.
 Normalized fields used by callers: type_id, base_health, move_speed, sprite_id,
 score_value, behavior_flags (frozenset).
+
+Templates are also compiled once into EnemyArchetype records (get_archetype) so that
+make_enemy_from_template is a dict copy plus scaling, and spawn pools per size class are
+cached (get_spawn_pools).
 """
 from __future__ import annotations
 
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from config.enemy_data import (
     BOSS_TEMPLATE,
@@ -26,6 +32,8 @@ from config.enemy_data import (
     QUEEN_SPEED_MULTIPLIER,
 )
 
+from constants import ENEMY_COLOR, ENEMY_PROJECTILES_COLOR
+
 _ENEMY_DEF_CACHE: dict[str, Optional[dict[str, Any]]] = {}
 
 
@@ -63,5 +71,204 @@ def get_enemy_def(type_id: str) -> Optional[dict[str, Any]]:
 
 
 def clear_enemy_def_cache() -> None:
-    """Clear the cache (e.g. for tests or hot-reload)."""
+    """Clear the caches (e.g. for tests or hot-reload)."""
     _ENEMY_DEF_CACHE.clear()
+    _ARCHETYPE_CACHE.clear()
+    _SPAWN_POOLS.clear()
+
+
+# Scaling rules applied by make_enemy_from_template
+HP_RULE_QUEEN = "queen"  # fixed HP, speed not wave-scaled
+HP_RULE_SUPER_LARGE = "super_large"  # hp * scale * 1.5, no cap
+HP_RULE_LARGE_LASER = "large_laser"
+HP_RULE_AMBIENT = "ambient"  # template HP, stationary
+HP_RULE_STANDARD = "standard"
+
+
+@dataclass(frozen=True)
+class EnemyArchetype:
+    """A template compiled once: scaling rule, precomputed cooldown and the static enemy fields."""
+
+    type_id: str
+    size_class: Optional[str]
+    hp_rule: str
+    base_hp: int
+    base_speed: float
+    shoot_cooldown: float  # fire-rate multiplier already applied (except ambient)
+    rect: tuple[int, int, int, int]
+    fields: Mapping[str, Any]  # read-only; everything except hp/max_hp/speed/rect and random rolls
+    shield_rolls: int = 0  # number of random shield_angle draws (has_shield, has_reflective_shield)
+    rage_threshold: Optional[int] = None  # queen: template value, else rolled per enemy
+    behavior_flags: frozenset = field(default_factory=frozenset)
+
+
+def _hp_rule(t: dict) -> tuple[str, float]:
+    ttype = t.get("type")
+    if ttype == "queen":
+        return HP_RULE_QUEEN, t.get("speed", 80)
+    if ttype in ("super_large", "super_large_triple_laser"):
+        return HP_RULE_SUPER_LARGE, t.get("speed", 20)
+    if ttype == "large_laser":
+        return HP_RULE_LARGE_LASER, t.get("speed", 50)
+    if t.get("is_ambient"):
+        return HP_RULE_AMBIENT, 0
+    return HP_RULE_STANDARD, t.get("speed", 80)
+
+
+def compile_archetype(t: dict) -> EnemyArchetype:
+    """Compile a template dict (ENEMY_TEMPLATES entry or def) into an EnemyArchetype."""
+    hp_rule, base_speed = _hp_rule(t)
+    if t.get("is_ambient"):
+        shoot_cd = t["shoot_cooldown"]  # Ambient: rocket every 6s, no fire-rate modifier
+    else:
+        shoot_cd = t["shoot_cooldown"] / ENEMY_FIRE_RATE_MULTIPLIER
+
+    f: dict[str, Any] = {
+        "type": t["type"],
+        "color": ENEMY_COLOR,  # All enemies same color
+        "shoot_cooldown": shoot_cd,
+        "projectile_speed": t["projectile_speed"],
+        "projectile_color": t.get("projectile_color", ENEMY_PROJECTILES_COLOR),
+        "projectile_shape": t.get("projectile_shape", "circle"),
+    }
+    shield_rolls = 0
+    if t.get("has_shield"):
+        shield_rolls += 1
+        f["has_shield"] = True
+        f["shield_length"] = t.get("shield_length", 50)
+    if t.get("has_reflective_shield"):
+        shield_rolls += 1
+        f["has_reflective_shield"] = True
+        f["shield_length"] = t.get("shield_length", 60)
+        f["shield_hp"] = 0
+        f["turn_speed"] = t.get("turn_speed", 0.5)
+    if t.get("is_predictive"):
+        f["is_predictive"] = True
+    if t.get("is_ambient"):
+        f["is_ambient"] = True
+        f["rocket_cooldown"] = t.get("rocket_cooldown", 0.0)
+    if t.get("enemy_size_class"):
+        f["enemy_size_class"] = t["enemy_size_class"]
+    if t.get("is_flamethrower"):
+        f["is_flamethrower"] = True
+        f["flame_damage"] = t.get("flame_damage", 8)
+    if t.get("reflect_damage_mult") is not None:
+        f["reflect_damage_mult"] = t["reflect_damage_mult"]
+    if t.get("fires_rockets"):
+        f["fires_rockets"] = True
+        f["rocket_cooldown"] = t.get("rocket_cooldown", 0.0)
+        f["rocket_interval"] = t.get("rocket_interval", 5.0)
+    if t.get("can_use_grenades_player_allies_only"):
+        f["can_use_grenades_player_allies_only"] = True
+        f["grenade_cooldown"] = t.get("grenade_cooldown", 8.0)
+        f["time_since_grenade"] = t.get("time_since_grenade", 999.0)
+        f["grenade_damage"] = t.get("grenade_damage", 400)
+        f["grenade_radius"] = t.get("grenade_radius", 120)
+    if t.get("fires_laser"):
+        f["fires_laser"] = True
+        f["laser_cooldown"] = t.get("laser_cooldown", 0.0)
+        f["laser_interval"] = t.get("laser_interval", 3.0)
+        f["laser_duration"] = t.get("laser_duration", 0.4)
+        f["laser_deploy_time"] = t.get("laser_deploy_time", 2.0)
+        f["laser_damage"] = t.get("laser_damage", 80)
+        f["laser_length"] = t.get("laser_length", 600)
+    if t.get("fires_triple_laser"):
+        f["fires_triple_laser"] = True
+        f["laser_cooldown"] = t.get("laser_cooldown", 0.0)
+        f["laser_interval"] = t.get("laser_interval", 4.0)
+        f["laser_duration"] = t.get("laser_duration", 0.5)
+        f["laser_deploy_time"] = t.get("laser_deploy_time", 2.0)
+        f["laser_damage"] = t.get("laser_damage", 120)
+        f["laser_length"] = t.get("laser_length", 700)
+        f["laser_spread_deg"] = t.get("laser_spread_deg", 15)
+
+    rage_threshold = None
+    if hp_rule == HP_RULE_QUEEN:
+        f["name"] = t.get("name", "queen")
+        f["can_use_grenades"] = t.get("can_use_grenades", False)
+        f["grenade_cooldown"] = t.get("grenade_cooldown", 5.0)
+        f["time_since_grenade"] = t.get("time_since_grenade", 999.0)
+        f["damage_taken_since_rage"] = 0
+        f["rage_mode_active"] = False
+        f["rage_mode_timer"] = 0.0
+        f["predicts_player"] = t.get("predicts_player", False)
+        rage_threshold = t.get("rage_damage_threshold")
+
+    flags = set()
+    for key, flag in (("is_suicide", "suicider"), ("is_ambient", "ambient"), ("is_boss", "boss"), ("is_spawner", "spawner")):
+        if t.get(key):
+            flags.add(flag)
+    r = t["rect"]
+    return EnemyArchetype(
+        type_id=t["type"],
+        size_class=t.get("enemy_size_class"),
+        hp_rule=hp_rule,
+        base_hp=t.get("hp", 0),
+        base_speed=base_speed,
+        shoot_cooldown=shoot_cd,
+        rect=(r.x, r.y, r.w, r.h),
+        fields=MappingProxyType(f),
+        shield_rolls=shield_rolls,
+        rage_threshold=rage_threshold,
+        behavior_flags=frozenset(flags),
+    )
+
+
+_ARCHETYPE_CACHE: dict[int, tuple[dict, EnemyArchetype]] = {}
+
+
+def get_archetype(template: dict) -> EnemyArchetype:
+    """Compiled archetype for a template dict, compiled on first use. Keyed by template identity."""
+    entry = _ARCHETYPE_CACHE.get(id(template))
+    if entry is not None and entry[0] is template:
+        return entry[1]
+    arch = compile_archetype(template)
+    _ARCHETYPE_CACHE[id(template)] = (template, arch)
+    return arch
+
+
+@dataclass(frozen=True)
+class SpawnPools:
+    """Template pools used by spawn_system, built once from ENEMY_TEMPLATES."""
+
+    regular: tuple  # wave spawns (non-ambient)
+    regular_non_queen: tuple
+    regular_excluding_size: Mapping[str, tuple]  # size class -> regular templates of other classes
+    minions: tuple  # spawner minions (no spawner/boss/ambient)
+    _minions_in: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def minions_in(self, size_classes: frozenset) -> tuple:
+        """Minion templates whose size class is in size_classes (pool order kept), cached per set."""
+        pool = self._minions_in.get(size_classes)
+        if pool is None:
+            pool = tuple(t for t in self.minions if t.get("enemy_size_class") in size_classes)
+            self._minions_in[size_classes] = pool
+        return pool
+
+
+_SPAWN_POOLS: dict[str, SpawnPools] = {}
+
+
+def get_spawn_pools() -> SpawnPools:
+    pools = _SPAWN_POOLS.get("default")
+    if pools is not None:
+        return pools
+    regular = tuple(t for t in ENEMY_TEMPLATES if not t.get("is_ambient"))
+    if not regular:
+        regular = tuple(t for t in ENEMY_TEMPLATES if t.get("type") != "queen")
+    minions = tuple(
+        t for t in ENEMY_TEMPLATES if t.get("type") not in ("spawner", "FINAL_BOSS") and not t.get("is_ambient")
+    )
+    if not minions:
+        minions = tuple(t for t in ENEMY_TEMPLATES if t.get("type") != "FINAL_BOSS")
+    classes = ("basic", "large", "super_large")
+    pools = SpawnPools(
+        regular=regular,
+        regular_non_queen=tuple(t for t in regular if t.get("type") != "queen"),
+        regular_excluding_size=MappingProxyType(
+            {sc: tuple(t for t in regular if t.get("enemy_size_class") != sc) for sc in classes}
+        ),
+        minions=minions,
+    )
+    _SPAWN_POOLS["default"] = pools
+    return pools
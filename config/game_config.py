@@ -11,6 +11,8 @@ Tuning guide (which values to tweak for feel):
 - Faster vs slower weapons: player_base_shoot_cooldown, per-weapon cooldown_multiplier in config_weapons.
 - Easier vs harder early waves: base_enemies_per_wave, enemy_spawn_multiplier, difficulty multiplers in constants.
 - Feel profiles: use FEEL_PROFILE_CASUAL / FEEL_PROFILE_ARCADE to apply preset overrides (see apply_feel_profile).
+- Simulation cost: simulation_hz (e.g. 30) ticks gameplay less often; rendering interpolates positions at display rate.
+- Frame hitches: step_policy "clamp_drop" (skip ahead), "dilate" (brief slow motion) or "adaptive" (fewer catch-up steps on slow machines).
 - On-screen debug info (wave, enemy count, player HP): set debug_draw_overlay=True to enable the debug HUD in gameplay.
 - GPU physics: set use_gpu_physics=True (requires CUDA_AVAILABLE from gpu_physics).
 - Post-process profile: shader_profile "none" | "cpu_tint" | "gl_basic" (only when use_shaders=True).
@@ -73,6 +75,11 @@ class GameConfig:
     mod_enemy_spawn_multiplier: float = 1.0  # Custom enemy spawn multiplier
     mod_custom_waves_enabled: bool = False
     custom_waves: list = field(default_factory=list)  # Custom wave definitions (list of dicts)
+    simulation_hz: int = 60  # Fixed simulation tick rate; rendering interpolates between ticks (e.g. 30 on slow hardware).
+    wave_spawn_steps: int = 8  # Regular-wave enemies are placed over this many simulation steps (1 = all at once).
+    wave_prebuild_budget_ms: float = 1.0  # Per-step time spent pre-building the next wave during the countdown.
+    enemy_flow_field: bool = True  # Enemies chase along nav-grid flow fields around blocks (False = straight at the target).
+    step_policy: str = "clamp_drop"  # Fixed-step overload policy: "clamp_drop" | "dilate" | "adaptive" (see step_controller).
     debug_draw_overlay: bool = False  # When True, gameplay shows a small debug HUD (wave, enemies, HP, lives).
     use_shaders: bool = False  # When True, use GPU shaders for rendering (requires moderngl).
     shader_profile: str = "none"  # "none" | "cpu_tint" | "gl_basic"; only applies when use_shaders=True.
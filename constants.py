@@ -43,6 +43,8 @@ STATE_VICTORY = "VICTORY"
 STATE_MODS = "MODS"
 STATE_WAVE_BUILDER = "WAVE_BUILDER"
 STATE_CONTROLS = "CONTROLS"
+# Screens a run ends on (game over leads to name input); gameplay stops when one is current
+RUN_OVER_SCREENS = frozenset({STATE_GAME_OVER, STATE_NAME_INPUT, STATE_VICTORY})
 
 # ----------------------------
 # Difficulty constants
@@ -51,3 +51,6 @@ class AppContext:
 
     # Event bus for decoupling systems (optional; None or no-op when not set)
     event_bus: Optional[Any] = None
+
+    # Gameplay keys/mouse (input_source.InputSource); None means live pygame input
+    input_source: Optional[Any] = None
@@ -0,0 +1,175 @@
+"""
+Archetype storage for the lightweight ECS (see ecs_components.py).
+
+Entities with the same set of component types share an archetype; each archetype keeps one list
+(column) per component type plus the parallel entity ids, so systems iterate plain lists instead of
+per-entity dicts. Queries cache the list of matching archetypes and are invalidated only when a new
+archetype appears; adding/removing entities of existing signatures does not touch the cache.
+
+EcsStore also behaves like the old dict registry (eid -> {ComponentType: instance}) for reads, so
+code written against GameState.ecs_entities keeps working.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional, Type
+
+
+class Archetype:
+    """Entities sharing one component signature, stored column-wise."""
+
+    __slots__ = ("signature", "types", "ids", "columns")
+
+    def __init__(self, types: tuple[Type[Any], ...]):
+        self.types = types
+        self.signature = frozenset(types)
+        self.ids: list[int] = []
+        self.columns: dict[Type[Any], list[Any]] = {t: [] for t in types}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class EcsStore:
+    """Archetype-based component store with cached queries. Mapping-like view: eid -> {type: component}."""
+
+    def __init__(self):
+        self._archetypes: dict[frozenset, Archetype] = {}
+        self._locations: dict[int, tuple[Archetype, int]] = {}  # eid -> (archetype, row)
+        self._query_cache: dict[frozenset, list[Archetype]] = {}
+
+    # --- structure ----------------------------------------------------------------------------
+
+    def _archetype_for(self, types: Iterable[Type[Any]]) -> Archetype:
+        signature = frozenset(types)
+        arch = self._archetypes.get(signature)
+        if arch is None:
+            arch = Archetype(tuple(sorted(signature, key=lambda t: t.__qualname__)))
+            self._archetypes[signature] = arch
+            self._query_cache.clear()  # new archetype may match existing queries
+        return arch
+
+    def _append(self, eid: int, components: dict[Type[Any], Any]) -> None:
+        arch = self._archetype_for(components)
+        self._locations[eid] = (arch, len(arch.ids))
+        arch.ids.append(eid)
+        for t, column in arch.columns.items():
+            column.append(components[t])
+
+    def _detach(self, eid: int) -> Optional[dict[Type[Any], Any]]:
+        """Remove eid from its archetype (swap-remove). Returns its components, or None if unknown."""
+        loc = self._locations.pop(eid, None)
+        if loc is None:
+            return None
+        arch, row = loc
+        components = {t: column[row] for t, column in arch.columns.items()}
+        last = len(arch.ids) - 1
+        if row != last:
+            moved = arch.ids[last]
+            arch.ids[row] = moved
+            for column in arch.columns.values():
+                column[row] = column[last]
+            self._locations[moved] = (arch, row)
+        arch.ids.pop()
+        for column in arch.columns.values():
+            column.pop()
+        return components
+
+    def add(self, eid: int, components: Iterable[Any]) -> None:
+        """Insert (or replace) an entity; one component per type, later ones win."""
+        self._detach(eid)
+        self._append(eid, {type(c): c for c in components})
+
+    def add_component(self, eid: int, component: Any) -> None:
+        """Attach or replace one component, moving the entity to its new archetype."""
+        components = self._detach(eid)
+        if components is None:
+            raise KeyError(eid)
+        components[type(component)] = component
+        self._append(eid, components)
+
+    def remove_component(self, eid: int, component_type: Type[Any]) -> None:
+        components = self._detach(eid)
+        if components is None:
+            raise KeyError(eid)
+        components.pop(component_type, None)
+        self._append(eid, components)
+
+    def get_component(self, eid: int, component_type: Type[Any]) -> Any:
+        loc = self._locations.get(eid)
+        if loc is None:
+            return None
+        arch, row = loc
+        column = arch.columns.get(component_type)
+        return None if column is None else column[row]
+
+    # --- queries ------------------------------------------------------------------------------
+
+    def matching(self, *component_types: Type[Any]) -> list[Archetype]:
+        """Archetypes containing all component_types (cached until a new archetype is created)."""
+        key = frozenset(component_types)
+        archs = self._query_cache.get(key)
+        if archs is None:
+            archs = [a for sig, a in self._archetypes.items() if key <= sig]
+            self._query_cache[key] = archs
+        return archs
+
+    def entities_with(self, *component_types: Type[Any]) -> list[int]:
+        """Snapshot of entity ids having all component_types (safe to remove entities while iterating)."""
+        out: list[int] = []
+        for arch in self.matching(*component_types):
+            out.extend(arch.ids)
+        return out
+
+    def iter_columns(self, *component_types: Type[Any]) -> Iterator[tuple]:
+        """Yield (ids, column_1, ..., column_n) per matching non-empty archetype, in the requested order."""
+        for arch in self.matching(*component_types):
+            if arch.ids:
+                yield (arch.ids,) + tuple(arch.columns[t] for t in component_types)
+
+    # --- dict-like view -----------------------------------------------------------------------
+
+    def __getitem__(self, eid: int) -> dict[Type[Any], Any]:
+        arch, row = self._locations[eid]
+        return {t: column[row] for t, column in arch.columns.items()}
+
+    def __setitem__(self, eid: int, components: dict[Type[Any], Any]) -> None:
+        self.add(eid, components.values())
+
+    def __delitem__(self, eid: int) -> None:
+        if self._detach(eid) is None:
+            raise KeyError(eid)
+
+    def get(self, eid: int, default: Any = None) -> Any:
+        return self[eid] if eid in self._locations else default
+
+    def pop(self, eid: int, *default: Any) -> Any:
+        components = self._detach(eid)
+        if components is None:
+            if default:
+                return default[0]
+            raise KeyError(eid)
+        return components
+
+    def __contains__(self, eid: object) -> bool:
+        return eid in self._locations
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._locations))
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def keys(self) -> list[int]:
+        return list(self._locations)
+
+    def items(self) -> Iterator[tuple[int, dict[Type[Any], Any]]]:
+        for eid in list(self._locations):
+            yield eid, self[eid]
+
+    def clear(self) -> None:
+        """Drop all entities. Archetypes (and cached queries) are kept for reuse."""
+        self._locations.clear()
+        for arch in self._archetypes.values():
+            arch.ids.clear()
+            for column in arch.columns.values():
+                column.clear()
@@ -54,6 +54,6 @@ class Entity:
         """Override in subclasses. Default no-op."""
         pass
 
-    def draw(self, screen: pygame.Surface, state: Any = None) -> None:
-        """Override in subclasses. Default no-op."""
+    def draw(self, screen: pygame.Surface, state: Any = None, rect: Optional[pygame.Rect] = None) -> None:
+        """Override in subclasses (rect, when given, is the position to draw at). Default no-op."""
         pass
@@ -1,64 +1,154 @@
 """
-Enemy entity: wraps the existing enemy dict for unified Entity interface
-while keeping full dict-like access (enemy["rect"], enemy["hp"], etc.) for compatibility.
+Enemy entity: a slotted record for the fields the per-frame systems touch, with full dict-like
+access (enemy["rect"], enemy.get("color"), "key" in enemy) for everything else.
+
+Hot fields (ENEMY_SLOT_FIELDS) are real attributes, so the AI and movement loops read enemy.rect /
+enemy.is_suicide directly instead of going through a Python-level __getitem__. Other keys live in a
+plain dict. A slot holding None reads as an absent key, so enemy.get("is_boss", False) behaves
+exactly like it did on the legacy dict.
 """
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import pygame
 
 from .base import Entity
 
+# Always present on spawned enemies
+_CORE_FIELDS = ("type", "rect", "hp", "max_hp", "speed", "shoot_cooldown", "time_since_shot")
+# Behavior flags / size class: None when the template does not set them
+_FLAG_FIELDS = (
+    "is_boss",
+    "is_suicide",
+    "is_ambient",
+    "is_patrol",
+    "is_predictive",
+    "is_spawner",
+    "has_shield",
+    "has_reflective_shield",
+    "fires_rockets",
+    "fires_laser",
+    "fires_triple_laser",
+    "can_use_grenades_player_allies_only",
+    "can_use_missiles",
+    "is_flamethrower",
+    "enemy_size_class",
+)
+# Per-frame movement state written by movement_system
+_STATE_FIELDS = ("last_pos", "stuck_timer", "bait_phase")
+
+ENEMY_SLOT_FIELDS = _CORE_FIELDS + _FLAG_FIELDS + _STATE_FIELDS
+_SLOT_SET = frozenset(ENEMY_SLOT_FIELDS)
+
 
 class Enemy(Entity):
     """
-    Enemy that extends Entity and wraps the legacy dict representation.
-    Supports both attribute access (.rect, .hp, .alive) and dict access (["rect"], ["hp"])
-    so existing code using enemy["rect"] or enemy.get("color") keeps working.
+    Enemy that extends Entity. Hot fields are __slots__ attributes; the long tail of keys is a dict.
+    Supports both attribute access (.rect, .hp, .is_suicide, .alive) and dict access (["rect"], .get(),
+    in, pop, setdefault, keys/items) so existing code using enemy["rect"] keeps working.
     """
 
-    def __init__(self, data: dict):
-        rect = data.get("rect")
-        hp = data.get("hp", 0)
-        super().__init__(rect=rect, hp=hp, alive=hp > 0)
-        self._data = data
-
-    @property
-    def rect(self) -> Optional[pygame.Rect]:
-        return self._data.get("rect")
-
-    @rect.setter
-    def rect(self, value: Optional[pygame.Rect]) -> None:
-        self._data["rect"] = value
-
-    @property
-    def hp(self) -> int:
-        return self._data.get("hp", 0)
+    __slots__ = ENEMY_SLOT_FIELDS + ("_extra",)
 
-    @hp.setter
-    def hp(self, value: int) -> None:
-        self._data["hp"] = int(value)
+    def __init__(self, data: dict):
+        # Entity.__init__ is not called: rect/hp live in this class's own slots.
+        for name in ENEMY_SLOT_FIELDS:
+            setattr(self, name, None)
+        extra = {}
+        for key, value in data.items():
+            if key in _SLOT_SET:
+                setattr(self, key, value)
+            else:
+                extra[key] = value
+        self._extra = extra
 
     @property
     def alive(self) -> bool:
-        return self._data.get("hp", 0) > 0
+        return (self.hp or 0) > 0
+
+    # --- dict compatibility -------------------------------------------------------------------
 
     def __getitem__(self, key: str) -> Any:
-        return self._data[key]
+        if key in _SLOT_SET:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return self._extra[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self._data[key] = value
+        if key in _SLOT_SET:
+            setattr(self, key, value)
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _SLOT_SET:
+            if getattr(self, key) is None:
+                raise KeyError(key)
+            setattr(self, key, None)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in _SLOT_SET:
+            return getattr(self, key) is not None
+        return key in self._extra
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self._data.get(key, default)
+        if key in _SLOT_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self._extra.get(key, default)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in _SLOT_SET:
+            value = getattr(self, key)
+            if value is not None:
+                setattr(self, key, None)
+                return value
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return self._extra.pop(key, *default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = self.get(key)
+        if value is None and key not in self:
+            self[key] = default
+            return default
+        return value
+
+    def keys(self) -> list[str]:
+        return [k for k in ENEMY_SLOT_FIELDS if getattr(self, k) is not None] + list(self._extra)
+
+    def items(self) -> list[tuple[str, Any]]:
+        return [(k, self[k]) for k in self.keys()]
+
+    def values(self) -> list[Any]:
+        return [self[k] for k in self.keys()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def to_dict(self) -> dict:
+        """Plain dict copy (legacy representation)."""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"Enemy({self.to_dict()!r})"
 
     def update(self, dt: float, state: Any) -> None:
         """Per-enemy logic remains in the game loop; this is a hook for future use."""
         pass
 
-    def draw(self, screen: pygame.Surface, state: Any = None) -> None:
-        """Draw this enemy (rect only; health bars stay in the game loop)."""
-        rect = self._data.get("rect")
+    def draw(self, screen: pygame.Surface, state: Any = None, rect: Optional[pygame.Rect] = None) -> None:
+        """Draw this enemy (rect only; health bars stay in the game loop). rect overrides the position drawn."""
+        if rect is None:
+            rect = self.rect
         if rect is None:
             return
-        color = self._data.get("color", (200, 50, 50))
+        color = self.get("color", (200, 50, 50))
         pygame.draw.rect(screen, color, rect)
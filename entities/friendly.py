@@ -54,9 +54,10 @@ class Friendly(Entity):
         """Per-friendly logic remains in the game loop; hook for future use."""
         pass
 
-    def draw(self, screen: pygame.Surface, state: Any = None) -> None:
-        """Draw this friendly (rect only; health bars stay in the game loop)."""
-        rect = self._data.get("rect")
+    def draw(self, screen: pygame.Surface, state: Any = None, rect: Optional[pygame.Rect] = None) -> None:
+        """Draw this friendly (rect only; health bars stay in the game loop). rect overrides the position drawn."""
+        if rect is None:
+            rect = self._data.get("rect")
         if rect is None:
             return
         color = self._data.get("color", (100, 200, 100))
@@ -0,0 +1,120 @@
+"""
+Compiled player fire profiles: everything about a shot that does not depend on aim.
+
+A FireProfile resolves the weapon def (config.projectile_defs, else WEAPON_CONFIGS), stat multipliers,
+unlock bonus and random damage multiplier into spread angles, bullet size/speed and a template of the
+bullet fields. game.spawn_player_bullet_and_log looks one up per shot and only rotates the aim and
+places the rect.
+
+Profiles are cached in state.fire_profiles per (weapon mode, player_stat_version, player_bullet_damage,
+unlocked, random_damage_multiplier). Code that changes state.player_stat_multipliers must call
+note_stat_multipliers_changed (pickups do); versions come from one process-wide counter, so a cached
+profile is never reused for different multipliers, even after a snapshot restore.
+"""
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+
+from config.projectile_defs import WEAPON_CONFIGS, get_projectile_def
+from constants import (
+    UNLOCKED_WEAPON_DAMAGE_MULT,
+    player_bullet_size,
+    player_bullet_speed,
+    player_bullets_color,
+)
+
+if TYPE_CHECKING:
+    from state import GameState
+
+MAX_CACHED_PROFILES = 32  # Random-damage pickups roll new keys; the cache is dropped when it grows past this
+
+_STAT_VERSIONS = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class FireProfile:
+    """Resolved shot parameters for one weapon mode and stat set."""
+    weapon_mode: str
+    spread_deg: tuple[float, ...]  # Spread directions from the aim (degrees); a shot fires along the last one
+    size: tuple[int, int]
+    speed: float
+    bullet_fields: Mapping[str, Any]  # color, damage, penetration, explosion_radius, knockback, bounces, is_rocket
+
+
+def note_stat_multipliers_changed(state: "GameState") -> None:
+    """Give state a new player_stat_version after player_stat_multipliers changed."""
+    state.player_stat_version = next(_STAT_VERSIONS)
+
+
+def compile_fire_profile(state: "GameState", weapon_mode: str) -> FireProfile:
+    """Build the profile for weapon_mode from the current weapon def and player stats."""
+    pd = get_projectile_def("player_" + weapon_mode) if weapon_mode != "laser" else None
+    if pd:
+        base_speed = pd["speed"]
+        base_size = pd["size"]
+        weapon_config = {
+            "damage_multiplier": pd["damage_multiplier"],
+            "size_multiplier": pd["size_multiplier"],
+            "spread_angle_deg": pd["spread_angle_deg"],
+            "num_projectiles": pd["num_projectiles"],
+            "color": pd["color"],
+            "explosion_radius": pd["explosion_radius"],
+            "max_bounces": pd["max_bounces"],
+            "is_rocket": pd["is_rocket"],
+        }
+    else:
+        weapon_config = WEAPON_CONFIGS.get(weapon_mode, WEAPON_CONFIGS["basic"])
+        base_speed = player_bullet_speed * weapon_config["speed_multiplier"]
+        base_size = player_bullet_size
+
+    # Multi-projectile weapons (triple, basic): center, left, right
+    if weapon_config["num_projectiles"] > 1:
+        spread = weapon_config["spread_angle_deg"]
+        spread_deg = (0.0, -spread, spread)
+    else:
+        spread_deg = (0.0,)
+
+    mults = state.player_stat_multipliers
+    size_mult = mults["bullet_size"] * weapon_config["size_multiplier"]
+    size = (int(base_size[0] * size_mult), int(base_size[1] * size_mult))
+    damage = int(state.player_bullet_damage * mults["bullet_damage"])
+    damage = int(damage * weapon_config["damage_multiplier"])
+    if weapon_mode in state.unlocked_weapons:
+        damage = int(damage * UNLOCKED_WEAPON_DAMAGE_MULT)  # Unlocked-weapon shots deal 1.75x damage
+    damage = int(damage * state.random_damage_multiplier)
+    # Rocket launcher: always has explosion
+    explosion_bonus = 100.0 if weapon_config["is_rocket"] else 0.0
+    explosion_radius = max(weapon_config["explosion_radius"], mults["bullet_explosion_radius"] + explosion_bonus)
+
+    return FireProfile(
+        weapon_mode=weapon_mode,
+        spread_deg=spread_deg,
+        size=size,
+        speed=base_speed * mults["bullet_speed"],
+        bullet_fields=MappingProxyType({
+            "color": weapon_config.get("color", player_bullets_color),
+            "damage": damage,
+            "penetration": int(mults["bullet_penetration"]),
+            "explosion_radius": explosion_radius,
+            "knockback": mults["bullet_knockback"],
+            "bounces": weapon_config["max_bounces"],
+            "is_rocket": weapon_config["is_rocket"],
+        }),
+    )
+
+
+def fire_profile(state: "GameState") -> FireProfile:
+    """Profile for the current weapon mode, compiled on first use for the current stats."""
+    mode = state.current_weapon_mode
+    key = (mode, state.player_stat_version, state.player_bullet_damage, mode in state.unlocked_weapons,
+           state.random_damage_multiplier)
+    cache = state.fire_profiles
+    profile = cache.get(key)
+    if profile is None:
+        if len(cache) >= MAX_CACHED_PROFILES:
+            cache.clear()
+        profile = cache[key] = compile_fire_profile(state, mode)
+    return profile
@@ -65,7 +65,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import pygame
-import sqlite3
 
 # Suppress pygame's pkg_resources deprecation warning (pygame internal, not our code)
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated")
@@ -115,7 +114,6 @@ from constants import (
     ENEMY_PROJECTILE_DAMAGE,
     ENEMY_PROJECTILE_SIZE,
     ENEMY_PROJECTILES_COLOR,
-    HIGH_SCORES_DB,
     LIVES_START,
     MOUSE_BUTTON_RIGHT,
     PLAYER_CLASS_BALANCED,
@@ -134,7 +132,6 @@ from constants import (
     STATE_PLAYING,
     STATE_TITLE,
     STATE_VICTORY,
-    UNLOCKED_WEAPON_DAMAGE_MULT,
     ally_drop_cooldown,
     boost_drain_per_s,
     boost_meter_max,
@@ -161,8 +158,6 @@ from constants import (
     overshield_recharge_cooldown,
     pause_options,
     player_bullet_shapes,
-    player_bullet_size,
-    player_bullet_speed,
     player_bullets_color,
     player_class_options,
     player_class_stats,
@@ -187,7 +182,6 @@ from config_enemies import (
     FRIENDLY_AI_TEMPLATES,
 )
 from config_weapons import (
-    WEAPON_CONFIGS,
     WEAPON_NAMES,
     WEAPON_DISPLAY_COLORS,
     WEAPON_UNLOCK_ORDER,
@@ -218,12 +212,14 @@ from scenes.transitions import SceneTransition, KIND_NONE, KIND_PUSH, KIND_POP,
 from visual_effects import apply_menu_effects, apply_pause_effects
 from shader_effects import get_menu_shader_stack, get_pause_shader_stack, get_gameplay_shader_stack
 from simulation_systems import SIMULATION_SYSTEMS
-from systems.spawn_system import start_wave as spawn_system_start_wave
+from systems.spawn_system import start_wave as spawn_system_start_wave, note_enemy_removed
 from systems.input_system import handle_gameplay_input
 from systems.telemetry_system import update_telemetry
 from systems.audio_system import init_mixer, sync_from_config, play_sfx, play_music, stop_music
 from pickups import apply_pickup_effect
 from systems.collision_movement import move_player_with_push, move_enemy_with_push
+from fire_profiles import fire_profile
+from systems.owner_index import OWNED_DAMAGE_NUMBERS, OWNED_PROJECTILES, add_child, keep_children, remove_children
 try:
     from telemetry.perf import record_frame as _perf_record_frame
 except ImportError:
@@ -240,8 +236,13 @@ from geometry_utils import (
     set_screen_dimensions,
 )
 from level_utils import filter_blocks_no_overlap, clone_enemies_from_templates
-from hazards import hazard_obstacles, check_point_in_hazard
+from hazards import hazard_obstacles, check_point_in_hazard, reset_hazard_obstacles
+from spawn_sampler import SpawnSampler
+from step_controller import make_step_controller
+from input_source import LIVE_INPUT, RecordingInput
+from wave_beams import generate_wave_beam_points, check_wave_beam_collision
 from level_state import LevelState
+from game_utils import init_high_scores_db, get_high_scores, save_high_score, is_high_score
 
 # Placeholder WIDTH/HEIGHT for module-level geometry (trapezoids, etc.). Runtime dimensions live in AppContext (ctx.width, ctx.height).
 WIDTH = 1920
@@ -319,6 +320,16 @@ def _build_app_context(screen: pygame.Surface, clock: pygame.time.Clock, width:
     sync_from_config(ctx.config)
     return ctx
 
+def _build_level(width: int, height: int, player_rect: pygame.Rect) -> tuple[LevelState, list]:
+    """Generate level geometry (blocks kept clear of player_rect) and teleporter pads. Uses the random module."""
+    level = build_level_geometry(width, height)
+    level.destructible_blocks = filter_blocks_no_overlap(level.destructible_blocks, [level.moveable_blocks, level.giant_blocks, level.super_giant_blocks, level.trapezoid_blocks, level.triangle_blocks], player_rect)
+    level.moveable_blocks = filter_blocks_no_overlap(level.moveable_blocks, [level.destructible_blocks, level.giant_blocks, level.super_giant_blocks, level.trapezoid_blocks, level.triangle_blocks], player_rect)
+    level.giant_blocks = filter_blocks_no_overlap(level.giant_blocks, [level.destructible_blocks, level.moveable_blocks, level.super_giant_blocks, level.trapezoid_blocks, level.triangle_blocks], player_rect)
+    level.super_giant_blocks = filter_blocks_no_overlap(level.super_giant_blocks, [level.destructible_blocks, level.moveable_blocks, level.giant_blocks, level.trapezoid_blocks, level.triangle_blocks], player_rect)
+    return level, _place_teleporter_pads(level, width, height)
+
+
 def _build_initial_game_state(ctx: AppContext) -> GameState:
     """Create and initialize GameState with level geometry and context."""
     game_state = GameState()
@@ -330,13 +341,7 @@ def _build_initial_game_state(ctx: AppContext) -> GameState:
     pygame.mouse.set_visible(True)
 
     # Build level geometry and store in game_state.level
-    level = build_level_geometry(ctx.width, ctx.height)
-    level.destructible_blocks = filter_blocks_no_overlap(level.destructible_blocks, [level.moveable_blocks, level.giant_blocks, level.super_giant_blocks, level.trapezoid_blocks, level.triangle_blocks], game_state.player_rect)
-    level.moveable_blocks = filter_blocks_no_overlap(level.moveable_blocks, [level.destructible_blocks, level.giant_blocks, level.super_giant_blocks, level.trapezoid_blocks, level.triangle_blocks], game_state.player_rect)
-    level.giant_blocks = filter_blocks_no_overlap(level.giant_blocks, [level.destructible_blocks, level.moveable_blocks, level.super_giant_blocks, level.trapezoid_blocks, level.triangle_blocks], game_state.player_rect)
-    level.super_giant_blocks = filter_blocks_no_overlap(level.super_giant_blocks, [level.destructible_blocks, level.moveable_blocks, level.giant_blocks, level.trapezoid_blocks, level.triangle_blocks], game_state.player_rect)
-    game_state.level = level
-    game_state.teleporter_pads = _place_teleporter_pads(level, ctx.width, ctx.height)
+    game_state.level, game_state.teleporter_pads = _build_level(ctx.width, ctx.height, game_state.player_rect)
     
     # Level context for movement_system and collision_system (callables and data; avoids circular imports)
     def _make_level_context():
@@ -393,6 +398,7 @@ def _build_initial_game_state(ctx: AppContext) -> GameState:
             "spawn_enemy_projectile_predictive": spawn_enemy_projectile_predictive,
             "difficulty": ctx.config.difficulty,
             "random_spawn_position": random_spawn_position,
+            "spawn_sampler": SpawnSampler(w, h),
             "telemetry": ctx.telemetry_client,
             "telemetry_enabled": ctx.config.enable_telemetry,
             "overshield_recharge_cooldown": overshield_recharge_cooldown,
@@ -408,6 +414,9 @@ def _build_initial_game_state(ctx: AppContext) -> GameState:
             "wave_banner_duration": getattr(ctx.config, "wave_banner_duration", 1.5),
             "base_enemies_per_wave": getattr(ctx.config, "base_enemies_per_wave", 12),
             "enemy_spawn_multiplier": getattr(ctx.config, "enemy_spawn_multiplier", 3.5),
+            "wave_spawn_steps": ctx.config.wave_spawn_steps,
+            "wave_prebuild_budget_s": ctx.config.wave_prebuild_budget_ms / 1000.0,
+            "enemy_flow_field": ctx.config.enemy_flow_field,
             "log_player_death": _log_player_death,
             "config": ctx.config,
         }
@@ -483,16 +492,20 @@ def _build_scene_stack() -> SceneStack:
     return scene_stack
 
 
-def _build_loop_params() -> tuple[int, float, int]:
-    """Return (FPS, FIXED_DT, MAX_SIMULATION_STEPS)."""
+def _build_loop_params(simulation_hz: int = 60) -> tuple[int, float, int]:
+    """Return (FPS, FIXED_DT, MAX_SIMULATION_STEPS). Rendering stays at FPS; simulation ticks at simulation_hz."""
     FPS = 60
-    FIXED_DT = 1.0 / 60.0
+    FIXED_DT = 1.0 / max(1, simulation_hz)
     MAX_SIMULATION_STEPS = 6  # cap to avoid spiral of death when dt is large
     return FPS, FIXED_DT, MAX_SIMULATION_STEPS
 
 
-def _create_app():
-    """Build ctx, game_state, scene_stack and loop invariants. Used by GameApp."""
+def _create_app(headless: bool = False):
+    """Build ctx, game_state, scene_stack and loop invariants. Used by GameApp.
+
+    headless skips the shader prompt, music and high-score setup (replays, batch runs).
+    GAME_RECORD_INPUT=<path> records gameplay input to path (see input_source).
+    """
     # Resolve physics backend before any geometry/physics use
     force_python = "--python-physics" in sys.argv or os.environ.get("USE_PYTHON_PHYSICS", "").strip() == "1"
     _physics_impl, using_c_physics = resolve_physics(force_python=force_python)
@@ -501,13 +514,19 @@ def _create_app():
     screen, clock, width, height = _create_window_and_clock()
     ctx = _build_app_context(screen, clock, width, height, using_c_physics)
     game_state = _build_initial_game_state(ctx)
-    _setup_initial_resources()
-    _prompt_shader_mode(ctx)
+    if headless:
+        ctx.config.use_shaders = False
+    else:
+        _setup_initial_resources()
+        _prompt_shader_mode(ctx)
+    record_path = os.environ.get("GAME_RECORD_INPUT", "").strip()
+    if record_path:
+        ctx.input_source = RecordingInput(record_path)
 
     # Hook telemetry handlers into EventBus
     register_telemetry_event_handlers(ctx.event_bus, ctx, game_state)
 
-    FPS, FIXED_DT, MAX_SIMULATION_STEPS = _build_loop_params()
+    FPS, FIXED_DT, MAX_SIMULATION_STEPS = _build_loop_params(ctx.config.simulation_hz)
     
     def _update_simulation(sim_dt: float, gs: GameState, app_ctx: AppContext) -> None:
         """Run one fixed timestep of gameplay (timers, movement, collision, spawn, AI)."""
@@ -527,6 +546,7 @@ def _create_app():
     r.max_sim_steps = MAX_SIMULATION_STEPS
     r.update_simulation = _update_simulation
     r.simulation_accumulator = 0.0
+    r.step_controller = make_step_controller(ctx.config.step_policy, MAX_SIMULATION_STEPS, 1.0 / FPS)
     return r
 
     # Fixed-step simulation: deterministic updates, robust to frame spikes
@@ -575,6 +595,49 @@ def _print_active_shader_profiles(config) -> None:
         print(f"[Shader profiles] could not report: {e}")
 
 
+def _apply_player_class_stats(ctx: AppContext, game_state: GameState) -> None:
+    """Set player HP, speed, damage and fire rate from the selected class (done when a run starts from the menu)."""
+    stats = player_class_stats[ctx.config.player_class]
+    game_state.player_max_hp = int(1000 * stats["hp_mult"] * 0.75)
+    game_state.player_hp = game_state.player_max_hp
+    game_state.player_speed = int(ctx.config.player_base_speed * stats["speed_mult"])
+    game_state.player_bullet_damage = int(ctx.config.player_base_damage * stats["damage_mult"])
+    game_state.player_shoot_cooldown = ctx.config.player_base_shoot_cooldown / stats["firerate_mult"]
+
+
+def _start_seeded_run(ctx: AppContext, game_state: GameState, scene_stack: SceneStack, seed: int) -> None:
+    """Restart the run at wave 1 from a known RNG seed (input recording and replay start here).
+
+    The level is regenerated from the seed and written into the existing LevelState in place, since
+    level_context closures and lists refer to it. Hazards are module-level and move during play, so
+    they are put back to their initial layout first.
+    """
+    random.seed(seed)
+    reset_hazard_obstacles()
+    sampler = game_state.level_context.get("spawn_sampler") if game_state.level_context else None
+    if sampler is not None:
+        sampler.rng.seed(seed)
+    game_state.reset_run(ctx, center_player=True)
+    level, pads = _build_level(ctx.width, ctx.height, game_state.player_rect)
+    if game_state.level is None:
+        game_state.level = level
+    else:
+        game_state.level.restore(level.snapshot())
+    game_state.teleporter_pads[:] = pads
+    game_state.wave_start_reason = "seeded_run"
+    spawn_system_start_wave(1, game_state)
+    scene_stack.clear()
+    scene_stack.push(GameplayScene(STATE_PLAYING))
+    game_state.current_screen = STATE_PLAYING
+
+
+def _finish_input_recording(ctx: AppContext) -> None:
+    """Close an active input recording when its run ends or another run starts (one recording = one seeded run)."""
+    source = ctx.input_source
+    if isinstance(source, RecordingInput) and source.started:
+        source.close()
+
+
 def _get_current_scene(scene_stack: SceneStack):
     """Return the current scene from the stack, or None if empty."""
     return scene_stack.current()
@@ -898,6 +961,7 @@ def _handle_events(
             current_state = _get_current_state(scene_stack) or STATE_PLAYING
             game_state.current_screen = current_state
         if result.get("restart") or result.get("restart_to_wave1") or result.get("replay"):
+            _finish_input_recording(ctx)
             game_state.reset_run(ctx, center_player=bool(result.get("restart_to_wave1") or result.get("replay")))
             if result.get("restart"):
                 game_state.ui.menu_section = 0
@@ -908,18 +972,14 @@ def _handle_events(
                 game_state.current_screen = STATE_PLAYING
                 play_music("in-game", loop=True)
         if result.get("start_game") and result.get("screen") == STATE_PLAYING:
+            _finish_input_recording(ctx)
             stop_music()
             play_music("in-game", loop=True)
             if ctx.config.enable_telemetry:
                 ctx.telemetry_client = Telemetry(db_path="game_telemetry.db", flush_interval_s=0.5, max_buffer=700)
             else:
                 ctx.telemetry_client = NoOpTelemetry()
-            stats = player_class_stats[ctx.config.player_class]
-            game_state.player_max_hp = int(1000 * stats["hp_mult"] * 0.75)
-            game_state.player_hp = game_state.player_max_hp
-            game_state.player_speed = int(ctx.config.player_base_speed * stats["speed_mult"])
-            game_state.player_bullet_damage = int(ctx.config.player_base_damage * stats["damage_mult"])
-            game_state.player_shoot_cooldown = ctx.config.player_base_shoot_cooldown / stats["firerate_mult"]
+            _apply_player_class_stats(ctx, game_state)
             if game_state.ui.endurance_mode_selected == 1:
                 game_state.lives = 999
                 game_state.current_screen = STATE_ENDURANCE
@@ -990,9 +1050,18 @@ def _step_simulation(
     game_state: GameState,
     scene_stack: SceneStack,
     screen_ctx: dict,
+    step_controller=None,
 ) -> tuple[float, bool]:
-    """Run fixed-step simulation updates. Returns (new_accumulator, should_quit)."""
-    simulation_accumulator += dt
+    """Run fixed-step simulation updates. Returns (new_accumulator, should_quit).
+
+    With a step_controller (see step_controller.py) the controller sets the step budget and
+    settles leftover debt; without one, the accumulator is carried over uncapped (legacy).
+    """
+    if step_controller is not None:
+        simulation_accumulator, MAX_SIMULATION_STEPS = step_controller.plan(simulation_accumulator, dt, FIXED_DT)
+        step_start = time.perf_counter()
+    else:
+        simulation_accumulator += dt
     steps = 0
     should_quit = False
     while simulation_accumulator >= FIXED_DT and steps < MAX_SIMULATION_STEPS:
@@ -1013,6 +1082,10 @@ def _step_simulation(
         _update_simulation(FIXED_DT, game_state, ctx)
         simulation_accumulator -= FIXED_DT
         steps += 1
+    if step_controller is not None:
+        simulation_accumulator = step_controller.settle(
+            simulation_accumulator, steps, FIXED_DT, time.perf_counter() - step_start
+        )
     return simulation_accumulator, should_quit
 
 
@@ -1069,9 +1142,7 @@ def _render_current_scene(
         render_gameplay_with_optional_shaders(render_ctx, game_state, {"app_ctx": ctx, "gameplay_ctx": gameplay_ctx})
         
         # Clean up expired UI tokens (state updates; timers decremented in update loop)
-        for dmg_num in game_state.damage_numbers[:]:
-            if dmg_num["timer"] <= 0:
-                game_state.damage_numbers.remove(dmg_num)
+        keep_children(game_state.damage_numbers, lambda d: d["timer"] > 0)
         for msg in game_state.weapon_pickup_messages[:]:
             if msg["timer"] <= 0:
                 game_state.weapon_pickup_messages.remove(msg)
@@ -1625,7 +1696,7 @@ deaths = 0
 score = 0
 survival_time = 0.0  # Total time survived in seconds
 
-# High score system - HIGH_SCORES_DB imported from constants.py
+# High score system - persistence lives in high_score_store.HighScoreStore (via game_utils)
 player_name_input = ""  # Current name being typed
 name_input_active = False  # Whether we're in name input mode
 final_score_for_high_score = 0  # Score to save when name is entered
@@ -1722,175 +1793,6 @@ def random_spawn_position(size: tuple[int, int], state: GameState, max_attempts:
 # Wave start and wave/boss/difficulty logic live in systems.spawn_system (start_wave, update)
 
 
-def init_high_scores_db():
-    """Initialize the high scores database."""
-    conn = sqlite3.connect(HIGH_SCORES_DB)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS high_scores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_name TEXT NOT NULL,
-            score INTEGER NOT NULL,
-            waves_survived INTEGER NOT NULL,
-            time_survived REAL NOT NULL,
-            enemies_killed INTEGER NOT NULL,
-            difficulty TEXT NOT NULL,
-            date_achieved TEXT NOT NULL
-        );
-    """)
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_score ON high_scores(score DESC);")
-    conn.commit()
-    conn.close()
-
-
-def get_high_scores(limit: int = 10) -> list[dict]:
-    """Get top high scores from database."""
-    conn = sqlite3.connect(HIGH_SCORES_DB)
-    cursor = conn.execute("""
-        SELECT player_name, score, waves_survived, time_survived, enemies_killed, difficulty, date_achieved
-        FROM high_scores
-        ORDER BY score DESC
-        LIMIT ?
-    """, (limit,))
-    scores = []
-    for row in cursor.fetchall():
-        scores.append({
-            "name": row[0],
-            "score": row[1],
-            "waves": row[2],
-            "time": row[3],
-            "kills": row[4],
-            "difficulty": row[5],
-            "date": row[6]
-        })
-    conn.close()
-    return scores
-
-
-def save_high_score(name: str, score: int, waves: int, time_survived: float, enemies_killed: int, difficulty: str):
-    """Save a high score to the database."""
-    if not name or not name.strip():
-        name = "Anonymous"
-    conn = sqlite3.connect(HIGH_SCORES_DB)
-    conn.execute("""
-        INSERT INTO high_scores (player_name, score, waves_survived, time_survived, enemies_killed, difficulty, date_achieved)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (name.strip()[:20], score, waves, time_survived, enemies_killed, difficulty, datetime.now(timezone.utc).isoformat()))
-    conn.commit()
-    conn.close()
-
-
-def is_high_score(score: int) -> bool:
-    """Check if a score qualifies for the high score board (top 10)."""
-    scores = get_high_scores(10)
-    if len(scores) < 10:
-        return True
-    return score > scores[-1]["score"]
-
-
-def generate_wave_beam_points(start_pos: pygame.Vector2, direction: pygame.Vector2, pattern: str, length: int, amplitude: float = 50.0, frequency: float = 0.02, time_offset: float = 0.0) -> list[pygame.Vector2]:
-    """Generate points along a wave pattern beam.
-    
-    Args:
-        start_pos: Starting position of the beam
-        direction: Normalized direction vector
-        pattern: Wave pattern type ("sine", "cosine", "tangent", etc.)
-        length: Length of the beam in pixels
-        amplitude: Amplitude of the wave (pixels)
-        frequency: Frequency of the wave (cycles per pixel)
-        time_offset: Time-based phase offset for undulation (in seconds)
-    
-    Returns:
-        List of points along the wave path
-    """
-    points = []
-    perp = pygame.Vector2(-direction.y, direction.x)  # Perpendicular vector for wave offset
-    
-    num_points = max(200, length // 5)  # Generate more points for smoother solid line
-    step = length / num_points
-    
-    # Undulation: 0.5 second period = 4 * pi radians per second (2 * pi / 0.5)
-    undulation_phase = time_offset * 4 * math.pi  # Phase offset for 0.5 second period
-    
-    for i in range(num_points + 1):
-        t = i * step
-        x = start_pos.x + direction.x * t
-        y = start_pos.y + direction.y * t
-        
-        # Calculate wave offset based on pattern with time-based undulation
-        wave_value = 0.0
-        angle = t * frequency * 2 * math.pi + undulation_phase
-        
-        if pattern == "sine":
-            wave_value = math.sin(angle)
-        elif pattern == "cosine":
-            wave_value = math.cos(angle)
-        elif pattern == "tangent":
-            # Clamp to prevent infinite values
-            wave_value = math.tan(angle)
-            wave_value = max(-10.0, min(10.0, wave_value))
-        elif pattern == "cotangent":
-            # Clamp to prevent infinite values
-            if abs(math.sin(angle)) > 0.01:
-                wave_value = math.cos(angle) / math.sin(angle)
-                wave_value = max(-10.0, min(10.0, wave_value))
-            else:
-                wave_value = 0.0
-        elif pattern == "secant":
-            # Clamp to prevent infinite values
-            if abs(math.cos(angle)) > 0.01:
-                wave_value = 1.0 / math.cos(angle)
-                wave_value = max(-10.0, min(10.0, wave_value))
-            else:
-                wave_value = 0.0
-        elif pattern == "cosecant":
-            # Clamp to prevent infinite values
-            if abs(math.sin(angle)) > 0.01:
-                wave_value = 1.0 / math.sin(angle)
-                wave_value = max(-10.0, min(10.0, wave_value))
-            else:
-                wave_value = 0.0
-        
-        # Apply wave offset perpendicular to direction
-        offset = perp * (wave_value * amplitude)
-        point = pygame.Vector2(x, y) + offset
-        points.append(point)
-    
-    return points
-
-
-def check_wave_beam_collision(points: list[pygame.Vector2], rect: pygame.Rect, width: int) -> tuple[pygame.Vector2 | None, float]:
-    """Check if a wave beam (represented by points) collides with a rectangle.
-    
-    Returns:
-        Tuple of (closest_hit_point, distance) or (None, infinity) if no collision
-    """
-    closest_hit = None
-    closest_dist = float('inf')
-    
-    # Check each segment of the beam
-    for i in range(len(points) - 1):
-        p1 = points[i]
-        p2 = points[i + 1]
-        
-        # Check if this segment intersects the rect
-        hit = line_rect_intersection(p1, p2, rect)
-        if hit:
-            dist = (hit - points[0]).length()
-            if dist < closest_dist:
-                closest_dist = dist
-                closest_hit = hit
-    
-    # Also check if any point is inside the rect (for thick beams)
-    for point in points:
-        if rect.collidepoint(point.x, point.y):
-            dist = (point - points[0]).length()
-            if dist < closest_dist:
-                closest_dist = dist
-                closest_hit = point
-    
-    return (closest_hit, closest_dist)
-
-
 def spawn_pickup(pickup_type: str, state: GameState):
     """Spawn a pickup at a non-overlapping position. Uses state.level for geometry when available."""
     size = (64, 64)
@@ -1999,10 +1901,11 @@ def create_pickup_collection_effect(x: int, y: int, color: tuple[int, int, int],
 def spawn_player_bullet_and_log(state: GameState, ctx: AppContext):
     if state.player_rect is None:
         return
+    source = ctx.input_source or LIVE_INPUT
     # Determine aiming direction based on aiming mode
     if ctx.config.aim_mode == AIM_ARROWS:
         # Arrow key aiming
-        keys = pygame.key.get_pressed()
+        keys = source.get_pressed()
         dx = 0
         dy = 0
         if keys[pygame.K_LEFT]:
@@ -2029,90 +1932,28 @@ def spawn_player_bullet_and_log(state: GameState, ctx: AppContext):
         my = int(state.player_rect.centery + base_dir.y * target_dist)
     else:
         # Mouse aiming (default)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = source.get_mouse_pos()
         base_dir = vec_toward(state.player_rect.centerx, state.player_rect.centery, mx, my)
 
     shape = player_bullet_shapes[state.player_bullet_shape_index % len(player_bullet_shapes)]
     state.player_bullet_shape_index = (state.player_bullet_shape_index + 1) % len(player_bullet_shapes)
 
-    # Resolve weapon params from data-driven def when available, else WEAPON_CONFIGS
-    from config.projectile_defs import get_projectile_def
-    weapon_mode = state.current_weapon_mode
-    pd = get_projectile_def("player_" + weapon_mode) if weapon_mode != "laser" else None
-    if pd:
-        base_speed = pd["speed"]
-        base_size = pd["size"]
-        weapon_config = {
-            "damage_multiplier": pd["damage_multiplier"],
-            "size_multiplier": pd["size_multiplier"],
-            "speed_multiplier": 1.0,
-            "spread_angle_deg": pd["spread_angle_deg"],
-            "num_projectiles": pd["num_projectiles"],
-            "color": pd["color"],
-            "explosion_radius": pd["explosion_radius"],
-            "max_bounces": pd["max_bounces"],
-            "is_rocket": pd["is_rocket"],
-        }
-    else:
-        weapon_config = WEAPON_CONFIGS.get(weapon_mode, WEAPON_CONFIGS["basic"])
-        base_speed = player_bullet_speed * weapon_config["speed_multiplier"]
-        base_size = player_bullet_size
-
-    # Determine shot pattern based on weapon mode
-    if weapon_config["num_projectiles"] > 1:
-        # Multi-projectile weapons (triple, basic)
-        spread_angle_deg = weapon_config["spread_angle_deg"]
-        directions = [
-            base_dir,  # center
-            base_dir.rotate(-spread_angle_deg),  # left
-            base_dir.rotate(spread_angle_deg),  # right
-        ]
-    else:
-        directions = [base_dir]
-
-    # Spawn bullets for each direction
-    for d in directions:
-        # Apply stat multipliers and weapon-specific multipliers
-        size_mult = state.player_stat_multipliers["bullet_size"] * weapon_config["size_multiplier"]
-        effective_size = (
-            int(base_size[0] * size_mult),
-            int(base_size[1] * size_mult),
-        )
-        effective_speed = base_speed * state.player_stat_multipliers["bullet_speed"]
-        base_damage = int(state.player_bullet_damage * state.player_stat_multipliers["bullet_damage"])
-        # Apply weapon damage multiplier
-        effective_damage = int(base_damage * weapon_config["damage_multiplier"])
-        # Unlocked-weapon shots deal 1.75x damage
-        if state.current_weapon_mode in state.unlocked_weapons:
-            effective_damage = int(effective_damage * UNLOCKED_WEAPON_DAMAGE_MULT)
-        
-        # Apply random damage multiplier (from random_damage pickup)
-        effective_damage = int(effective_damage * state.random_damage_multiplier)
-        
-        # Rocket launcher: always has explosion
-        if weapon_config["is_rocket"]:
-            rocket_explosion = max(weapon_config["explosion_radius"], state.player_stat_multipliers["bullet_explosion_radius"] + 100.0)
-        else:
-            rocket_explosion = max(weapon_config["explosion_radius"], state.player_stat_multipliers["bullet_explosion_radius"])
-
-    r = pygame.Rect(
-        state.player_rect.centerx - effective_size[0] // 2,
-        state.player_rect.centery - effective_size[1] // 2,
-        effective_size[0],
-        effective_size[1],
-    )
-    state.player_bullets.append({
-        "rect": r,
-        "vel": d * effective_speed,
-        "shape": shape,
-        "color": weapon_config.get("color", player_bullets_color),  # Use weapon color from config
-            "damage": effective_damage,
-                "penetration": int(state.player_stat_multipliers["bullet_penetration"]),
-                "explosion_radius": rocket_explosion,
-                "knockback": state.player_stat_multipliers["bullet_knockback"],
-                "bounces": weapon_config["max_bounces"],  # Max bounces from config
-                "is_rocket": weapon_config["is_rocket"],
-            })
+    # Weapon def, stat multipliers and damage bonuses are resolved once per weapon/stat set (fire_profiles)
+    profile = fire_profile(state)
+    fields = profile.bullet_fields
+    w, h = profile.size
+    x = state.player_rect.centerx - w // 2
+    y = state.player_rect.centery - h // 2
+    speed = profile.speed
+    # One bullet per shot, along the last spread direction (right, for triple/basic): the shot has always
+    # emitted only that one, and balance and telemetry baselines are built on it
+    for angle in profile.spread_deg[-1:]:
+        d = base_dir.rotate(angle) if angle else base_dir
+        bullet = dict(fields)
+        bullet["rect"] = pygame.Rect(x, y, w, h)
+        bullet["vel"] = d * speed
+        bullet["shape"] = shape
+        state.player_bullets.append(bullet)
     state.shots_fired += 1
 
     if ctx.config.enable_telemetry and ctx.telemetry_client:
@@ -2177,7 +2018,7 @@ def spawn_enemy_projectile(enemy: dict, state: GameState, telemetry_client=None,
     bounces = enemy.get("bouncing_projectiles", False)
     
     proj_damage = enemy.get("flame_damage", enemy.get("damage", 10))
-    state.enemy_projectiles.append({
+    add_child(state.enemy_projectiles, {
         "rect": r,
         "vel": d * enemy["projectile_speed"],
         "enemy_type": enemy["type"],
@@ -2185,7 +2026,7 @@ def spawn_enemy_projectile(enemy: dict, state: GameState, telemetry_client=None,
         "shape": proj_shape,
         "bounces": 10 if bounces else 0,
         "damage": proj_damage,
-    })
+    }, enemy)
     
     # Log enemy projectile metadata
     if telemetry_enabled and telemetry_client:
@@ -2216,7 +2057,7 @@ def spawn_enemy_projectile_predictive(enemy: dict, direction: pygame.Vector2, st
     )
     proj_color = enemy.get("projectile_color", default_color)
     proj_shape = enemy.get("projectile_shape", "diamond")  # Rhomboid shape
-    state.enemy_projectiles.append({
+    add_child(state.enemy_projectiles, {
         "rect": r,
         "vel": direction * enemy["projectile_speed"],
         "enemy_type": enemy["type"],
@@ -2224,7 +2065,7 @@ def spawn_enemy_projectile_predictive(enemy: dict, direction: pygame.Vector2, st
         "shape": proj_shape,
         "bounces": 0,
         "lifetime": 5.0,  # Projectiles disappear after 5 seconds to prevent lingering
-    })
+    }, enemy)
 
 
 def spawn_boss_projectile(boss: dict, direction: pygame.Vector2, state: GameState):
@@ -2241,7 +2082,8 @@ def spawn_boss_projectile(boss: dict, direction: pygame.Vector2, state: GameStat
     )
     proj_color = boss.get("projectile_color", default_color)
     proj_shape = boss.get("projectile_shape", "circle")
-    state.enemy_projectiles.append(
+    add_child(
+        state.enemy_projectiles,
         {
             "rect": r,
             "vel": direction * boss["projectile_speed"],
@@ -2250,7 +2092,8 @@ def spawn_boss_projectile(boss: dict, direction: pygame.Vector2, state: GameStat
             "shape": proj_shape,
             "bounces": 0,
             "lifetime": 5.0,  # Boss projectiles disappear after 5 seconds to prevent lingering
-        }
+        },
+        boss,
     )
 
 
@@ -2291,14 +2134,12 @@ def kill_enemy(enemy: dict, state: GameState, width: int, height: int, event_bus
         for spawned_enemy in state.enemies[:]:
             if spawned_enemy.get("spawned_by") is enemy:
                 # Recursively kill spawned enemy (but don't drop weapons for spawned enemies)
-                spawned_enemy_type = spawned_enemy.get("type", "enemy")
-                # Remove projectiles
-                for proj in state.enemy_projectiles[:]:
-                    if proj.get("enemy_type") == spawned_enemy_type:
-                        state.enemy_projectiles.remove(proj)
+                # Remove its projectiles
+                remove_children(state.enemy_projectiles, spawned_enemy, OWNED_PROJECTILES)
                 # Remove from list
                 try:
                     state.enemies.remove(spawned_enemy)
+                    note_enemy_removed(state, spawned_enemy)
                 except ValueError:
                     pass
                 state.enemies_killed += 1
@@ -2311,23 +2152,10 @@ def kill_enemy(enemy: dict, state: GameState, width: int, height: int, event_bus
         "timer": 3.0,  # Display for 3 seconds
     })
     
-    # Remove projectiles and damage numbers associated with this dead enemy
-    enemy_pos = pygame.Vector2(enemy["rect"].center)
-    cleanup_radius_sq = 2500  # 50 pixels squared - damage numbers within this range are removed
-    
-    # Remove ALL enemy projectiles from this dead enemy (by matching enemy_type)
-    # This ensures projectiles are removed regardless of distance when enemy dies
-    for proj in state.enemy_projectiles[:]:
-        # Remove if projectile matches this enemy's type
-        # This removes all projectiles from this enemy, even if they've traveled far
-        if proj.get("enemy_type") == enemy_type:
-            state.enemy_projectiles.remove(proj)
-    
-    # Remove damage numbers near the dead enemy's position
-    for dmg_num in state.damage_numbers[:]:
-        dmg_pos = pygame.Vector2(dmg_num["x"], dmg_num["y"])
-        if (dmg_pos - enemy_pos).length_squared() < cleanup_radius_sq:
-            state.damage_numbers.remove(dmg_num)
+    # Remove ALL projectiles this enemy fired (even if they've traveled far) and the damage numbers shown
+    # on it; the owner index (systems.owner_index) lists them, so neither list is scanned
+    remove_children(state.enemy_projectiles, enemy, OWNED_PROJECTILES)
+    remove_children(state.damage_numbers, enemy, OWNED_DAMAGE_NUMBERS)
     
     # If boss is killed, spawn level completion weapon in center
     if is_boss:
@@ -2343,6 +2171,7 @@ def kill_enemy(enemy: dict, state: GameState, width: int, height: int, event_bus
     
     try:
         state.enemies.remove(enemy)
+        note_enemy_removed(state, enemy)
     except ValueError:
         pass  # Already removed
     score_delta = calculate_kill_score(state.wave_number, state.run_time)
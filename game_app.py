@@ -6,14 +6,20 @@ from __future__ import annotations
 
 import pygame
 
+from input_source import LIVE_INPUT, RecordingInput
+from step_controller import make_step_controller
+
 
 class GameApp:
     """Owns game state, context/config, scene stack, and the Pygame main loop."""
 
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False, input_source=None) -> None:
+        """headless: skip interactive/audio setup (replays). input_source: overrides ctx.input_source."""
         # Import here to avoid circular import (game imports GameApp, GameApp uses game)
         import game as game_module
-        r = game_module._create_app()
+        r = game_module._create_app(headless=headless)
+        if input_source is not None:
+            r.ctx.input_source = input_source
         self.ctx = r.ctx
         self.game_state = r.game_state
         self.scene_stack = r.scene_stack
@@ -22,6 +28,7 @@ class GameApp:
         self.max_sim_steps = r.max_sim_steps
         self.update_simulation = r.update_simulation
         self.simulation_accumulator = r.simulation_accumulator
+        self.step_controller = r.step_controller  # Overload policy; metrics in step_controller.metrics
         
         # Create reusable screen_ctx once (only update mutable values per frame)
         self.screen_ctx = {
@@ -52,6 +59,20 @@ class GameApp:
         # Store events from process_events() for use in update()
         self._current_events: list = []
 
+    def use_step_policy(self, policy: str) -> None:
+        """Replace the step controller (replays and batch runs force clamp_drop: adaptive steps follow wall-clock cost)."""
+        self.ctx.config.step_policy = policy
+        self.step_controller = make_step_controller(policy, self.max_sim_steps, 1.0 / self.fps)
+
+    def run_in_progress(self) -> bool:
+        """True while update() plays gameplay frames: PLAYING/ENDURANCE is current and the run has not
+        ended (game over and victory set game_state.current_screen before the scene stack follows)."""
+        import game as game_module
+        from constants import RUN_OVER_SCREENS, STATE_ENDURANCE, STATE_PLAYING
+
+        current_state = game_module._get_current_state(self.scene_stack) or self.game_state.current_screen
+        return current_state in (STATE_PLAYING, STATE_ENDURANCE) and self.game_state.current_screen not in RUN_OVER_SCREENS
+
     def process_events(self) -> bool:
         """Process all input events. Returns False if the game should stop running."""
         import game as game_module
@@ -80,7 +101,7 @@ class GameApp:
     def update(self, dt: float) -> bool:
         """Run simulation updates. Returns False if the game should stop running."""
         import game as game_module
-        from constants import STATE_PLAYING, STATE_ENDURANCE
+        from constants import RUN_OVER_SCREENS, STATE_PLAYING, STATE_ENDURANCE
         
         # Update run time
         self.game_state.run_time += dt
@@ -89,8 +110,15 @@ class GameApp:
         # Game state updates (only when playing)
         current_state = game_module._get_current_state(self.scene_stack) or self.game_state.current_screen
         if current_state == STATE_PLAYING or current_state == STATE_ENDURANCE:
+            # Gameplay input source (live, recording or replay); a recording starts its own seeded run
+            source = self.ctx.input_source or LIVE_INPUT
+            if isinstance(source, RecordingInput) and not source.started:
+                game_module._start_seeded_run(self.ctx, self.game_state, self.scene_stack, source.seed)
+                source.start(self.game_state, self.ctx.config.aim_mode)
+            events = source.begin_frame(dt, self._current_events)
+
             # Get key state once per frame (used by multiple systems)
-            keys_pressed = pygame.key.get_pressed()
+            keys_pressed = source.get_pressed()
             
             # Gameplay input: movement, fire, weapons, abilities (handled in input_system)
             def _try_spawn_bullet():
@@ -125,7 +153,7 @@ class GameApp:
                     else:
                         direction = pygame.Vector2(dx, dy).normalize()
                 else:
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = source.get_mouse_pos()
                     direction = vec_toward(pl.centerx, pl.centery, mx, my)
                 end_pos = pygame.Vector2(pl.center) + direction * laser_length
                 laser_dmg = int(laser_damage * UNLOCKED_WEAPON_DAMAGE_MULT) if "laser" in self.game_state.unlocked_weapons else laser_damage
@@ -136,9 +164,8 @@ class GameApp:
                 self.game_state.laser_time_since_shot = 0.0
 
             # Get events for gameplay input (movement, abilities, etc.)
-            # Use events from process_events() (stored in self._current_events)
+            # Events come from process_events() (self._current_events), passed through the input source above
             # Note: handle_gameplay_input will call _try_spawn_bullet and _try_laser via callbacks
-            events = self._current_events
             from systems.input_system import handle_gameplay_input
             from constants import (
                 overshield_recharge_cooldown, shield_duration, grenade_cooldown,
@@ -163,17 +190,21 @@ class GameApp:
                 "boost_regen_per_s": boost_regen_per_s,
                 "boost_speed_mult": boost_speed_mult,
                 "slow_speed_mult": slow_speed_mult,
+                "input_source": source,
             }
             handle_gameplay_input(events, self.game_state, gameplay_input_ctx)
 
             # Fixed-step simulation: run one or more steps with FIXED_DT
             self.simulation_accumulator, should_quit = game_module._step_simulation(
                 self.simulation_accumulator, dt, self.fixed_dt, self.max_sim_steps,
-                self.update_simulation, self.ctx, self.game_state, self.scene_stack, self.screen_ctx
+                self.update_simulation, self.ctx, self.game_state, self.scene_stack, self.screen_ctx,
+                self.step_controller,
             )
             if should_quit:
                 return False
-            # Optional: for future render interpolation (smooth between steps)
+            if self.game_state.current_screen in RUN_OVER_SCREENS:
+                game_module._finish_input_recording(self.ctx)  # A recording covers one seeded run
+            # Fraction of a step left in the accumulator; renderers lerp rects by it (rendering/interpolation.py)
             setattr(self.game_state, "simulation_interpolation", self.simulation_accumulator / self.fixed_dt if self.fixed_dt else 0.0)
             # Only update telemetry if enabled (function already has guard, but avoid call overhead)
             if self.telemetry_enabled:
@@ -240,4 +271,6 @@ class GameApp:
             raise
         
         finally:
+            if self.ctx.input_source is not None:
+                self.ctx.input_source.close()
             game_module._handle_exit(self.ctx, self.game_state)
@@ -5,16 +5,14 @@ the main module focused on orchestration, loop, and scene flow.
 from __future__ import annotations
 
 import math
-import sqlite3
-from datetime import datetime, timezone
 
 from constants import (
-    HIGH_SCORES_DB,
     PICKUP_LIFETIME,
     SCORE_BASE_POINTS,
     SCORE_TIME_MULTIPLIER,
     SCORE_WAVE_MULTIPLIER,
 )
+from high_score_store import get_store
 from state import GameState
 
 
@@ -62,70 +60,25 @@ def update_pickup_effects(dt: float, state: GameState) -> None:
 
 
 def init_high_scores_db() -> None:
-    """Initialize the high scores database."""
-    conn = sqlite3.connect(HIGH_SCORES_DB)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS high_scores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_name TEXT NOT NULL,
-            score INTEGER NOT NULL,
-            waves_survived INTEGER NOT NULL,
-            time_survived REAL NOT NULL,
-            enemies_killed INTEGER NOT NULL,
-            difficulty TEXT NOT NULL,
-            date_achieved TEXT NOT NULL
-        );
-    """)
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_score ON high_scores(score DESC);")
-    conn.commit()
-    conn.close()
+    """Initialize the high scores database (opens the shared HighScoreStore)."""
+    get_store()
 
 
 def get_high_scores(limit: int = 10) -> list[dict]:
-    """Get top high scores from database."""
-    conn = sqlite3.connect(HIGH_SCORES_DB)
-    cursor = conn.execute("""
-        SELECT player_name, score, waves_survived, time_survived, enemies_killed, difficulty, date_achieved
-        FROM high_scores
-        ORDER BY score DESC
-        LIMIT ?
-    """, (limit,))
-    scores = []
-    for row in cursor.fetchall():
-        scores.append({
-            "name": row[0],
-            "score": row[1],
-            "waves": row[2],
-            "time": row[3],
-            "kills": row[4],
-            "difficulty": row[5],
-            "date": row[6]
-        })
-    conn.close()
-    return scores
+    """Get top high scores (served from the store's cached board)."""
+    return get_store().get_high_scores(limit)
 
 
 def save_high_score(
     name: str, score: int, waves: int, time_survived: float, enemies_killed: int, difficulty: str
 ) -> None:
     """Save a high score to the database."""
-    if not name or not name.strip():
-        name = "Anonymous"
-    conn = sqlite3.connect(HIGH_SCORES_DB)
-    conn.execute("""
-        INSERT INTO high_scores (player_name, score, waves_survived, time_survived, enemies_killed, difficulty, date_achieved)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (name.strip()[:20], score, waves, time_survived, enemies_killed, difficulty, datetime.now(timezone.utc).isoformat()))
-    conn.commit()
-    conn.close()
+    get_store().save_high_score(name, score, waves, time_survived, enemies_killed, difficulty)
 
 
 def is_high_score(score: int) -> bool:
     """Check if a score qualifies for the high score board (top 10)."""
-    scores = get_high_scores(10)
-    if len(scores) < 10:
-        return True
-    return score > scores[-1]["score"]
+    return get_store().is_high_score(score)
 
 
 def calculate_kill_score(wave_num: int, run_time: float) -> int:
@@ -1,10 +1,18 @@
 """Rotating paraboloid/trapezoid hazard system. Used by game.py for collision and rendering."""
 from __future__ import annotations
 
+import copy
 import math
+from typing import Sequence
 
 import pygame
 
+# Optional NumPy for batched point-in-polygon; pure-Python ray casts are used when unavailable.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Design-time dimensions for initial hazard layout (same as game default)
 _WIDTH = 1920
 _HEIGHT = 1080
@@ -82,6 +90,16 @@ hazard_obstacles: list[dict] = [
     },
 ]
 
+# Layout at import time; hazards move in place during play (see reset_hazard_obstacles)
+_INITIAL_HAZARD_OBSTACLES: list[dict] = copy.deepcopy(hazard_obstacles)
+
+
+def reset_hazard_obstacles() -> None:
+    """Put the module hazards back to their initial layout, keeping the list and dict objects."""
+    for hazard, initial in zip(hazard_obstacles, _INITIAL_HAZARD_OBSTACLES):
+        hazard.clear()
+        hazard.update(copy.deepcopy(initial))
+
 
 def generate_paraboloid_points(center: pygame.Vector2, width: float, height: float, rotation: float) -> list[pygame.Vector2]:
     """Generate points for a paraboloid shape (parabolic curve in 2D)."""
@@ -127,6 +145,91 @@ def generate_trapezoid_points(center: pygame.Vector2, width: float, height: floa
     return points
 
 
+# Local-space (unrotated, centered) polygons keyed by (shape, width, height). Same sample values as the
+# generators above, so transforming them with the same formula yields identical points.
+PARABOLOID_SEGMENTS = 100
+_local_shape_cache: dict[tuple[str, float, float], tuple[tuple[float, float], ...]] = {}
+
+
+def get_local_hazard_shape(shape: str, width: float, height: float) -> tuple[tuple[float, float], ...]:
+    """Return the cached local-space polygon for a hazard shape."""
+    key = (shape, width, height)
+    local = _local_shape_cache.get(key)
+    if local is None:
+        if shape == "trapezoid":
+            top_width = width * 0.6
+            local = (
+                (-top_width / 2, -height / 2),
+                (top_width / 2, -height / 2),
+                (width / 2, height / 2),
+                (-width / 2, height / 2),
+            )
+        else:
+            pts = []
+            for i in range(PARABOLOID_SEGMENTS + 1):
+                t = (i / PARABOLOID_SEGMENTS) * 2.0 - 1.0
+                pts.append((t * (width / 2), (t ** 2) * (height / 2)))
+            local = tuple(pts)
+        _local_shape_cache[key] = local
+    return local
+
+
+def _paraboloid_extreme_indices(lin: float, quad: float) -> tuple[int, ...]:
+    """Sample indices that can hold the min/max of lin*t + quad*t^2 over the sampled t in [-1, 1]."""
+    n = PARABOLOID_SEGMENTS
+    if quad == 0.0:
+        return (0, n)
+    t_vertex = -lin / (2.0 * quad)
+    if t_vertex <= -1.0 or t_vertex >= 1.0:
+        return (0, n)
+    i = int((t_vertex + 1.0) * 0.5 * n)
+    return (0, n, i, min(n, i + 1))
+
+
+def _hazard_bounds(shape: str, width: float, height: float, local, cx: float, cy: float,
+                   cos_r: float, sin_r: float) -> pygame.Rect:
+    """Bounding rect of the transformed polygon without scanning every point.
+
+    Trapezoid: the 4 vertices. Paraboloid: each world axis is a quadratic in t, so its extremes over the
+    samples lie at the ends or at the two samples around the vertex; evaluating those gives the same
+    min/max as scanning all points.
+    """
+    if shape == "trapezoid":
+        xs_idx = ys_idx = range(len(local))
+    else:
+        xs_idx = _paraboloid_extreme_indices((width / 2) * cos_r, -(height / 2) * sin_r)
+        ys_idx = _paraboloid_extreme_indices((width / 2) * sin_r, (height / 2) * cos_r)
+    xs = [cx + (local[i][0] * cos_r - local[i][1] * sin_r) for i in xs_idx]
+    ys = [cy + (local[i][0] * sin_r + local[i][1] * cos_r) for i in ys_idx]
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+
+
+def update_hazard_geometry(hazard: dict) -> None:
+    """Refresh hazard["points"] and hazard["bounding_rect"] from the cached local shape.
+
+    Skipped entirely when shape, size, center and rotation are unchanged since the last call.
+    """
+    shape = hazard["shape"]
+    width = hazard["width"]
+    height = hazard["height"]
+    center = hazard["center"]
+    rotation = hazard["rotation_angle"]
+    pose = (shape, width, height, center.x, center.y, rotation)
+    if hazard.get("_geometry_pose") == pose and hazard.get("points"):
+        return
+    local = get_local_hazard_shape(shape, width, height)
+    cos_r = math.cos(rotation)
+    sin_r = math.sin(rotation)
+    cx, cy = center.x, center.y
+    hazard["points"] = [
+        pygame.Vector2(cx + (x * cos_r - y * sin_r), cy + (x * sin_r + y * cos_r)) for x, y in local
+    ]
+    hazard["bounding_rect"] = _hazard_bounds(shape, width, height, local, cx, cy, cos_r, sin_r)
+    hazard["_geometry_pose"] = pose
+
+
 def check_point_in_hazard(point: pygame.Vector2, hazard_points: list[pygame.Vector2], bounding_rect: pygame.Rect) -> bool:
     """Check if a point is inside the hazard shape (paraboloid or trapezoid). Uses point-in-polygon algorithm."""
     if not bounding_rect.collidepoint(point.x, point.y):
@@ -153,11 +256,99 @@ def check_point_in_hazard(point: pygame.Vector2, hazard_points: list[pygame.Vect
     return inside
 
 
+def _hazard_edge_arrays(hazard: dict):
+    """Polygon edges as NumPy arrays (p1x, p1y, p2x, p2y), cached until the geometry pose changes."""
+    pose = hazard.get("_geometry_pose")
+    cached = hazard.get("_edge_arrays")
+    if cached is not None and pose is not None and cached[0] == pose:
+        return cached[1]
+    pts = np.array([(p.x, p.y) for p in hazard["points"]], dtype=np.float64)
+    nxt = np.roll(pts, -1, axis=0)
+    edges = (pts[:, 0], pts[:, 1], nxt[:, 0], nxt[:, 1])
+    hazard["_edge_arrays"] = (pose, edges)
+    return edges
+
+
+def _points_in_polygon_np(xs, ys, edges):
+    """Vectorized form of check_point_in_hazard's ray cast (same comparisons, same arithmetic)."""
+    p1x, p1y, p2x, p2y = (e[None, :] for e in edges)
+    x = xs[:, None]
+    y = ys[:, None]
+    span = (y > np.minimum(p1y, p2y)) & (y <= np.maximum(p1y, p2y)) & (x <= np.maximum(p1x, p2x))
+    dy = np.where(p1y != p2y, p2y - p1y, 1.0)
+    xinters = (y - p1y) * (p2x - p1x) / dy + p1x
+    crossings = span & ((p1x == p2x) | (x <= xinters))
+    return (np.count_nonzero(crossings, axis=1) & 1).astype(bool)
+
+
+def points_in_hazards(points: Sequence[tuple[float, float]], hazard_list: list) -> list[list[int]]:
+    """Batch hazard membership: for each hazard (same order), the indices of points inside it.
+
+    Points are pre-filtered by each hazard's bounding rect; survivors are ray-cast in one NumPy
+    pass per hazard (or with check_point_in_hazard when NumPy is not installed).
+    """
+    result: list[list[int]] = [[] for _ in hazard_list]
+    if not points:
+        return result
+    if np is not None:
+        arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        all_x = arr[:, 0]
+        all_y = arr[:, 1]
+    for h_idx, hazard in enumerate(hazard_list):
+        pts = hazard.get("points")
+        if not pts or len(pts) < 3:
+            continue
+        br = hazard["bounding_rect"]
+        if np is None:
+            result[h_idx] = [
+                i for i, (x, y) in enumerate(points)
+                if check_point_in_hazard(pygame.Vector2(x, y), pts, br)
+            ]
+            continue
+        in_rect = (all_x >= br.left) & (all_x < br.right) & (all_y >= br.top) & (all_y < br.bottom)
+        candidates = np.flatnonzero(in_rect)
+        if candidates.size == 0:
+            continue
+        inside = _points_in_polygon_np(all_x[candidates], all_y[candidates], _hazard_edge_arrays(hazard))
+        result[h_idx] = candidates[inside].tolist()
+    return result
+
+
 def check_hazard_collision(hazard1: dict, hazard2: dict) -> bool:
     """Check if two hazards are colliding based on their bounding rectangles."""
     return hazard1["bounding_rect"].colliderect(hazard2["bounding_rect"])
 
 
+# Below this many hazards every pair is a candidate; sorting costs more than it prunes.
+SWEEP_AND_PRUNE_MIN_HAZARDS = 12
+
+
+def hazard_candidate_pairs(hazard_list: list) -> list[tuple[int, int]]:
+    """Sweep-and-prune broadphase over bounding rects. Returns index pairs (i < j), sorted.
+
+    Rects are swept along x; a rect leaves the active set once its right edge is at or before the
+    current left edge, and pairs still active are only emitted when they also overlap on y.
+    """
+    n = len(hazard_list)
+    if n < SWEEP_AND_PRUNE_MIN_HAZARDS:
+        return [(i, j) for i in range(n) for j in range(i + 1, n)]
+    rects = [h["bounding_rect"] for h in hazard_list]
+    order = sorted(range(len(rects)), key=lambda i: rects[i].left)
+    active: list[int] = []
+    pairs: list[tuple[int, int]] = []
+    for i in order:
+        r = rects[i]
+        left, top, bottom = r.left, r.top, r.bottom
+        active = [j for j in active if rects[j].right > left]
+        for j in active:
+            o = rects[j]
+            if o.top < bottom and top < o.bottom:
+                pairs.append((j, i) if j < i else (i, j))
+        active.append(i)
+    pairs.sort()
+    return pairs
+
+
 def resolve_hazard_collision(hazard1: dict, hazard2: dict) -> None:
     """Resolve collision between two hazards - make them bounce off each other."""
     center1 = hazard1["center"]
@@ -223,33 +414,10 @@ def update_hazard_obstacles(dt: float, hazard_list: list, current_lvl: int, widt
             hazard["center"].y = height - hazard["height"] // 2
             hazard["velocity"].y = -abs(hazard["velocity"].y)
 
-        if hazard["shape"] == "trapezoid":
-            hazard["points"] = generate_trapezoid_points(
-                hazard["center"],
-                hazard["width"],
-                hazard["height"],
-                hazard["rotation_angle"]
-            )
-        else:
-            hazard["points"] = generate_paraboloid_points(
-                hazard["center"],
-                hazard["width"],
-                hazard["height"],
-                hazard["rotation_angle"]
-            )
-
-        if hazard["points"]:
-            min_x = min(p.x for p in hazard["points"])
-            max_x = max(p.x for p in hazard["points"])
-            min_y = min(p.y for p in hazard["points"])
-            max_y = max(p.y for p in hazard["points"])
-            hazard["bounding_rect"] = pygame.Rect(
-                min_x, min_y,
-                max_x - min_x,
-                max_y - min_y
-            )
+        update_hazard_geometry(hazard)
 
-    for i in range(len(hazard_list)):
-        for j in range(i + 1, len(hazard_list)):
-            if check_hazard_collision(hazard_list[i], hazard_list[j]):
-                resolve_hazard_collision(hazard_list[i], hazard_list[j])
+    # Broadphase candidates come back in the same (i, j) order as the old pairwise loop, so bounce
+    # resolution (which chains velocity changes) is unchanged.
+    for i, j in hazard_candidate_pairs(hazard_list):
+        if check_hazard_collision(hazard_list[i], hazard_list[j]):
+            resolve_hazard_collision(hazard_list[i], hazard_list[j])
@@ -0,0 +1,140 @@
+"""
+Persistent high-score store: one SQLite connection (WAL) plus an in-memory sorted top-N cache.
+Qualification checks are a bisect over the cached scores; the cache is reloaded only when another
+connection/process has committed (PRAGMA data_version changed).
+"""
+from __future__ import annotations
+
+import bisect
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional
+
+from constants import HIGH_SCORES_DB
+
+HIGH_SCORE_BOARD_SIZE = 10
+
+_SELECT_TOP = """
+    SELECT player_name, score, waves_survived, time_survived, enemies_killed, difficulty, date_achieved
+    FROM high_scores
+    ORDER BY score DESC, id ASC
+    LIMIT ?
+"""
+
+
+def _row_to_entry(row: tuple) -> dict:
+    return {
+        "name": row[0],
+        "score": row[1],
+        "waves": row[2],
+        "time": row[3],
+        "kills": row[4],
+        "difficulty": row[5],
+        "date": row[6],
+    }
+
+
+class HighScoreStore:
+    """High scores table with a cached, descending top-N list."""
+
+    def __init__(self, db_path: str = HIGH_SCORES_DB, capacity: int = HIGH_SCORE_BOARD_SIZE):
+        self.db_path = db_path
+        self.capacity = int(capacity)
+        self.conn = sqlite3.connect(self.db_path, timeout=5.0)
+        self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.execute("PRAGMA synchronous = NORMAL;")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS high_scores (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_name TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                waves_survived INTEGER NOT NULL,
+                time_survived REAL NOT NULL,
+                enemies_killed INTEGER NOT NULL,
+                difficulty TEXT NOT NULL,
+                date_achieved TEXT NOT NULL
+            );
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_score ON high_scores(score DESC);")
+        self.conn.commit()
+
+        self._top: list[dict] = []
+        self._neg_scores: list[int] = []  # -score, ascending (parallel to _top) for bisect
+        self._data_version: Optional[int] = None
+        self._reload()
+
+    def _current_data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version;").fetchone()[0]
+
+    def _reload(self) -> None:
+        rows = self.conn.execute(_SELECT_TOP, (self.capacity,)).fetchall()
+        self._top = [_row_to_entry(r) for r in rows]
+        self._neg_scores = [-e["score"] for e in self._top]
+        self._data_version = self._current_data_version()
+
+    def _sync(self) -> None:
+        """Reload the cache if another connection has committed since we last looked."""
+        if self._current_data_version() != self._data_version:
+            self._reload()
+
+    def get_high_scores(self, limit: Optional[int] = None) -> list[dict]:
+        """Top scores, best first (default: the whole board). Served from the cache when limit fits in it."""
+        if limit is None:
+            limit = self.capacity
+        self._sync()
+        if limit > self.capacity:
+            return [_row_to_entry(r) for r in self.conn.execute(_SELECT_TOP, (limit,)).fetchall()]
+        return [dict(e) for e in self._top[:limit]]
+
+    def rank(self, score: int) -> int:
+        """0-based board position a new score would take (ties rank below existing entries)."""
+        self._sync()
+        return bisect.bisect_right(self._neg_scores, -int(score))
+
+    def is_high_score(self, score: int) -> bool:
+        """Check if a score qualifies for the board (top capacity)."""
+        return self.rank(score) < self.capacity
+
+    def save_high_score(
+        self, name: str, score: int, waves: int, time_survived: float, enemies_killed: int, difficulty: str
+    ) -> None:
+        """Insert a score and update the cached board in place."""
+        if not name or not name.strip():
+            name = "Anonymous"
+        entry = {
+            "name": name.strip()[:20],
+            "score": int(score),
+            "waves": waves,
+            "time": time_survived,
+            "kills": enemies_killed,
+            "difficulty": difficulty,
+            "date": datetime.now(timezone.utc).isoformat(),
+        }
+        self._sync()
+        self.conn.execute("""
+            INSERT INTO high_scores (player_name, score, waves_survived, time_survived, enemies_killed, difficulty, date_achieved)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (entry["name"], entry["score"], waves, time_survived, enemies_killed, difficulty, entry["date"]))
+        self.conn.commit()
+        pos = bisect.bisect_right(self._neg_scores, -entry["score"])
+        if pos < self.capacity:
+            self._neg_scores.insert(pos, -entry["score"])
+            self._top.insert(pos, entry)
+            del self._neg_scores[self.capacity:]
+            del self._top[self.capacity:]
+        # Our own commit does not bump data_version, so the next _sync() only reloads if another
+        # process wrote in the meantime.
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+_default_store: Optional[HighScoreStore] = None
+
+
+def get_store() -> HighScoreStore:
+    """Process-wide store for HIGH_SCORES_DB, opened on first use."""
+    global _default_store
+    if _default_store is None:
+        _default_store = HighScoreStore()
+    return _default_store
@@ -0,0 +1,209 @@
+"""
+Input sources for gameplay: live pygame input, recording to a file, and replay from a file.
+
+Gameplay code (systems.input_system.handle_gameplay_input, game.spawn_player_bullet_and_log and
+GameApp's laser aim) reads keys and mouse through ctx.input_source instead of pygame directly.
+GameApp calls begin_frame(dt, events) once per gameplay frame; everything read until the next
+begin_frame belongs to that frame.
+
+Recording file (JSON lines, optionally gzip when the path ends in .gz):
+  line 1: header {"version", "seed", "aim_mode", "player": {...}} - what a replay needs to start
+          the same run (see game._start_seeded_run)
+  then one line per frame: [dt, [pressed keys queried this frame], mx, my, button_mask, events]
+  where events are [type, key_or_button, x, y] for KEYDOWN / MOUSEBUTTONDOWN.
+
+Only keys that gameplay actually queried (and found pressed) are stored, so frames stay small.
+Set GAME_RECORD_INPUT=<path> to record a session; replay with python -m benchmarks.replay_session.
+A recording covers one seeded run: it is closed when that run ends (game over, victory) or another
+run is started, and later runs are not recorded.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from typing import IO, Any, Optional
+
+import pygame
+
+RECORDING_VERSION = 1
+# GameState fields copied into the header so a replay starts with the same player stats
+RECORDED_PLAYER_FIELDS = (
+    "player_max_hp",
+    "player_hp",
+    "player_speed",
+    "player_bullet_damage",
+    "player_shoot_cooldown",
+    "lives",
+)
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class InputSource:
+    """Live pygame input (the default). Subclasses record or replay it."""
+
+    seed: Optional[int] = None  # Set on sources whose run must start from a known RNG seed
+
+    def begin_frame(self, dt: float, events: list) -> list:
+        """Start a gameplay frame. Returns the events gameplay should handle this frame."""
+        return events
+
+    def get_pressed(self) -> Any:
+        return pygame.key.get_pressed()
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return pygame.mouse.get_pos()
+
+    def get_mouse_pressed(self) -> tuple[bool, bool, bool]:
+        return pygame.mouse.get_pressed()
+
+    def close(self) -> None:
+        pass
+
+
+LIVE_INPUT = InputSource()
+
+
+class _RecordingKeys:
+    """Wraps pygame's key state; remembers which queried keys were pressed."""
+
+    __slots__ = ("_live", "pressed")
+
+    def __init__(self, live: Any):
+        self._live = live
+        self.pressed: set[int] = set()
+
+    def __getitem__(self, key: int) -> bool:
+        down = bool(self._live[key])
+        if down:
+            self.pressed.add(key)
+        return down
+
+
+class _ReplayKeys:
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed: frozenset):
+        self.pressed = pressed
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class RecordingInput(InputSource):
+    """Live input that also writes every gameplay frame to path."""
+
+    def __init__(self, path: str, seed: Optional[int] = None):
+        self.path = path
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(4), "little")
+        self.started = False
+        self._file: Optional[IO[str]] = None
+        self._frame: Optional[list] = None
+        self._keys: Optional[_RecordingKeys] = None
+        self._mouse_pos = (0, 0)
+        self._buttons = (False, False, False)
+
+    def start(self, state: Any, aim_mode: str) -> None:
+        """Write the header; call right after the seeded run has been set up."""
+        self._file = _open(self.path, "w")
+        header = {
+            "version": RECORDING_VERSION,
+            "seed": self.seed,
+            "aim_mode": aim_mode,
+            "player": {name: getattr(state, name) for name in RECORDED_PLAYER_FIELDS},
+        }
+        self._file.write(json.dumps(header) + "\n")
+        self.started = True
+
+    def _flush_frame(self) -> None:
+        if self._frame is not None and self._file is not None:
+            self._frame[1] = sorted(self._keys.pressed)
+            self._file.write(json.dumps(self._frame, separators=(",", ":")) + "\n")
+        self._frame = None
+
+    def begin_frame(self, dt: float, events: list) -> list:
+        self._flush_frame()
+        self._keys = _RecordingKeys(pygame.key.get_pressed())
+        self._mouse_pos = pygame.mouse.get_pos()
+        self._buttons = pygame.mouse.get_pressed()
+        mask = sum(1 << i for i, down in enumerate(self._buttons[:3]) if down)
+        recorded = []
+        for e in events:
+            if e.type == pygame.KEYDOWN:
+                recorded.append([e.type, e.key, 0, 0])
+            elif e.type == pygame.MOUSEBUTTONDOWN:
+                recorded.append([e.type, e.button, e.pos[0], e.pos[1]])
+        self._frame = [dt, None, self._mouse_pos[0], self._mouse_pos[1], mask, recorded]
+        return events
+
+    def get_pressed(self) -> Any:
+        return self._keys if self._keys is not None else pygame.key.get_pressed()
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return self._mouse_pos
+
+    def get_mouse_pressed(self) -> tuple[bool, bool, bool]:
+        return self._buttons
+
+    def close(self) -> None:
+        """Write the pending frame and close the file; frames after this are not recorded."""
+        self._flush_frame()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ReplayInput(InputSource):
+    """Plays back a recording frame by frame (no pygame input is read)."""
+
+    def __init__(self, path: str):
+        with _open(path, "r") as f:
+            lines = f.read().splitlines()
+        if not lines:
+            raise ValueError(f"empty input recording: {path}")
+        self.header = json.loads(lines[0])
+        if self.header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"unsupported input recording version: {self.header.get('version')}")
+        self.seed = self.header["seed"]
+        self.frames = [json.loads(line) for line in lines[1:] if line]
+        self.index = 0
+        self._keys = _ReplayKeys(frozenset())
+        self._mouse_pos = (0, 0)
+        self._buttons = (False, False, False)
+
+    @property
+    def done(self) -> bool:
+        return self.index >= len(self.frames)
+
+    @property
+    def next_dt(self) -> float:
+        """dt of the next frame to replay."""
+        return self.frames[self.index][0]
+
+    def begin_frame(self, dt: float, events: list) -> list:
+        dt, keys, mx, my, mask, recorded = self.frames[self.index]
+        self.index += 1
+        self._keys = _ReplayKeys(frozenset(keys))
+        self._mouse_pos = (mx, my)
+        self._buttons = (bool(mask & 1), bool(mask & 2), bool(mask & 4))
+        out = []
+        for etype, code, x, y in recorded:
+            if etype == pygame.KEYDOWN:
+                out.append(pygame.event.Event(etype, key=code))
+            else:
+                out.append(pygame.event.Event(etype, button=code, pos=(x, y)))
+        return out
+
+    def get_pressed(self) -> Any:
+        return self._keys
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return self._mouse_pos
+
+    def get_mouse_pressed(self) -> tuple[bool, bool, bool]:
+        return self._buttons
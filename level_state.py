@@ -21,3 +21,15 @@ class LevelState:
     super_giant_blocks: list[Any]
     hazard_obstacles: list[Any]
     moving_health_zone: Optional[dict[str, Any]] = None
+
+    def snapshot(self) -> Any:
+        """Detached copy of the geometry (see state_snapshot)."""
+        from state_snapshot import snapshot_level
+
+        return snapshot_level(self)
+
+    def restore(self, snap: Any) -> None:
+        """Restore geometry from snapshot() in place, without regenerating the level."""
+        from state_snapshot import restore_level
+
+        restore_level(self, snap)
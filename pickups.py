@@ -20,6 +20,7 @@ from constants import (
     PICKUP_BONUS_POINTS,
 )
 from config_weapons import WEAPON_NAMES, WEAPON_DISPLAY_COLORS
+from fire_profiles import note_stat_multipliers_changed
 from telemetry import PlayerActionEvent
 
 
@@ -57,41 +58,49 @@ def _apply_max_health_pickup(game_state: "GameState", ctx: "AppContext", pickup_
 def _apply_speed_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply speed pickup effect - increases speed multiplier by 0.15."""
     game_state.player_stat_multipliers["speed"] += 0.15
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_firerate_permanent_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply permanent fire rate pickup effect - capped at 2.0x to prevent performance issues."""
     game_state.player_stat_multipliers["firerate"] = min(2.0, game_state.player_stat_multipliers["firerate"] + 0.12)
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_bullet_size_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply bullet size pickup effect - increases bullet size multiplier by 0.20."""
     game_state.player_stat_multipliers["bullet_size"] += 0.20
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_bullet_speed_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply bullet speed pickup effect - increases bullet speed multiplier by 0.15."""
     game_state.player_stat_multipliers["bullet_speed"] += 0.15
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_bullet_damage_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply bullet damage pickup effect - increases bullet damage multiplier by 0.20."""
     game_state.player_stat_multipliers["bullet_damage"] += 0.20
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_bullet_knockback_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply bullet knockback pickup effect - increases bullet knockback multiplier by 0.25."""
     game_state.player_stat_multipliers["bullet_knockback"] += 0.25
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_bullet_penetration_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply bullet penetration pickup effect - increases penetration count by 1."""
     game_state.player_stat_multipliers["bullet_penetration"] += 1
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_bullet_explosion_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
     """Apply bullet explosion pickup effect - increases explosion radius by 25.0."""
     game_state.player_stat_multipliers["bullet_explosion_radius"] += 25.0
+    note_stat_multipliers_changed(game_state)
 
 
 def _apply_health_regen_pickup(game_state: "GameState", ctx: "AppContext", pickup_type: str) -> None:
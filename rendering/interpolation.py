@@ -0,0 +1,57 @@
+"""
+Render interpolation between fixed simulation steps.
+
+The simulation records where every moving rect was at the start of each step
+(capture_positions, run first in SIMULATION_SYSTEMS). Renderers then draw each rect at
+lerp(previous, current, state.simulation_interpolation), where the interpolation factor is the
+leftover accumulator / fixed_dt set by GameApp each frame. This lets the simulation tick slower
+than the display (GameConfig.simulation_hz) without visible judder.
+
+Rects without a captured position (spawned this step) and rects that jumped further than
+SNAP_DISTANCE (teleports, respawns) are drawn where they are.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterator, Optional
+
+import pygame
+
+SNAP_DISTANCE = 160  # px per step; larger moves are teleports and are not interpolated
+
+
+def _moving_rects(state: Any) -> Iterator[pygame.Rect]:
+    player = getattr(state, "player_rect", None)
+    if player is not None:
+        yield player
+    for enemy in state.enemies:
+        yield enemy["rect"]
+    for friendly in state.friendly_ai:
+        r = friendly.get("rect")
+        if r is not None:
+            yield r
+    for group in (state.player_bullets, state.enemy_projectiles, state.friendly_projectiles, state.missiles):
+        for item in group:
+            yield item["rect"]
+
+
+def capture_positions(state: Any) -> None:
+    """Record each moving rect's position before this simulation step moves it."""
+    state.render_prev_positions = {id(r): (r, r.x, r.y) for r in _moving_rects(state)}
+
+
+def interpolated_rect(state: Any, rect: Optional[pygame.Rect]) -> Optional[pygame.Rect]:
+    """rect drawn at the interpolated position for this frame (rect itself when nothing to blend)."""
+    if rect is None:
+        return None
+    alpha = getattr(state, "simulation_interpolation", 1.0)
+    if alpha >= 1.0:
+        return rect
+    entry = getattr(state, "render_prev_positions", {}).get(id(rect))
+    if entry is None or entry[0] is not rect:
+        return rect
+    _, px, py = entry
+    dx = rect.x - px
+    dy = rect.y - py
+    if (dx == 0 and dy == 0) or abs(dx) > SNAP_DISTANCE or abs(dy) > SNAP_DISTANCE:
+        return rect
+    return rect.move(round(px + dx * alpha) - rect.x, round(py + dy * alpha) - rect.y)
@@ -9,6 +9,7 @@ from typing import Any
 import pygame
 
 from .context import RenderContext
+from .interpolation import interpolated_rect
 
 # Module-level caches for rendering optimization
 _wall_texture_cache = {}
@@ -247,30 +248,31 @@ def _draw_pickups(screen: pygame.Surface, state: Any, ctx: dict) -> None:
 
 
 def _draw_projectiles(screen: pygame.Surface, state: Any) -> None:
-    """Draw enemy, player, and friendly projectiles."""
+    """Draw enemy, player, and friendly projectiles (at interpolated positions)."""
     for proj in getattr(state, "enemy_projectiles", []):
-        draw_projectile(screen, proj["rect"], proj["color"], proj.get("shape", "circle"))
+        draw_projectile(screen, interpolated_rect(state, proj["rect"]), proj["color"], proj.get("shape", "circle"))
     for bullet in getattr(state, "player_bullets", []):
-        draw_projectile(screen, bullet["rect"], bullet["color"], bullet.get("shape", "circle"))
+        draw_projectile(screen, interpolated_rect(state, bullet["rect"]), bullet["color"], bullet.get("shape", "circle"))
     for proj in getattr(state, "friendly_projectiles", []):
-        draw_projectile(screen, proj["rect"], proj["color"], proj.get("shape", "circle"))
+        draw_projectile(screen, interpolated_rect(state, proj["rect"]), proj["color"], proj.get("shape", "circle"))
 
 
 def _draw_allies_and_enemies(screen: pygame.Surface, state: Any) -> None:
-    """Draw friendly AI and enemies (unified entity.draw or rect fallback)."""
+    """Draw friendly AI and enemies (unified entity.draw or rect fallback) at interpolated positions."""
     for friendly in getattr(state, "friendly_ai", []):
+        r = interpolated_rect(state, friendly.get("rect"))
         if hasattr(friendly, "draw"):
-            friendly.draw(screen)
+            friendly.draw(screen, rect=r)
         else:
-            r = friendly.get("rect")
             if r:
                 pygame.draw.rect(screen, friendly.get("color", (100, 200, 100)), r)
     enemies_list = getattr(state, "enemies", [])
     highlight_when_few = len(enemies_list) <= 5
     for enemy in enemies_list:
         r = enemy.get("rect") if isinstance(enemy, dict) else getattr(enemy, "rect", None)
+        r = interpolated_rect(state, r)
         if hasattr(enemy, "draw"):
-            enemy.draw(screen)
+            enemy.draw(screen, rect=r)
         elif r:
             base_color = enemy.get("color", (200, 50, 50))
             flash_t = enemy.get("damage_flash_timer", 0.0)
@@ -289,13 +291,14 @@ def _draw_effects(screen: pygame.Surface, state: Any) -> None:
         pygame.draw.circle(screen, (255, 100, 0), (explosion["x"], explosion["y"]), explosion["radius"], 3)
         pygame.draw.circle(screen, (255, 200, 0), (explosion["x"], explosion["y"]), explosion["radius"] // 2)
     for missile in getattr(state, "missiles", []):
-        pygame.draw.rect(screen, (160, 80, 220), missile["rect"])
-        pygame.draw.rect(screen, (100, 40, 160), missile["rect"], 2)
+        r = interpolated_rect(state, missile["rect"])
+        pygame.draw.rect(screen, (160, 80, 220), r)
+        pygame.draw.rect(screen, (100, 40, 160), r, 2)
 
 
 def _draw_player(screen: pygame.Surface, state: Any) -> None:
     """Draw player circle (and border); shield-active uses red tint."""
-    player = getattr(state, "player_rect", None)
+    player = interpolated_rect(state, getattr(state, "player_rect", None))
     if player is None:
         return
     player_color = (255, 255, 255)
@@ -10,10 +10,17 @@ from constants import jump_duration
 from context import AppContext
 from game_utils import update_pickup_effects
 from hazards import update_hazard_obstacles
+from rendering.interpolation import capture_positions
 from state import GameState
+from systems.owner_index import keep_children
 from systems.registry import SIMULATION_SYSTEMS as REGISTRY_SYSTEMS
 
 
+def _sim_capture_render_positions(gs: GameState, sim_dt: float, app_ctx: AppContext) -> None:
+    # Start-of-step positions for render interpolation; must run before anything moves
+    capture_positions(gs)
+
+
 def _sim_player_and_ability_timers(gs: GameState, sim_dt: float, app_ctx: AppContext) -> None:
     gs.player_time_since_shot += sim_dt
     gs.laser_time_since_shot += sim_dt
@@ -42,10 +49,9 @@ def _sim_player_and_ability_timers(gs: GameState, sim_dt: float, app_ctx: AppCon
 
 
 def _sim_damage_and_weapon_message_cleanup(gs: GameState, sim_dt: float, app_ctx: AppContext) -> None:
-    for dmg_num in gs.damage_numbers[:]:
+    for dmg_num in gs.damage_numbers:
         dmg_num["timer"] -= sim_dt
-        if dmg_num["timer"] <= 0:
-            gs.damage_numbers.remove(dmg_num)
+    keep_children(gs.damage_numbers, lambda d: d["timer"] > 0)
     for msg in gs.weapon_pickup_messages[:]:
         msg["timer"] -= sim_dt
         if msg["timer"] <= 0:
@@ -104,6 +110,7 @@ def _sim_juice_timers(gs: GameState, sim_dt: float, app_ctx: AppContext) -> None
 
 
 SIMULATION_SYSTEMS = [
+    _sim_capture_render_positions,
     _sim_player_and_ability_timers,
     _sim_damage_and_weapon_message_cleanup,
     _sim_shield_and_jump_state,
@@ -0,0 +1,254 @@
+"""
+Free-space spawn sampler: a coarse occupancy grid over the play area.
+
+Obstacles (blocks, hazards, health zone, pickups, pads, player) are stamped into per-cell counts
+and re-stamped only when their rect changes. For each spawn size the free top-left cells are
+derived once from a summed-area table (erosion by the size's cell footprint); sampling then picks
+from that list with a seeded RNG and re-validates against the live grid, dropping stale entries
+(amortized O(1) per spawn). Spawns reserve their cells so a batch never overlaps itself.
+sample() returns None when nothing fits - callers decide what to do; there is no overlapping fallback.
+spawn() first relaxes the player clearance; the wave spawner defers what still does not fit.
+"""
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+import pygame
+
+SPAWN_CELL_SIZE = 40
+PLAYER_CLEARANCE_MULT = 10  # Keep spawns this many player sizes from the player center
+CLEARANCE_RELAX = (1.0, 0.5, 0.25)  # Player-clearance scales spawn() tries in turn when nothing fits
+_MAX_SAMPLE_TRIES = 32
+
+
+class SpawnSampler:
+    """Occupancy grid + per-size free-cell lists for O(1) non-overlapping spawn placement."""
+
+    def __init__(self, width: int, height: int, cell_size: int = SPAWN_CELL_SIZE, seed: Optional[int] = None):
+        self.width = int(width)
+        self.height = int(height)
+        self.cell = int(cell_size)
+        self.cols = max(1, self.width // self.cell)
+        self.rows = max(1, self.height // self.cell)
+        self.rng = random.Random(seed)
+        self._occ = [0] * (self.cols * self.rows)
+        self._obstacles: dict[Hashable, tuple] = {}  # key -> (x, y, w, h) as stamped
+        self._reserved: list[Hashable] = []
+        self._free: dict[tuple[int, int], list[int]] = {}  # (cells_w, cells_h) -> candidate cell indices
+        self._freed = False  # an obstacle moved/left since the free lists were built
+
+    # --- occupancy ----------------------------------------------------------------------------
+
+    def _cell_span(self, x: int, y: int, w: int, h: int) -> tuple[int, int, int, int]:
+        c = self.cell
+        c0 = max(0, x // c)
+        r0 = max(0, y // c)
+        c1 = min(self.cols - 1, (x + w - 1) // c)
+        r1 = min(self.rows - 1, (y + h - 1) // c)
+        return c0, r0, c1, r1
+
+    def _stamp(self, rect: tuple, delta: int) -> None:
+        x, y, w, h = rect
+        if w <= 0 or h <= 0:
+            return
+        c0, r0, c1, r1 = self._cell_span(x, y, w, h)
+        occ = self._occ
+        cols = self.cols
+        for r in range(r0, r1 + 1):
+            base = r * cols
+            for col in range(c0, c1 + 1):
+                occ[base + col] += delta
+
+    def set_obstacle(self, key: Hashable, rect: pygame.Rect) -> None:
+        """Add or move an obstacle. No-op when its rect is unchanged."""
+        new = (rect.x, rect.y, rect.w, rect.h)
+        old = self._obstacles.get(key)
+        if old == new:
+            return
+        if old is not None:
+            self._stamp(old, -1)
+            self._freed = True
+        self._stamp(new, 1)
+        self._obstacles[key] = new
+
+    def remove_obstacle(self, key: Hashable) -> None:
+        old = self._obstacles.pop(key, None)
+        if old is not None:
+            self._stamp(old, -1)
+            self._freed = True
+
+    def reserve(self, rect: pygame.Rect) -> None:
+        """Mark a spawned rect occupied until the next sync()."""
+        key = ("reserved", len(self._reserved))
+        self._reserved.append(key)
+        self.set_obstacle(key, rect)
+
+    def sync(self, rects: Iterable[tuple[Hashable, pygame.Rect]]) -> None:
+        """Bring the grid in line with the current obstacle set; only changed rects are re-stamped."""
+        for key in self._reserved:
+            self.remove_obstacle(key)
+        self._reserved.clear()
+        seen = set()
+        for key, rect in rects:
+            seen.add(key)
+            self.set_obstacle(key, rect)
+        for key in [k for k in self._obstacles if k not in seen]:
+            self.remove_obstacle(key)
+
+    def sync_state(self, state, enemies: bool = False) -> None:
+        """sync() from the level geometry, pickups, teleporter pads and player on a GameState.
+
+        enemies: also stamp the live enemies (placing deferred spawns mid-wave, after earlier
+        spawns have moved away from their reserved cells).
+        """
+        obstacles = iter_spawn_obstacles(state)
+        if enemies:
+            obstacles = itertools.chain(obstacles, ((id(e), e["rect"]) for e in state.enemies))
+        self.sync(obstacles)
+
+    def get_state(self, map_key: Callable[[Hashable], Any] = lambda k: k) -> dict:
+        """Everything sampling depends on besides future syncs (RNG, stamps, reservations, free lists).
+
+        map_key translates obstacle keys (e.g. object ids into something that survives a restore).
+        """
+        return {
+            "rng": self.rng.getstate(),
+            "occ": list(self._occ),
+            "obstacles": [(map_key(k), rect) for k, rect in self._obstacles.items()],
+            "reserved": list(self._reserved),
+            "free": {size: list(cells) for size, cells in self._free.items()},
+            "freed": self._freed,
+        }
+
+    def set_state(self, saved: dict, map_key: Callable[[Any], Hashable] = lambda k: k) -> None:
+        """Restore get_state(); map_key undoes the translation get_state applied to obstacle keys."""
+        self.rng.setstate(saved["rng"])
+        self._occ[:] = saved["occ"]
+        self._obstacles = {map_key(k): rect for k, rect in saved["obstacles"]}
+        self._reserved = list(saved["reserved"])
+        self._free = {size: list(cells) for size, cells in saved["free"].items()}
+        self._freed = saved["freed"]
+
+    # --- sampling -----------------------------------------------------------------------------
+
+    def _footprint(self, w: int, h: int) -> tuple[int, int]:
+        return max(1, math.ceil(w / self.cell)), max(1, math.ceil(h / self.cell))
+
+    def _block_free(self, idx: int, fw: int, fh: int) -> bool:
+        occ = self._occ
+        cols = self.cols
+        for r in range(fh):
+            base = idx + r * cols
+            for c in range(fw):
+                if occ[base + c]:
+                    return False
+        return True
+
+    def _build_free(self, fw: int, fh: int) -> list[int]:
+        """Top-left cells whose fw x fh block is empty (summed-area table erosion)."""
+        cols, rows, occ = self.cols, self.rows, self._occ
+        sat = [[0] * (cols + 1) for _ in range(rows + 1)]
+        for r in range(rows):
+            acc = 0
+            row_above = sat[r]
+            row = sat[r + 1]
+            base = r * cols
+            for c in range(cols):
+                acc += 1 if occ[base + c] else 0
+                row[c + 1] = row_above[c + 1] + acc
+        free = []
+        for r in range(rows - fh + 1):
+            for c in range(cols - fw + 1):
+                if sat[r + fh][c + fw] - sat[r][c + fw] - sat[r + fh][c] + sat[r][c] == 0:
+                    free.append(r * cols + c)
+        return free
+
+    def _free_cells(self, fw: int, fh: int) -> list[int]:
+        if self._freed:
+            self._free.clear()
+            self._freed = False
+        free = self._free.get((fw, fh))
+        if free is None:
+            free = self._build_free(fw, fh)
+            self._free[(fw, fh)] = free
+        return free
+
+    def sample(
+        self,
+        size: tuple[int, int],
+        avoid_center: Optional[tuple[float, float]] = None,
+        avoid_radius: float = 0.0,
+    ) -> Optional[pygame.Rect]:
+        """Random free rect of the given size, or None if none fits (or all fits are inside avoid_radius)."""
+        w, h = int(size[0]), int(size[1])
+        fw, fh = self._footprint(w, h)
+        free = self._free_cells(fw, fh)
+        c = self.cell
+        slack_x = fw * c - w
+        slack_y = fh * c - h
+        tries = 0
+        while free and tries < _MAX_SAMPLE_TRIES:
+            i = self.rng.randrange(len(free))
+            idx = free[i]
+            if not self._block_free(idx, fw, fh):
+                free[i] = free[-1]  # stale (something was stamped since the list was built); not a try
+                free.pop()
+                continue
+            tries += 1
+            row, col = divmod(idx, self.cols)
+            x = col * c + (self.rng.randint(0, slack_x) if slack_x > 0 else 0)
+            y = row * c + (self.rng.randint(0, slack_y) if slack_y > 0 else 0)
+            rect = pygame.Rect(x, y, w, h)
+            if avoid_center is not None and math.dist(rect.center, avoid_center) < avoid_radius:
+                continue
+            return rect
+        return None
+
+    def spawn(self, size: tuple[int, int], state=None) -> Optional[pygame.Rect]:
+        """sample() with the usual player clearance for state, reserving the result.
+
+        When nothing fits outside the clearance, it is shrunk (CLEARANCE_RELAX) before giving up.
+        """
+        if state is None:
+            rect = self.sample(size)
+        else:
+            avoid_center, avoid_radius = player_clearance(state, self.width, self.height)
+            for scale in CLEARANCE_RELAX:
+                rect = self.sample(size, avoid_center, avoid_radius * scale)
+                if rect is not None:
+                    break
+        if rect is not None:
+            self.reserve(rect)
+        return rect
+
+
+def player_clearance(state, width: int, height: int) -> tuple[tuple[float, float], float]:
+    """(center, radius) around the player that spawns keep clear of."""
+    player_rect = getattr(state, "player_rect", None)
+    if player_rect is None:
+        return (width // 2, height // 2), 28 * PLAYER_CLEARANCE_MULT
+    return player_rect.center, max(player_rect.w, player_rect.h) * PLAYER_CLEARANCE_MULT
+
+
+def iter_spawn_obstacles(state):
+    """(key, rect) for everything a spawn must not overlap; keys are stable per object."""
+    player_rect = getattr(state, "player_rect", None)
+    if player_rect is not None:
+        yield "player", player_rect
+    lev = getattr(state, "level", None)
+    if lev is not None:
+        for blocks in (lev.static_blocks, lev.moveable_blocks, lev.destructible_blocks, lev.giant_blocks, lev.super_giant_blocks):
+            for b in blocks:
+                yield id(b), b["rect"]
+        for blocks in (lev.trapezoid_blocks, lev.triangle_blocks, lev.hazard_obstacles):
+            for b in blocks:
+                yield id(b), b["bounding_rect"]
+        if lev.moving_health_zone:
+            yield "health_zone", lev.moving_health_zone["rect"]
+    for p in getattr(state, "pickups", ()):
+        yield id(p), p["rect"]
+    for pad in getattr(state, "teleporter_pads", ()):
+        yield id(pad), pad["rect"]
@@ -7,6 +7,7 @@ from typing import Any, Iterator, Optional, Type
 
 import pygame
 
+from ecs_store import EcsStore
 from level_state import LevelState
 from ui_state import UiState
 
@@ -20,6 +21,9 @@ class GameState:
     """
     # Core game entity lists
     enemies: list = field(default_factory=list)
+    enemy_size_class_counts: dict = field(default_factory=dict)  # see spawn_system.size_class_counts
+    enemy_behaviors: dict = field(default_factory=dict)  # see ai_system.behavior_members
+    enemy_behaviors_indexed: int = 0
     player_bullets: list = field(default_factory=list)
     enemy_projectiles: list = field(default_factory=list)
     friendly_projectiles: list = field(default_factory=list)
@@ -99,6 +103,8 @@ class GameState:
         "bullet_penetration": 0,
         "bullet_explosion_radius": 0.0,
     })
+    player_stat_version: int = 0  # see fire_profiles.note_stat_multipliers_changed
+    fire_profiles: dict = field(default_factory=dict)  # compiled shots per weapon/stats, see fire_profiles.fire_profile
     random_damage_multiplier: float = 1.0
     fire_rate_buff_t: float = 0.0
     
@@ -110,6 +116,8 @@ class GameState:
     max_level: int = 3
     wave_active: bool = True
     time_to_next_wave: float = 0.0
+    # Regular wave being pre-built or placed over several steps (systems.spawn_system.PendingWave)
+    spawn_queue: Any = None
     boss_active: bool = False
     pickup_spawn_timer: float = 0.0
 
@@ -126,6 +134,7 @@ class GameState:
     damage_dealt: int = 0
     enemies_spawned: int = 0
     enemies_killed: int = 0
+    spawns_dropped: int = 0  # enemies dropped because no free space was found (systems.spawn_system)
     deaths: int = 0
     pos_timer: float = 0.0
     
@@ -177,37 +186,59 @@ class GameState:
     # Level geometry (set when level is built in main)
     level: Optional[LevelState] = None
 
+    # Render interpolation (rendering.interpolation): rect positions at the start of the last step, blend factor 0..1
+    render_prev_positions: dict = field(default_factory=dict)
+    simulation_interpolation: float = 1.0
+
+    # Collision snapshot, only set while movement_system moves enemies (systems.collision_world)
+    collision_world: Any = None
+    # Navigation grid and flow fields for enemy chasing, derived from level (systems.nav_grid)
+    nav_grid: Any = None
+
     # Level context for systems (set by main/game loop): move_player, move_enemy, clamp, blocks, width, height, rect_offscreen, vec_toward, update_friendly_ai
     level_context: Any = None
 
-    # Lightweight ECS registry (optional): entity_id -> {ComponentType: instance}
+    # Lightweight ECS registry (optional): archetype store, readable as entity_id -> {ComponentType: instance}
     # Coexists with enemies, player_bullets, etc. during migration.
-    ecs_entities: dict[int, dict[Type[Any], Any]] = field(default_factory=dict)
+    ecs_entities: EcsStore = field(default_factory=EcsStore)
     _ecs_next_id: int = 0
 
     def create_entity(self, components: list[Any]) -> int:
         """Create an entity with the given components. Returns entity id."""
         eid = self._ecs_next_id
         self._ecs_next_id += 1
-        self.ecs_entities[eid] = {type(c): c for c in components}
+        self.ecs_entities.add(eid, components)
         return eid
 
     def get_entities_with(self, *component_types: Type[Any]) -> Iterator[int]:
-        """Yield entity ids that have all of the given component types."""
-        for eid, comps in self.ecs_entities.items():
-            if all(t in comps for t in component_types):
-                yield eid
+        """Yield entity ids that have all of the given component types (cached archetype query)."""
+        return iter(self.ecs_entities.entities_with(*component_types))
 
     def remove_entity(self, eid: int) -> None:
         """Remove an entity from the registry."""
         self.ecs_entities.pop(eid, None)
 
+    def snapshot(self, include_rng: bool = True) -> Any:
+        """Checkpoint of gameplay state, level geometry, ECS and RNG (see state_snapshot). UI/flow is not captured."""
+        from state_snapshot import snapshot_state
+
+        return snapshot_state(self, include_rng=include_rng)
+
+    def restore(self, snap: Any) -> None:
+        """Restore a snapshot() in place (entity lists, level lists and player_rect keep their identity)."""
+        from state_snapshot import restore_state
+
+        restore_state(self, snap)
+
     def reset_run(self, ctx: Any = None, *, center_player: bool = False) -> None:
         """Reset the game state for a brand new run.
         Clears entities, bullets, projectiles; resets HP, lives, score, timers; resets wave/level and default weapons.
         If center_player is True and ctx has width/height, centers player_rect. Caller then typically calls spawn_system_start_wave(1, self).
         """
         self.enemies.clear()
+        self.enemy_size_class_counts.clear()
+        self.enemy_behaviors.clear()
+        self.enemy_behaviors_indexed = 0
         self.player_bullets.clear()
         self.enemy_projectiles.clear()
         self.friendly_projectiles.clear()
@@ -237,4 +268,5 @@ class GameState:
         self.wave_in_level = wave if wave <= 3 else ((wave - 1) % 3) + 1
         self.current_level = max(1, (wave - 1) // 3 + 1) if wave >= 1 else 1
         self.wave_active = False
-        self.time_to_next_wave = 0.0
\ No newline at end of file
+        self.time_to_next_wave = 0.0
+        self.spawn_queue = None
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Snapshot and in-place restore for GameState and LevelState.
+
+A snapshot is a detached copy of the gameplay fields: entity lists (enemies, bullets, allies,
+pickups, ...), timers, counters, player rect, level geometry, the ECS store and the global
+`random` state. Restoring writes the copy back into the existing objects (lists, dicts, sets and
+the player rect are updated in place, so anything holding a reference to state.enemies or
+level.trapezoid_blocks keeps working) without re-running level generation.
+
+Copies share aliasing across the whole snapshot (e.g. state.dropped_ally that is also in
+state.friendly_ai stays one object), and values that are not plain data (surfaces, callables,
+other objects) are shared rather than copied. A snapshot can be restored any number of times.
+
+Not captured: UI/screen flow, level_context, collision_world, nav_grid, fire_profiles and render interpolation state.
+The spawn sampler in level_context is the exception: its RNG, occupancy and free lists are captured with
+the `random` state (obstacle keys are translated to the restored objects), so a restored checkpoint
+places the same enemies in the same spots.
+"""
+from __future__ import annotations
+
+import copy
+import dataclasses
+import random
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pygame
+
+from entities.enemy import Enemy
+from entities.friendly import Friendly
+
+# GameState fields owned by the app/UI or rebuilt every step
+_SKIPPED_STATE_FIELDS = frozenset({
+    "ui",
+    "current_screen",
+    "previous_screen",
+    "controls_rebinding",
+    "level",
+    "level_context",
+    "collision_world",
+    "nav_grid",
+    "fire_profiles",
+    "render_prev_positions",
+    "simulation_interpolation",
+    "ecs_entities",
+})
+
+_ATOMIC = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _clone(value: Any, memo: dict[int, Any]) -> Any:
+    """Copy plain data (dict/list/tuple/set, Rect, Vector2, Random, Enemy, Friendly, dataclasses); share everything else."""
+    t = type(value)
+    if t in _ATOMIC:
+        return value
+    key = id(value)
+    hit = memo.get(key)
+    if hit is not None:
+        return hit
+    if t is dict:
+        out: Any = {}
+        memo[key] = out
+        for k, v in value.items():
+            out[k] = _clone(v, memo)
+    elif t is list:
+        out = []
+        memo[key] = out
+        out.extend(_clone(v, memo) for v in value)
+    elif t is tuple:
+        out = tuple(_clone(v, memo) for v in value)
+    elif t is set or t is frozenset:
+        out = t(value)
+    elif t is pygame.Rect:
+        out = pygame.Rect(value)
+    elif t is pygame.Vector2:
+        out = pygame.Vector2(value)
+    elif t is random.Random:
+        out = random.Random()
+        out.setstate(value.getstate())
+    elif t is Enemy:
+        out = Enemy({})
+        memo[key] = out
+        for k, v in value.items():
+            out[k] = _clone(v, memo)
+    elif t is Friendly:
+        out = Friendly(_clone(value._data, memo))
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        out = copy.copy(value)
+        memo[key] = out
+        for f in dataclasses.fields(value):
+            object.__setattr__(out, f.name, _clone(getattr(value, f.name), memo))
+    else:
+        return value
+    memo[key] = out
+    return out
+
+
+def _assign(obj: Any, name: str, value: Any) -> None:
+    """Set obj.name = value, updating the existing container/rect in place when the types match."""
+    current = getattr(obj, name, None)
+    t = type(value)
+    if current is not None and type(current) is t:
+        if t is list:
+            current[:] = value
+            return
+        if t is dict or t is set:
+            current.clear()
+            current.update(value)
+            return
+        if t is pygame.Rect:
+            current.update(value)
+            return
+    setattr(obj, name, value)
+
+
+@dataclass
+class LevelSnapshot:
+    fields: dict[str, Any]
+
+
+@dataclass
+class GameStateSnapshot:
+    fields: dict[str, Any]
+    level: Optional[LevelSnapshot]
+    ecs: list[tuple[int, list[Any]]]
+    rng_state: Optional[tuple]
+    sampler_state: Optional[dict] = None
+
+
+def _spawn_sampler(state: Any) -> Any:
+    ctx = getattr(state, "level_context", None)
+    return ctx.get("spawn_sampler") if ctx else None
+
+
+def _is_plain_key(key: Any) -> bool:
+    return type(key) in (int, str, tuple)
+
+
+def snapshot_level(level: Any, memo: Optional[dict[int, Any]] = None) -> LevelSnapshot:
+    memo = {} if memo is None else memo
+    return LevelSnapshot({f.name: _clone(getattr(level, f.name), memo) for f in dataclasses.fields(level)})
+
+
+def restore_level(level: Any, snap: LevelSnapshot, memo: Optional[dict[int, Any]] = None) -> None:
+    memo = {} if memo is None else memo
+    for name, value in snap.fields.items():
+        _assign(level, name, _clone(value, memo))
+
+
+def snapshot_state(state: Any, include_rng: bool = True) -> GameStateSnapshot:
+    """Detached copy of state's gameplay fields, level geometry, ECS entities and (optionally) the random module
+    and spawn sampler RNG states."""
+    memo: dict[int, Any] = {}
+    fields = {
+        f.name: _clone(getattr(state, f.name), memo)
+        for f in dataclasses.fields(state)
+        if f.name not in _SKIPPED_STATE_FIELDS
+    }
+    level = snapshot_level(state.level, memo) if state.level is not None else None
+    ecs = [(eid, [_clone(c, memo) for c in components.values()]) for eid, components in state.ecs_entities.items()]
+    sampler = _spawn_sampler(state)
+    sampler_state = None
+    if include_rng and sampler is not None:
+        # Sampler obstacles are keyed by id(object): key them by the object's copy instead
+        sampler_state = sampler.get_state(lambda k: memo.get(k, k) if type(k) is int else k)
+    return GameStateSnapshot(fields, level, ecs, random.getstate() if include_rng else None, sampler_state)
+
+
+def restore_state(state: Any, snap: GameStateSnapshot) -> None:
+    """Write snap back into state in place (and into state.level when both have level data)."""
+    memo: dict[int, Any] = {}
+    for name, value in snap.fields.items():
+        _assign(state, name, _clone(value, memo))
+    if snap.level is not None:
+        if state.level is None:
+            from level_state import LevelState
+
+            state.level = LevelState(**{k: _clone(v, memo) for k, v in snap.level.fields.items()})
+        else:
+            restore_level(state.level, snap.level, memo)
+    store = state.ecs_entities
+    store.clear()
+    for eid, components in snap.ecs:
+        store.add(eid, [_clone(c, memo) for c in components])
+    if snap.rng_state is not None:
+        random.setstate(snap.rng_state)
+    sampler = _spawn_sampler(state)
+    if sampler is not None and snap.sampler_state is not None:
+        sampler.set_state(snap.sampler_state, lambda k: k if _is_plain_key(k) else id(memo.get(id(k), k)))
@@ -0,0 +1,160 @@
+"""
+Fixed-step controllers for game._step_simulation: how much simulated time a frame may consume and
+what happens to the rest when the machine falls behind.
+
+The old loop capped a frame at MAX_SIMULATION_STEPS but kept the leftover accumulator, so one hitch
+(GC pause, telemetry flush) turned into several frames of max-step catch-up, each of which was slow
+enough to build more debt. Every controller here settles the frame by discarding debt beyond one
+step, so a hitch costs at most one capped frame. Policies differ in how they get there:
+
+- ClampDropController: run up to max_steps, drop the rest (the game skips ahead).
+- TimeDilationController: scale dt down while overloaded so the game runs in slow motion instead of
+  skipping; the scale recovers gradually once frames fit again.
+- AdaptiveStepController: measure wall-clock cost per step and lower the step cap so catch-up never
+  takes longer than the frame budget, then clamp-and-drop like the default.
+
+Usage per frame: accumulator, budget = controller.plan(accumulator, dt, fixed_dt); run at most
+budget steps; accumulator = controller.settle(accumulator, steps_run, fixed_dt, elapsed_s).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+STEP_POLICY_CLAMP_DROP = "clamp_drop"
+STEP_POLICY_DILATE = "dilate"
+STEP_POLICY_ADAPTIVE = "adaptive"
+
+
+@dataclass
+class StepMetrics:
+    """Counters for overload handling (seconds are simulated time unless noted)."""
+    frames: int = 0
+    steps: int = 0
+    dropped_time: float = 0.0  # Accumulator debt discarded
+    dilated_time: float = 0.0  # Wall-clock time not simulated because of slow motion
+    overload_frames: int = 0  # Frames that dropped or dilated time
+    overload_episodes: int = 0  # Runs of consecutive overload frames
+    max_steps_in_frame: int = 0
+    time_scale: float = 1.0  # Current dilation factor (1.0 = real time)
+    step_budget: int = 0  # Step cap used for the last frame
+    in_overload: bool = False
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class ClampDropController:
+    """Run up to max_steps per frame; discard any accumulator debt left after that."""
+
+    policy = STEP_POLICY_CLAMP_DROP
+
+    def __init__(self, max_steps: int = 6):
+        self.max_steps = max(1, int(max_steps))
+        self.metrics = StepMetrics(step_budget=self.max_steps)
+        self._overloaded_this_frame = False
+
+    def plan(self, accumulator: float, dt: float, fixed_dt: float) -> tuple[float, int]:
+        """Add this frame's dt to the accumulator. Returns (accumulator, step budget)."""
+        self._overloaded_this_frame = False
+        self.metrics.step_budget = self.max_steps
+        return accumulator + max(0.0, dt), self.max_steps
+
+    def settle(self, accumulator: float, steps: int, fixed_dt: float, elapsed: float = 0.0) -> float:
+        """Record the frame and drop debt beyond one step. Returns the accumulator to carry over."""
+        m = self.metrics
+        m.frames += 1
+        m.steps += steps
+        if steps > m.max_steps_in_frame:
+            m.max_steps_in_frame = steps
+        if fixed_dt > 0 and accumulator >= fixed_dt:
+            kept = accumulator % fixed_dt
+            m.dropped_time += accumulator - kept
+            accumulator = kept
+            self._overloaded_this_frame = True
+        if self._overloaded_this_frame:
+            m.overload_frames += 1
+            if not m.in_overload:
+                m.overload_episodes += 1
+            m.in_overload = True
+        else:
+            m.in_overload = False
+        return accumulator
+
+    def reset_metrics(self) -> None:
+        self.metrics = StepMetrics(step_budget=self.metrics.step_budget, time_scale=self.metrics.time_scale)
+
+
+class TimeDilationController(ClampDropController):
+    """Slow the simulation down instead of skipping when a frame needs more than max_steps.
+
+    The time scale drops immediately to what max_steps can cover (never below min_scale) and
+    recovers toward 1.0 at recovery_per_s (scale units per wall-clock second).
+    """
+
+    policy = STEP_POLICY_DILATE
+
+    def __init__(self, max_steps: int = 6, min_scale: float = 0.25, recovery_per_s: float = 2.0):
+        super().__init__(max_steps)
+        self.min_scale = min(1.0, max(0.0, min_scale))
+        self.recovery_per_s = recovery_per_s
+
+    def plan(self, accumulator: float, dt: float, fixed_dt: float) -> tuple[float, int]:
+        self._overloaded_this_frame = False
+        self.metrics.step_budget = self.max_steps
+        m = self.metrics
+        dt = max(0.0, dt)
+        capacity = self.max_steps * fixed_dt - accumulator
+        target = 1.0 if dt <= 0 or dt <= capacity else max(self.min_scale, capacity / dt)
+        scale = min(1.0, m.time_scale + self.recovery_per_s * dt)
+        if target < scale:
+            scale = target
+        m.time_scale = scale
+        if scale < 1.0:
+            m.dilated_time += dt * (1.0 - scale)
+            self._overloaded_this_frame = True
+        return accumulator + dt * scale, self.max_steps
+
+
+class AdaptiveStepController(ClampDropController):
+    """Clamp-and-drop with a step cap sized from measured step cost so catch-up fits frame_budget.
+
+    Step cost is an exponential moving average of elapsed / steps as reported to settle().
+    """
+
+    policy = STEP_POLICY_ADAPTIVE
+
+    def __init__(self, max_steps: int = 6, frame_budget: float = 1.0 / 60.0, smoothing: float = 0.2):
+        super().__init__(max_steps)
+        self.frame_budget = frame_budget
+        self.smoothing = smoothing
+        self.step_cost = 0.0  # Seconds of wall-clock per step (0 until measured)
+
+    def current_budget(self) -> int:
+        if self.step_cost <= 0:
+            return self.max_steps
+        return max(1, min(self.max_steps, int(self.frame_budget / self.step_cost)))
+
+    def plan(self, accumulator: float, dt: float, fixed_dt: float) -> tuple[float, int]:
+        self._overloaded_this_frame = False
+        budget = self.current_budget()
+        self.metrics.step_budget = budget
+        return accumulator + max(0.0, dt), budget
+
+    def settle(self, accumulator: float, steps: int, fixed_dt: float, elapsed: float = 0.0) -> float:
+        if steps > 0 and elapsed > 0:
+            cost = elapsed / steps
+            a = self.smoothing
+            self.step_cost = cost if self.step_cost <= 0 else self.step_cost + a * (cost - self.step_cost)
+        return super().settle(accumulator, steps, fixed_dt, elapsed)
+
+
+def make_step_controller(policy: str = STEP_POLICY_CLAMP_DROP, max_steps: int = 6, frame_budget: float = 1.0 / 60.0):
+    """Build the controller for a GameConfig.step_policy value (unknown values fall back to clamp-and-drop).
+
+    frame_budget is the render frame time (1 / FPS), not the simulation tick.
+    """
+    if policy == STEP_POLICY_DILATE:
+        return TimeDilationController(max_steps)
+    if policy == STEP_POLICY_ADAPTIVE:
+        return AdaptiveStepController(max_steps, frame_budget=frame_budget)
+    return ClampDropController(max_steps)
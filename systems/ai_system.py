@@ -1,13 +1,20 @@
-"""AI logic: enemy targeting, ally behavior, queen shield/missiles, suicide, reflector, shooting."""
+"""AI logic: enemy targeting, ally behavior, queen shield/missiles, suicide, reflector, shooting.
+
+Enemy AI is split into behaviors (ENEMY_BEHAVIORS); each keeps a member list in state.enemy_behaviors,
+updated when enemies spawn or die (spawn_system.note_enemy_spawned/removed).
+"""
 from __future__ import annotations
 
 import math
 import random
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
 
 import pygame
 
 from constants import STATE_NAME_INPUT
+from telemetry import perf
 
 if TYPE_CHECKING:
     from state import GameState
@@ -29,160 +36,321 @@ def _update_ally_ai(state, dt: float, ctx: dict) -> None:
         update_friendly(state, dt)
 
 
+@dataclass(frozen=True)
+class EnemyBehavior:
+    """One enemy AI behavior: which enemies it applies to and how to update them.
+
+    matches(enemy) is evaluated once when the enemy spawns (behavior flags are fixed by the
+    archetype); update(members, step) then runs over just those enemies each step.
+    """
+    name: str
+    matches: Callable[[Any], bool]
+    update: Callable[[list, "_AiStep"], None]
+
+
+class _AiStep:
+    """Per-step inputs shared by the behaviors; targets are looked up lazily and cached per enemy."""
+
+    __slots__ = ("state", "dt", "ctx", "player", "_find_threat", "_slots", "_targets")
+
+    def __init__(self, state, dt: float, ctx: dict, player: pygame.Rect):
+        self.state = state
+        self.dt = dt
+        self.ctx = ctx
+        self.player = player
+        self._find_threat = ctx.get("find_nearest_threat")
+        self._slots = ctx.get("_player_targeting_slots", set())
+        self._targets: dict[int, Any] = {}
+
+    def target(self, enemy):
+        """(target_pos, target_type) for enemy this step, or None."""
+        key = id(enemy)
+        if key in self._targets:
+            return self._targets[key]
+        info = None
+        if self._find_threat:
+            enemy_pos = pygame.Vector2(enemy.rect.center)
+            info = self._find_threat(enemy_pos, self.player, self.state.friendly_ai, allow_player=key in self._slots)
+        self._targets[key] = info
+        return info
+
+
 def _update_enemy_ai(state, dt: float, ctx: dict) -> None:
-    """Target selection, queen shield/missiles, suicide detonation, reflector shield aim, shooting."""
+    """Run each enemy behavior over its own members (see ENEMY_BEHAVIORS).
+
+    state.enemies are entities.Enemy records; flags and rect are read as attributes.
+    With GAME_DEBUG_PERF=1 each behavior's time is recorded (telemetry.perf.get_ai_behavior_stats).
+    """
     player = state.player_rect
     if player is None:
         return
-    find_threat = ctx.get("find_nearest_threat")
-    vec_toward = ctx.get("vec_toward")
+    members = behavior_members(state)
+    step = _AiStep(state, dt, ctx, player)
+    timed = perf.is_enabled()
+    for behavior in ENEMY_BEHAVIORS:
+        group = members.get(behavior.name)
+        if not group:
+            continue
+        if timed:
+            n = len(group)
+            t0 = time.perf_counter()
+            behavior.update(group, step)
+            perf.record_ai_behavior(behavior.name, time.perf_counter() - t0, n)
+        else:
+            behavior.update(group, step)
+
+
+def _queen_shield(members: list, step: _AiStep) -> None:
+    dt = step.dt
+    for enemy in members:
+        _update_queen_shield(enemy, dt)
+
+
+def _queen_missiles(members: list, step: _AiStep) -> None:
+    missile_damage = step.ctx.get("missile_damage", 100)
+    for enemy in members:
+        _update_queen_missiles(enemy, step.dt, step.target(enemy), step.state, missile_damage)
+
+
+def _suicide(members: list, step: _AiStep) -> None:
+    """Detonate when close, apply damage, remove enemy (kill_enemy also drops it from every behavior)."""
+    ctx = step.ctx
     kill_enemy = ctx.get("kill_enemy")
     reset_after_death = ctx.get("reset_after_death")
-    missile_damage = ctx.get("missile_damage", 100)
     testing_mode = ctx.get("testing_mode", False)
     invulnerability_mode = ctx.get("invulnerability_mode", False)
-    spawn_projectile = ctx.get("spawn_enemy_projectile")
-    spawn_projectile_predictive = ctx.get("spawn_enemy_projectile_predictive")
+    for enemy in members[:]:
+        _try_suicide_detonate(enemy, step.player, step.state, ctx, kill_enemy, reset_after_death, testing_mode, invulnerability_mode)
+
 
-    player_targeting_slots = ctx.get("_player_targeting_slots", set())
-    for enemy in state.enemies[:]:
-        enemy_pos = pygame.Vector2(enemy["rect"].center)
-        allow_player = id(enemy) in player_targeting_slots
-        target_info = find_threat(enemy_pos, player, state.friendly_ai, allow_player=allow_player) if find_threat else None
+def _shield_aim(members: list, step: _AiStep) -> None:
+    """Reflector / shield enemy: turn shield toward target (shield enemies reflect unless flanked)."""
+    for enemy in members:
+        target_info = step.target(enemy)
         if target_info:
-            target_pos, target_type = target_info
-            direction = vec_toward(enemy_pos.x, enemy_pos.y, target_pos.x, target_pos.y) if vec_toward else pygame.Vector2(1, 0)
-        else:
-            direction = pygame.Vector2(1, 0)
-
-        # Queen: shield phase and missile firing
-        if enemy.get("type") == "queen" and enemy.get("has_shield"):
-            _update_queen_shield(enemy, dt)
-        if enemy.get("type") == "queen" and enemy.get("can_use_missiles"):
-            _update_queen_missiles(enemy, dt, target_info, state, missile_damage)
-
-        # Suicide: detonate when close, apply damage, remove enemy
-        if enemy.get("is_suicide"):
-            if _try_suicide_detonate(enemy, player, state, ctx, kill_enemy, reset_after_death, testing_mode, invulnerability_mode):
-                continue
-
-        # Reflector / shield enemy: turn shield toward target (shield enemies reflect unless flanked)
-        if target_info and (enemy.get("has_reflective_shield") or (enemy.get("has_shield") and not enemy.get("has_reflective_shield"))):
-            _update_reflector_shield_angle(enemy, target_info, dt)
-
-        # Ambient: stationary, fires one rocket at player every 6s (dodgeable)
-        if enemy.get("is_ambient") and spawn_projectile and player:
-            rocket_cd = enemy.get("rocket_cooldown", 0.0) + dt
-            enemy["rocket_cooldown"] = rocket_cd
-            if rocket_cd >= enemy.get("shoot_cooldown", 6.0):
-                spawn_projectile(enemy, state)
-                enemy["rocket_cooldown"] = 0.0
-            continue
+            _update_reflector_shield_angle(enemy, target_info, step.dt)
 
-        # Super large: rockets + grenades (grenades damage only player and allies)
-        if enemy.get("fires_rockets") and target_info:
-            missile_damage = ctx.get("missile_damage", 800)
-            rcd = enemy.get("rocket_cooldown", 0.0) + dt
-            enemy["rocket_cooldown"] = rcd
-            if rcd >= enemy.get("rocket_interval", 5.0):
-                missile_rect = pygame.Rect(
-                    enemy["rect"].centerx - 8, enemy["rect"].centery - 8, 16, 16
-                )
-                state.missiles.append({
-                    "rect": missile_rect,
-                    "vel": pygame.Vector2(0, 0),
-                    "target_enemy": None,
-                    "target_player": True,
-                    "speed": 400,
-                    "damage": missile_damage // 2,
-                    "explosion_radius": 100,
-                })
-                enemy["rocket_cooldown"] = 0.0
-        if enemy.get("can_use_grenades_player_allies_only"):
-            tsg = enemy.get("time_since_grenade", 999.0) + dt
-            enemy["time_since_grenade"] = tsg
-            if tsg >= enemy.get("grenade_cooldown", 8.0):
-                state.grenade_explosions.append({
-                    "x": enemy["rect"].centerx,
-                    "y": enemy["rect"].centery,
-                    "radius": 0,
-                    "max_radius": enemy.get("grenade_radius", 120),
-                    "timer": 0.3,
-                    "damage": enemy.get("grenade_damage", 400),
-                    "source": "enemy_player_allies_only",
-                })
-                enemy["time_since_grenade"] = 0.0
-        if enemy.get("fires_rockets") or enemy.get("can_use_grenades_player_allies_only"):
-            continue  # Super large uses only rockets + grenades, no normal projectiles
-
-        # Large laser: single beam at player
-        if enemy.get("fires_laser") and target_info and vec_toward:
-            lcd = enemy.get("laser_cooldown", 0.0) + dt
-            enemy["laser_cooldown"] = lcd
-            if lcd >= enemy.get("laser_interval", 3.0):
-                target_pos, _ = target_info
-                dx = target_pos.x - enemy["rect"].centerx
-                dy = target_pos.y - enemy["rect"].centery
-                length = enemy.get("laser_length", 600)
-                if dx * dx + dy * dy >= 1e-6:
-                    scale = length / math.sqrt(dx * dx + dy * dy)
-                    end_pos = pygame.Vector2(enemy["rect"].centerx + dx * scale, enemy["rect"].centery + dy * scale)
-                else:
-                    end_pos = pygame.Vector2(enemy["rect"].centerx + length, enemy["rect"].centery)
-                deploy = enemy.get("laser_deploy_time", 2.0)
+
+def _ambient_rockets(members: list, step: _AiStep) -> None:
+    """Ambient: stationary, fires one rocket at player every 6s (dodgeable)."""
+    spawn_projectile = step.ctx.get("spawn_enemy_projectile")
+    if not spawn_projectile:
+        return
+    dt, state = step.dt, step.state
+    for enemy in members:
+        rocket_cd = enemy.get("rocket_cooldown", 0.0) + dt
+        enemy["rocket_cooldown"] = rocket_cd
+        if rocket_cd >= enemy.get("shoot_cooldown", 6.0):
+            spawn_projectile(enemy, state)
+            enemy["rocket_cooldown"] = 0.0
+
+
+def _heavy_rockets(members: list, step: _AiStep) -> None:
+    """Super large: homing rockets at the player."""
+    missile_damage = step.ctx.get("missile_damage", 800)
+    dt, state = step.dt, step.state
+    for enemy in members:
+        if not step.target(enemy):
+            continue
+        rcd = enemy.get("rocket_cooldown", 0.0) + dt
+        enemy["rocket_cooldown"] = rcd
+        if rcd >= enemy.get("rocket_interval", 5.0):
+            missile_rect = pygame.Rect(
+                enemy.rect.centerx - 8, enemy.rect.centery - 8, 16, 16
+            )
+            state.missiles.append({
+                "rect": missile_rect,
+                "vel": pygame.Vector2(0, 0),
+                "target_enemy": None,
+                "target_player": True,
+                "speed": 400,
+                "damage": missile_damage // 2,
+                "explosion_radius": 100,
+            })
+            enemy["rocket_cooldown"] = 0.0
+
+
+def _heavy_grenades(members: list, step: _AiStep) -> None:
+    """Super large: grenades that damage only the player and allies."""
+    dt, state = step.dt, step.state
+    for enemy in members:
+        tsg = enemy.get("time_since_grenade", 999.0) + dt
+        enemy["time_since_grenade"] = tsg
+        if tsg >= enemy.get("grenade_cooldown", 8.0):
+            state.grenade_explosions.append({
+                "x": enemy.rect.centerx,
+                "y": enemy.rect.centery,
+                "radius": 0,
+                "max_radius": enemy.get("grenade_radius", 120),
+                "timer": 0.3,
+                "damage": enemy.get("grenade_damage", 400),
+                "source": "enemy_player_allies_only",
+            })
+            enemy["time_since_grenade"] = 0.0
+
+
+def _laser(members: list, step: _AiStep) -> None:
+    """Large laser: single beam at the target."""
+    if not step.ctx.get("vec_toward"):
+        return
+    dt, state = step.dt, step.state
+    for enemy in members:
+        target_info = step.target(enemy)
+        if not target_info:
+            continue
+        lcd = enemy.get("laser_cooldown", 0.0) + dt
+        enemy["laser_cooldown"] = lcd
+        if lcd >= enemy.get("laser_interval", 3.0):
+            target_pos, _ = target_info
+            dx = target_pos.x - enemy.rect.centerx
+            dy = target_pos.y - enemy.rect.centery
+            length = enemy.get("laser_length", 600)
+            if dx * dx + dy * dy >= 1e-6:
+                scale = length / math.sqrt(dx * dx + dy * dy)
+                end_pos = pygame.Vector2(enemy.rect.centerx + dx * scale, enemy.rect.centery + dy * scale)
+            else:
+                end_pos = pygame.Vector2(enemy.rect.centerx + length, enemy.rect.centery)
+            deploy = enemy.get("laser_deploy_time", 2.0)
+            state.enemy_laser_beams.append({
+                "start": pygame.Vector2(enemy.rect.center),
+                "end": end_pos,
+                "damage": enemy.get("laser_damage", 80) * 60,  # per second in collision
+                "timer": enemy.get("laser_duration", 0.4),
+                "deploy_time": deploy,
+                "deploy_timer": deploy,  # countdown: no damage until 0, then beam is active
+                "color": (180, 100, 255),
+                "width": 4,
+            })
+            enemy["laser_cooldown"] = 0.0
+
+
+def _triple_laser(members: list, step: _AiStep) -> None:
+    """Super large triple laser: three beams with spread."""
+    if not step.ctx.get("vec_toward"):
+        return
+    dt, state = step.dt, step.state
+    for enemy in members:
+        target_info = step.target(enemy)
+        if not target_info:
+            continue
+        lcd = enemy.get("laser_cooldown", 0.0) + dt
+        enemy["laser_cooldown"] = lcd
+        if lcd >= enemy.get("laser_interval", 4.0):
+            target_pos, _ = target_info
+            cx, cy = enemy.rect.centerx, enemy.rect.centery
+            dx = target_pos.x - cx
+            dy = target_pos.y - cy
+            length = enemy.get("laser_length", 700)
+            spread_deg = enemy.get("laser_spread_deg", 15) * (3.14159265 / 180.0)
+            base_angle = math.atan2(dy, dx)
+            deploy = enemy.get("laser_deploy_time", 2.0)
+            for off in (-spread_deg, 0, spread_deg):
+                a = base_angle + off
+                ex = cx + length * math.cos(a)
+                ey = cy + length * math.sin(a)
                 state.enemy_laser_beams.append({
-                    "start": pygame.Vector2(enemy["rect"].center),
-                    "end": end_pos,
-                    "damage": enemy.get("laser_damage", 80) * 60,  # per second in collision
-                    "timer": enemy.get("laser_duration", 0.4),
+                    "start": pygame.Vector2(cx, cy),
+                    "end": pygame.Vector2(ex, ey),
+                    "damage": enemy.get("laser_damage", 120) * 60,
+                    "timer": enemy.get("laser_duration", 0.5),
                     "deploy_time": deploy,
-                    "deploy_timer": deploy,  # countdown: no damage until 0, then beam is active
-                    "color": (180, 100, 255),
-                    "width": 4,
+                    "deploy_timer": deploy,
+                    "color": (200, 80, 255),
+                    "width": 6,
                 })
-                enemy["laser_cooldown"] = 0.0
-            continue
+            enemy["laser_cooldown"] = 0.0
 
-        # Super large triple laser: three beams with spread
-        if enemy.get("fires_triple_laser") and target_info and vec_toward:
-            lcd = enemy.get("laser_cooldown", 0.0) + dt
-            enemy["laser_cooldown"] = lcd
-            if lcd >= enemy.get("laser_interval", 4.0):
-                target_pos, _ = target_info
-                cx, cy = enemy["rect"].centerx, enemy["rect"].centery
-                dx = target_pos.x - cx
-                dy = target_pos.y - cy
-                length = enemy.get("laser_length", 700)
-                spread_deg = enemy.get("laser_spread_deg", 15) * (3.14159265 / 180.0)
-                base_angle = math.atan2(dy, dx)
-                deploy = enemy.get("laser_deploy_time", 2.0)
-                for off in (-spread_deg, 0, spread_deg):
-                    a = base_angle + off
-                    ex = cx + length * math.cos(a)
-                    ey = cy + length * math.sin(a)
-                    state.enemy_laser_beams.append({
-                        "start": pygame.Vector2(cx, cy),
-                        "end": pygame.Vector2(ex, ey),
-                        "damage": enemy.get("laser_damage", 120) * 60,
-                        "timer": enemy.get("laser_duration", 0.5),
-                        "deploy_time": deploy,
-                        "deploy_timer": deploy,
-                        "color": (200, 80, 255),
-                        "width": 6,
-                    })
-                enemy["laser_cooldown"] = 0.0
-            continue
 
-        # Non-reflector shooting
-        if not enemy.get("has_reflective_shield") and spawn_projectile and spawn_projectile_predictive:
-            enemy["shoot_cooldown"] = enemy.get("shoot_cooldown", 999.0) + dt
-            if enemy["shoot_cooldown"] >= enemy.get("shoot_cooldown_time", 1.0):
-                if target_info:
-                    if enemy.get("is_predictive", False):
-                        spawn_projectile_predictive(enemy, direction, state)
-                    else:
-                        spawn_projectile(enemy, state)
-                enemy["shoot_cooldown"] = 0.0
+def _shooter(members: list, step: _AiStep) -> None:
+    """Non-reflector shooting; the target is only looked up when the cooldown is up."""
+    ctx = step.ctx
+    spawn_projectile = ctx.get("spawn_enemy_projectile")
+    spawn_projectile_predictive = ctx.get("spawn_enemy_projectile_predictive")
+    if not (spawn_projectile and spawn_projectile_predictive):
+        return
+    vec_toward = ctx.get("vec_toward")
+    dt, state = step.dt, step.state
+    for enemy in members:
+        enemy["shoot_cooldown"] = enemy.get("shoot_cooldown", 999.0) + dt
+        if enemy["shoot_cooldown"] >= enemy.get("shoot_cooldown_time", 1.0):
+            target_info = step.target(enemy)
+            if target_info:
+                if enemy.is_predictive:
+                    target_pos, _ = target_info
+                    cx, cy = enemy.rect.center
+                    direction = vec_toward(cx, cy, target_pos.x, target_pos.y) if vec_toward else pygame.Vector2(1, 0)
+                    spawn_projectile_predictive(enemy, direction, state)
+                else:
+                    spawn_projectile(enemy, state)
+            enemy["shoot_cooldown"] = 0.0
+
+
+def _is_heavy(e) -> bool:
+    return bool(e.fires_rockets or e.can_use_grenades_player_allies_only)
+
+
+# Run in this order each step. Ambient, heavy (rockets/grenades), laser and triple laser enemies
+# use only their own attack; everything else without a reflective shield is a regular shooter.
+ENEMY_BEHAVIORS: tuple[EnemyBehavior, ...] = (
+    EnemyBehavior("queen_shield", lambda e: e.type == "queen" and e.has_shield, _queen_shield),
+    EnemyBehavior("queen_missiles", lambda e: e.type == "queen" and e.can_use_missiles, _queen_missiles),
+    EnemyBehavior("suicide", lambda e: e.is_suicide, _suicide),
+    EnemyBehavior("shield_aim", lambda e: e.has_reflective_shield or e.has_shield, _shield_aim),
+    EnemyBehavior("ambient_rockets", lambda e: e.is_ambient, _ambient_rockets),
+    EnemyBehavior("heavy_rockets", lambda e: not e.is_ambient and e.fires_rockets, _heavy_rockets),
+    EnemyBehavior(
+        "heavy_grenades",
+        lambda e: not e.is_ambient and e.can_use_grenades_player_allies_only,
+        _heavy_grenades,
+    ),
+    EnemyBehavior("laser", lambda e: not e.is_ambient and not _is_heavy(e) and e.fires_laser, _laser),
+    EnemyBehavior(
+        "triple_laser",
+        lambda e: not e.is_ambient and not _is_heavy(e) and not e.fires_laser and e.fires_triple_laser,
+        _triple_laser,
+    ),
+    EnemyBehavior(
+        "shooter",
+        lambda e: not (e.is_ambient or _is_heavy(e) or e.fires_laser or e.fires_triple_laser or e.has_reflective_shield),
+        _shooter,
+    ),
+)
+
+
+def behavior_members(state) -> dict[str, list]:
+    """Live enemies per behavior name, kept incrementally on spawn and death.
+
+    Rebuilt if state.enemies was changed without going through note_enemy_behaviors/forget
+    (the indexed count no longer matches).
+    """
+    members = state.enemy_behaviors
+    if state.enemy_behaviors_indexed != len(state.enemies):
+        members.clear()
+        state.enemy_behaviors_indexed = 0
+        for e in state.enemies:
+            note_enemy_behaviors(state, e)
+    return members
+
+
+def note_enemy_behaviors(state, enemy) -> None:
+    """Add a spawned enemy to the member list of every behavior it matches."""
+    members = state.enemy_behaviors
+    for behavior in ENEMY_BEHAVIORS:
+        if behavior.matches(enemy):
+            members.setdefault(behavior.name, []).append(enemy)
+    state.enemy_behaviors_indexed += 1
+
+
+def forget_enemy_behaviors(state, enemy) -> None:
+    """Drop a removed enemy from every behavior member list."""
+    if state.enemy_behaviors_indexed <= 0:
+        return
+    for group in state.enemy_behaviors.values():
+        for i, e in enumerate(group):
+            if e is enemy:
+                del group[i]
+                break
+    state.enemy_behaviors_indexed -= 1
 
 
 def _update_queen_shield(enemy: dict, dt: float) -> None:
@@ -91,10 +91,15 @@ def _check_enemy_collision(
 ) -> bool:
     """
     Check if enemy collides with any solid object.
+    Uses the per-step CollisionWorld snapshot when movement_system has one active.
     
     Returns:
         True if collision detected, False otherwise
     """
+    world = getattr(state, "collision_world", None)
+    if world is not None:
+        return world.collides(enemy_rect)
+
     # Check static blocks
     for b in level.static_blocks:
         if enemy_rect.colliderect(b["rect"]):
@@ -355,3 +360,70 @@ def move_enemy_with_push(
     
     # Clamp to screen bounds
     clamp_rect_to_screen(enemy_rect, width, height)
+
+    world = getattr(state, "collision_world", None)
+    if world is not None:
+        world.update(enemy_rect)
+
+
+ENEMY_SEPARATION_MAX_PUSH = 4
+
+
+def separate_enemies(
+    state: "GameState",
+    width: int,
+    height: int,
+    max_push: int = ENEMY_SEPARATION_MAX_PUSH,
+) -> int:
+    """
+    Push overlapping enemies apart using the active CollisionWorld (no-op without one).
+
+    Each live, non-ambient, non-patrol enemy looks up the enemies sharing its grid cells and moves
+    out along the shallower overlap axis, at most max_push px per axis per step. A push is dropped
+    if it would enter a block, pickup, teleporter pad, the player or a friendly (unless the enemy
+    already overlaps one, so it can work its way out). Cost is linear in
+    the number of enemies for a bounded local density.
+
+    Returns:
+        Number of enemies moved
+    """
+    world = getattr(state, "collision_world", None)
+    if world is None:
+        return 0
+    moved = 0
+    for enemy in state.enemies:
+        if enemy.hp <= 0 or enemy.is_ambient or enemy.is_patrol:
+            continue
+        rect = enemy.rect
+        overlaps = world.enemy_overlaps(rect)
+        if not overlaps:
+            continue
+        push_x = push_y = 0
+        cx, cy = rect.center
+        for other in overlaps:
+            dx = cx - other.centerx
+            dy = cy - other.centery
+            depth_x = (rect.width + other.width) // 2 - abs(dx)
+            depth_y = (rect.height + other.height) // 2 - abs(dy)
+            if depth_x <= depth_y:
+                push_x += depth_x if dx > 0 else -depth_x
+            else:
+                push_y += depth_y if dy > 0 else -depth_y
+        push_x = max(-max_push, min(max_push, push_x))
+        push_y = max(-max_push, min(max_push, push_y))
+        if push_x == 0 and push_y == 0:
+            continue
+        start = rect.topleft
+        # An enemy already embedded in a solid (e.g. spawned on the player) may still be pushed out
+        embedded = world.collides_non_enemy(rect)
+        for axis_dx, axis_dy in ((push_x, 0), (0, push_y)):
+            if axis_dx == 0 and axis_dy == 0:
+                continue
+            rect.move_ip(axis_dx, axis_dy)
+            if not embedded and world.collides_non_enemy(rect):
+                rect.move_ip(-axis_dx, -axis_dy)
+        clamp_rect_to_screen(rect, width, height)
+        if rect.topleft != start:
+            world.update(rect)
+            moved += 1
+    return moved
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from .collision_common import apply_player_damage
+from .owner_index import remove_child
 
 
 def handle_enemy_laser_beam_collisions(state, dt: float, ctx: dict) -> None:
@@ -34,13 +35,11 @@ def handle_enemy_projectile_player_collisions(state, ctx: dict) -> None:
         if not proj["rect"].colliderect(player):
             continue
         if state.shield_active:
-            if proj in state.enemy_projectiles:
-                state.enemy_projectiles.remove(proj)
+            remove_child(state.enemy_projectiles, proj)
             continue
         damage = proj.get("damage", 10)
         apply_player_damage(state, damage, ctx)
-        if proj in state.enemy_projectiles:
-            state.enemy_projectiles.remove(proj)
+        remove_child(state.enemy_projectiles, proj)
 
 
 def handle_teleporter_player(state, ctx: dict) -> None:
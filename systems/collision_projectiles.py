@@ -4,7 +4,10 @@ from __future__ import annotations
 import math
 import pygame
 
+from hazards import points_in_hazards
+
 from .collision_common import apply_player_damage, set_enemy_damage_flash
+from .owner_index import OWNED_DAMAGE_NUMBERS, add_child, remove_child
 
 try:
     from gpu_physics import check_collisions_batch, CUDA_AVAILABLE
@@ -17,21 +20,25 @@ except Exception:
 def handle_hazard_enemy_collisions(state, dt: float, ctx: dict) -> None:
     lev = getattr(state, "level", None)
     hazards = lev.hazard_obstacles if lev else []
-    for hazard in hazards:
-        if not hazard.get("points") or len(hazard["points"]) < 3:
+    kill = ctx.get("kill_enemy")
+    if not hazards or not kill or not state.enemies:
+        return
+    enemies = state.enemies[:]
+    inside_by_hazard = points_in_hazards([e["rect"].center for e in enemies], hazards)
+    killed: set[int] = set()
+    for hazard, inside in zip(hazards, inside_by_hazard):
+        if not inside:
             continue
         hazard_damage = hazard.get("damage", 10)
-        check = ctx.get("check_point_in_hazard")
-        kill = ctx.get("kill_enemy")
-        if not check or not kill:
-            continue
-        for enemy in state.enemies[:]:
-            center = pygame.Vector2(enemy["rect"].center)
-            if check(center, hazard["points"], hazard["bounding_rect"]):
-                enemy["hp"] -= hazard_damage * dt
-                set_enemy_damage_flash(enemy, ctx)
-                if enemy["hp"] <= 0:
-                    kill(enemy, state)
+        for idx in inside:
+            if idx in killed:
+                continue
+            enemy = enemies[idx]
+            enemy["hp"] -= hazard_damage * dt
+            set_enemy_damage_flash(enemy, ctx)
+            if enemy["hp"] <= 0:
+                killed.add(idx)
+                kill(enemy, state)
 
 
 def handle_laser_beam_collisions(state, dt: float, ctx: dict) -> None:
@@ -95,7 +102,7 @@ def _process_bullet_enemy_hit(state, ctx: dict, bullet: dict, enemy: dict) -> No
                 enemy["rect"].centery - size[1] // 2,
                 size[0], size[1],
             )
-            state.enemy_projectiles.append({
+            add_child(state.enemy_projectiles, {
                 "rect": ref,
                 "vel": to_bullet * enemy.get("projectile_speed", 300),
                 "enemy_type": enemy["type"],
@@ -103,7 +110,7 @@ def _process_bullet_enemy_hit(state, ctx: dict, bullet: dict, enemy: dict) -> No
                 "shape": enemy.get("projectile_shape", "circle"),
                 "bounces": 0,
                 "damage": dmg,
-            })
+            }, enemy)
             if bullet in state.player_bullets:
                 state.player_bullets.remove(bullet)
             return
@@ -124,14 +131,14 @@ def _process_bullet_enemy_hit(state, ctx: dict, bullet: dict, enemy: dict) -> No
                     enemy["rect"].centery - size[1] // 2,
                     size[0], size[1],
                 )
-                state.enemy_projectiles.append({
+                add_child(state.enemy_projectiles, {
                     "rect": ref,
                     "vel": -bdir * enemy.get("projectile_speed", 300),
                     "enemy_type": enemy["type"],
                     "color": enemy.get("projectile_color", color),
                     "shape": enemy.get("projectile_shape", "circle"),
                     "bounces": 0,
-                })
+                }, enemy)
                 enemy["shield_hp"] = 0
             if bullet in state.player_bullets:
                 state.player_bullets.remove(bullet)
@@ -139,13 +146,13 @@ def _process_bullet_enemy_hit(state, ctx: dict, bullet: dict, enemy: dict) -> No
         dmg = bullet.get("damage", player_damage)
         enemy["hp"] -= dmg
         set_enemy_damage_flash(enemy, ctx)
-        state.damage_numbers.append({
+        add_child(state.damage_numbers, {
             "x": enemy["rect"].centerx,
             "y": enemy["rect"].y - 20,
             "damage": int(dmg),
             "timer": 2.0,
             "color": (255, 255, 100),
-        })
+        }, enemy, OWNED_DAMAGE_NUMBERS)
         if enemy["hp"] <= 0:
             kill(enemy, state)
         if bullet.get("penetration", 0) <= 0:
@@ -157,13 +164,13 @@ def _process_bullet_enemy_hit(state, ctx: dict, bullet: dict, enemy: dict) -> No
     dmg = bullet.get("damage", player_damage)
     enemy["hp"] -= dmg
     set_enemy_damage_flash(enemy, ctx)
-    state.damage_numbers.append({
+    add_child(state.damage_numbers, {
         "x": enemy["rect"].centerx,
         "y": enemy["rect"].y - 20,
         "damage": int(dmg),
         "timer": 2.0,
         "color": (255, 255, 100),
-    })
+    }, enemy, OWNED_DAMAGE_NUMBERS)
     if enemy["hp"] <= 0:
         kill(enemy, state)
     if bullet.get("penetration", 0) <= 0:
@@ -222,7 +229,15 @@ def handle_player_bullet_block_collisions(state, dt: float, ctx: dict) -> None:
     hazards = lev.hazard_obstacles
     player_damage = state.player_bullet_damage
 
-    for bullet in state.player_bullets[:]:
+    bullets = state.player_bullets[:]
+    # First hazard (in list order) containing each bullet center, computed in one batch up front.
+    bullet_hazard: dict[int, dict] = {}
+    if check_hazard and hazards:
+        for hazard, inside in zip(hazards, points_in_hazards([b["rect"].center for b in bullets], hazards)):
+            for idx in inside:
+                bullet_hazard.setdefault(idx, hazard)
+
+    for b_idx, bullet in enumerate(bullets):
         if bullet.get("removed"):
             continue
         for block in d_blocks + m_blocks:
@@ -280,32 +295,25 @@ def handle_player_bullet_block_collisions(state, dt: float, ctx: dict) -> None:
                 break
         if bullet.get("removed"):
             continue
-        if not check_hazard:
-            continue
-        for hazard in hazards:
-            if not hazard.get("points") or len(hazard["points"]) < 3:
-                continue
-            bc = pygame.Vector2(bullet["rect"].center)
-            if check_hazard(bc, hazard["points"], hazard["bounding_rect"]):
-                vel = bullet.get("vel", pygame.Vector2(0, 0))
-                if vel.length_squared() > 0:
-                    v = hazard.get("velocity", pygame.Vector2(0, 0))
-                    hazard["velocity"] = v + vel.normalize() * 200.0 * dt
-                if bullet in state.player_bullets:
-                    state.player_bullets.remove(bullet)
-                bullet["removed"] = True
-                break
+        hazard = bullet_hazard.get(b_idx)
+        if hazard is not None:
+            vel = bullet.get("vel", pygame.Vector2(0, 0))
+            if vel.length_squared() > 0:
+                v = hazard.get("velocity", pygame.Vector2(0, 0))
+                hazard["velocity"] = v + vel.normalize() * 200.0 * dt
+            if bullet in state.player_bullets:
+                state.player_bullets.remove(bullet)
+            bullet["removed"] = True
 
 
 def handle_enemy_projectile_lifetime_offscreen(state, ctx: dict) -> None:
     offscreen = ctx.get("rect_offscreen")
     for proj in state.enemy_projectiles[:]:
         if "lifetime" in proj and proj["lifetime"] <= 0:
-            if proj in state.enemy_projectiles:
-                state.enemy_projectiles.remove(proj)
+            remove_child(state.enemy_projectiles, proj)
             continue
-        if offscreen and offscreen(proj["rect"]) and proj in state.enemy_projectiles:
-            state.enemy_projectiles.remove(proj)
+        if offscreen and offscreen(proj["rect"]):
+            remove_child(state.enemy_projectiles, proj)
 
 
 def handle_enemy_projectile_block_collisions(state, ctx: dict) -> None:
@@ -323,8 +331,7 @@ def handle_enemy_projectile_block_collisions(state, ctx: dict) -> None:
                         d_blocks.remove(block)
                     else:
                         m_blocks.remove(block)
-                if proj in state.enemy_projectiles:
-                    state.enemy_projectiles.remove(proj)
+                remove_child(state.enemy_projectiles, proj)
                 break
 
 
@@ -338,8 +345,7 @@ def handle_enemy_projectile_friendly_collisions(state, ctx: dict) -> None:
                 continue
             damage = proj.get("damage", 10)
             friendly["hp"] = friendly.get("hp", friendly.get("max_hp", 100)) - damage
-            if proj in state.enemy_projectiles:
-                state.enemy_projectiles.remove(proj)
+            remove_child(state.enemy_projectiles, proj)
             if friendly["hp"] <= 0 and friendly in state.friendly_ai:
                 state.friendly_ai.remove(friendly)
             break
@@ -374,13 +380,13 @@ def handle_friendly_projectile_offscreen_blocks_enemies(state, ctx: dict) -> Non
                     dmg = proj.get("damage", 20)
                     enemy["hp"] -= dmg
                     set_enemy_damage_flash(enemy, ctx)
-                    state.damage_numbers.append({
+                    add_child(state.damage_numbers, {
                         "x": enemy["rect"].centerx,
                         "y": enemy["rect"].y - 20,
                         "damage": int(dmg),
                         "timer": 2.0,
                         "color": (255, 255, 100),
-                    })
+                    }, enemy, OWNED_DAMAGE_NUMBERS)
                     if enemy["hp"] <= 0 and kill:
                         kill(enemy, state)
                     state.friendly_projectiles.remove(proj)
@@ -410,13 +416,13 @@ def handle_grenade_explosion_damage(state, dt: float, ctx: dict) -> None:
                 if d <= r:
                     enemy["hp"] -= damage_val
                     set_enemy_damage_flash(enemy, ctx)
-                    state.damage_numbers.append({
+                    add_child(state.damage_numbers, {
                         "x": enemy["rect"].centerx,
                         "y": enemy["rect"].y - 20,
                         "damage": int(damage_val),
                         "timer": 2.0,
                         "color": (255, 200, 100),
-                    })
+                    }, enemy, OWNED_DAMAGE_NUMBERS)
                     if enemy["hp"] <= 0 and kill:
                         kill(enemy, state)
         if source == "enemy_player_allies_only":
@@ -472,13 +478,13 @@ def handle_missile_collisions(state, ctx: dict) -> None:
                     dmg = missile.get("damage", md)
                     enemy["hp"] -= dmg
                     set_enemy_damage_flash(enemy, ctx)
-                    state.damage_numbers.append({
+                    add_child(state.damage_numbers, {
                         "x": enemy["rect"].centerx,
                         "y": enemy["rect"].y - 20,
                         "damage": int(dmg),
                         "timer": 2.0,
                         "color": (255, 150, 50),
-                    })
+                    }, enemy, OWNED_DAMAGE_NUMBERS)
                     if enemy["hp"] <= 0 and kill:
                         kill(enemy, state)
             if missile.get("target_player") and player:
@@ -0,0 +1,176 @@
+"""
+Per-step collision snapshot for enemy movement.
+
+Built once at the start of movement_system._update_enemies from the level geometry, pickups, pads,
+health zone, player, live friendlies and enemies. Rects are bucketed in a uniform grid; an enemy
+(or any other tracked rect) that moves is re-bucketed in place with update(), so each move is a
+local query instead of a scan over every blocker and every other enemy.
+
+Enemy rects are tagged so the separation pass (collision_movement.separate_enemies) can find
+overlapping enemy pairs by cell and test its push-outs against everything else (blocks, pickups,
+teleporter pads, player) without touching the rest of the enemy list.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+import pygame
+
+if TYPE_CHECKING:
+    from state import GameState
+
+COLLISION_CELL_SIZE = 64
+
+
+class CollisionWorld:
+    """Uniform-grid index of solid rects (live references; call update() after moving one)."""
+
+    __slots__ = ("cell", "_buckets", "_spans", "_enemy_ids")
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self.cell = int(cell_size)
+        self._buckets: dict[tuple[int, int], list[pygame.Rect]] = {}
+        self._spans: dict[int, tuple[int, int, int, int]] = {}  # id(rect) -> cell span it is bucketed in
+        self._enemy_ids: set[int] = set()
+
+    def _span(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        c = self.cell
+        return rect.left // c, rect.top // c, (rect.right - 1) // c, (rect.bottom - 1) // c
+
+    def _bucket(self, rect: pygame.Rect, span: tuple[int, int, int, int]) -> None:
+        buckets = self._buckets
+        c0, r0, c1, r1 = span
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket is None:
+                    buckets[(cx, cy)] = [rect]
+                else:
+                    bucket.append(rect)
+
+    def _unbucket(self, rect: pygame.Rect, span: tuple[int, int, int, int]) -> None:
+        buckets = self._buckets
+        c0, r0, c1, r1 = span
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket is None:
+                    continue
+                for i, r in enumerate(bucket):
+                    if r is rect:
+                        bucket[i] = bucket[-1]
+                        bucket.pop()
+                        break
+
+    def add(self, rect: pygame.Rect, enemy: bool = False) -> None:
+        if id(rect) in self._spans:
+            return
+        span = self._span(rect)
+        self._spans[id(rect)] = span
+        self._bucket(rect, span)
+        if enemy:
+            self._enemy_ids.add(id(rect))
+
+    def add_all(self, rects: Iterable[pygame.Rect], enemy: bool = False) -> None:
+        for rect in rects:
+            self.add(rect, enemy)
+
+    def remove(self, rect: pygame.Rect) -> None:
+        span = self._spans.pop(id(rect), None)
+        if span is not None:
+            self._unbucket(rect, span)
+            self._enemy_ids.discard(id(rect))
+
+    def is_enemy(self, rect: pygame.Rect) -> bool:
+        return id(rect) in self._enemy_ids
+
+    def update(self, rect: pygame.Rect) -> None:
+        """Re-bucket a tracked rect after it moved (enemy step, pushed block). No-op if its cells are unchanged."""
+        old = self._spans.get(id(rect))
+        if old is None:
+            return
+        new = self._span(rect)
+        if new != old:
+            self._unbucket(rect, old)
+            self._bucket(rect, new)
+            self._spans[id(rect)] = new
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        """True if rect overlaps any tracked rect other than itself."""
+        buckets = self._buckets
+        c = self.cell
+        c0, r0, c1, r1 = rect.left // c, rect.top // c, (rect.right - 1) // c, (rect.bottom - 1) // c
+        colliderect = rect.colliderect
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket is None:
+                    continue
+                for other in bucket:
+                    if other is not rect and colliderect(other):
+                        return True
+        return False
+
+    def collides_non_enemy(self, rect: pygame.Rect) -> bool:
+        """True if rect overlaps a tracked rect that is not an enemy (blocks, pickups, pads, player, friendlies)."""
+        buckets = self._buckets
+        enemy_ids = self._enemy_ids
+        c = self.cell
+        c0, r0, c1, r1 = rect.left // c, rect.top // c, (rect.right - 1) // c, (rect.bottom - 1) // c
+        colliderect = rect.colliderect
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket is None:
+                    continue
+                for other in bucket:
+                    if other is not rect and id(other) not in enemy_ids and colliderect(other):
+                        return True
+        return False
+
+    def candidates(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """Tracked rects sharing a cell with rect (each once, excluding rect itself); not overlap-filtered."""
+        buckets = self._buckets
+        c = self.cell
+        c0, r0, c1, r1 = rect.left // c, rect.top // c, (rect.right - 1) // c, (rect.bottom - 1) // c
+        if c0 == c1 and r0 == r1:
+            return [r for r in buckets.get((c0, r0), ()) if r is not rect]
+        seen = {id(rect)}
+        out = []
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                for other in buckets.get((cx, cy), ()):
+                    if id(other) not in seen:
+                        seen.add(id(other))
+                        out.append(other)
+        return out
+
+    def enemy_overlaps(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """Enemy rects overlapping rect (excluding rect itself)."""
+        enemy_ids = self._enemy_ids
+        colliderect = rect.colliderect
+        return [o for o in self.candidates(rect) if id(o) in enemy_ids and colliderect(o)]
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    @classmethod
+    def from_state(cls, state: "GameState", cell_size: int = COLLISION_CELL_SIZE) -> "CollisionWorld":
+        """Snapshot of everything _check_enemy_collision tests against."""
+        world = cls(cell_size)
+        level = getattr(state, "level", None)
+        if level is not None:
+            for blocks in (level.static_blocks, level.destructible_blocks, level.moveable_blocks,
+                           level.giant_blocks, level.super_giant_blocks):
+                world.add_all(b["rect"] for b in blocks)
+            for blocks in (level.trapezoid_blocks, level.triangle_blocks):
+                world.add_all(b.get("bounding_rect", b.get("rect")) for b in blocks)
+            if level.moving_health_zone:
+                world.add(level.moving_health_zone["rect"])
+        world.add_all(p["rect"] for p in state.pickups)
+        if state.player_rect is not None:
+            world.add(state.player_rect)
+        world.add_all(pad["rect"] for pad in state.teleporter_pads)
+        world.add_all(f["rect"] for f in state.friendly_ai if f.get("hp", 1) > 0)
+        world.add_all((e["rect"] for e in state.enemies), enemy=True)
+        return world
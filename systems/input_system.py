@@ -23,11 +23,13 @@ from constants import (
 )
 from config_enemies import FRIENDLY_AI_TEMPLATES
 from allies import make_friendly_from_template
+from input_source import LIVE_INPUT
 
 
 def handle_gameplay_input(events, game_state, ctx) -> None:
     """Parse gameplay-only input: move, jump/dash, fire, weapon switch, abilities.
     ctx must have: controls, aiming_mode, width, height, spawn_player_bullet, spawn_laser_beam.
+    Keys and mouse are read from ctx["input_source"] (live pygame input when absent).
     Only call when game_state.current_screen is STATE_PLAYING or STATE_ENDURANCE.
     """
     state = getattr(game_state, "current_screen", None)
@@ -35,6 +37,7 @@ def handle_gameplay_input(events, game_state, ctx) -> None:
         return
 
     controls = ctx.get("controls") or {}
+    source = ctx.get("input_source") or LIVE_INPUT
     aiming_mode = ctx.get("aiming_mode")
     player = game_state.player_rect
 
@@ -55,7 +58,7 @@ def handle_gameplay_input(events, game_state, ctx) -> None:
 
         if event.type == pygame.KEYDOWN:
             if direct_allies_binding != MOUSE_BUTTON_RIGHT and event.key == direct_allies_binding:
-                mx, my = pygame.mouse.get_pos()
+                mx, my = source.get_mouse_pos()
                 game_state.ally_command_target = (float(mx), float(my))
                 game_state.ally_command_timer = 5.0
 
@@ -148,7 +151,7 @@ def handle_gameplay_input(events, game_state, ctx) -> None:
                         game_state.jump_velocity = pygame.Vector2(0, -jump_speed)
 
     # ---- Polled: movement, boost/slow, fire, laser ----
-    keys = pygame.key.get_pressed()
+    keys = source.get_pressed()
     move_x = 0
     move_y = 0
     if keys[controls.get("move_left", pygame.K_a)]:
@@ -191,7 +194,7 @@ def handle_gameplay_input(events, game_state, ctx) -> None:
     game_state.move_input_y = move_y
 
     # Fire and laser: set flag and call callbacks; callbacks (from game.py) perform cooldown check and spawn
-    mouse = pygame.mouse.get_pressed()
+    mouse = source.get_mouse_pressed()
     shoot_input = mouse[0] or (aiming_mode == AIM_ARROWS and (
         keys[pygame.K_LEFT] or keys[pygame.K_RIGHT] or keys[pygame.K_UP] or keys[pygame.K_DOWN]))
     game_state.fire_pressed = shoot_input
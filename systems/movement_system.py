@@ -12,6 +12,9 @@ import pygame
 
 from constants import MAX_ENEMIES_TARGETING_PLAYER
 from enemies import find_nearest_threat, find_threats_in_dodge_range
+from systems.collision_movement import separate_enemies
+from systems.collision_world import CollisionWorld
+from systems.nav_grid import nav_grid_for
 
 try:
     from ecs_components import PositionComponent, VelocityComponent
@@ -101,8 +104,25 @@ def _nearest_point_on_perimeter(pos: pygame.Vector2, rect: pygame.Rect) -> pygam
     return pygame.Vector2(best[0], best[1])
 
 
+def _chase_direction(nav, enemy_pos: pygame.Vector2, goal_x: float, goal_y: float, vec_toward) -> pygame.Vector2:
+    """Unit direction toward a goal: along the nav flow field when there is one, else straight at it."""
+    if nav is not None:
+        flow = nav.direction(enemy_pos.x, enemy_pos.y, goal_x, goal_y)
+        if flow is not None:
+            return pygame.Vector2(flow)
+    direction = vec_toward(enemy_pos.x, enemy_pos.y, goal_x, goal_y)
+    if direction.length_squared() < 1e-6:
+        return pygame.Vector2(1, 0)  # already at target, avoid normalizing zero
+    return direction.normalize()
+
+
 def _update_enemies(state, dt: float, ctx: dict) -> None:
-    """Enemy position: chase target, patrol outer until player leaves main area, stuck/wander/dodge."""
+    """Enemy position: chase target, patrol outer until player leaves main area, stuck/wander/dodge.
+
+    state.enemies are entities.Enemy records; hot fields are read as attributes (enemy.rect, enemy.is_boss).
+    Chasing follows the nav grid's flow field toward the target (systems.nav_grid) unless level_context
+    "enemy_flow_field" is False.
+    """
     player = state.player_rect
     if player is None:
         return
@@ -123,140 +143,151 @@ def _update_enemies(state, dt: float, ctx: dict) -> None:
     # Only allow up to N enemies to target the player; the rest target friendlies or patrol. Closest N by distance get the slots.
     player_center = pygame.Vector2(player.center)
     candidates = [
-        (e, (pygame.Vector2(e["rect"].center) - player_center).length_squared())
+        (e, (pygame.Vector2(e.rect.center) - player_center).length_squared())
         for e in state.enemies
-        if e.get("hp", 1) > 0 and not e.get("is_ambient")
+        if e.hp > 0 and not e.is_ambient
     ]
     candidates.sort(key=lambda x: x[1])
     ctx["_player_targeting_slots"] = set(id(e) for e, _ in candidates[:MAX_ENEMIES_TARGETING_PLAYER])
 
-    for enemy in state.enemies:
-        if enemy.get("hp", 1) <= 0:
-            continue
-        if enemy.get("is_ambient"):
-            continue  # Stationary
-
-        current_pos = pygame.Vector2(enemy["rect"].center)
-        last_pos = enemy.get("last_pos", current_pos)
-        stuck_timer = enemy.get("stuck_timer", 0.0)
-        distance_moved = current_pos.distance_to(last_pos)
-        if distance_moved < 5.0:
-            stuck_timer += dt
-        else:
-            stuck_timer = 0.0
-        enemy["last_pos"] = current_pos
-        enemy["stuck_timer"] = stuck_timer
-
-        enemy_pos = pygame.Vector2(enemy["rect"].center)
-        allow_player = id(enemy) in ctx.get("_player_targeting_slots", set())
-        target_info = find_nearest_threat(enemy_pos, player, state.friendly_ai, allow_player=allow_player)
-
-        # When player is in main area, non-boss non-patrol enemies patrol the outer area
-        if target_info and player_in_main and outer_rect and not enemy.get("is_boss") and not enemy.get("is_patrol"):
-            patrol_target = _nearest_point_on_perimeter(enemy_pos, outer_rect)
-            target_pos = patrol_target
-        elif target_info:
-            target_pos, _ = target_info
-        else:
-            target_pos = None
-
-        if target_pos is not None:
-            direction = vec_toward(enemy_pos.x, enemy_pos.y, target_pos.x, target_pos.y)
-            if direction.length_squared() < 1e-6:
-                direction = pygame.Vector2(1, 0)  # already at target, avoid normalizing zero
+    # Collision snapshot for this step: enemy moves query it and re-bucket themselves in place
+    world = CollisionWorld.from_state(state)
+    state.collision_world = world
+    try:
+        nav = nav_grid_for(state, width, height) if ctx.get("enemy_flow_field", True) else None
+
+        for enemy in state.enemies:
+            if enemy.hp <= 0:
+                continue
+            if enemy.is_ambient:
+                continue  # Stationary
+
+            current_pos = pygame.Vector2(enemy.rect.center)
+            last_pos = enemy.last_pos
+            if last_pos is None:
+                last_pos = current_pos
+            stuck_timer = enemy.stuck_timer or 0.0
+            distance_moved = current_pos.distance_to(last_pos)
+            if distance_moved < 5.0:
+                stuck_timer += dt
             else:
-                direction = direction.normalize()
-            enemy_speed = enemy.get("speed", 80) * dt
-
-            # Bait grenades: approach player then retreat from grenade range (get in, get out)
-            if target_info and not enemy.get("is_boss") and not enemy.get("is_patrol") and not enemy.get("is_ambient"):
-                target_pos_v, target_type = target_info
-                if target_type == "player":
-                    dist_to_player = enemy_pos.distance_to(pygame.Vector2(player.center))
-                    GRENADE_BAIT_INNER, GRENADE_BAIT_OUTER = 120.0, 220.0
-                    phase = enemy.get("bait_phase", "approach")
-                    if dist_to_player < GRENADE_BAIT_INNER:
-                        phase = "retreat"
-                    elif dist_to_player > GRENADE_BAIT_OUTER:
-                        phase = "approach"
-                    enemy["bait_phase"] = phase
-                    if phase == "retreat":
-                        away = vec_toward(player.centerx, player.centery, enemy_pos.x, enemy_pos.y)
-                        if away.length_squared() >= 1e-6:
-                            direction = away.normalize()
-
-            if len(state.enemies) <= 5 and not player_in_main:
-                direction = vec_toward(enemy_pos.x, enemy_pos.y, player.centerx, player.centery)
-                if direction.length_squared() >= 1e-6:
-                    direction = direction.normalize()
+                stuck_timer = 0.0
+            enemy.last_pos = current_pos
+            enemy.stuck_timer = stuck_timer
+
+            enemy_pos = pygame.Vector2(enemy.rect.center)
+            allow_player = id(enemy) in ctx.get("_player_targeting_slots", set())
+            target_info = find_nearest_threat(enemy_pos, player, state.friendly_ai, allow_player=allow_player)
+
+            # When player is in main area, non-boss non-patrol enemies patrol the outer area
+            patrolling = False
+            if target_info and player_in_main and outer_rect and not enemy.is_boss and not enemy.is_patrol:
+                patrol_target = _nearest_point_on_perimeter(enemy_pos, outer_rect)
+                target_pos = patrol_target
+                patrolling = True
+            elif target_info:
+                target_pos, _ = target_info
             else:
-                if stuck_timer >= 5.0:
-                    direction = -direction
-                    random_angle = random.uniform(0, 2 * math.pi)
-                    escape_dir = pygame.Vector2(math.cos(random_angle), math.sin(random_angle))
-                    direction = direction + escape_dir * 0.5
-                    if direction.length_squared() >= 1e-6:
-                        direction = direction.normalize()
-                    else:
-                        direction = escape_dir
-                    enemy["stuck_timer"] = 0.0
-
-                if random.random() < 0.25:
-                    wander_angle = random.uniform(-0.8, 0.8)
-                    cos_a = math.cos(wander_angle)
-                    sin_a = math.sin(wander_angle)
-                    direction = pygame.Vector2(
-                        direction.x * cos_a - direction.y * sin_a,
-                        direction.x * sin_a + direction.y * cos_a,
+                target_pos = None
+
+            if target_pos is not None:
+                # Perimeter points differ per enemy, so only threat targets share a flow field
+                direction = _chase_direction(None if patrolling else nav, enemy_pos, target_pos.x, target_pos.y, vec_toward)
+                enemy_speed = enemy.speed * dt
+
+                # Bait grenades: approach player then retreat from grenade range (get in, get out)
+                if target_info and not enemy.is_boss and not enemy.is_patrol and not enemy.is_ambient:
+                    target_pos_v, target_type = target_info
+                    if target_type == "player":
+                        dist_to_player = enemy_pos.distance_to(pygame.Vector2(player.center))
+                        GRENADE_BAIT_INNER, GRENADE_BAIT_OUTER = 120.0, 220.0
+                        phase = enemy.bait_phase or "approach"
+                        if dist_to_player < GRENADE_BAIT_INNER:
+                            phase = "retreat"
+                        elif dist_to_player > GRENADE_BAIT_OUTER:
+                            phase = "approach"
+                        enemy.bait_phase = phase
+                        if phase == "retreat":
+                            away = vec_toward(player.centerx, player.centery, enemy_pos.x, enemy_pos.y)
+                            if away.length_squared() >= 1e-6:
+                                direction = away.normalize()
+
+                if len(state.enemies) <= 5 and not player_in_main:
+                    direction = _chase_direction(nav, enemy_pos, player.centerx, player.centery, vec_toward)
+                else:
+                    if stuck_timer >= 5.0:
+                        direction = -direction
+                        random_angle = random.uniform(0, 2 * math.pi)
+                        escape_dir = pygame.Vector2(math.cos(random_angle), math.sin(random_angle))
+                        direction = direction + escape_dir * 0.5
+                        if direction.length_squared() >= 1e-6:
+                            direction = direction.normalize()
+                        else:
+                            direction = escape_dir
+                        enemy.stuck_timer = 0.0
+
+                    if random.random() < 0.25:
+                        wander_angle = random.uniform(-0.8, 0.8)
+                        cos_a = math.cos(wander_angle)
+                        sin_a = math.sin(wander_angle)
+                        direction = pygame.Vector2(
+                            direction.x * cos_a - direction.y * sin_a,
+                            direction.x * sin_a + direction.y * cos_a,
+                        )
+                        if direction.length_squared() >= 1e-6:
+                            direction = direction.normalize()
+                        # else keep previous direction
+
+                    if random.random() < 0.05:
+                        random_angle = random.uniform(0, 2 * math.pi)
+                        direction = pygame.Vector2(math.cos(random_angle), math.sin(random_angle))
+
+                    # Dodge shots: always try to sidestep when bullets/projectiles are in range
+                    dodge_threats = find_threats_in_dodge_range(
+                        enemy_pos, state.player_bullets, state.friendly_projectiles, 220.0
                     )
-                    if direction.length_squared() >= 1e-6:
-                        direction = direction.normalize()
-                    # else keep previous direction
-
-                if random.random() < 0.05:
-                    random_angle = random.uniform(0, 2 * math.pi)
-                    direction = pygame.Vector2(math.cos(random_angle), math.sin(random_angle))
-
-                # Dodge shots: always try to sidestep when bullets/projectiles are in range
-                dodge_threats = find_threats_in_dodge_range(
-                    enemy_pos, state.player_bullets, state.friendly_projectiles, 220.0
-                )
-                if dodge_threats:
-                    dodge_dir = pygame.Vector2(-direction.y, direction.x)
-                    if random.random() < 0.5:
-                        dodge_dir = -dodge_dir
-                    direction = direction + dodge_dir * 0.6
-                    if direction.length_squared() >= 1e-6:
-                        direction = direction.normalize()
-
-            move_x = int(direction.x * enemy_speed)
-            move_y = int(direction.y * enemy_speed)
-            move_enemy(state, enemy["rect"], move_x, move_y)
-
-        if enemy.get("is_patrol"):
-            patrol_side = enemy.get("patrol_side", 0)
-            patrol_progress = enemy.get("patrol_progress", 0.0)
-            patrol_speed = 0.3 * dt
-            patrol_progress += patrol_speed
-            if patrol_progress >= 1.0:
-                patrol_progress = 0.0
-                patrol_side = (patrol_side + 1) % 4
-                enemy["patrol_side"] = patrol_side
-            enemy["patrol_progress"] = patrol_progress
-            border_margin = 50
-            if patrol_side == 0:
-                x = border_margin + (width - 2 * border_margin) * patrol_progress
-                y = border_margin
-            elif patrol_side == 1:
-                x = width - border_margin
-                y = border_margin + (height - 2 * border_margin) * patrol_progress
-            elif patrol_side == 2:
-                x = width - border_margin - (width - 2 * border_margin) * patrol_progress
-                y = height - border_margin
-            else:
-                x = border_margin
-                y = height - border_margin - (height - 2 * border_margin) * patrol_progress
-            enemy["rect"].center = (int(x), int(y))
+                    if dodge_threats:
+                        dodge_dir = pygame.Vector2(-direction.y, direction.x)
+                        if random.random() < 0.5:
+                            dodge_dir = -dodge_dir
+                        direction = direction + dodge_dir * 0.6
+                        if direction.length_squared() >= 1e-6:
+                            direction = direction.normalize()
+
+                move_x = int(direction.x * enemy_speed)
+                move_y = int(direction.y * enemy_speed)
+                move_enemy(state, enemy.rect, move_x, move_y)
+
+            if enemy.is_patrol:
+                patrol_side = enemy.get("patrol_side", 0)
+                patrol_progress = enemy.get("patrol_progress", 0.0)
+                patrol_speed = 0.3 * dt
+                patrol_progress += patrol_speed
+                if patrol_progress >= 1.0:
+                    patrol_progress = 0.0
+                    patrol_side = (patrol_side + 1) % 4
+                    enemy["patrol_side"] = patrol_side
+                enemy["patrol_progress"] = patrol_progress
+                border_margin = 50
+                if patrol_side == 0:
+                    x = border_margin + (width - 2 * border_margin) * patrol_progress
+                    y = border_margin
+                elif patrol_side == 1:
+                    x = width - border_margin
+                    y = border_margin + (height - 2 * border_margin) * patrol_progress
+                elif patrol_side == 2:
+                    x = width - border_margin - (width - 2 * border_margin) * patrol_progress
+                    y = height - border_margin
+                else:
+                    x = border_margin
+                    y = height - border_margin - (height - 2 * border_margin) * patrol_progress
+                enemy.rect.center = (int(x), int(y))
+                world.update(enemy.rect)
+
+        # Resolve enemy stacking left by spawns, patrol snapping and screen clamping
+        separate_enemies(state, width, height)
+    finally:
+        state.collision_world = None
 
 
 def _update_player_bullets(state, dt: float, ctx: dict) -> None:
@@ -397,11 +428,10 @@ def _update_ecs_position_velocity(state: "GameState", dt: float) -> None:
     ecs = getattr(state, "ecs_entities", None)
     if not ecs:
         return
-    for eid in state.get_entities_with(PositionComponent, VelocityComponent):
-        comps = ecs.get(eid, {})
-        pos = comps.get(PositionComponent)
-        vel = comps.get(VelocityComponent)
-        if pos is None or vel is None or pos.rect is None:
-            continue
-        pos.rect.x += int(vel.vx * dt)
-        pos.rect.y += int(vel.vy * dt)
+    # Column iteration over the matching archetypes (no per-entity dict lookups)
+    for _ids, positions, velocities in ecs.iter_columns(PositionComponent, VelocityComponent):
+        for pos, vel in zip(positions, velocities):
+            if pos.rect is None:
+                continue
+            pos.rect.x += int(vel.vx * dt)
+            pos.rect.y += int(vel.vy * dt)
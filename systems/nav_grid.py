@@ -0,0 +1,292 @@
+"""
+Coarse navigation grid and flow fields for enemy chasing.
+
+The grid covers the screen in NAV_CELL_SIZE cells. A cell is blocked while any level block (inflated
+by NAV_CLEARANCE so enemies fit through the open cells) overlaps the small square at its centre (the
+enemy's target in that cell); testing the whole cell would also close the cell beside every wall and
+gaps a little narrower than two cells. Trapezoid and triangle blocks are rasterized from their points
+(shifted along with their rect when pushed), not their bounding rect. sync() runs once per movement
+step and only re-marks the cells of blocks that moved, appeared or were destroyed, so static geometry
+costs nothing after the first build.
+
+A flow field is a Dijkstra pass (8-connected, no corner cutting) out from one goal cell; every cell
+stores the next cell on its shortest path. Fields are cached per goal cell and dropped when the
+blocked set changes, so one is only computed when the goal (player or friendly) enters a new cell or
+geometry moves. Enemies then sample their cell's next-cell per step instead of pushing and sliding
+into blocks. The moving health zone is left out (it moves every step and is not a wall).
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from level_state import LevelState
+    from state import GameState
+
+NAV_CELL_SIZE = 40
+NAV_CLEARANCE = 14  # Half the smallest enemy, roughly; blocks grow by this much when marking cells
+CENTRE_FRACTION = 0.125  # Half-size of the centre square tested per cell, as a fraction of the cell
+MAX_CACHED_FIELDS = 8  # Player plus a few friendly goals
+
+_STRAIGHT, _DIAGONAL = 10, 14
+_NEIGHBORS = (
+    (1, 0, _STRAIGHT), (-1, 0, _STRAIGHT), (0, 1, _STRAIGHT), (0, -1, _STRAIGHT),
+    (1, 1, _DIAGONAL), (1, -1, _DIAGONAL), (-1, 1, _DIAGONAL), (-1, -1, _DIAGONAL),
+)
+
+
+def _level_rects(level: "LevelState"):
+    """(block, rect, points) for every block enemies collide with; points is None for plain rect blocks."""
+    for blocks in (level.static_blocks, level.destructible_blocks, level.moveable_blocks,
+                   level.giant_blocks, level.super_giant_blocks):
+        for b in blocks:
+            yield b, b["rect"], None
+    for blocks in (level.trapezoid_blocks, level.triangle_blocks):
+        for b in blocks:
+            points = b.get("points")
+            yield b, b.get("bounding_rect", b.get("rect")), points if points and len(points) >= 3 else None
+
+
+def _placed_polygon(points, rect) -> list[tuple[float, float]]:
+    """points moved so their bounds start at rect's corner (pushing a block moves its rect, not its points)."""
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    dx, dy = rect.x - min(xs), rect.y - min(ys)
+    return [(x + dx, y + dy) for x, y in zip(xs, ys)]
+
+
+def _polygon_overlaps_box(poly, axes, x0: float, y0: float, x1: float, y1: float) -> bool:
+    """Separating-axis test of a convex polygon against the box (x0, y0)-(x1, y1); touching is not overlapping."""
+    cx, cy = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+    hx, hy = (x1 - x0) * 0.5, (y1 - y0) * 0.5
+    for nx, ny, lo, hi in axes:
+        center = cx * nx + cy * ny
+        reach = hx * abs(nx) + hy * abs(ny)
+        if center + reach <= lo or center - reach >= hi:
+            return False
+    return True
+
+
+class FlowField:
+    """Shortest-path next cell toward one goal cell (-1 where the goal is unreachable)."""
+
+    __slots__ = ("goal", "next_cell")
+
+    def __init__(self, goal: int, next_cell: list[int]):
+        self.goal = goal
+        self.next_cell = next_cell
+
+
+class NavGrid:
+    """Blocked-cell counts for a level plus cached flow fields (see module docstring)."""
+
+    def __init__(self, width: int, height: int, cell_size: int = NAV_CELL_SIZE, clearance: int = NAV_CLEARANCE):
+        self.cell = int(cell_size)
+        self.clearance = int(clearance)
+        self.width = int(width)
+        self.height = int(height)
+        self.cols = max(1, -(-self.width // self.cell))
+        self.rows = max(1, -(-self.height // self.cell))
+        self.level: Optional["LevelState"] = None
+        self.blocked = [0] * (self.cols * self.rows)  # number of blocks covering each cell
+        self.version = 0  # bumped whenever a cell turns blocked or open
+        self.fields_built = 0
+        self._blocks: dict[int, tuple[tuple[int, int, int, int], list[int]]] = {}  # id -> (rect, cells)
+        self._fields: OrderedDict[int, FlowField] = OrderedDict()
+        self._fields_version = 0
+
+    # Geometry
+
+    def _span(self, x: int, y: int, w: int, h: int) -> tuple[int, int, int, int]:
+        c, m = self.cell, self.clearance
+        c0 = max(0, (x - m) // c)
+        r0 = max(0, (y - m) // c)
+        c1 = min(self.cols - 1, (x + w + m - 1) // c)
+        r1 = min(self.rows - 1, (y + h + m - 1) // c)
+        return c0, r0, c1, r1
+
+    def _cells(self, rect, points) -> list[int]:
+        """Cells a block covers: those whose centre square the block (grown by the clearance) overlaps.
+
+        Plain rects are tested directly; trapezoids and triangles by their (convex) points.
+        """
+        c0, r0, c1, r1 = self._span(rect.x, rect.y, rect.w, rect.h)
+        c, m, cols = self.cell, self.clearance, self.cols
+        half = c * 0.5
+        if points is None:
+            left, top, right, bottom = rect.x, rect.y, rect.x + rect.w, rect.y + rect.h
+
+            def hits(x0: float, y0: float, x1: float, y1: float) -> bool:
+                return left < x1 and right > x0 and top < y1 and bottom > y0
+        else:
+            poly = _placed_polygon(points, rect)
+            xs = [p[0] for p in poly]
+            ys = [p[1] for p in poly]
+            axes = [(1.0, 0.0, min(xs), max(xs)), (0.0, 1.0, min(ys), max(ys))]
+            for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+                nx, ny = ay - by, bx - ax
+                if nx or ny:
+                    proj = [x * nx + y * ny for x, y in poly]
+                    axes.append((nx, ny, min(proj), max(proj)))
+
+            def hits(x0: float, y0: float, x1: float, y1: float) -> bool:
+                return _polygon_overlaps_box(poly, axes, x0, y0, x1, y1)
+        reach = m + c * CENTRE_FRACTION
+        cells = []
+        for row in range(r0, r1 + 1):
+            cy = row * c + half
+            for col in range(c0, c1 + 1):
+                cx = col * c + half
+                if hits(cx - reach, cy - reach, cx + reach, cy + reach):
+                    cells.append(row * cols + col)
+        return cells
+
+    def _mark(self, cells: list[int], delta: int) -> None:
+        blocked = self.blocked
+        flipped = False
+        for i in cells:
+            before = blocked[i]
+            blocked[i] = before + delta
+            if (before == 0) != (blocked[i] == 0):
+                flipped = True
+        if flipped:
+            self.version += 1
+
+    def sync(self, level: "LevelState") -> None:
+        """Bring blocked cells up to date with level: only blocks that moved, appeared or vanished are re-marked."""
+        if level is not self.level:
+            self.level = level
+            self.blocked = [0] * (self.cols * self.rows)
+            self._blocks.clear()
+            self.version += 1
+        known = self._blocks
+        seen = set()
+        for block, rect, points in _level_rects(level):
+            if rect is None:
+                continue
+            key = id(block)
+            seen.add(key)
+            r = (rect.x, rect.y, rect.w, rect.h)
+            entry = known.get(key)
+            if entry is not None:
+                if entry[0] == r:
+                    continue
+                self._mark(entry[1], -1)
+            cells = self._cells(rect, points)
+            self._mark(cells, 1)
+            known[key] = (r, cells)
+        if len(seen) != len(known):
+            for key in [k for k in known if k not in seen]:
+                self._mark(known.pop(key)[1], -1)
+
+    # Cells
+
+    def cell_at(self, x: float, y: float) -> int:
+        """Index of the cell containing (x, y), clamped to the grid."""
+        col = min(self.cols - 1, max(0, int(x) // self.cell))
+        row = min(self.rows - 1, max(0, int(y) // self.cell))
+        return row * self.cols + col
+
+    def cell_center(self, index: int) -> tuple[float, float]:
+        row, col = divmod(index, self.cols)
+        half = self.cell * 0.5
+        return col * self.cell + half, row * self.cell + half
+
+    def is_blocked(self, index: int) -> bool:
+        return self.blocked[index] > 0
+
+    # Flow fields
+
+    def field_to(self, x: float, y: float) -> FlowField:
+        """Flow field toward the cell containing (x, y); cached until the blocked set changes."""
+        if self._fields_version != self.version:
+            self._fields.clear()
+            self._fields_version = self.version
+        goal = self.cell_at(x, y)
+        field = self._fields.get(goal)
+        if field is not None:
+            self._fields.move_to_end(goal)
+            return field
+        field = self._build_field(goal)
+        self._fields[goal] = field
+        if len(self._fields) > MAX_CACHED_FIELDS:
+            self._fields.popitem(last=False)
+        return field
+
+    def _build_field(self, goal: int) -> FlowField:
+        cols, rows, blocked = self.cols, self.rows, self.blocked
+        n = cols * rows
+        dist = [math.inf] * n
+        next_cell = [-1] * n
+        dist[goal] = 0
+        next_cell[goal] = goal
+        heap = [(0, goal)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+            row, col = divmod(i, cols)
+            for dc, dr, cost in _NEIGHBORS:
+                c, r = col + dc, row + dr
+                if c < 0 or r < 0 or c >= cols or r >= rows:
+                    continue
+                j = r * cols + c
+                if blocked[j]:
+                    continue
+                if dc and dr and (blocked[row * cols + c] or blocked[r * cols + col]):
+                    continue  # No cutting past a blocked corner
+                nd = d + cost
+                if nd < dist[j]:
+                    dist[j] = nd
+                    next_cell[j] = i  # Reached from i, so j's next step toward the goal is i
+                    heapq.heappush(heap, (nd, j))
+        # Blocked cells (an enemy overlapping a block's clearance margin) step out to their best open neighbour
+        for i in range(n):
+            if not blocked[i] or i == goal:
+                continue
+            row, col = divmod(i, cols)
+            best, best_d = -1, math.inf
+            for dc, dr, cost in _NEIGHBORS:
+                c, r = col + dc, row + dr
+                if 0 <= c < cols and 0 <= r < rows:
+                    j = r * cols + c
+                    if not blocked[j] and dist[j] + cost < best_d:
+                        best, best_d = j, dist[j] + cost
+            next_cell[i] = best
+        self.fields_built += 1
+        return FlowField(goal, next_cell)
+
+    def direction(self, x: float, y: float, goal_x: float, goal_y: float) -> Optional[tuple[float, float]]:
+        """Unit direction from (x, y) along the flow toward (goal_x, goal_y).
+
+        None when already in the goal's cell or the goal is unreachable; callers then head straight for it.
+        """
+        field = self.field_to(goal_x, goal_y)
+        i = self.cell_at(x, y)
+        nxt = field.next_cell[i]
+        if nxt < 0 or i == field.goal:
+            return None
+        if nxt == field.goal:
+            tx, ty = goal_x, goal_y
+        else:
+            tx, ty = self.cell_center(nxt)
+        dx, dy = tx - x, ty - y
+        length = math.hypot(dx, dy)
+        if length < 1e-6:
+            return None
+        return dx / length, dy / length
+
+
+def nav_grid_for(state: "GameState", width: int, height: int) -> Optional[NavGrid]:
+    """state.nav_grid synced to state.level (created on first use, or when the screen size changes)."""
+    level = getattr(state, "level", None)
+    if level is None:
+        return None
+    nav = state.nav_grid
+    if nav is None or nav.width != width or nav.height != height:
+        nav = state.nav_grid = NavGrid(width, height)
+    nav.sync(level)
+    return nav
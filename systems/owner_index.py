@@ -0,0 +1,82 @@
+"""
+Owner index for enemy projectiles and damage numbers.
+
+Objects added with add_child carry "slot" (their index in the list) and, when they belong to an enemy,
+"owner"; the enemy lists its children under OWNED_PROJECTILES / OWNED_DAMAGE_NUMBERS. remove_child
+swaps the list's last item into the freed slot, so removal is O(1) and list order is not kept.
+remove_children (enemy death) touches only that enemy's children instead of scanning the lists.
+
+Owner lists are not updated when a child is removed elsewhere (hit, expiry, clear()); an entry only
+counts while items[child["slot"]] is child, and add_child prunes dead entries as the list grows.
+Objects appended without add_child still work: a missing or stale slot falls back to a scan.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+OWNED_PROJECTILES = "owned_projectiles"
+OWNED_DAMAGE_NUMBERS = "owned_damage_numbers"
+_PRUNE_AT = 16  # Owner lists are pruned of dead entries whenever they reach a power of two from here
+
+
+def _live(items: list, obj: dict) -> bool:
+    slot = obj.get("slot", -1)
+    return 0 <= slot < len(items) and items[slot] is obj
+
+
+def add_child(items: list, obj: dict, owner: Optional[Any] = None, key: str = OWNED_PROJECTILES) -> dict:
+    """Append obj to items; when owner is given, record obj under owner[key]. Returns obj."""
+    obj["slot"] = len(items)
+    items.append(obj)
+    if owner is not None:
+        obj["owner"] = owner
+        owned = owner.get(key)
+        if owned is None:
+            owner[key] = [obj]
+        else:
+            owned.append(obj)
+            n = len(owned)
+            if n >= _PRUNE_AT and n & (n - 1) == 0:
+                owned[:] = [c for c in owned if _live(items, c)]
+    return obj
+
+
+def remove_child(items: list, obj: dict) -> bool:
+    """Remove obj from items (swap with the last item). Returns False if it was not in items."""
+    slot = obj.get("slot", -1)
+    if not (0 <= slot < len(items) and items[slot] is obj):
+        for slot, o in enumerate(items):
+            if o is obj:
+                break
+        else:
+            return False
+    last = items.pop()
+    if last is not obj:
+        items[slot] = last
+        last["slot"] = slot
+    return True
+
+
+def remove_children(items: list, owner: Any, key: str = OWNED_PROJECTILES) -> int:
+    """Remove owner's live children from items. Returns how many were removed."""
+    owned = owner.get(key)
+    if not owned:
+        return 0
+    removed = 0
+    for child in owned:
+        if _live(items, child):
+            remove_child(items, child)
+            removed += 1
+    owned.clear()
+    return removed
+
+
+def keep_children(items: list, keep: Callable[[dict], bool]) -> int:
+    """Drop every item for which keep(item) is false, in one pass (order kept). Returns how many were dropped."""
+    kept = [o for o in items if keep(o)]
+    dropped = len(items) - len(kept)
+    if dropped:
+        items[:] = kept
+        for i, o in enumerate(kept):
+            o["slot"] = i
+    return dropped
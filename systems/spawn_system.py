@@ -4,8 +4,12 @@ All spawn/wave/boss logic runs here. Game passes callables and runtime data via
 """
 from __future__ import annotations
 
+import logging
+import math
 import random
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
@@ -16,17 +20,87 @@ from config_enemies import (
     ENEMY_FIRE_RATE_MULTIPLIER,
     ENEMY_SPAWN_MULTIPLIER,
     ENEMY_SPEED_SCALE_MULTIPLIER,
-    ENEMY_TEMPLATES,
 )
-from config.enemy_defs import get_enemy_def
+from config.enemy_defs import get_enemy_def, get_spawn_pools
 from constants import ENEMY_COLOR, STATE_VICTORY, difficulty_multipliers
 from enemies import log_enemy_spawns, make_enemy_from_template
 from entities import Enemy
+from systems.ai_system import forget_enemy_behaviors, note_enemy_behaviors
 from telemetry.events import WaveEnemyTypeEvent, WaveEvent
 
 if TYPE_CHECKING:
     from state import GameState
 
+logger = logging.getLogger(__name__)
+
+# Max live enemies per size class
+CAP_BASIC, CAP_LARGE, CAP_SUPER_LARGE = 20, 10, 2
+
+# Amortized regular waves: enemies are built during the next-wave countdown (a wall-clock budget
+# per step) and placed over WAVE_SPAWN_STEPS simulation steps once the wave starts.
+# Overridable via level_context "wave_spawn_steps" / "wave_prebuild_budget_s".
+WAVE_SPAWN_STEPS = 8
+WAVE_PREBUILD_BUDGET_S = 0.001
+MAX_QUEENS_PER_WAVE = 3
+# Steps deferred enemies (no free space) are retried against the level and the live enemies; one that
+# still does not fit after that, even without the player clearance, is dropped (logged, counted in
+# state.spawns_dropped) so the wave can end.
+WAVE_DEFER_STEPS = 30
+
+
+@dataclass
+class PendingWave:
+    """A regular wave being built (before it starts) and placed (after it starts), a few enemies per step.
+
+    Template picks and enemy rolls come from a private RNG seeded from `random` when the wave is
+    planned, so how much gets built per step (wall-clock budget) never changes what is built.
+    Placement runs a fixed number of enemies per step, so a seeded run plays the same everywhere.
+    """
+    wave_num: int
+    hp_scale: float
+    speed_scale: float
+    count: int  # build attempts (enemies requested for the wave)
+    rng: random.Random
+    picks: int = 0  # build attempts made so far
+    queen_count: int = 0
+    size_counts: dict = field(default_factory=dict)  # built enemies per size class (caps)
+    built: list = field(default_factory=list)  # built enemies in spawn order
+    placed: int = 0  # built[:placed] have been placed or deferred
+    deferred: list = field(default_factory=list)  # built enemies that found no free space yet; retried each step
+    deferred_steps: int = 0  # steps spent retrying deferred enemies (they are dropped after WAVE_DEFER_STEPS)
+    per_step: int = 0  # enemies placed per step; 0 until the wave starts
+    type_counts: dict = field(default_factory=dict)  # placed enemies per type (telemetry)
+
+
+def size_class_counts(state) -> dict:
+    """Live enemies per enemy_size_class (None = unclassed), kept incrementally on spawn and death.
+
+    Recounted if state.enemies was changed without going through note_enemy_spawned/removed
+    (the totals no longer match).
+    """
+    counts = state.enemy_size_class_counts
+    if sum(counts.values()) != len(state.enemies):
+        counts.clear()
+        for e in state.enemies:
+            sc = e.get("enemy_size_class")
+            counts[sc] = counts.get(sc, 0) + 1
+    return counts
+
+
+def note_enemy_spawned(state, enemy) -> None:
+    counts = state.enemy_size_class_counts
+    sc = enemy.get("enemy_size_class")
+    counts[sc] = counts.get(sc, 0) + 1
+    note_enemy_behaviors(state, enemy)
+
+
+def note_enemy_removed(state, enemy) -> None:
+    counts = state.enemy_size_class_counts
+    sc = enemy.get("enemy_size_class")
+    if counts.get(sc, 0) > 0:
+        counts[sc] -= 1
+    forget_enemy_behaviors(state, enemy)
+
 
 def update(state: "GameState", dt: float) -> None:
     """Spawn enemies, advance waves, handle spawner minions. Called each gameplay frame."""
@@ -34,6 +108,7 @@ def update(state: "GameState", dt: float) -> None:
     if ctx is None:
         return
 
+    _advance_spawn_queue(state, ctx)
     _handle_spawner_enemies(state, dt, ctx)
     _update_wave_timers(state, dt, ctx)
 
@@ -87,6 +162,9 @@ def _start_wave(wave_num: int, state, ctx: dict) -> None:
         pf("wave_start")
 
     state.enemies = []
+    state.enemy_size_class_counts.clear()
+    state.enemy_behaviors.clear()
+    state.enemy_behaviors_indexed = 0
     state.boss_active = False
     state.wave_damage_taken = 0
     state.side_quests["no_hit_wave"]["active"] = True
@@ -102,7 +180,11 @@ def _start_wave(wave_num: int, state, ctx: dict) -> None:
     diff_mult = difficulty_multipliers.get(difficulty, difficulty_multipliers["NORMAL"])
     w = ctx.get("width", 1920)
     h = ctx.get("height", 1080)
-    random_spawn = ctx.get("random_spawn_position")
+    random_spawn = _spawn_position_fn(ctx)
+    sampler = ctx.get("spawn_sampler")
+    if sampler is not None:
+        # Free-space sampler: never overlaps, returns None when nothing fits.
+        sampler.sync_state(state)
     telemetry = ctx.get("telemetry")
     telemetry_enabled = ctx.get("telemetry_enabled", False)
     overshield_cooldown = ctx.get("overshield_recharge_cooldown", 45.0)
@@ -110,15 +192,14 @@ def _start_wave(wave_num: int, state, ctx: dict) -> None:
 
     # Boss on wave 3 of each level
     if state.wave_in_level == 3:
+        state.spawn_queue = None
         _spawn_boss_wave(wave_num, state, ctx, diff_mult, w, h, telemetry, telemetry_enabled, overshield_cooldown)
-        _spawn_ambient_enemies(state, ctx, wave_num, random_spawn, telemetry, telemetry_enabled)
+        _spawn_ambient_enemies(state, ctx, wave_num, random_spawn, telemetry, telemetry_enabled, exact=sampler is not None)
         return
 
-    # Normal waves (1 and 2)
-    hp_scale, speed_scale, count, spawned = _spawn_regular_wave(
-        wave_num, state, ctx, diff_mult, random_spawn, telemetry, telemetry_enabled
-    )
-    _spawn_ambient_enemies(state, ctx, wave_num, random_spawn, telemetry, telemetry_enabled)
+    # Normal waves (1 and 2): first batch now, the rest over the next steps (_advance_spawn_queue)
+    pending = _start_regular_wave(wave_num, state, ctx)
+    _spawn_ambient_enemies(state, ctx, wave_num, random_spawn, telemetry, telemetry_enabled, exact=sampler is not None)
 
     state.wave_active = True
     state.overshield_recharge_timer = overshield_cooldown
@@ -132,22 +213,48 @@ def _start_wave(wave_num: int, state, ctx: dict) -> None:
                 t=state.run_time,
                 wave_number=wave_num,
                 event_type="start",
-                enemies_spawned=count,
-                hp_scale=hp_scale,
-                speed_scale=speed_scale,
+                enemies_spawned=pending.count,
+                hp_scale=pending.hp_scale,
+                speed_scale=pending.speed_scale,
             )
         )
 
 
-def _spawn_ambient_enemies(state, ctx: dict, wave_num: int, random_spawn, telemetry, telemetry_enabled: bool) -> None:
-    """Spawn 3–5 stationary ambient enemies at start of each round, randomly placed, non-overlapping."""
+def _spawn_position_fn(ctx: dict):
+    """Spawn placement callable: the free-space sampler (synced at wave start) or random_spawn_position."""
+    sampler = ctx.get("spawn_sampler")
+    if sampler is not None:
+        return sampler.spawn
+    return ctx.get("random_spawn_position")
+
+
+def _spawn_ambient_enemies(
+    state, ctx: dict, wave_num: int, random_spawn, telemetry, telemetry_enabled: bool, exact: bool = False
+) -> None:
+    """Spawn 3–5 stationary ambient enemies at start of each round, randomly placed, non-overlapping.
+
+    exact: random_spawn already guarantees non-overlap (SpawnSampler.spawn) and returns None when full;
+    those enemies are deferred like a regular wave's (_defer_enemies).
+    """
     ambient_tmpl = get_enemy_def("ambient")
     if not ambient_tmpl or not random_spawn:
         return
     count = random.randint(3, 5)
     spawned = []
+    deferred = []
     for _ in range(count):
         enemy = make_enemy_from_template(ambient_tmpl, 1.0, 1.0)
+        if exact:
+            r = random_spawn((enemy["rect"].w, enemy["rect"].h), state)
+            if r is None:
+                logger.debug("No free space for ambient enemy (wave %d); deferred", wave_num)
+                deferred.append(enemy)
+                continue
+            enemy["rect"] = r
+            state.enemies.append(enemy)
+            note_enemy_spawned(state, enemy)
+            spawned.append(enemy)
+            continue
         for _ in range(25):
             r = random_spawn((enemy["rect"].w, enemy["rect"].h), state)
             # avoid overlapping other ambients in this batch
@@ -157,7 +264,10 @@ def _spawn_ambient_enemies(state, ctx: dict, wave_num: int, random_spawn, teleme
         else:
             enemy["rect"] = random_spawn((enemy["rect"].w, enemy["rect"].h), state)
         state.enemies.append(enemy)
+        note_enemy_spawned(state, enemy)
         spawned.append(enemy)
+    if deferred:
+        _defer_enemies(state, wave_num, deferred)
     if telemetry_enabled and telemetry:
         ref = [state.enemies_spawned]
         log_enemy_spawns(spawned, telemetry, state.run_time, ref)
@@ -167,6 +277,16 @@ def _spawn_ambient_enemies(state, ctx: dict, wave_num: int, random_spawn, teleme
         )
 
 
+def _defer_enemies(state, wave_num: int, enemies: list) -> None:
+    """Hand enemies that found no free space to the current wave's placement queue (_place_pending), so
+    they are retried each step and the wave keeps spawning until they are placed or dropped. Boss waves
+    and fully placed regular waves get an empty PendingWave to carry them."""
+    pending = state.spawn_queue
+    if pending is None or not pending.per_step or pending.wave_num != wave_num:
+        pending = state.spawn_queue = PendingWave(wave_num, 1.0, 1.0, 0, random.Random(wave_num), per_step=1)
+    pending.deferred.extend(enemies)
+
+
 def _spawn_boss_wave(
     wave_num: int,
     state,
@@ -190,7 +310,9 @@ def _spawn_boss_wave(
     boss["speed"] = BOSS_TEMPLATE["speed"] * ENEMY_SPEED_SCALE_MULTIPLIER
     boss["phase"] = 1
     boss["time_since_shot"] = 0.0
-    state.enemies.append(Enemy(boss))
+    boss = Enemy(boss)
+    state.enemies.append(boss)
+    note_enemy_spawned(state, boss)
     state.boss_active = True
     pf = ctx.get("play_sfx")
     if callable(pf):
@@ -213,18 +335,14 @@ def _spawn_boss_wave(
     state.overshield_recharge_timer = overshield_cooldown
 
 
-def _spawn_regular_wave(
-    wave_num: int,
-    state,
-    ctx: dict,
-    diff_mult: dict,
-    random_spawn,
-    telemetry,
-    telemetry_enabled: bool,
-) -> tuple:
-    """Spawn regular enemies for waves 1 and 2. Returns (hp_scale, speed_scale, count, spawned_list)."""
-    level_mult = 1.0 + (state.current_level - 1) * 0.3
-    wave_in_level_mult = 1.0 + (state.wave_in_level - 1) * 0.15
+def _plan_regular_wave(wave_num: int, state, ctx: dict) -> PendingWave:
+    """Scaling and enemy count for a regular wave; nothing is built yet. Draws the wave's RNG seed from `random`."""
+    current_level = min(state.max_level, (wave_num - 1) // 3 + 1)
+    wave_in_level = ((wave_num - 1) % 3) + 1
+    difficulty = ctx.get("difficulty", "NORMAL")
+    diff_mult = difficulty_multipliers.get(difficulty, difficulty_multipliers["NORMAL"])
+    level_mult = 1.0 + (current_level - 1) * 0.3
+    wave_in_level_mult = 1.0 + (wave_in_level - 1) * 0.15
     hp_scale = (1.0 + 0.15 * (wave_num - 1)) * diff_mult["enemy_hp"] * level_mult * wave_in_level_mult
     speed_scale = (1.0 + 0.05 * (wave_num - 1)) * diff_mult["enemy_speed"] * level_mult * wave_in_level_mult
     base_enemies = ctx.get("base_enemies_per_wave")
@@ -235,78 +353,163 @@ def _spawn_regular_wave(
         spawn_mult = ENEMY_SPAWN_MULTIPLIER
     base_count = base_enemies + 2 * (wave_num - 1)
     count = min(int(base_count * diff_mult["enemy_spawn"] * spawn_mult), MAX_ENEMIES_PER_WAVE)
-
-    spawned = []
-    enemy_type_counts = {}
-    queen_count = 0
-    max_queens_per_wave = 3
-
-    # Pool excludes ambient (ambient spawn separately)
-    spawn_templates = [t for t in ENEMY_TEMPLATES if not t.get("is_ambient")]
-    if not spawn_templates:
-        spawn_templates = [t for t in ENEMY_TEMPLATES if t.get("type") != "queen"]
-
-    CAP_BASIC, CAP_LARGE, CAP_SUPER_LARGE = 20, 10, 2
-
-    def size_class_count(enemies_list, size_class: str) -> int:
-        return sum(1 for e in enemies_list if e.get("enemy_size_class") == size_class)
-
-    for _ in range(count):
-        current_basic = size_class_count(state.enemies, "basic") + size_class_count(spawned, "basic")
-        current_large = size_class_count(state.enemies, "large") + size_class_count(spawned, "large")
-        current_super = size_class_count(state.enemies, "super_large") + size_class_count(spawned, "super_large")
-
-        tmpl = random.choice(spawn_templates)
-        if tmpl.get("type") == "queen" and queen_count >= max_queens_per_wave:
-            non_queen = [t for t in spawn_templates if t.get("type") != "queen"]
-            if non_queen:
-                tmpl = random.choice(non_queen)
+    return PendingWave(wave_num, hp_scale, speed_scale, count, random.Random(random.getrandbits(64)))
+
+
+def _build_pending(pending: PendingWave, budget_s: Optional[float] = None) -> None:
+    """Build enemies for pending (template picks with size caps, then make_enemy_from_template).
+
+    budget_s: stop once this much wall-clock time has been spent (at least one enemy is built);
+    None builds the rest of the wave.
+    """
+    # Pool excludes ambient (ambient spawn separately); pools are precomputed in config.enemy_defs
+    pools = get_spawn_pools()
+    spawn_templates = pools.regular
+    counts = pending.size_counts
+    rng = pending.rng
+    deadline = time.perf_counter() + budget_s if budget_s is not None else None
+
+    while pending.picks < pending.count:
+        pending.picks += 1
+        current_basic = counts.get("basic", 0)
+        current_large = counts.get("large", 0)
+        current_super = counts.get("super_large", 0)
+
+        tmpl = rng.choice(spawn_templates)
+        if tmpl.get("type") == "queen" and pending.queen_count >= MAX_QUEENS_PER_WAVE:
+            if pools.regular_non_queen:
+                tmpl = rng.choice(pools.regular_non_queen)
             else:
                 continue
         sc = tmpl.get("enemy_size_class", "basic")
         if sc == "super_large" and current_super >= CAP_SUPER_LARGE:
-            candidates = [t for t in spawn_templates if t.get("enemy_size_class") != "super_large"]
+            candidates = pools.regular_excluding_size["super_large"]
             if not candidates:
                 continue
-            tmpl = random.choice(candidates)
+            tmpl = rng.choice(candidates)
             sc = tmpl.get("enemy_size_class", "basic")
         if sc == "large" and current_large >= CAP_LARGE:
-            candidates = [t for t in spawn_templates if t.get("enemy_size_class") != "large"]
+            candidates = pools.regular_excluding_size["large"]
             if not candidates:
                 continue
-            tmpl = random.choice(candidates)
+            tmpl = rng.choice(candidates)
             sc = tmpl.get("enemy_size_class", "basic")
         if sc == "basic" and current_basic >= CAP_BASIC:
-            candidates = [t for t in spawn_templates if t.get("enemy_size_class") != "basic"]
+            candidates = pools.regular_excluding_size["basic"]
             if not candidates:
                 continue
-            tmpl = random.choice(candidates)
-
-        enemy = make_enemy_from_template(tmpl, hp_scale, speed_scale)
+            tmpl = rng.choice(candidates)
+
+        enemy = make_enemy_from_template(tmpl, pending.hp_scale, pending.speed_scale, rng=rng)
+        pending.built.append(enemy)
+        sc_built = enemy.get("enemy_size_class")
+        counts[sc_built] = counts.get(sc_built, 0) + 1
+        if enemy["type"] == "queen":
+            pending.queen_count += 1
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+
+def _place_pending(state, ctx: dict, pending: PendingWave, limit: int) -> None:
+    """Place up to limit built enemies (plus any deferred ones) into state.enemies; finishes the wave's
+    telemetry when all are placed. Enemies with no free space are deferred to the next step, and dropped
+    (never overlapped) once they have been retried for WAVE_DEFER_STEPS steps."""
+    random_spawn = _spawn_position_fn(ctx)
+    telemetry = ctx.get("telemetry")
+    telemetry_enabled = ctx.get("telemetry_enabled", False)
+    end = min(len(pending.built), pending.placed + limit)
+    batch = pending.built[pending.placed:end]
+    sampler = ctx.get("spawn_sampler")
+    retried = len(pending.deferred)
+    if retried:
+        # Earlier spawns have moved or died since their cells were reserved: re-stamp the live enemies
+        pending.deferred_steps += 1
+        if sampler is not None:
+            sampler.sync_state(state, enemies=True)
+        batch = pending.deferred + batch
+        pending.deferred = []
+    give_up = pending.deferred_steps >= WAVE_DEFER_STEPS
+    spawned = []
+    for i, enemy in enumerate(batch):
         if random_spawn:
-            enemy["rect"] = random_spawn((enemy["rect"].w, enemy["rect"].h), state)
+            size = (enemy["rect"].w, enemy["rect"].h)
+            r = random_spawn(size, state)
+            if r is None and give_up and i < retried and sampler is not None:
+                r = sampler.spawn(size)  # Last try: no player clearance (still clear of the player rect)
+            if r is None and give_up and i < retried:
+                logger.warning("No free space for %s (wave %d) after %d steps; dropped",
+                               enemy["type"], pending.wave_num, pending.deferred_steps)
+                state.spawns_dropped += 1
+                continue
+            if r is None:
+                logger.debug("No free space for %s (wave %d); deferred", enemy["type"], pending.wave_num)
+                pending.deferred.append(enemy)
+                continue
+            enemy["rect"] = r
         spawned.append(enemy)
+        note_enemy_spawned(state, enemy)
         t = enemy["type"]
-        enemy_type_counts[t] = enemy_type_counts.get(t, 0) + 1
-        if t == "queen":
-            queen_count += 1
-
+        pending.type_counts[t] = pending.type_counts.get(t, 0) + 1
+    pending.placed = end
     state.enemies.extend(spawned)
-    if telemetry:
+    if telemetry and spawned:
         ref = [state.enemies_spawned]
         log_enemy_spawns(spawned, telemetry, state.run_time, ref)
         state.enemies_spawned = ref[0]
+    if pending.placed < len(pending.built) or pending.deferred:
+        return
+    state.spawn_queue = None
     if telemetry_enabled and telemetry:
-        for enemy_type, type_count in enemy_type_counts.items():
+        for enemy_type, type_count in pending.type_counts.items():
             telemetry.log_wave_enemy_types(
                 WaveEnemyTypeEvent(
                     t=state.run_time,
-                    wave_number=wave_num,
+                    wave_number=pending.wave_num,
                     enemy_type=enemy_type,
                     count=type_count,
                 )
             )
-    return (hp_scale, speed_scale, count, spawned)
+
+
+def _start_regular_wave(wave_num: int, state, ctx: dict) -> PendingWave:
+    """Start a regular wave: use the wave pre-built during the countdown (or plan it now), finish
+    building it and place the first batch. The rest is placed by _advance_spawn_queue."""
+    pending = state.spawn_queue
+    if pending is None or pending.wave_num != wave_num or pending.per_step:
+        pending = _plan_regular_wave(wave_num, state, ctx)
+    state.spawn_queue = pending
+    _build_pending(pending)
+    # Largest first, while the free space is still in one piece (stable: same order for a seed)
+    pending.built.sort(key=lambda e: e["rect"].w * e["rect"].h, reverse=True)
+    steps = max(1, int(ctx.get("wave_spawn_steps", WAVE_SPAWN_STEPS)))
+    pending.per_step = max(1, math.ceil(len(pending.built) / steps))
+    _place_pending(state, ctx, pending, pending.per_step)
+    return pending
+
+
+def wave_spawning(state) -> bool:
+    """True while the current wave still has enemies waiting to be placed."""
+    pending = getattr(state, "spawn_queue", None)
+    return pending is not None and pending.per_step > 0
+
+
+def queued_enemies(state) -> int:
+    """Enemies of the current wave not placed yet (0 once the wave is fully spawned)."""
+    if not wave_spawning(state):
+        return 0
+    pending = state.spawn_queue
+    return len(pending.built) - pending.placed + len(pending.deferred)
+
+
+def _advance_spawn_queue(state, ctx: dict) -> None:
+    """Per step: place the next batch of a started wave, or keep pre-building the next one."""
+    pending = state.spawn_queue
+    if pending is None:
+        return
+    if pending.per_step:
+        _place_pending(state, ctx, pending, pending.per_step)
+    elif pending.picks < pending.count:
+        _build_pending(pending, ctx.get("wave_prebuild_budget_s", WAVE_PREBUILD_BUDGET_S))
 
 
 def _handle_spawner_enemies(state, dt: float, ctx: dict) -> None:
@@ -326,18 +529,12 @@ def _handle_spawner_enemies(state, dt: float, ctx: dict) -> None:
         max_spawns = enemy.get("max_spawns", 3)
 
         if time_since_spawn >= spawn_cooldown and spawn_count < max_spawns:
-            pool = [t for t in ENEMY_TEMPLATES if t.get("type") not in ("spawner", "FINAL_BOSS") and not t.get("is_ambient")]
-            if not pool:
-                pool = [t for t in ENEMY_TEMPLATES if t.get("type") != "FINAL_BOSS"]
-            CAP_B, CAP_L, CAP_S = 20, 10, 2
-            nb = sum(1 for e in state.enemies if e.get("enemy_size_class") == "basic")
-            nl = sum(1 for e in state.enemies if e.get("enemy_size_class") == "large")
-            ns = sum(1 for e in state.enemies if e.get("enemy_size_class") == "super_large")
-            candidates = [t for t in pool if (
-                (t.get("enemy_size_class") == "basic" and nb < CAP_B) or
-                (t.get("enemy_size_class") == "large" and nl < CAP_L) or
-                (t.get("enemy_size_class") == "super_large" and ns < CAP_S)
-            )]
+            counts = size_class_counts(state)
+            open_classes = frozenset(
+                sc for sc, cap in (("basic", CAP_BASIC), ("large", CAP_LARGE), ("super_large", CAP_SUPER_LARGE))
+                if counts.get(sc, 0) < cap
+            )
+            candidates = get_spawn_pools().minions_in(open_classes)
             if not candidates:
                 enemy["time_since_spawn"] = time_since_spawn
                 continue
@@ -346,6 +543,7 @@ def _handle_spawner_enemies(state, dt: float, ctx: dict) -> None:
             spawned_enemy["rect"] = random_spawn((spawned_enemy["rect"].w, spawned_enemy["rect"].h), state)
             spawned_enemy["spawned_by"] = enemy
             state.enemies.append(spawned_enemy)
+            note_enemy_spawned(state, spawned_enemy)
             enemy["spawn_count"] = spawn_count + 1
             enemy["time_since_spawn"] = 0.0
             if telemetry_enabled and telemetry:
@@ -356,12 +554,24 @@ def _handle_spawner_enemies(state, dt: float, ctx: dict) -> None:
             enemy["time_since_spawn"] = time_since_spawn
 
 
+def _plan_next_wave(state, ctx: dict) -> None:
+    """Queue the next wave for pre-building during the countdown (regular waves only; not after the last level)."""
+    if state.wave_in_level >= 3 and state.current_level >= state.max_level:
+        return
+    next_wave = state.wave_number + 1
+    if ((next_wave - 1) % 3) + 1 == 3:
+        return
+    state.spawn_queue = _plan_regular_wave(next_wave, state, ctx)
+
+
 def _update_wave_timers(state, dt: float, ctx: dict) -> None:
     """When all enemies are dead, run countdown then start next wave or trigger victory."""
-    if not state.wave_active or len(state.enemies) != 0:
+    if not state.wave_active or len(state.enemies) != 0 or wave_spawning(state):
         return
 
     state.time_to_next_wave += dt
+    if state.spawn_queue is None:
+        _plan_next_wave(state, ctx)
     if state.time_to_next_wave < 3.0:
         return
 
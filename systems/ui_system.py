@@ -11,6 +11,7 @@ import pygame
 
 from constants import STATE_PLAYING, AIM_ARROWS
 from rendering import RenderContext, draw_health_bar, draw_centered_text, render_hud_text
+from rendering.interpolation import interpolated_rect
 
 if TYPE_CHECKING:
     from state import GameState
@@ -97,12 +98,12 @@ def _draw_entity_health_bars(screen: pygame.Surface, state, show: bool) -> None:
         return
     for friendly in getattr(state, "friendly_ai", []):
         if friendly.get("hp", 0) > 0:
-            r = friendly.get("rect")
+            r = interpolated_rect(state, friendly.get("rect"))
             if r:
                 draw_health_bar(screen, r.x, r.y - 10, r.w, 5, friendly["hp"], friendly.get("max_hp", friendly["hp"]))
     for enemy in getattr(state, "enemies", []):
         if enemy.get("hp", 0) > 0:
-            r = enemy.get("rect")
+            r = interpolated_rect(state, enemy.get("rect"))
             if r:
                 draw_health_bar(screen, r.x, r.y - 10, r.w, 5, enemy["hp"], enemy.get("max_hp", enemy["hp"]))
 
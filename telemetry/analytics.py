@@ -0,0 +1,266 @@
+"""
+Cross-run analytics: materialized per-run and per-wave aggregate tables.
+Aggregates are filled incrementally (Telemetry.end_run calls update_run) and a watermark
+records the highest run id processed, so refresh() only touches runs that ended since; update_run
+also picks up older ended runs that were never aggregated before moving it.
+Cross-run queries (top sessions, weapon shot counts) then read small tables instead of raw events.
+"""
+import sqlite3
+from typing import Optional
+
+from . import schema
+
+_WATERMARK_KEY = "runs"
+
+
+def init_analytics_schema(conn: sqlite3.Connection) -> None:
+    """Create aggregate tables and the watermark table. Idempotent."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS analytics_watermark (
+            name TEXT PRIMARY KEY,
+            last_run_id INTEGER NOT NULL
+        );
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS run_aggregates (
+            run_id INTEGER PRIMARY KEY,
+            difficulty TEXT,
+            max_level INTEGER,
+            max_wave INTEGER,
+            final_score INTEGER,
+            seconds_survived REAL,
+            shots_fired INTEGER NOT NULL DEFAULT 0,
+            hits INTEGER NOT NULL DEFAULT 0,
+            enemies_killed INTEGER NOT NULL DEFAULT 0,
+            damage_dealt INTEGER NOT NULL DEFAULT 0,
+            damage_taken INTEGER NOT NULL DEFAULT 0,
+            deaths INTEGER NOT NULL DEFAULT 0,
+            accuracy_pct REAL NOT NULL DEFAULT 0,
+            kills_per_second REAL NOT NULL DEFAULT 0,
+            dps REAL NOT NULL DEFAULT 0,
+            FOREIGN KEY(run_id) REFERENCES runs(id) ON DELETE CASCADE
+        );
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS wave_aggregates (
+            run_id INTEGER NOT NULL,
+            wave_number INTEGER NOT NULL,
+            start_time REAL NOT NULL,
+            end_time REAL,
+            enemies_spawned INTEGER NOT NULL DEFAULT 0,
+            hp_scale REAL,
+            speed_scale REAL,
+            enemies_killed INTEGER NOT NULL DEFAULT 0,
+            hits INTEGER NOT NULL DEFAULT 0,
+            damage_dealt INTEGER NOT NULL DEFAULT 0,
+            damage_taken INTEGER NOT NULL DEFAULT 0,
+            shots INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (run_id, wave_number),
+            FOREIGN KEY(run_id) REFERENCES runs(id) ON DELETE CASCADE
+        );
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS run_weapon_aggregates (
+            run_id INTEGER NOT NULL,
+            weapon_mode TEXT NOT NULL,
+            shots INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (run_id, weapon_mode),
+            FOREIGN KEY(run_id) REFERENCES runs(id) ON DELETE CASCADE
+        );
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_agg_score ON run_aggregates(final_score);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_agg_survived ON run_aggregates(seconds_survived);")
+    conn.commit()
+
+
+def get_watermark(conn: sqlite3.Connection) -> int:
+    """Highest run id already aggregated (0 when nothing has been processed)."""
+    if not schema.table_exists(conn, "analytics_watermark"):
+        return 0
+    row = conn.execute(
+        "SELECT last_run_id FROM analytics_watermark WHERE name = ?;", (_WATERMARK_KEY,)
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _set_watermark(conn: sqlite3.Connection, run_id: int) -> None:
+    conn.execute(
+        "INSERT INTO analytics_watermark (name, last_run_id) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET last_run_id = MAX(last_run_id, excluded.last_run_id);",
+        (_WATERMARK_KEY, int(run_id)),
+    )
+
+
+def _ratio(num, den, scale: float = 1.0) -> float:
+    return float(num) / float(den) * scale if den else 0.0
+
+
+def _aggregate_run(conn: sqlite3.Connection, run_id: int) -> None:
+    cols = schema.get_columns(conn, "runs")
+
+    def col(name: str) -> str:
+        return name if name in cols else f"NULL AS {name}"
+
+    row = conn.execute(
+        f"""
+        SELECT {col('difficulty')}, {col('max_level')}, {col('max_wave')}, {col('final_score')},
+               seconds_survived, shots_fired, hits, enemies_killed,
+               {col('damage_dealt')}, damage_taken, {col('deaths')}
+        FROM runs WHERE id = ?;
+        """,
+        (run_id,),
+    ).fetchone()
+    if row is None:
+        return
+    (difficulty, max_level, max_wave, final_score, survived,
+     shots, hits, killed, dealt, taken, deaths) = row
+    survived_f = float(survived or 0.0)
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO run_aggregates (
+            run_id, difficulty, max_level, max_wave, final_score, seconds_survived,
+            shots_fired, hits, enemies_killed, damage_dealt, damage_taken, deaths,
+            accuracy_pct, kills_per_second, dps
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+        """,
+        (
+            run_id, difficulty, max_level, max_wave, final_score, survived,
+            int(shots or 0), int(hits or 0), int(killed or 0), int(dealt or 0),
+            int(taken or 0), int(deaths or 0),
+            _ratio(hits or 0, shots or 0, 100.0),
+            _ratio(killed or 0, survived_f),
+            _ratio(dealt or 0, survived_f),
+        ),
+    )
+
+    # Per-wave: one window per wave start, ending at the next start (or end of run).
+    starts = conn.execute(
+        """
+        SELECT wave_number, MIN(t), MAX(enemies_spawned), MAX(hp_scale), MAX(speed_scale)
+        FROM waves
+        WHERE run_id = ? AND event_type = 'start'
+        GROUP BY wave_number
+        ORDER BY MIN(t) ASC;
+        """,
+        (run_id,),
+    ).fetchall()
+    conn.execute("DELETE FROM wave_aggregates WHERE run_id = ?;", (run_id,))
+    wave_rows = []
+    for i, (wave_number, start_t, spawned, hp_scale, speed_scale) in enumerate(starts):
+        end_t: Optional[float] = starts[i + 1][1] if i + 1 < len(starts) else survived
+        upper = end_t if end_t is not None else float("inf")
+        hits_row = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(killed), 0), COALESCE(SUM(damage), 0) "
+            "FROM enemy_hits WHERE run_id = ? AND t >= ? AND t < ?;",
+            (run_id, start_t, upper),
+        ).fetchone()
+        taken_row = conn.execute(
+            "SELECT COALESCE(SUM(amount), 0) FROM player_damage WHERE run_id = ? AND t >= ? AND t < ?;",
+            (run_id, start_t, upper),
+        ).fetchone()
+        shots_row = conn.execute(
+            "SELECT COUNT(*) FROM shots WHERE run_id = ? AND t >= ? AND t < ?;",
+            (run_id, start_t, upper),
+        ).fetchone()
+        wave_rows.append(
+            (
+                run_id, int(wave_number), float(start_t), end_t, int(spawned or 0),
+                hp_scale, speed_scale, int(hits_row[1]), int(hits_row[0]), int(hits_row[2]),
+                int(taken_row[0]), int(shots_row[0]),
+            )
+        )
+    if wave_rows:
+        conn.executemany(
+            """
+            INSERT INTO wave_aggregates (
+                run_id, wave_number, start_time, end_time, enemies_spawned, hp_scale, speed_scale,
+                enemies_killed, hits, damage_dealt, damage_taken, shots
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+            """,
+            wave_rows,
+        )
+
+    # Per-weapon shots: merge the run's switch timeline with its shot times in one pass.
+    conn.execute("DELETE FROM run_weapon_aggregates WHERE run_id = ?;", (run_id,))
+    switches = conn.execute(
+        "SELECT t, weapon_mode FROM weapon_switches WHERE run_id = ? ORDER BY t ASC;", (run_id,)
+    ).fetchall()
+    counts: dict[str, int] = {}
+    idx = 0
+    current = "unknown"
+    for (shot_t,) in conn.execute("SELECT t FROM shots WHERE run_id = ? ORDER BY t ASC;", (run_id,)):
+        while idx < len(switches) and switches[idx][0] <= shot_t:
+            current = switches[idx][1]
+            idx += 1
+        counts[current] = counts.get(current, 0) + 1
+    if counts:
+        conn.executemany(
+            "INSERT INTO run_weapon_aggregates (run_id, weapon_mode, shots) VALUES (?, ?, ?);",
+            [(run_id, mode, n) for mode, n in counts.items()],
+        )
+
+
+def _pending_run_ids(conn: sqlite3.Connection) -> list[int]:
+    return [
+        r[0] for r in conn.execute(
+            "SELECT id FROM runs WHERE id > ? AND ended_at IS NOT NULL ORDER BY id ASC;",
+            (get_watermark(conn),),
+        ).fetchall()
+    ]
+
+
+def update_run(conn: sqlite3.Connection, run_id: int) -> None:
+    """(Re)aggregate a single ended run and advance the watermark. Commits.
+
+    Ended runs between the watermark and run_id that were never aggregated (DBs written before
+    analytics existed) are aggregated first, so moving the watermark never skips them.
+    """
+    run_id = int(run_id)
+    pending = _pending_run_ids(conn)
+    for other in pending:
+        if other != run_id:
+            _aggregate_run(conn, other)
+    _aggregate_run(conn, run_id)
+    _set_watermark(conn, max(pending + [run_id]))
+    conn.commit()
+
+
+def refresh(conn: sqlite3.Connection) -> int:
+    """Aggregate every ended run above the watermark. Returns the number of runs processed."""
+    init_analytics_schema(conn)
+    run_ids = _pending_run_ids(conn)
+    for run_id in run_ids:
+        _aggregate_run(conn, run_id)
+    if run_ids:
+        _set_watermark(conn, run_ids[-1])
+    conn.commit()
+    return len(run_ids)
+
+
+def top_runs(conn: sqlite3.Connection, order_by: str = "final_score", limit: int = 10) -> list[tuple]:
+    """Top runs from run_aggregates by final_score or seconds_survived (materialized top_sessions.sql)."""
+    if order_by not in ("final_score", "seconds_survived"):
+        raise ValueError(f"Unsupported order_by: {order_by}")
+    return conn.execute(
+        f"""
+        SELECT run_id, difficulty, max_level, final_score, seconds_survived,
+               enemies_killed, accuracy_pct, dps
+        FROM run_aggregates
+        WHERE {order_by} IS NOT NULL
+        ORDER BY {order_by} DESC
+        LIMIT ?;
+        """,
+        (int(limit),),
+    ).fetchall()
+
+
+def weapon_shot_totals(conn: sqlite3.Connection) -> list[tuple[str, int]]:
+    """Shots per weapon across all aggregated runs (materialized weapon_accuracy.sql)."""
+    return conn.execute(
+        """
+        SELECT weapon_mode, SUM(shots) AS shots
+        FROM run_weapon_aggregates
+        GROUP BY weapon_mode
+        ORDER BY shots DESC;
+        """
+    ).fetchall()
@@ -0,0 +1,114 @@
+"""
+Balance batch results: one row per simulated wave, written by the balance farm (balance_farm.py).
+Workers simulate headless runs and send results to the parent process, which is the only writer,
+so a whole batch lands in one telemetry DB next to the regular run tables.
+"""
+import json
+import sqlite3
+import time
+from typing import Any, Iterable
+
+
+def init_balance_schema(conn: sqlite3.Connection) -> None:
+    """Create balance batch tables. Idempotent."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS balance_batches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            overrides TEXT NOT NULL,
+            runs INTEGER NOT NULL,
+            waves INTEGER NOT NULL,
+            base_seed INTEGER NOT NULL
+        );
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS balance_waves (
+            batch_id INTEGER NOT NULL,
+            seed INTEGER NOT NULL,
+            wave_number INTEGER NOT NULL,
+            weapon_mode TEXT,
+            cleared INTEGER NOT NULL,
+            time_to_clear REAL,
+            sim_seconds REAL NOT NULL,
+            damage_taken INTEGER NOT NULL DEFAULT 0,
+            enemies_spawned INTEGER NOT NULL DEFAULT 0,
+            enemies_killed INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (batch_id, seed, wave_number),
+            FOREIGN KEY(batch_id) REFERENCES balance_batches(id) ON DELETE CASCADE
+        );
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS balance_weapon_kills (
+            batch_id INTEGER NOT NULL,
+            seed INTEGER NOT NULL,
+            wave_number INTEGER NOT NULL,
+            weapon_mode TEXT NOT NULL,
+            kills INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (batch_id, seed, wave_number, weapon_mode),
+            FOREIGN KEY(batch_id) REFERENCES balance_batches(id) ON DELETE CASCADE
+        );
+    """)
+    conn.commit()
+
+
+def start_batch(conn: sqlite3.Connection, overrides: dict[str, Any], runs: int, waves: int, base_seed: int) -> int:
+    """Record a new batch and return its id. Commits."""
+    init_balance_schema(conn)
+    cur = conn.execute(
+        "INSERT INTO balance_batches (started_at, overrides, runs, waves, base_seed) VALUES (?, ?, ?, ?, ?);",
+        (time.strftime("%Y-%m-%dT%H:%M:%S"), json.dumps(overrides, sort_keys=True), int(runs), int(waves), int(base_seed)),
+    )
+    conn.commit()
+    return int(cur.lastrowid)
+
+
+def insert_waves(conn: sqlite3.Connection, batch_id: int, waves: Iterable[Any]) -> int:
+    """Insert wave results (objects with balance_farm.WaveResult's fields). Commits; returns the row count."""
+    wave_rows = []
+    kill_rows = []
+    for w in waves:
+        wave_rows.append((
+            batch_id, w.seed, w.wave_number, w.weapon_mode, int(w.cleared), w.time_to_clear,
+            w.sim_seconds, w.damage_taken, w.enemies_spawned, w.enemies_killed,
+        ))
+        kill_rows.extend((batch_id, w.seed, w.wave_number, weapon, kills) for weapon, kills in w.kills_by_weapon.items())
+    conn.executemany(
+        "INSERT OR REPLACE INTO balance_waves (batch_id, seed, wave_number, weapon_mode, cleared, time_to_clear, "
+        "sim_seconds, damage_taken, enemies_spawned, enemies_killed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);",
+        wave_rows,
+    )
+    conn.executemany(
+        "INSERT OR REPLACE INTO balance_weapon_kills (batch_id, seed, wave_number, weapon_mode, kills) "
+        "VALUES (?, ?, ?, ?, ?);",
+        kill_rows,
+    )
+    conn.commit()
+    return len(wave_rows)
+
+
+def wave_summary(conn: sqlite3.Connection, batch_id: int) -> list[tuple]:
+    """Per wave: (wave_number, samples, clear_rate, avg_time_to_clear, avg_damage_taken, avg_kills)."""
+    return conn.execute(
+        """
+        SELECT wave_number, COUNT(*), AVG(cleared), AVG(time_to_clear), AVG(damage_taken), AVG(enemies_killed)
+        FROM balance_waves
+        WHERE batch_id = ?
+        GROUP BY wave_number
+        ORDER BY wave_number ASC;
+        """,
+        (int(batch_id),),
+    ).fetchall()
+
+
+def weapon_kill_totals(conn: sqlite3.Connection, batch_id: int) -> list[tuple[str, int]]:
+    """Kills per weapon across the batch."""
+    return conn.execute(
+        """
+        SELECT weapon_mode, SUM(kills) AS kills
+        FROM balance_weapon_kills
+        WHERE batch_id = ?
+        GROUP BY weapon_mode
+        ORDER BY kills DESC;
+        """,
+        (int(batch_id),),
+    ).fetchall()
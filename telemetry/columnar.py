@@ -0,0 +1,229 @@
+"""
+Compact columnar export/import of a single telemetry run.
+A run is written to one zip archive: a JSON manifest plus one deflated binary buffer per column.
+Strings are dictionary-encoded (int32 codes), the t column is delta-encoded on its float64 bit
+pattern (exactly reversible), NULLs are kept in a separate mask. Buffers are little-endian
+int64/float64/int32 so analysis code can np.frombuffer them directly; only the stdlib is needed here.
+"""
+import array
+import json
+import sqlite3
+import sys
+import zipfile
+from typing import Optional
+
+from . import analytics, schema
+
+FORMAT_VERSION = 1
+
+_INT = "int"
+_FLOAT = "float"
+_STR = "str"
+_JSON = "json"
+
+
+def event_tables(conn: sqlite3.Connection) -> list[str]:
+    """Per-run event tables (those with run_id and t columns), in creation order."""
+    names = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY rowid;")]
+    return [n for n in names if {"run_id", "t"} <= schema.get_columns(conn, n)]
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    return [r[1] for r in conn.execute(f"PRAGMA table_info({table});").fetchall()]
+
+
+def _to_bytes(arr: array.array) -> bytes:
+    if sys.byteorder != "little":
+        arr = array.array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> array.array:
+    arr = array.array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+def _float_bits(values: list[float]) -> array.array:
+    return _from_bytes("q", _to_bytes(array.array("d", values)))
+
+
+def _kind(values: list) -> str:
+    present = [v for v in values if v is not None]
+    if all(isinstance(v, int) for v in present):
+        return _INT
+    if all(isinstance(v, (int, float)) for v in present):
+        return _FLOAT
+    if all(isinstance(v, str) for v in present):
+        return _STR
+    return _JSON
+
+
+def _encode_column(name: str, values: list) -> tuple[dict, dict[str, bytes]]:
+    """Return (manifest entry, {suffix: payload}) for one column."""
+    kind = _kind(values)
+    meta: dict = {"name": name, "kind": kind}
+    blobs: dict[str, bytes] = {}
+    nulls = [v is None for v in values]
+    if any(nulls):
+        blobs["nulls"] = bytes(nulls)
+
+    if kind == _INT:
+        blobs["data"] = _to_bytes(array.array("q", [0 if v is None else v for v in values]))
+    elif kind == _FLOAT:
+        filled = [0.0 if v is None else float(v) for v in values]
+        if name == "t" and all(v >= 0.0 for v in filled):
+            # Non-negative float64 bit patterns are ordered ints, so deltas stay small and exact.
+            bits = _float_bits(filled)
+            deltas = array.array("q", [bits[0]] if bits else [])
+            deltas.extend(bits[i] - bits[i - 1] for i in range(1, len(bits)))
+            meta["delta"] = True
+            blobs["data"] = _to_bytes(deltas)
+        else:
+            blobs["data"] = _to_bytes(array.array("d", filled))
+    elif kind == _STR:
+        codes_of: dict[str, int] = {}
+        codes = array.array("i")
+        for v in values:
+            if v is None:
+                codes.append(-1)
+            else:
+                codes.append(codes_of.setdefault(v, len(codes_of)))
+        meta["dictionary"] = list(codes_of)
+        blobs["data"] = _to_bytes(codes)
+    else:
+        blobs["data"] = json.dumps(values).encode("utf-8")
+    return meta, blobs
+
+
+def _decode_column(meta: dict, data: bytes, nulls: Optional[bytes]):
+    """Decode one column. Numeric columns without NULLs come back as array.array, otherwise a list."""
+    kind = meta["kind"]
+    if kind == _JSON:
+        return json.loads(data.decode("utf-8"))
+    if kind == _STR:
+        dictionary = meta["dictionary"]
+        return [None if c < 0 else dictionary[c] for c in _from_bytes("i", data)]
+    if kind == _INT:
+        values = _from_bytes("q", data)
+    elif meta.get("delta"):
+        deltas = _from_bytes("q", data)
+        bits = array.array("q")
+        acc = 0
+        for d in deltas:
+            acc += d
+            bits.append(acc)
+        values = _from_bytes("d", _to_bytes(bits))
+    else:
+        values = _from_bytes("d", data)
+    if nulls is None:
+        return values
+    return [None if n else v for v, n in zip(values, nulls)]
+
+
+def export_run(conn: sqlite3.Connection, run_id: int, path: str) -> dict:
+    """Write one run (runs row, its event rows and the zones they reference) to a columnar archive. Returns the manifest."""
+    run_cols = _table_columns(conn, "runs")
+    run_row = conn.execute("SELECT * FROM runs WHERE id = ?;", (int(run_id),)).fetchone()
+    if run_row is None:
+        raise ValueError(f"Run {run_id} not found")
+
+    manifest: dict = {
+        "format_version": FORMAT_VERSION,
+        "run": {c: v for c, v in zip(run_cols, run_row) if c != "id"},
+        "zones": [],
+        "tables": {},
+    }
+    if schema.table_exists(conn, "zones"):
+        zone_cols = _table_columns(conn, "zones")
+        manifest["zones"] = [
+            dict(zip(zone_cols, r)) for r in conn.execute(
+                "SELECT * FROM zones WHERE id IN (SELECT zone_id FROM player_zone_visits WHERE run_id = ?);",
+                (int(run_id),),
+            ).fetchall()
+        ]
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        for table in event_tables(conn):
+            cols = [c for c in _table_columns(conn, table) if c not in ("id", "run_id")]
+            rows = conn.execute(
+                f"SELECT {', '.join(cols)} FROM {table} WHERE run_id = ? ORDER BY id ASC;", (int(run_id),)
+            ).fetchall()
+            if not rows:
+                continue
+            entries = []
+            for i, col in enumerate(cols):
+                meta, blobs = _encode_column(col, [r[i] for r in rows])
+                for suffix, payload in blobs.items():
+                    zf.writestr(f"{table}/{col}.{suffix}", payload)
+                entries.append(meta)
+            manifest["tables"][table] = {"rows": len(rows), "columns": entries}
+        zf.writestr("manifest.json", json.dumps(manifest))
+    return manifest
+
+
+def read_manifest(path: str) -> dict:
+    with zipfile.ZipFile(path) as zf:
+        return json.loads(zf.read("manifest.json"))
+
+
+def load_columns(path: str, table: str, columns: Optional[list[str]] = None) -> dict:
+    """Load selected columns of one table from an archive without touching SQLite."""
+    with zipfile.ZipFile(path) as zf:
+        manifest = json.loads(zf.read("manifest.json"))
+        info = manifest["tables"].get(table)
+        if info is None:
+            return {}
+        names = set(zf.namelist())
+        out = {}
+        for meta in info["columns"]:
+            if columns is not None and meta["name"] not in columns:
+                continue
+            base = f"{table}/{meta['name']}"
+            nulls = zf.read(base + ".nulls") if base + ".nulls" in names else None
+            out[meta["name"]] = _decode_column(meta, zf.read(base + ".data"), nulls)
+        return out
+
+
+def import_run(conn: sqlite3.Connection, path: str) -> int:
+    """Insert an exported run into conn (schema must be initialized). Returns the new run id."""
+    manifest = read_manifest(path)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format version: {manifest.get('format_version')}")
+
+    run_cols = schema.get_columns(conn, "runs")
+    run = {k: v for k, v in manifest["run"].items() if k in run_cols}
+    cur = conn.cursor()
+    cur.execute(
+        f"INSERT INTO runs ({', '.join(run)}) VALUES ({', '.join('?' for _ in run)});",
+        tuple(run.values()),
+    )
+    run_id = cur.lastrowid
+
+    zone_map: dict[int, int] = {}
+    for zone in manifest["zones"]:
+        old_id = zone.pop("id")
+        cur.execute(
+            f"INSERT OR IGNORE INTO zones ({', '.join(zone)}) VALUES ({', '.join('?' for _ in zone)});",
+            tuple(zone.values()),
+        )
+        row = cur.execute("SELECT id FROM zones WHERE zone_name = ?;", (zone["zone_name"],)).fetchone()
+        zone_map[old_id] = row[0]
+
+    for table in manifest["tables"]:
+        data = load_columns(path, table)
+        cols = list(data)
+        if table == "player_zone_visits" and "zone_id" in data:
+            data["zone_id"] = [None if z is None else zone_map.get(z) for z in data["zone_id"]]
+        rows = [(run_id,) + r for r in zip(*(data[c] for c in cols))]
+        cur.executemany(
+            f"INSERT INTO {table} (run_id, {', '.join(cols)}) VALUES ({', '.join('?' for _ in range(len(cols) + 1))});",
+            rows,
+        )
+    conn.commit()
+    if run.get("ended_at") is not None and schema.table_exists(conn, "run_aggregates"):
+        analytics.update_run(conn, run_id)
+    return run_id
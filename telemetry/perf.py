@@ -11,6 +11,8 @@ from collections import deque
 
 _DEBUG_PERF = os.environ.get("GAME_DEBUG_PERF", "0").strip() == "1"
 _frame_times: deque[float] = deque(maxlen=300)  # ~5 s at 60 fps
+_flush_samples: deque[tuple[float, int]] = deque(maxlen=300)  # (duration_s, rows) per telemetry flush
+_ai_behavior_totals: dict[str, list] = {}  # behavior name -> [calls, seconds, enemies updated]
 
 
 def is_enabled() -> bool:
@@ -29,6 +31,52 @@ def get_last_frame_times() -> list[float]:
     return list(_frame_times)
 
 
+def record_flush(duration_s: float, rows: int) -> None:
+    """Record one Telemetry.flush (wall-clock seconds, rows written). No-op when GAME_DEBUG_PERF is not set."""
+    if _DEBUG_PERF:
+        _flush_samples.append((duration_s, rows))
+
+
+def get_flush_stats() -> dict:
+    """Summary of recent telemetry flushes: count, rows, last/mean/max duration in ms. Zeros when empty."""
+    if not _flush_samples:
+        return {"count": 0, "rows": 0, "last_ms": 0.0, "mean_ms": 0.0, "max_ms": 0.0}
+    durations = [d for d, _ in _flush_samples]
+    return {
+        "count": len(_flush_samples),
+        "rows": sum(r for _, r in _flush_samples),
+        "last_ms": durations[-1] * 1000.0,
+        "mean_ms": sum(durations) / len(durations) * 1000.0,
+        "max_ms": max(durations) * 1000.0,
+    }
+
+
+def record_ai_behavior(name: str, duration_s: float, enemies: int) -> None:
+    """Record one enemy AI behavior update (see systems.ai_system.ENEMY_BEHAVIORS). No-op when GAME_DEBUG_PERF is not set."""
+    if _DEBUG_PERF:
+        totals = _ai_behavior_totals.get(name)
+        if totals is None:
+            totals = _ai_behavior_totals[name] = [0, 0.0, 0]
+        totals[0] += 1
+        totals[1] += duration_s
+        totals[2] += enemies
+
+
+def get_ai_behavior_stats() -> dict[str, dict]:
+    """Per AI behavior: calls, enemies updated, total_ms and us_per_enemy, slowest total first."""
+    stats = {}
+    for name, (calls, seconds, enemies) in sorted(_ai_behavior_totals.items(), key=lambda kv: -kv[1][1]):
+        stats[name] = {
+            "calls": calls,
+            "enemies": enemies,
+            "total_ms": seconds * 1000.0,
+            "us_per_enemy": seconds * 1e6 / enemies if enemies else 0.0,
+        }
+    return stats
+
+
 def clear() -> None:
-    """Clear stored frame times."""
+    """Clear stored frame times, flush samples and AI behavior totals."""
     _frame_times.clear()
+    _flush_samples.clear()
+    _ai_behavior_totals.clear()
@@ -477,7 +477,18 @@ def init_schema(conn: sqlite3.Connection) -> None:
 
     conn.commit()
 
+    _create_index_if_missing(conn, "enemy_spawns", "idx_enemy_spawns_run_t", "run_id, t")
+    _create_index_if_missing(conn, "player_positions", "idx_player_positions_run_t", "run_id, t")
+    _create_index_if_missing(conn, "shots", "idx_shots_run_t", "run_id, t")
     _create_index_if_missing(conn, "enemy_hits", "idx_enemy_hits_run_t", "run_id, t")
+    _create_index_if_missing(conn, "player_deaths", "idx_player_deaths_run_t", "run_id, t")
+    _create_index_if_missing(conn, "player_deaths", "idx_player_deaths_run_wave", "run_id, wave_number")
+    _create_index_if_missing(conn, "waves", "idx_waves_run_t", "run_id, t")
+    _create_index_if_missing(conn, "enemy_positions", "idx_enemy_positions_run_t", "run_id, t")
+    _create_index_if_missing(conn, "player_velocities", "idx_player_velocities_run_t", "run_id, t")
+    _create_index_if_missing(conn, "bullet_metadata", "idx_bullet_metadata_run_t", "run_id, t")
+    _create_index_if_missing(conn, "level_events", "idx_level_events_run_t", "run_id, t")
+    _create_index_if_missing(conn, "overshield_events", "idx_overshield_run_t", "run_id, t")
     _create_index_if_missing(conn, "player_damage", "idx_player_damage_run_t", "run_id, t")
     _create_index_if_missing(conn, "run_state_samples", "idx_run_state_run_t", "run_id, t")
     _create_index_if_missing(conn, "waves", "idx_waves_run_wave", "run_id, wave_number")
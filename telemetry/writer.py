@@ -1,10 +1,12 @@
 """
 Buffered SQLite telemetry writer. Buffers inserts, flushes on timer or when full, closes cleanly.
 """
+import dataclasses
 import sqlite3
+import time
 from typing import Optional
 
-from . import schema
+from . import analytics, perf, schema
 from .events import (
     BossEvent,
     BulletMetadataEvent,
@@ -32,6 +34,48 @@ from .events import (
 )
 
 
+# A flush that takes longer than this (a quarter of a 60 fps frame) shrinks the batch size.
+FLUSH_BUDGET_S = 0.004
+
+
+def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    cols = ("run_id",) + columns
+    return f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)});"
+
+
+def _event_columns(event_cls) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(event_cls))
+
+
+# (buffer attribute, INSERT statement) in flush order. Buffered tuples are (run_id, *event fields).
+FLUSH_PLAN: tuple[tuple[str, str], ...] = (
+    ("_enemy_spawn_buf", _insert_sql("enemy_spawns", _event_columns(EnemySpawnEvent))),
+    ("_pos_buf", _insert_sql("player_positions", _event_columns(PlayerPosEvent))),
+    ("_shot_buf", _insert_sql("shots", _event_columns(ShotEvent))),
+    ("_enemy_hit_buf", _insert_sql("enemy_hits", _event_columns(EnemyHitEvent))),
+    ("_player_damage_buf", _insert_sql("player_damage", _event_columns(PlayerDamageEvent))),
+    ("_player_death_buf", _insert_sql("player_deaths", _event_columns(PlayerDeathEvent))),
+    ("_run_state_buf", _insert_sql("run_state_samples", ("t", "player_hp", "enemies_alive"))),
+    ("_wave_buf", _insert_sql("waves", _event_columns(WaveEvent))),
+    ("_enemy_pos_buf", _insert_sql("enemy_positions", _event_columns(EnemyPositionEvent))),
+    ("_player_velocity_buf", _insert_sql("player_velocities", _event_columns(PlayerVelocityEvent))),
+    ("_bullet_metadata_buf", _insert_sql("bullet_metadata", _event_columns(BulletMetadataEvent))),
+    ("_score_buf", _insert_sql("score_events", _event_columns(ScoreEvent))),
+    ("_level_buf", _insert_sql("level_events", _event_columns(LevelEvent))),
+    ("_boss_buf", _insert_sql("boss_events", _event_columns(BossEvent))),
+    ("_weapon_switch_buf", _insert_sql("weapon_switches", _event_columns(WeaponSwitchEvent))),
+    ("_pickup_buf", _insert_sql("pickup_events", _event_columns(PickupEvent))),
+    ("_overshield_buf", _insert_sql("overshield_events", _event_columns(OvershieldEvent))),
+    ("_player_action_buf", _insert_sql("player_actions", _event_columns(PlayerActionEvent))),
+    ("_zone_visit_buf", _insert_sql("player_zone_visits", _event_columns(ZoneVisitEvent))),
+    ("_friendly_spawn_buf", _insert_sql("friendly_ai_spawns", _event_columns(FriendlyAISpawnEvent))),
+    ("_friendly_position_buf", _insert_sql("friendly_ai_positions", _event_columns(FriendlyAIPositionEvent))),
+    ("_friendly_shot_buf", _insert_sql("friendly_ai_shots", _event_columns(FriendlyAIShotEvent))),
+    ("_friendly_death_buf", _insert_sql("friendly_ai_deaths", _event_columns(FriendlyAIDeathEvent))),
+    ("_wave_enemy_types_buf", _insert_sql("wave_enemy_types", _event_columns(WaveEnemyTypeEvent))),
+)
+
+
 class NoOpTelemetry:
     """No-op implementation when telemetry is disabled. Every method is a no-op."""
 
@@ -50,10 +94,17 @@ class Telemetry:
         db_path: str = "game_telemetry.db",
         flush_interval_s: float = 0.5,
         max_buffer: int = 500,
+        adaptive: bool = True,
+        flush_budget_s: float = FLUSH_BUDGET_S,
     ):
         self.db_path = db_path
         self.flush_interval_s = float(flush_interval_s)
         self.max_buffer = int(max_buffer)
+        self._base_flush_interval_s = self.flush_interval_s
+        self._base_max_buffer = self.max_buffer
+        self.adaptive = adaptive
+        self.flush_budget_s = float(flush_budget_s)
+        self.last_flush_s = 0.0
 
         self.conn = sqlite3.connect(self.db_path)
         self.conn.execute("PRAGMA journal_mode = WAL;")
@@ -61,6 +112,7 @@ class Telemetry:
         self.conn.execute("PRAGMA cache_size = -64000;")
         self.conn.execute("PRAGMA foreign_keys = ON;")
         schema.init_schema(self.conn)
+        analytics.init_analytics_schema(self.conn)
 
         self.run_id: Optional[int] = None
         self._time_since_flush = 0.0
@@ -90,6 +142,9 @@ class Telemetry:
         self._wave_enemy_types_buf: list[tuple] = []
         self._run_state_buf: list[tuple] = []
 
+        self._flush_plan = tuple((getattr(self, attr), sql) for attr, sql in FLUSH_PLAN)
+        self._buffers = tuple(buf for buf, _ in self._flush_plan)
+
     def start_run(self, started_at_iso: str, player_max_hp: int) -> int:
         cur = self.conn.cursor()
         cur.execute(
@@ -153,6 +208,7 @@ class Telemetry:
             tuple(values),
         )
         self.conn.commit()
+        analytics.update_run(self.conn, self.run_id)
 
     def log_enemy_spawn(self, event: EnemySpawnEvent) -> None:
         if self.run_id is None:
@@ -380,202 +436,37 @@ class Telemetry:
         self._time_since_flush += float(dt)
         if self._time_since_flush >= self.flush_interval_s:
             self.flush()
-        total = (
-            len(self._enemy_spawn_buf) + len(self._pos_buf) + len(self._shot_buf)
-            + len(self._enemy_hit_buf) + len(self._player_damage_buf) + len(self._player_death_buf)
-            + len(self._wave_buf) + len(self._enemy_pos_buf) + len(self._player_velocity_buf)
-            + len(self._bullet_metadata_buf) + len(self._score_buf) + len(self._level_buf)
-            + len(self._boss_buf) + len(self._weapon_switch_buf) + len(self._pickup_buf)
-            + len(self._overshield_buf) + len(self._wave_enemy_types_buf) + len(self._run_state_buf)
-        )
-        if total >= self.max_buffer:
+        elif sum(map(len, self._buffers)) >= self.max_buffer:
             self.flush()
 
     def flush(self, force: bool = False) -> None:
         if not force:
             self._time_since_flush = 0.0
-        cur = self.conn.cursor()
-        wrote_any = False
-
-        def run(table_sql_values: list[tuple[str, str, list]]) -> bool:
-            nonlocal wrote_any
-            for sql, params in table_sql_values:
-                if params:
-                    cur.executemany(sql, params)
-                    wrote_any = True
-            return wrote_any
-
-        if self._enemy_spawn_buf:
-            cur.executemany(
-                "INSERT INTO enemy_spawns (run_id, t, enemy_type, x, y, w, h, hp) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._enemy_spawn_buf,
-            )
-            self._enemy_spawn_buf.clear()
-            wrote_any = True
-        if self._pos_buf:
-            cur.executemany(
-                "INSERT INTO player_positions (run_id, t, x, y) VALUES (?, ?, ?, ?);",
-                self._pos_buf,
-            )
-            self._pos_buf.clear()
-            wrote_any = True
-        if self._shot_buf:
-            cur.executemany(
-                "INSERT INTO shots (run_id, t, origin_x, origin_y, target_x, target_y, dir_x, dir_y) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._shot_buf,
-            )
-            self._shot_buf.clear()
-            wrote_any = True
-        if self._enemy_hit_buf:
-            cur.executemany(
-                "INSERT INTO enemy_hits (run_id, t, enemy_type, enemy_x, enemy_y, damage, enemy_hp_after, killed) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._enemy_hit_buf,
-            )
-            self._enemy_hit_buf.clear()
-            wrote_any = True
-        if self._player_damage_buf:
-            cur.executemany(
-                "INSERT INTO player_damage (run_id, t, amount, source_type, source_enemy_type, player_x, player_y, player_hp_after) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._player_damage_buf,
-            )
-            self._player_damage_buf.clear()
-            wrote_any = True
-        if self._player_death_buf:
-            cur.executemany(
-                "INSERT INTO player_deaths (run_id, t, player_x, player_y, lives_left, wave_number) VALUES (?, ?, ?, ?, ?, ?);",
-                self._player_death_buf,
-            )
-            self._player_death_buf.clear()
-            wrote_any = True
-        if self._run_state_buf:
-            cur.executemany(
-                "INSERT INTO run_state_samples (run_id, t, player_hp, enemies_alive) VALUES (?, ?, ?, ?);",
-                self._run_state_buf,
-            )
-            self._run_state_buf.clear()
-            wrote_any = True
-        if self._wave_buf:
-            cur.executemany(
-                "INSERT INTO waves (run_id, t, wave_number, event_type, enemies_spawned, hp_scale, speed_scale) VALUES (?, ?, ?, ?, ?, ?, ?);",
-                self._wave_buf,
-            )
-            self._wave_buf.clear()
-            wrote_any = True
-        if self._enemy_pos_buf:
-            cur.executemany(
-                "INSERT INTO enemy_positions (run_id, t, enemy_type, x, y, speed, vel_x, vel_y) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._enemy_pos_buf,
-            )
-            self._enemy_pos_buf.clear()
-            wrote_any = True
-        if self._player_velocity_buf:
-            cur.executemany(
-                "INSERT INTO player_velocities (run_id, t, x, y, vel_x, vel_y, speed) VALUES (?, ?, ?, ?, ?, ?, ?);",
-                self._player_velocity_buf,
-            )
-            self._player_velocity_buf.clear()
-            wrote_any = True
-        if self._bullet_metadata_buf:
-            cur.executemany(
-                "INSERT INTO bullet_metadata (run_id, t, bullet_type, shape, color_r, color_g, color_b, source_enemy_type) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._bullet_metadata_buf,
-            )
-            self._bullet_metadata_buf.clear()
-            wrote_any = True
-        if self._score_buf:
-            cur.executemany(
-                "INSERT INTO score_events (run_id, t, score, score_change, source) VALUES (?, ?, ?, ?, ?);",
-                self._score_buf,
-            )
-            self._score_buf.clear()
-            wrote_any = True
-        if self._level_buf:
-            cur.executemany(
-                "INSERT INTO level_events (run_id, t, level, level_name) VALUES (?, ?, ?, ?);",
-                self._level_buf,
-            )
-            self._level_buf.clear()
-            wrote_any = True
-        if self._boss_buf:
-            cur.executemany(
-                "INSERT INTO boss_events (run_id, t, wave_number, phase, hp, max_hp, event_type) VALUES (?, ?, ?, ?, ?, ?, ?);",
-                self._boss_buf,
-            )
-            self._boss_buf.clear()
-            wrote_any = True
-        if self._weapon_switch_buf:
-            cur.executemany(
-                "INSERT INTO weapon_switches (run_id, t, weapon_mode) VALUES (?, ?, ?);",
-                self._weapon_switch_buf,
-            )
-            self._weapon_switch_buf.clear()
-            wrote_any = True
-        if self._pickup_buf:
-            cur.executemany(
-                "INSERT INTO pickup_events (run_id, t, pickup_type, x, y, collected) VALUES (?, ?, ?, ?, ?, ?);",
-                self._pickup_buf,
-            )
-            self._pickup_buf.clear()
-            wrote_any = True
-        if self._overshield_buf:
-            cur.executemany(
-                "INSERT INTO overshield_events (run_id, t, overshield, max_overshield, change) VALUES (?, ?, ?, ?, ?);",
-                self._overshield_buf,
-            )
-            self._overshield_buf.clear()
-            wrote_any = True
-        if self._player_action_buf:
-            cur.executemany(
-                "INSERT INTO player_actions (run_id, t, action_type, x, y, duration, success) VALUES (?, ?, ?, ?, ?, ?, ?);",
-                self._player_action_buf,
-            )
-            self._player_action_buf.clear()
-            wrote_any = True
-        if self._zone_visit_buf:
-            cur.executemany(
-                "INSERT INTO player_zone_visits (run_id, t, zone_id, zone_name, zone_type, event_type, x, y) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._zone_visit_buf,
-            )
-            self._zone_visit_buf.clear()
-            wrote_any = True
-        if self._friendly_spawn_buf:
-            cur.executemany(
-                "INSERT INTO friendly_ai_spawns (run_id, t, friendly_type, x, y, w, h, hp, behavior) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);",
-                self._friendly_spawn_buf,
-            )
-            self._friendly_spawn_buf.clear()
-            wrote_any = True
-        if self._friendly_position_buf:
-            cur.executemany(
-                "INSERT INTO friendly_ai_positions (run_id, t, friendly_type, x, y, speed, vel_x, vel_y, target_enemy_type) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);",
-                self._friendly_position_buf,
-            )
-            self._friendly_position_buf.clear()
-            wrote_any = True
-        if self._friendly_shot_buf:
-            cur.executemany(
-                "INSERT INTO friendly_ai_shots (run_id, t, friendly_type, origin_x, origin_y, target_x, target_y, target_enemy_type) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
-                self._friendly_shot_buf,
-            )
-            self._friendly_shot_buf.clear()
-            wrote_any = True
-        if self._friendly_death_buf:
-            cur.executemany(
-                "INSERT INTO friendly_ai_deaths (run_id, t, friendly_type, x, y, killed_by) VALUES (?, ?, ?, ?, ?, ?);",
-                self._friendly_death_buf,
-            )
-            self._friendly_death_buf.clear()
-            wrote_any = True
-        if self._wave_enemy_types_buf:
-            cur.executemany(
-                "INSERT INTO wave_enemy_types (run_id, t, wave_number, enemy_type, count) VALUES (?, ?, ?, ?, ?);",
-                self._wave_enemy_types_buf,
-            )
-            self._wave_enemy_types_buf.clear()
-            wrote_any = True
-
-        if wrote_any:
-            self.conn.commit()
+        pending = [(sql, buf) for buf, sql in self._flush_plan if buf]
+        if not pending:
+            return
+        start = time.perf_counter()
+        rows = 0
+        with self.conn:  # one transaction for every non-empty table
+            for sql, buf in pending:
+                self.conn.executemany(sql, buf)
+                rows += len(buf)
+        for _, buf in pending:
+            buf.clear()
+        duration = time.perf_counter() - start
+        self.last_flush_s = duration
+        perf.record_flush(duration, rows)
+        if self.adaptive and not force:
+            self._adapt_flush_policy(duration)
+
+    def _adapt_flush_policy(self, duration: float) -> None:
+        """Slow flushes: write smaller batches more often. Cheap flushes: batch more, commit less."""
+        if duration > self.flush_budget_s:
+            self.flush_interval_s = max(self._base_flush_interval_s / 4.0, self.flush_interval_s * 0.75)
+            self.max_buffer = max(self._base_max_buffer // 4, int(self.max_buffer * 0.75))
+        elif duration < self.flush_budget_s * 0.25:
+            self.flush_interval_s = min(self._base_flush_interval_s * 4.0, self.flush_interval_s * 1.25)
+            self.max_buffer = min(self._base_max_buffer * 4, int(self.max_buffer * 1.25) + 1)
 
     def close(self) -> None:
         self.flush(force=True)
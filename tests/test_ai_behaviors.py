@@ -0,0 +1,141 @@
+"""Tests for behavior-partitioned enemy AI: membership on spawn/death, per-behavior updates, perf stats."""
+from __future__ import annotations
+
+import pygame
+import pytest
+
+from config_enemies import ENEMY_TEMPLATES
+from enemies import make_enemy_from_template
+from state import GameState
+from systems.ai_system import behavior_members, update as ai_update
+from systems.spawn_system import note_enemy_removed, note_enemy_spawned
+from telemetry import perf
+
+
+def _enemy(type_id: str, pos=(100, 100), **flags):
+    t = next(t for t in ENEMY_TEMPLATES if t["type"] == type_id)
+    e = make_enemy_from_template(t, 1.0, 1.0)
+    e.rect.topleft = pos
+    for name, value in flags.items():
+        e[name] = value
+    return e
+
+
+def _spawn(state, enemy):
+    state.enemies.append(enemy)
+    note_enemy_spawned(state, enemy)
+    return enemy
+
+
+def _members(state, name):
+    return behavior_members(state).get(name, [])
+
+
+@pytest.fixture
+def ai_state():
+    state = GameState()
+    state.player_rect = pygame.Rect(600, 100, 32, 32)
+    fired = []
+
+    def kill_enemy(enemy, st):
+        st.enemies.remove(enemy)
+        note_enemy_removed(st, enemy)
+
+    def find_threat(pos, player, friendly, allow_player=True):
+        return pygame.Vector2(player.center), "player"
+
+    state.level_context = {
+        "find_nearest_threat": find_threat,
+        "vec_toward": lambda x0, y0, x1, y1: (pygame.Vector2(x1 - x0, y1 - y0) or pygame.Vector2(1, 0)).normalize(),
+        "kill_enemy": kill_enemy,
+        "spawn_enemy_projectile": lambda enemy, st: fired.append(("plain", enemy)),
+        "spawn_enemy_projectile_predictive": lambda enemy, direction, st: fired.append(("predictive", enemy)),
+    }
+    state.fired = fired
+    return state
+
+
+def test_membership_follows_archetype_flags(ai_state):
+    grunt = _spawn(ai_state, _enemy("grunt"))
+    ambient = _spawn(ai_state, _enemy("ambient"))
+    reflector = _spawn(ai_state, _enemy("reflector"))
+    shield = _spawn(ai_state, _enemy("shield enemy"))
+    big = _spawn(ai_state, _enemy("super_large"))
+    queen = _spawn(ai_state, _enemy("queen", can_use_missiles=True))
+
+    assert _members(ai_state, "shooter") == [grunt, shield, queen]
+    assert _members(ai_state, "ambient_rockets") == [ambient]
+    assert _members(ai_state, "shield_aim") == [reflector, shield, queen]
+    assert _members(ai_state, "heavy_rockets") == [big]
+    assert _members(ai_state, "heavy_grenades") == [big]
+    assert _members(ai_state, "queen_shield") == [queen]
+    assert _members(ai_state, "queen_missiles") == [queen]
+
+
+def test_death_removes_enemy_from_every_behavior(ai_state):
+    queen = _spawn(ai_state, _enemy("queen", can_use_missiles=True))
+    other = _spawn(ai_state, _enemy("queen", (300, 300), can_use_missiles=True))
+    ai_state.level_context["kill_enemy"](queen, ai_state)
+    for name in ("queen_shield", "queen_missiles", "shield_aim", "shooter"):
+        assert _members(ai_state, name) == [other]
+
+
+def test_members_rebuilt_when_enemies_replaced_directly(ai_state):
+    _spawn(ai_state, _enemy("grunt"))
+    _spawn(ai_state, _enemy("grunt", (200, 100)))
+    laser = _enemy("large_laser")
+    ai_state.enemies = [laser]
+    assert _members(ai_state, "shooter") == []
+    assert _members(ai_state, "laser") == [laser]
+
+
+def test_ambient_fires_rocket_and_skips_regular_shooting(ai_state):
+    ambient = _spawn(ai_state, _enemy("ambient"))
+    ambient["rocket_cooldown"] = ambient.get("shoot_cooldown", 6.0)
+    ai_update(ai_state, 0.016)
+    assert ai_state.fired == [("plain", ambient)]
+    assert ambient["rocket_cooldown"] == 0.0
+
+
+def test_shooter_fires_when_cooldown_elapsed(ai_state):
+    grunt = _spawn(ai_state, _enemy("grunt"))
+    grunt["shoot_cooldown"] = 999.0
+    ai_update(ai_state, 0.016)
+    assert len(ai_state.fired) == 1 and ai_state.fired[0][1] is grunt
+    assert grunt["shoot_cooldown"] == 0.0
+
+
+def test_suicide_detonates_and_leaves_all_behaviors(ai_state):
+    bomber = _spawn(ai_state, _enemy("suicide", ai_state.player_rect.topleft, is_suicide=True))
+    bomber["shoot_cooldown"] = 999.0
+    hp = ai_state.player_hp
+    ai_update(ai_state, 0.016)
+    assert bomber not in ai_state.enemies
+    assert all(bomber not in group for group in behavior_members(ai_state).values())
+    assert ai_state.player_hp < hp
+    assert ai_state.fired == []  # detonated before it could shoot
+    assert len(ai_state.grenade_explosions) == 1
+
+
+def test_laser_enemy_fires_beam(ai_state):
+    laser = _spawn(ai_state, _enemy("large_laser"))
+    laser["laser_cooldown"] = laser.get("laser_interval", 3.0)
+    ai_update(ai_state, 0.016)
+    assert len(ai_state.enemy_laser_beams) == 1
+    assert ai_state.fired == []
+
+
+def test_behavior_timings_recorded_when_perf_enabled(ai_state, monkeypatch):
+    monkeypatch.setattr(perf, "_DEBUG_PERF", True)
+    perf.clear()
+    for i in range(3):
+        _spawn(ai_state, _enemy("grunt", (100 + i * 40, 100)))
+    _spawn(ai_state, _enemy("ambient"))
+    ai_update(ai_state, 0.016)
+    ai_update(ai_state, 0.016)
+    stats = perf.get_ai_behavior_stats()
+    assert stats["shooter"]["calls"] == 2 and stats["shooter"]["enemies"] == 6
+    assert stats["ambient_rockets"]["enemies"] == 2
+    assert "laser" not in stats  # no members, not run
+    perf.clear()
+    assert perf.get_ai_behavior_stats() == {}
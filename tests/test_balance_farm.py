@@ -0,0 +1,78 @@
+"""Tests for the balance farm: overrides, headless bot runs and batch results in the telemetry DB."""
+import sqlite3
+
+import pytest
+
+import balance_farm
+from balance_farm import WaveResult, check_balance_overrides, run_farm, simulate_run
+from telemetry import balance as balance_db
+
+
+def test_unknown_overrides_are_rejected():
+    check_balance_overrides({"player_bullet_damage": 30, "laser_cooldown": 0.2})
+    with pytest.raises(ValueError, match="no_such_setting"):
+        check_balance_overrides({"player_bullet_damage": 30, "no_such_setting": 1})
+    with pytest.raises(ValueError):
+        check_balance_overrides({"__name__": "x"})
+
+
+def test_batch_results_aggregate_per_wave_and_weapon():
+    conn = sqlite3.connect(":memory:")
+    batch_id = balance_db.start_batch(conn, {"player_bullet_damage": 30}, runs=2, waves=2, base_seed=1)
+    balance_db.insert_waves(conn, batch_id, [
+        WaveResult(1, 1, "basic", True, 20.0, 23.0, 100, 30, 30, {"basic": 30}),
+        WaveResult(1, 2, "triple", False, None, 60.0, 300, 35, 10, {"triple": 10}),
+        WaveResult(2, 1, "basic", True, 30.0, 33.0, 200, 30, 30, {"basic": 28, "triple": 2}),
+    ])
+    assert balance_db.wave_summary(conn, batch_id) == [
+        (1, 2, 1.0, 25.0, 150.0, 30.0),
+        (2, 1, 0.0, None, 300.0, 10.0),
+    ]
+    assert balance_db.weapon_kill_totals(conn, batch_id) == [("basic", 58), ("triple", 12)]
+    other = balance_db.start_batch(conn, {}, runs=1, waves=1, base_seed=1)
+    assert balance_db.wave_summary(conn, other) == []
+
+
+def test_simulated_run_reports_wave_with_weapon():
+    results = simulate_run(seed=3, waves=2, weapons=("triple",), max_wave_seconds=1.0)
+    assert len(results) == 1  # Wave 1 is not cleared in one second, which ends the run
+    wave = results[0]
+    assert wave.wave_number == 1
+    assert wave.weapon_mode == "triple"
+    assert not wave.cleared
+    assert wave.sim_seconds == pytest.approx(1.0, abs=0.05)
+    assert wave.enemies_spawned > 30  # the whole wave, not just the first placement batch
+    assert sum(wave.kills_by_weapon.values()) == wave.enemies_killed
+    assert set(wave.kills_by_weapon) <= {"triple"}
+
+
+def test_farm_writes_worker_results_into_one_db(tmp_path):
+    db = str(tmp_path / "balance.db")
+    batch_id = run_farm(runs=2, waves=1, overrides={"player_bullet_damage": 40}, workers=2, db_path=db,
+                        base_seed=7, max_wave_seconds=0.5)
+    conn = sqlite3.connect(db)
+    try:
+        seeds = [r[0] for r in conn.execute(
+            "SELECT seed FROM balance_waves WHERE batch_id = ? ORDER BY seed;", (batch_id,))]
+        overrides = conn.execute("SELECT overrides FROM balance_batches WHERE id = ?;", (batch_id,)).fetchone()[0]
+    finally:
+        conn.close()
+    assert seeds == [7, 8]
+    assert "player_bullet_damage" in overrides
+
+
+def test_collect_results_does_not_wait_for_a_dead_worker(monkeypatch, capsys):
+    import multiprocessing as mp
+    import os
+
+    monkeypatch.setattr(balance_farm, "RESULT_POLL_S", 0.05)
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    crashed = ctx.Process(target=os._exit, args=(3,))  # dies without posting "done"
+    crashed.start()
+    crashed.join()
+    results.put(("run", 5, ["wave"]))
+    played = []
+    assert balance_farm._collect_results(results, [crashed], played.append) == {5}
+    assert played == [["wave"]]
+    assert f"worker {crashed.pid} exited (code 3)" in capsys.readouterr().err
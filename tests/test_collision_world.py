@@ -0,0 +1,152 @@
+"""Tests for the per-step CollisionWorld snapshot used by enemy movement."""
+import random
+
+import pygame
+import pytest
+
+from config_enemies import ENEMY_TEMPLATES
+from enemies import make_enemy_from_template
+from level_state import LevelState
+from state import GameState
+from systems.collision_movement import _check_enemy_collision, move_enemy_with_push, separate_enemies
+from systems.collision_world import CollisionWorld
+from systems.movement_system import update as movement_update
+
+W, H = 1920, 1080
+
+
+def _level(rng: random.Random) -> LevelState:
+    blocks = [{"rect": pygame.Rect(rng.randint(0, W - 120), rng.randint(0, H - 120), 120, 60)} for _ in range(12)]
+    return LevelState(
+        static_blocks=blocks, trapezoid_blocks=[], triangle_blocks=[], destructible_blocks=[],
+        moveable_blocks=[], giant_blocks=[], super_giant_blocks=[], hazard_obstacles=[],
+        moving_health_zone={"rect": pygame.Rect(900, 500, 80, 80)},
+    )
+
+
+def _state(n: int, seed: int = 0) -> GameState:
+    rng = random.Random(seed)
+    random.seed(seed)
+    state = GameState()
+    state.level = _level(rng)
+    state.player_rect = pygame.Rect(40, 40, 28, 28)
+    grunt = next(t for t in ENEMY_TEMPLATES if t.get("type") == "grunt")
+    for _ in range(n):
+        e = make_enemy_from_template(grunt, 1.0, 1.0)
+        e.rect.topleft = (rng.randint(0, W - 40), rng.randint(0, H - 40))
+        state.enemies.append(e)
+    return state
+
+
+def test_snapshot_matches_linear_scan_and_tracks_moves():
+    state = _state(150)
+    world = CollisionWorld.from_state(state)
+    rng = random.Random(1)
+    for enemy in state.enemies:
+        for _ in range(5):
+            enemy.rect.x += rng.randint(-40, 40)
+            enemy.rect.y += rng.randint(-40, 40)
+            world.update(enemy.rect)
+        probe = enemy.rect
+        assert world.collides(probe) == _check_enemy_collision(probe, state.level, state)
+
+
+def test_enemy_step_uses_snapshot_and_never_creates_overlaps():
+    state = _state(120, seed=3)
+    lv = state.level
+    state.level_context = {
+        "move_player": lambda p, dx, dy: None,
+        "move_enemy": lambda s, rect, mx, my: move_enemy_with_push(rect, mx, my, lv, s, W, H),
+        "vec_toward": lambda x1, y1, x2, y2: pygame.Vector2(x2 - x1, y2 - y1),
+        "width": W,
+        "height": H,
+    }
+    # Separate any initial overlaps so the invariant is meaningful
+    state.enemies = [e for i, e in enumerate(state.enemies) if e.rect.collidelist([o.rect for o in state.enemies[:i]]) == -1]
+    before = {id(e): e.rect.copy() for e in state.enemies}
+    for _ in range(10):
+        movement_update(state, 1 / 60)
+    assert state.collision_world is None
+    assert any(e.rect != before[id(e)] for e in state.enemies)
+    rects = [e.rect for e in state.enemies]
+    for i, r in enumerate(rects):
+        assert r.collidelist(rects[i + 1:]) == -1
+
+
+
+def test_snapshot_cleared_when_enemy_step_raises():
+    state = _state(20, seed=4)
+
+    def failing_move(s, rect, mx, my):
+        assert s.collision_world is not None
+        raise RuntimeError("move failed")
+
+    state.level_context = {
+        "move_player": lambda p, dx, dy: None,
+        "move_enemy": failing_move,
+        "vec_toward": lambda x1, y1, x2, y2: pygame.Vector2(x2 - x1, y2 - y1),
+        "width": W,
+        "height": H,
+    }
+    with pytest.raises(RuntimeError):
+        movement_update(state, 1 / 60)
+    assert state.collision_world is None
+
+def _clustered_state(n: int, seed: int = 0) -> GameState:
+    """n grunts packed around the player at a fixed density (cluster radius grows with sqrt(n))."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    state = GameState()
+    state.level = _level(random.Random(99))
+    state.level.static_blocks = []
+    state.player_rect = pygame.Rect(W // 2 - 14, H // 2 - 14, 28, 28)
+    grunt = next(t for t in ENEMY_TEMPLATES if t.get("type") == "grunt")
+    spread = int(25 * n ** 0.5)
+    for _ in range(n):
+        e = make_enemy_from_template(grunt, 1.0, 1.0)
+        e.rect.center = (W // 2 + rng.randint(-spread, spread), H // 2 + rng.randint(-spread, spread))
+        state.enemies.append(e)
+    return state
+
+
+def _overlapping_pairs(state: GameState) -> int:
+    rects = [e.rect for e in state.enemies]
+    return sum(len(r.collidelistall(rects[i + 1:])) for i, r in enumerate(rects))
+
+
+def test_separation_resolves_200_clustered_enemies():
+    state = _clustered_state(200)
+    before = _overlapping_pairs(state)
+    assert before > 100
+    for _ in range(40):
+        state.collision_world = CollisionWorld.from_state(state)
+        separate_enemies(state, W, H)
+    state.collision_world = None
+    assert _overlapping_pairs(state) < before // 20
+
+
+def test_separation_never_pushes_into_pickups_or_pads():
+    state = _clustered_state(60, seed=2)
+    pickup = {"rect": pygame.Rect(W // 2 + 40, H // 2 - 10, 20, 20)}
+    pad = {"rect": pygame.Rect(W // 2 - 80, H // 2 + 30, 40, 40)}
+    state.pickups = [pickup]
+    state.teleporter_pads = [pad]
+    clear = [e for e in state.enemies if not e.rect.colliderect(pickup["rect"]) and not e.rect.colliderect(pad["rect"])]
+    for _ in range(30):
+        state.collision_world = CollisionWorld.from_state(state)
+        separate_enemies(state, W, H)
+    for e in clear:
+        assert not e.rect.colliderect(pickup["rect"])
+        assert not e.rect.colliderect(pad["rect"])
+
+
+def test_separation_candidate_work_scales_linearly():
+    def candidate_work(n: int) -> int:
+        state = _clustered_state(n, seed=5)
+        world = CollisionWorld.from_state(state)
+        return sum(len(world.candidates(e.rect)) for e in state.enemies)
+
+    small, large = candidate_work(50), candidate_work(200)
+    # Fixed density: 4x the enemies should cost ~4x the candidate checks (all-pairs would be 16x)
+    assert large < 6 * small
+    assert large < 200 * 199 // 20
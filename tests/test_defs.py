@@ -58,3 +58,34 @@ def test_projectile_def_caching():
     a = get_projectile_def("player_basic")
     b = get_projectile_def("player_basic")
     assert a is b
+
+
+def test_archetype_compiled_once_and_enemies_are_independent_copies():
+    from config_enemies import ENEMY_TEMPLATES
+    from config.enemy_defs import get_archetype
+    from enemies import make_enemy_from_template
+
+    clear_enemy_def_cache()
+    t = next(tmpl for tmpl in ENEMY_TEMPLATES if tmpl.get("has_reflective_shield"))
+    arch = get_archetype(t)
+    assert get_archetype(t) is arch
+    with pytest.raises(TypeError):
+        arch.fields["hp"] = 1
+    e1 = make_enemy_from_template(t, 1.0, 1.0)
+    e2 = make_enemy_from_template(t, 2.0, 1.0)
+    e1["shield_hp"] = 99
+    e1["rect"].x = 500
+    assert e2["shield_hp"] == 0 and e2["rect"].x == t["rect"].x
+    assert e2["hp"] > e1["hp"]
+
+
+def test_spawn_pools_are_cached():
+    from config.enemy_defs import get_spawn_pools
+
+    clear_enemy_def_cache()
+    pools = get_spawn_pools()
+    assert get_spawn_pools() is pools
+    assert not any(t.get("is_ambient") for t in pools.regular)
+    basic = pools.minions_in(frozenset({"basic"}))
+    assert basic and all(t.get("enemy_size_class") == "basic" for t in basic)
+    assert pools.minions_in(frozenset({"basic"})) is basic
@@ -0,0 +1,59 @@
+"""Tests for the archetype ECS store behind GameState.ecs_entities."""
+import pygame
+
+from ecs_components import HealthComponent, PositionComponent, RenderComponent, VelocityComponent
+from state import GameState
+from systems.movement_system import _update_ecs_position_velocity
+
+
+def _mover(state, x=0):
+    return state.create_entity([PositionComponent(pygame.Rect(x, 0, 4, 4)), VelocityComponent(60.0, 0.0)])
+
+
+def test_create_and_query_by_signature():
+    state = GameState()
+    a = _mover(state)
+    b = state.create_entity([PositionComponent(pygame.Rect(0, 0, 4, 4))])
+    c = _mover(state)
+    assert sorted(state.get_entities_with(PositionComponent)) == [a, b, c]
+    assert sorted(state.get_entities_with(PositionComponent, VelocityComponent)) == [a, c]
+    assert list(state.get_entities_with(HealthComponent)) == []
+    assert set(state.ecs_entities[a]) == {PositionComponent, VelocityComponent}
+
+
+def test_query_cache_invalidated_only_by_new_archetypes():
+    state = GameState()
+    store = state.ecs_entities
+    _mover(state)
+    first = store.matching(PositionComponent)
+    _mover(state)
+    assert store.matching(PositionComponent) is first  # same archetype: cache kept
+    eid = state.create_entity([PositionComponent(pygame.Rect(0, 0, 1, 1)), RenderComponent()])
+    assert store.matching(PositionComponent) is not first
+    assert eid in state.get_entities_with(PositionComponent)
+
+
+def test_remove_and_component_changes_keep_columns_consistent():
+    state = GameState()
+    ids = [_mover(state, x) for x in range(5)]
+    state.remove_entity(ids[1])  # swap-remove moves the last row into slot 1
+    assert ids[1] not in state.ecs_entities
+    assert state.ecs_entities.get_component(ids[4], PositionComponent).rect.x == 4
+
+    state.ecs_entities.add_component(ids[2], HealthComponent(5, 5))
+    assert list(state.get_entities_with(HealthComponent)) == [ids[2]]
+    assert ids[2] in state.get_entities_with(PositionComponent, VelocityComponent)
+    state.ecs_entities.remove_component(ids[2], VelocityComponent)
+    assert ids[2] not in state.get_entities_with(VelocityComponent)
+
+    _update_ecs_position_velocity(state, 1.0)
+    xs = {eid: state.ecs_entities[eid][PositionComponent].rect.x for eid in state.ecs_entities}
+    assert xs == {ids[0]: 60, ids[2]: 2, ids[3]: 63, ids[4]: 64}
+
+
+def test_reset_run_clears_entities():
+    state = GameState()
+    _mover(state)
+    state.reset_run()
+    assert len(state.ecs_entities) == 0
+    assert list(state.get_entities_with(PositionComponent)) == []
@@ -0,0 +1,44 @@
+"""Tests for the slotted Enemy record: attribute fast path and dict compatibility."""
+import pygame
+import pytest
+
+from entities import Enemy
+
+
+def _enemy() -> Enemy:
+    return Enemy({"type": "grunt", "rect": pygame.Rect(1, 2, 10, 10), "hp": 30, "speed": 80, "color": (1, 2, 3)})
+
+
+def test_hot_fields_are_attributes_and_items():
+    e = _enemy()
+    assert e.rect is e["rect"]
+    e.hp = 5
+    assert e["hp"] == 5 and e.alive
+    e["speed"] = 0
+    assert e.speed == 0 and e.get("speed", 80) == 0  # falsy values are still present
+    assert not hasattr(e, "__dict__")
+
+
+def test_absent_flags_behave_like_missing_dict_keys():
+    e = _enemy()
+    assert e.is_suicide is None
+    assert e.get("is_boss", False) is False
+    assert "is_boss" not in e
+    with pytest.raises(KeyError):
+        e["is_boss"]
+    e["is_boss"] = True
+    assert "is_boss" in e and e.pop("is_boss") is True
+    assert "is_boss" not in e
+    assert e.pop("is_boss", "gone") == "gone"
+
+
+def test_long_tail_keys_and_mapping_protocol():
+    e = _enemy()
+    e["shield_angle"] = 1.5
+    assert e.setdefault("shield_angle", 0.0) == 1.5
+    assert e.setdefault("patrol_side", 0) == 0 and e["patrol_side"] == 0
+    d = dict(e)
+    assert d == e.to_dict()
+    assert d["color"] == (1, 2, 3) and d["type"] == "grunt" and "is_boss" not in d
+    del e["color"]
+    assert "color" not in e and len(e) == len(d) - 1
@@ -0,0 +1,93 @@
+"""Tests for compiled player fire profiles and the shots spawn_player_bullet_and_log builds from them."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from constants import AIM_ARROWS, UNLOCKED_WEAPON_DAMAGE_MULT
+from fire_profiles import compile_fire_profile, fire_profile
+from pickups import apply_pickup_effect
+from state import GameState
+
+
+class _NoKeys(dict):
+    def __missing__(self, key):
+        return False
+
+
+def _state(mode: str) -> GameState:
+    state = GameState()
+    state.player_rect = pygame.Rect(400, 300, 32, 32)
+    state.current_weapon_mode = mode
+    return state
+
+
+def _ctx():
+    keys = _NoKeys({pygame.K_RIGHT: True})
+    source = SimpleNamespace(get_pressed=lambda: keys)
+    return SimpleNamespace(
+        config=SimpleNamespace(aim_mode=AIM_ARROWS, enable_telemetry=False),
+        input_source=source,
+        telemetry_client=None,
+    )
+
+
+def test_triple_profile_resolves_spread_size_and_damage():
+    state = _state("triple")
+    state.player_bullet_damage = 20
+    profile = compile_fire_profile(state, "triple")
+    assert profile.spread_deg == (0.0, -30.0, 30.0)
+    assert profile.size == (24, 24)  # 8 px base x 3.0 size multiplier
+    assert profile.bullet_fields["damage"] == int(20 * UNLOCKED_WEAPON_DAMAGE_MULT)  # triple is unlocked by default
+    assert profile.bullet_fields["penetration"] == 0
+
+
+def test_profile_cached_until_stats_change():
+    state = _state("giant")
+    first = fire_profile(state)
+    assert fire_profile(state) is first
+    apply_pickup_effect("bullet_damage", state, SimpleNamespace())
+    second = fire_profile(state)
+    assert second is not first
+    assert second.bullet_fields["damage"] > first.bullet_fields["damage"]
+
+
+@pytest.mark.parametrize("change", [
+    lambda s: setattr(s, "current_weapon_mode", "basic"),
+    lambda s: setattr(s, "player_bullet_damage", s.player_bullet_damage + 5),
+    lambda s: setattr(s, "random_damage_multiplier", 1.5),
+    lambda s: s.unlocked_weapons.discard("giant"),
+])
+def test_profile_recompiled_when_shot_inputs_change(change):
+    state = _state("giant")
+    first = fire_profile(state)
+    change(state)
+    assert fire_profile(state) is not first
+
+
+def test_stat_versions_stay_unique_across_states():
+    a, b = _state("giant"), _state("giant")
+    apply_pickup_effect("bullet_size", a, SimpleNamespace())
+    apply_pickup_effect("bullet_speed", b, SimpleNamespace())
+    assert a.player_stat_version != b.player_stat_version
+
+
+@pytest.mark.parametrize("mode, angle", [("triple", 30.0), ("basic", 30.0), ("giant", 0.0)])
+def test_shot_spawns_one_bullet_along_last_spread_direction(mode, angle):
+    import game
+
+    state = _state(mode)
+    game.spawn_player_bullet_and_log(state, _ctx())
+    assert len(state.player_bullets) == 1
+    assert state.shots_fired == 1
+    bullet = state.player_bullets[0]
+    profile = fire_profile(state)
+    assert profile.spread_deg[-1] == angle
+    assert pygame.Vector2(1, 0).angle_to(bullet["vel"]) == pytest.approx(angle)  # aim is +x (K_RIGHT)
+    assert bullet["vel"].length() == pytest.approx(profile.speed)
+    fields = profile.bullet_fields
+    assert bullet["damage"] == fields["damage"] and bullet["rect"].center == state.player_rect.center
+    bullet["penetration"] -= 1  # bullets are copies; the profile is untouched
+    assert fire_profile(state).bullet_fields["penetration"] == 0
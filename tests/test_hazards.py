@@ -0,0 +1,164 @@
+"""Tests for hazard geometry: cached local shapes must reproduce the point generators exactly."""
+import math
+import random
+
+import pygame
+import pytest
+
+import hazards
+from hazards import (
+    generate_paraboloid_points,
+    generate_trapezoid_points,
+    update_hazard_geometry,
+    update_hazard_obstacles,
+)
+
+
+def _reference_bounds(points):
+    min_x = min(p.x for p in points)
+    max_x = max(p.x for p in points)
+    min_y = min(p.y for p in points)
+    max_y = max(p.y for p in points)
+    return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+
+
+def _hazard(shape, cx, cy, rotation, width=250, height=250):
+    return {"shape": shape, "center": pygame.Vector2(cx, cy), "width": width, "height": height,
+            "rotation_angle": rotation, "points": [], "bounding_rect": pygame.Rect(0, 0, 0, 0)}
+
+
+@pytest.mark.parametrize("shape,generator", [
+    ("paraboloid", generate_paraboloid_points),
+    ("trapezoid", generate_trapezoid_points),
+])
+def test_cached_geometry_matches_generators(shape, generator):
+    rng = random.Random(1234)
+    for _ in range(500):
+        cx, cy = rng.uniform(0, 1920), rng.uniform(0, 1080)
+        rotation = rng.uniform(0, 2 * math.pi)
+        w, h = rng.choice([(250, 250), (300, 120), (80, 400)])
+        hz = _hazard(shape, cx, cy, rotation, w, h)
+        update_hazard_geometry(hz)
+        expected = generator(pygame.Vector2(cx, cy), w, h, rotation)
+        assert hz["points"] == expected
+        assert hz["bounding_rect"] == _reference_bounds(expected)
+
+
+def test_axis_aligned_rotations_match_generators():
+    for rotation in (0.0, math.pi / 2, math.pi, 3 * math.pi / 2):
+        hz = _hazard("paraboloid", 400.0, 300.0, rotation)
+        update_hazard_geometry(hz)
+        expected = generate_paraboloid_points(pygame.Vector2(400, 300), 250, 250, rotation)
+        assert hz["bounding_rect"] == _reference_bounds(expected)
+
+
+def test_geometry_not_rebuilt_when_pose_unchanged():
+    hz = _hazard("paraboloid", 100.0, 100.0, 0.5)
+    update_hazard_geometry(hz)
+    points = hz["points"]
+    update_hazard_geometry(hz)
+    assert hz["points"] is points
+    hz["center"].x += 1.0
+    update_hazard_geometry(hz)
+    assert hz["points"] is not points
+
+
+def test_update_hazard_obstacles_produces_generator_polygons():
+    hz = _hazard("paraboloid", 500.0, 500.0, 0.0)
+    hz.update({"rotation_speed": 0.9, "orbit_center": pygame.Vector2(500, 500), "orbit_radius": 100,
+               "orbit_angle": 0.0, "orbit_speed": 0.6, "velocity": pygame.Vector2(150, 90)})
+    for level in (1, 2):
+        update_hazard_obstacles(1.0 / 60.0, [hz], level, 1920, 1080)
+        gen = generate_trapezoid_points if level >= 2 else generate_paraboloid_points
+        expected = gen(hz["center"], hz["width"], hz["height"], hz["rotation_angle"])
+        assert hz["points"] == expected
+        assert hz["bounding_rect"] == _reference_bounds(expected)
+    assert len(hazards._local_shape_cache) >= 2
+
+
+@pytest.fixture(params=["numpy", "python"])
+def batch_backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(hazards, "np", None)
+    return request.param
+
+
+def test_points_in_hazards_matches_single_point_ray_cast(batch_backend):
+    rng = random.Random(7)
+    hazard_list = []
+    for i in range(8):
+        hz = _hazard("paraboloid" if i % 2 else "trapezoid", rng.uniform(200, 1700), rng.uniform(200, 900),
+                     rng.uniform(0, 2 * math.pi))
+        update_hazard_geometry(hz)
+        hazard_list.append(hz)
+    points = [(rng.randint(0, 1920), rng.randint(0, 1080)) for _ in range(400)]
+    points += [(int(p.x), int(p.y)) for p in hazard_list[0]["points"][:20]]  # edge cases on the outline
+
+    result = hazards.points_in_hazards(points, hazard_list)
+
+    for hz, inside in zip(hazard_list, result):
+        expected = [i for i, (x, y) in enumerate(points)
+                    if hazards.check_point_in_hazard(pygame.Vector2(x, y), hz["points"], hz["bounding_rect"])]
+        assert inside == expected
+    assert any(result)
+
+
+def test_points_in_hazards_skips_degenerate_hazards(batch_backend):
+    hz = _hazard("trapezoid", 100.0, 100.0, 0.0)
+    assert hazards.points_in_hazards([(100, 100)], [hz]) == [[]]
+    assert hazards.points_in_hazards([], [hz]) == [[]]
+
+
+def test_hazard_damages_only_enemies_inside(batch_backend):
+    from level_state import LevelState
+    from state import GameState
+    from systems.collision_projectiles import handle_hazard_enemy_collisions
+
+    hz = _hazard("trapezoid", 400.0, 300.0, 0.0)
+    hz["damage"] = 60
+    update_hazard_geometry(hz)
+    state = GameState()
+    state.level = LevelState(static_blocks=[], trapezoid_blocks=[], triangle_blocks=[], destructible_blocks=[],
+                             moveable_blocks=[], giant_blocks=[], super_giant_blocks=[], hazard_obstacles=[hz])
+    inside = {"rect": pygame.Rect(390, 290, 20, 20), "hp": 50, "type": "basic"}
+    dying = {"rect": pygame.Rect(380, 300, 20, 20), "hp": 10, "type": "basic"}
+    outside = {"rect": pygame.Rect(900, 900, 20, 20), "hp": 50, "type": "basic"}
+    state.enemies.extend([inside, dying, outside])
+    killed = []
+
+    def kill(enemy, st):
+        st.enemies.remove(enemy)
+        killed.append(enemy)
+
+    handle_hazard_enemy_collisions(state, 0.5, {"kill_enemy": kill})
+
+    assert inside["hp"] == 20
+    assert outside["hp"] == 50
+    assert killed == [dying]
+
+
+@pytest.mark.parametrize("n", [3, 16, 64])
+def test_sweep_and_prune_finds_same_colliding_pairs_as_pairwise(n):
+    from benchmarks.hazard_broadphase import make_hazards, pairwise
+
+    hazard_list = make_hazards(n, seed=n)
+    candidates = hazards.hazard_candidate_pairs(hazard_list)
+    assert candidates == sorted(candidates)
+    narrow = [(i, j) for i, j in candidates if hazards.check_hazard_collision(hazard_list[i], hazard_list[j])]
+    assert narrow == pairwise(hazard_list)
+    if n >= hazards.SWEEP_AND_PRUNE_MIN_HAZARDS:
+        assert len(candidates) < n * (n - 1) // 2
+
+
+def test_reset_hazard_obstacles_restores_initial_layout_in_place():
+    hazards.reset_hazard_obstacles()
+    initial = [(tuple(h["center"]), h["rotation_angle"], h["orbit_angle"]) for h in hazards.hazard_obstacles]
+    objects = [id(h) for h in hazards.hazard_obstacles]
+    for _ in range(30):
+        update_hazard_obstacles(1 / 60, hazards.hazard_obstacles, 1, 1920, 1080)
+    assert [tuple(h["center"]) for h in hazards.hazard_obstacles] != [c for c, _, _ in initial]
+    hazards.reset_hazard_obstacles()
+    assert [(tuple(h["center"]), h["rotation_angle"], h["orbit_angle"]) for h in hazards.hazard_obstacles] == initial
+    assert [id(h) for h in hazards.hazard_obstacles] == objects
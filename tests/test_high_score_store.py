@@ -0,0 +1,66 @@
+"""Tests for HighScoreStore: cached top-N board, qualification, and multi-process writes under WAL."""
+import multiprocessing
+
+from high_score_store import HighScoreStore
+
+
+def _save(store: HighScoreStore, name: str, score: int) -> None:
+    store.save_high_score(name, score, waves=1, time_survived=10.0, enemies_killed=5, difficulty="normal")
+
+
+def _worker(db_path: str, base: int, count: int) -> None:
+    store = HighScoreStore(db_path)
+    for i in range(count):
+        _save(store, f"p{base}", base + i)
+    store.close()
+
+
+def test_board_is_sorted_and_capped(tmp_path):
+    store = HighScoreStore(str(tmp_path / "hs.db"), capacity=3)
+    for score in (50, 10, 90, 70, 30):
+        _save(store, "a", score)
+    assert [e["score"] for e in store.get_high_scores()] == [90, 70, 50]
+    assert [e["score"] for e in store.get_high_scores(10)] == [90, 70, 50, 30, 10]
+    store.close()
+
+
+def test_is_high_score_uses_cached_board(tmp_path):
+    store = HighScoreStore(str(tmp_path / "hs.db"), capacity=2)
+    assert store.is_high_score(0)
+    _save(store, "a", 100)
+    _save(store, "b", 200)
+    assert not store.is_high_score(100)
+    assert store.is_high_score(101)
+    assert store.rank(300) == 0
+    store.close()
+
+
+def test_blank_name_saved_as_anonymous_and_persisted(tmp_path):
+    path = str(tmp_path / "hs.db")
+    store = HighScoreStore(path)
+    _save(store, "   ", 5)
+    store.close()
+    reopened = HighScoreStore(path)
+    assert reopened.get_high_scores()[0]["name"] == "Anonymous"
+    reopened.close()
+
+
+def test_concurrent_processes_share_board_via_wal(tmp_path):
+    path = str(tmp_path / "hs.db")
+    store = HighScoreStore(path, capacity=5)
+    assert store.conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+    _save(store, "main", 1)
+
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_worker, args=(path, base, 20)) for base in (1000, 2000, 3000)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+
+    # The cached board notices the other processes' commits without reopening.
+    assert [e["score"] for e in store.get_high_scores()] == [3019, 3018, 3017, 3016, 3015]
+    assert store.conn.execute("SELECT COUNT(*) FROM high_scores;").fetchone()[0] == 61
+    assert not store.is_high_score(3015)
+    store.close()
@@ -0,0 +1,138 @@
+"""Tests for input recording/replay and deterministic headless replay."""
+import json
+
+import pygame
+import pytest
+
+from benchmarks.replay_session import replay
+from input_source import RECORDING_VERSION, RecordingInput, ReplayInput
+
+
+class _Keys:
+    def __init__(self, down):
+        self.down = set(down)
+
+    def __getitem__(self, key):
+        return key in self.down
+
+
+@pytest.mark.parametrize("name", ["session.jsonl", "session.jsonl.gz"])
+def test_recorded_frames_replay_identically(tmp_path, monkeypatch, name):
+    frames = [
+        ({pygame.K_w}, (100, 200), (True, False, False), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_1)]),
+        ({pygame.K_a, pygame.K_s}, (101, 205), (False, False, True),
+         [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=(101, 205))]),
+        (set(), (0, 0), (False, False, False), []),
+    ]
+    live = {}
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: _Keys(live["keys"]))
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: live["pos"])
+    monkeypatch.setattr(pygame.mouse, "get_pressed", lambda *a, **k: live["buttons"])
+
+    class _Player:
+        player_max_hp = 100
+        player_hp = 90
+        player_speed = 7
+        player_bullet_damage = 20
+        player_shoot_cooldown = 0.2
+        lives = 3
+
+    path = str(tmp_path / name)
+    rec = RecordingInput(path, seed=42)
+    rec.start(_Player(), "mouse")
+    seen = []
+    for keys, pos, buttons, events in frames:
+        live.update(keys=keys, pos=pos, buttons=buttons)
+        rec.begin_frame(1 / 60, events)
+        pressed = rec.get_pressed()
+        # Gameplay only queries some keys; only those end up in the recording
+        seen.append({k for k in (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d) if pressed[k]})
+    rec.close()
+
+    rep = ReplayInput(path)
+    assert rep.seed == 42
+    assert rep.header["version"] == RECORDING_VERSION
+    assert rep.header["aim_mode"] == "mouse"
+    assert rep.header["player"]["player_hp"] == 90
+    for (keys, pos, buttons, events), queried in zip(frames, seen):
+        assert not rep.done
+        assert rep.next_dt == pytest.approx(1 / 60)
+        out = rep.begin_frame(0.0, [])
+        pressed = rep.get_pressed()
+        assert {k for k in (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d) if pressed[k]} == queried
+        assert not pressed[pygame.K_SPACE]
+        assert rep.get_mouse_pos() == pos
+        assert rep.get_mouse_pressed() == buttons
+        assert [(e.type, getattr(e, "key", None), getattr(e, "button", None)) for e in out] == \
+            [(e.type, getattr(e, "key", None), getattr(e, "button", None)) for e in events]
+    assert rep.done
+
+
+def test_unsupported_recording_version_is_rejected(tmp_path):
+    path = tmp_path / "old.jsonl"
+    path.write_text(json.dumps({"version": RECORDING_VERSION + 1, "seed": 1}) + "\n")
+    with pytest.raises(ValueError):
+        ReplayInput(str(path))
+
+
+def test_headless_replay_is_deterministic(tmp_path):
+    path = tmp_path / "session.jsonl"
+    lines = [json.dumps({"version": RECORDING_VERSION, "seed": 5, "aim_mode": "mouse", "player": {}})]
+    for i in range(90):
+        keys = [pygame.K_d] if i < 45 else [pygame.K_s]
+        lines.append(json.dumps([1 / 60, keys, 600 + i, 300, int(i % 3 != 0), []]))
+    path.write_text("\n".join(lines) + "\n")
+
+    first = replay(str(path))
+    second = replay(str(path))
+    assert first["frames"] == 90
+    assert first["steps"] > 0
+    assert first["digest"] == second["digest"]
+
+
+def _end_run_after(monkeypatch, steps):
+    """Add a simulation system that ends the run (game over -> name input) after `steps` steps."""
+    import game
+    from constants import STATE_NAME_INPUT
+
+    count = [0]
+
+    def game_over(state, dt, ctx):
+        count[0] += 1
+        if count[0] == steps:
+            state.current_screen = STATE_NAME_INPUT
+
+    monkeypatch.setattr(game, "SIMULATION_SYSTEMS", list(game.SIMULATION_SYSTEMS) + [game_over])
+
+
+def test_replay_stops_when_the_run_ends(tmp_path, monkeypatch):
+    path = tmp_path / "session.jsonl"
+    lines = [json.dumps({"version": RECORDING_VERSION, "seed": 5, "aim_mode": "mouse", "player": {}})]
+    lines += [json.dumps([1 / 60, [], 600, 300, 0, []]) for _ in range(60)]
+    path.write_text("\n".join(lines) + "\n")
+    _end_run_after(monkeypatch, 10)
+    assert replay(str(path))["frames"] == 10
+
+
+def test_recording_closes_when_the_run_ends(tmp_path, monkeypatch):
+    from constants import STATE_PLAYING
+    from game_app import GameApp
+
+    path = tmp_path / "session.jsonl"
+    rec = RecordingInput(str(path), seed=3)
+    app = GameApp(headless=True, input_source=rec)
+    app.use_step_policy("clamp_drop")
+    app.scene_stack.clear()
+    app.game_state.current_screen = STATE_PLAYING
+    _end_run_after(monkeypatch, 5)
+    for _ in range(8):
+        app.update(app.fixed_dt)
+    assert rec.started and rec._file is None
+    assert not app.run_in_progress()
+    recorded = path.read_text().splitlines()
+    assert len(recorded) == 1 + 5  # header + the frames of the run
+
+    app.game_state.current_screen = STATE_PLAYING  # e.g. a new run: not appended to this recording
+    for _ in range(3):
+        app.update(app.fixed_dt)
+    assert path.read_text().splitlines() == recorded
@@ -0,0 +1,161 @@
+"""Tests for the navigation grid: incremental blocked cells, cached flow fields, routing around walls."""
+from __future__ import annotations
+
+import random
+
+import pygame
+import pytest
+
+import game
+from entities import Enemy
+from level_state import LevelState
+from state import GameState
+from systems.movement_system import update as movement_update
+from systems.nav_grid import NavGrid, nav_grid_for
+
+
+def _level(**blocks) -> LevelState:
+    lists = {name: [] for name in (
+        "static_blocks", "trapezoid_blocks", "triangle_blocks", "destructible_blocks",
+        "moveable_blocks", "giant_blocks", "super_giant_blocks", "hazard_obstacles",
+    )}
+    lists.update(blocks)
+    return LevelState(**lists)
+
+
+@pytest.fixture
+def walled():
+    """800x600 with a giant wall at x 380-420 from y 0 to 480 (gap at the bottom)."""
+    wall = {"rect": pygame.Rect(380, 0, 40, 480)}
+    level = _level(giant_blocks=[wall])
+    nav = NavGrid(800, 600, cell_size=40, clearance=0)
+    nav.sync(level)
+    return nav, level, wall
+
+
+def _walk(nav: NavGrid, start: tuple[float, float], goal: tuple[float, float]) -> list[int]:
+    field = nav.field_to(*goal)
+    path = [nav.cell_at(*start)]
+    while path[-1] != field.goal and len(path) < nav.cols * nav.rows:
+        path.append(field.next_cell[path[-1]])
+    return path
+
+
+def test_blocks_mark_their_cells(walled):
+    nav, _, _ = walled
+    assert nav.is_blocked(nav.cell_at(400, 100))
+    assert not nav.is_blocked(nav.cell_at(300, 100))
+    assert not nav.is_blocked(nav.cell_at(400, 500))  # the gap under the wall
+
+
+def test_flow_routes_around_wall(walled):
+    nav, _, _ = walled
+    path = _walk(nav, (100, 100), (700, 100))
+    assert path[-1] == nav.cell_at(700, 100)
+    assert not any(nav.is_blocked(i) for i in path)
+    assert max(divmod(i, nav.cols)[0] for i in path) >= 12  # went down through the gap (rows 12+)
+    dx, dy = nav.direction(100, 100, 700, 100)
+    assert dy > 0.5  # heads for the gap, not straight into the wall
+
+
+def test_field_cached_per_goal_cell(walled):
+    nav, _, _ = walled
+    nav.field_to(700, 100)
+    nav.field_to(710, 105)  # same cell
+    assert nav.fields_built == 1
+    nav.field_to(700, 300)
+    assert nav.fields_built == 2
+
+
+def test_unchanged_geometry_keeps_fields(walled):
+    nav, level, _ = walled
+    nav.field_to(700, 100)
+    version = nav.version
+    nav.sync(level)
+    nav.field_to(700, 100)
+    assert nav.version == version and nav.fields_built == 1
+
+
+def test_moved_block_remarks_cells_and_drops_fields(walled):
+    nav, level, wall = walled
+    nav.field_to(700, 100)
+    wall["rect"].y = 120  # opens the top, closes the gap
+    nav.sync(level)
+    assert not nav.is_blocked(nav.cell_at(400, 20))
+    assert nav.is_blocked(nav.cell_at(400, 580))
+    nav.field_to(700, 100)
+    assert nav.fields_built == 2
+
+
+def test_destroyed_block_frees_cells(walled):
+    nav, level, wall = walled
+    level.giant_blocks.remove(wall)
+    nav.sync(level)
+    assert not any(nav.blocked)
+    assert nav.direction(100, 100, 700, 100) == pytest.approx((1.0, 0.0), abs=0.2)
+
+
+def test_direction_none_in_goal_cell_or_unreachable():
+    box = [{"rect": pygame.Rect(x, y, w, h)} for x, y, w, h in (
+        (560, 0, 40, 200), (560, 200, 240, 40),
+    )]
+    nav = NavGrid(800, 600, cell_size=40, clearance=0)
+    nav.sync(_level(static_blocks=box))
+    assert nav.direction(100, 100, 110, 110) is None
+    assert nav.direction(100, 100, 700, 100) is None  # goal walled into the top-right corner
+
+
+def test_movement_builds_grid_lazily_and_enemy_follows_flow(walled):
+    _, level, _ = walled
+    state = GameState()
+    state.level = level
+    state.player_rect = pygame.Rect(680, 80, 32, 32)
+    # A lone enemy (<= 5 alive) chases without random wander, so its first move is deterministic
+    state.enemies = [Enemy({"type": "grunt", "rect": pygame.Rect(90, 90, 20, 20), "hp": 10, "max_hp": 10, "speed": 100.0})]
+    moves = []
+    state.level_context = {
+        "width": 800,
+        "height": 600,
+        "move_enemy": lambda s, rect, mx, my: moves.append((mx, my)),
+        "vec_toward": lambda x0, y0, x1, y1: pygame.Vector2(x1 - x0, y1 - y0),
+        "move_player": lambda *a: None,
+    }
+    movement_update(state, 0.1)
+    assert isinstance(state.nav_grid, NavGrid)
+    assert nav_grid_for(state, 800, 600) is state.nav_grid
+    assert moves and moves[0][1] > 0  # heads down toward the gap instead of into the wall
+
+    state.level_context["enemy_flow_field"] = False
+    state.nav_grid = None
+    movement_update(state, 0.1)
+    assert state.nav_grid is None
+
+
+def test_triangle_marks_only_cells_it_covers():
+    rect = pygame.Rect(0, 0, 400, 400)
+    tri = {"points": [(0, 0), (400, 0), (0, 400)], "bounding_rect": rect, "rect": rect}
+    nav = NavGrid(800, 600, cell_size=40, clearance=0)
+    level = _level(triangle_blocks=[tri])
+    nav.sync(level)
+    assert nav.is_blocked(nav.cell_at(20, 20))
+    assert not nav.is_blocked(nav.cell_at(380, 380))  # inside the bounding rect, past the hypotenuse
+    rect.x += 200  # pushed: the rect moves and the points stay where they were built
+    nav.sync(level)
+    assert nav.is_blocked(nav.cell_at(220, 20))
+    assert not nav.is_blocked(nav.cell_at(20, 20))
+
+
+@pytest.mark.parametrize("size", [(1024, 768), (1920, 1080)])
+def test_default_level_open_area_stays_connected(size):
+    w, h = size
+    player = pygame.Rect((w - 28) // 2, (h - 28) // 2, 28, 28)
+    random.seed(1)
+    level, _ = game._build_level(w, h, player)
+    nav = NavGrid(w, h)
+    nav.sync(level)
+    blocked = sum(1 for b in nav.blocked if b)
+    assert blocked < 0.4 * len(nav.blocked)
+    field = nav.field_to(*player.center)
+    unreachable = [i for i, b in enumerate(nav.blocked) if not b and field.next_cell[i] < 0]
+    assert unreachable == []
+    assert not nav.is_blocked(nav.cell_at(w // 2, 100))  # under the top trapezoids
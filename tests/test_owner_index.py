@@ -0,0 +1,152 @@
+"""Tests for the projectile / damage-number owner index and owner-scoped cleanup in kill_enemy."""
+from __future__ import annotations
+
+import time
+
+import pygame
+
+from entities import Enemy
+from state import GameState
+from systems.owner_index import (
+    OWNED_DAMAGE_NUMBERS,
+    OWNED_PROJECTILES,
+    add_child,
+    keep_children,
+    remove_child,
+    remove_children,
+)
+
+
+def _enemy(i: int = 0, type_id: str = "grunt") -> Enemy:
+    return Enemy({"type": type_id, "rect": pygame.Rect(40 * i, 100, 20, 20), "hp": 0, "max_hp": 10})
+
+
+def _proj(tag=None) -> dict:
+    return {"rect": pygame.Rect(0, 0, 4, 4), "tag": tag}
+
+
+def _slots_consistent(items: list) -> bool:
+    return all(o["slot"] == i for i, o in enumerate(items))
+
+
+def test_remove_child_swaps_last_into_slot():
+    items = []
+    a, b, c = (add_child(items, _proj(t)) for t in "abc")
+    assert remove_child(items, a)
+    assert items == [c, b] and _slots_consistent(items)
+    assert not remove_child(items, a)
+
+
+def test_remove_child_falls_back_for_objects_appended_directly():
+    items = []
+    add_child(items, _proj("a"))
+    loose = _proj("loose")
+    items.append(loose)
+    assert remove_child(items, loose)
+    assert [o["tag"] for o in items] == ["a"]
+
+
+def test_remove_children_only_touches_owner():
+    items = []
+    mine, other = _enemy(0), _enemy(1)  # same type: cleanup is per owner, not per enemy_type
+    for i in range(5):
+        add_child(items, _proj(("mine", i)), mine)
+        add_child(items, _proj(("other", i)), other)
+    assert remove_children(items, mine) == 5
+    assert sorted(o["tag"] for o in items) == [("other", i) for i in range(5)]
+    assert _slots_consistent(items)
+    assert mine[OWNED_PROJECTILES] == []
+
+
+def test_children_removed_elsewhere_are_skipped():
+    items = []
+    owner = _enemy()
+    hit = add_child(items, _proj("hit"), owner)
+    add_child(items, _proj("live"), owner)
+    remove_child(items, hit)  # e.g. hit the player; owner list not updated
+    assert remove_children(items, owner) == 1
+    assert items == []
+
+    add_child(items, _proj("a"), owner)
+    items.clear()  # e.g. reset_after_death
+    newcomer = add_child(items, _proj("b"))
+    assert remove_children(items, owner) == 0
+    assert items == [newcomer]
+
+
+def test_keep_children_filters_in_order_and_renumbers():
+    items = []
+    for t in range(6):
+        add_child(items, {"timer": t})
+    assert keep_children(items, lambda d: d["timer"] % 2 == 0) == 3
+    assert [d["timer"] for d in items] == [0, 2, 4]
+    assert _slots_consistent(items)
+
+
+def test_owner_list_pruned_as_it_grows():
+    items = []
+    owner = _enemy()
+    for _ in range(100):
+        remove_child(items, add_child(items, _proj(), owner))
+    assert len(owner[OWNED_PROJECTILES]) < 64
+
+
+def _kill_tick_state() -> tuple[GameState, list[Enemy], list[Enemy]]:
+    """100 enemies about to die with 10 projectiles each, 10 survivors with 5, and one damage number per enemy."""
+    state = GameState()
+    state.player_rect = pygame.Rect(0, 0, 32, 32)
+    doomed = [_enemy(i) for i in range(100)]
+    survivors = [_enemy(i) for i in range(100, 110)]
+    state.enemies.extend(doomed + survivors)
+    for n, owners in ((10, doomed), (5, survivors)):
+        for owner in owners:
+            for _ in range(n):
+                add_child(state.enemy_projectiles, _proj(owner["type"]), owner)
+            add_child(state.damage_numbers, {"x": owner.rect.centerx, "y": owner.rect.y, "timer": 2.0}, owner,
+                      OWNED_DAMAGE_NUMBERS)
+    add_child(state.damage_numbers, {"x": 0, "y": 100, "timer": 3.0, "value": "PERFECT WAVE!"})
+    return state, doomed, survivors
+
+
+def test_kill_100_enemies_with_1000_live_projectiles_in_one_tick():
+    import game
+
+    state, doomed, survivors = _kill_tick_state()
+    assert len(state.enemy_projectiles) == 1050
+    for enemy in doomed:
+        game.kill_enemy(enemy, state, 800, 600)
+
+    assert state.enemies == survivors
+    assert len(state.enemy_projectiles) == 50
+    assert all(p["owner"] in survivors for p in state.enemy_projectiles)
+    assert _slots_consistent(state.enemy_projectiles)
+    assert len(state.damage_numbers) == 11  # survivors' numbers and the unowned banner
+    assert _slots_consistent(state.damage_numbers)
+
+
+def test_kill_cleanup_beats_scanning_the_lists(monkeypatch):
+    """The whole kill (score, drops, cleanup) must cost well under the per-death list scans it replaced."""
+    import game
+
+    # Once a mixer is up, play_sfx looks the sound up on disk per call; that is not what is timed here
+    monkeypatch.setattr(game, "play_sfx", lambda *a, **k: None)
+
+    def best_of(run) -> float:
+        times = []
+        for _ in range(3):
+            state, doomed, _ = _kill_tick_state()
+            start = time.perf_counter()
+            run(state, doomed)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    def kill(state, doomed):
+        for enemy in doomed:
+            game.kill_enemy(enemy, state, 800, 600)
+
+    def scan(state, doomed):
+        for enemy in doomed:
+            state.enemy_projectiles[:] = [p for p in state.enemy_projectiles if p.get("owner") is not enemy]
+            state.damage_numbers[:] = [d for d in state.damage_numbers if d.get("owner") is not enemy]
+
+    assert best_of(kill) < 0.5 * best_of(scan)
@@ -0,0 +1,63 @@
+"""Tests for render interpolation between simulation steps."""
+import pygame
+
+from rendering import RenderContext, render_entities
+from rendering.interpolation import capture_positions, interpolated_rect
+from state import GameState
+
+
+def _state_with_player(x=100, y=100) -> GameState:
+    state = GameState()
+    state.player_rect = pygame.Rect(x, y, 20, 20)
+    return state
+
+
+def test_blends_between_step_start_and_current_position():
+    state = _state_with_player()
+    bullet = {"rect": pygame.Rect(0, 0, 4, 4)}
+    state.player_bullets.append(bullet)
+    capture_positions(state)
+    state.player_rect.x += 40
+    bullet["rect"].move_ip(10, -20)
+    state.simulation_interpolation = 0.5
+    assert interpolated_rect(state, state.player_rect).topleft == (120, 100)
+    assert interpolated_rect(state, bullet["rect"]).topleft == (5, -10)
+    assert state.player_rect.topleft == (140, 100)  # the simulation rect is never touched
+    state.simulation_interpolation = 1.0
+    assert interpolated_rect(state, state.player_rect) is state.player_rect
+
+
+def test_new_and_teleported_rects_are_drawn_in_place():
+    state = _state_with_player()
+    capture_positions(state)
+    fresh = pygame.Rect(5, 5, 4, 4)
+    state.player_rect.x += 1000
+    state.simulation_interpolation = 0.25
+    assert interpolated_rect(state, fresh) is fresh
+    assert interpolated_rect(state, state.player_rect) is state.player_rect
+
+
+def test_capture_runs_first_in_simulation_step():
+    from simulation_systems import SIMULATION_SYSTEMS, _sim_capture_render_positions
+
+    assert SIMULATION_SYSTEMS[0] is _sim_capture_render_positions
+
+
+def test_player_drawn_at_interpolated_position():
+    state = _state_with_player(20, 20)
+    capture_positions(state)
+    state.player_rect.x += 60
+    state.simulation_interpolation = 0.5
+    screen = pygame.Surface((200, 100))
+    rctx = RenderContext(screen=screen, font=None, big_font=None, small_font=None, width=200, height=100)
+    render_entities(state, {}, rctx)
+    assert screen.get_at((60, 30))[:3] == (255, 255, 255)
+    assert screen.get_at((90, 30))[:3] == (0, 0, 0)
+
+
+def test_loop_params_follow_simulation_hz():
+    import game
+
+    fps, fixed_dt, _ = game._build_loop_params(30)
+    assert fps == 60
+    assert fixed_dt == 1.0 / 30
@@ -0,0 +1,196 @@
+"""Tests for SpawnSampler: free-cell sampling, incremental updates, no overlapping fallback, wave integration."""
+import random
+
+import pygame
+import pytest
+
+from level_state import LevelState
+from spawn_sampler import SpawnSampler, iter_spawn_obstacles
+from state import GameState
+from systems.spawn_system import WAVE_DEFER_STEPS, queued_enemies, start_wave, wave_spawning
+from systems.spawn_system import update as spawn_update
+
+
+def test_samples_never_overlap_obstacles_or_each_other():
+    sampler = SpawnSampler(800, 600, cell_size=40, seed=1)
+    wall = pygame.Rect(0, 200, 800, 80)
+    sampler.sync([("wall", wall)])
+    placed = []
+    for _ in range(40):
+        r = sampler.spawn((30, 30))
+        assert r is not None
+        assert not r.colliderect(wall)
+        assert pygame.Rect(0, 0, 800, 600).contains(r)
+        assert r.collidelist(placed) == -1
+        placed.append(r)
+
+
+def test_same_seed_same_positions():
+    def run(seed):
+        s = SpawnSampler(800, 600, seed=seed)
+        s.sync([("b", pygame.Rect(100, 100, 200, 200))])
+        return [tuple(s.spawn((40, 40))) for _ in range(20)]
+
+    assert run(7) == run(7)
+    assert run(7) != run(8)
+
+
+def test_returns_none_instead_of_overlapping_when_full():
+    sampler = SpawnSampler(200, 200, cell_size=40, seed=0)
+    sampler.sync([("left", pygame.Rect(0, 0, 120, 200)), ("right", pygame.Rect(160, 0, 40, 200))])
+    assert sampler.spawn((60, 60)) is None  # the free strip is only 40px wide
+    assert sampler.spawn((30, 30)) is not None
+
+
+def test_moving_obstacle_updates_grid_incrementally():
+    sampler = SpawnSampler(120, 40, cell_size=40, seed=0)
+    block = pygame.Rect(0, 0, 80, 40)
+    sampler.sync([("block", block)])
+    assert all(sampler.sample((40, 40)).x >= 80 for _ in range(10))
+    block.x = 40
+    sampler.sync([("block", block)])
+    assert all(sampler.sample((40, 40)).x < 40 for _ in range(10))
+
+
+def test_start_wave_uses_sampler_without_overlaps():
+    state = GameState()
+    state.enemies = []
+    state.current_level = 1
+    state.max_level = 3
+    state.run_time = 0.0
+    state.player_rect = pygame.Rect(900, 500, 28, 28)
+    sampler = SpawnSampler(1920, 1080, seed=3)
+    state.level_context = {
+        "width": 1920,
+        "height": 1080,
+        "difficulty": "NORMAL",
+        "random_spawn_position": None,
+        "spawn_sampler": sampler,
+        "telemetry": None,
+        "telemetry_enabled": False,
+    }
+    start_wave(2, state)
+    while wave_spawning(state):  # The wave is placed over several steps
+        spawn_update(state, 1 / 60)
+    rects = [e["rect"] for e in state.enemies]
+    assert len(rects) > 20
+    for i, r in enumerate(rects):
+        assert r.collidelist(rects[i + 1:]) == -1
+        assert pygame.Vector2(r.center).distance_to(state.player_rect.center) >= 28 * 10
+
+
+def test_spawn_relaxes_player_clearance_before_giving_up():
+    state = GameState()
+    state.player_rect = pygame.Rect(186, 186, 28, 28)
+    sampler = SpawnSampler(400, 400, cell_size=40, seed=0)
+    sampler.sync_state(state)
+    r = sampler.spawn((40, 40), state)  # nothing is 280px from the center of a 400x400 area
+    assert r is not None
+    assert not r.colliderect(state.player_rect)
+
+
+@pytest.mark.parametrize("size", [(1024, 768), (1920, 1080)])
+def test_default_level_wave_places_every_enemy(size):
+    import game
+
+    w, h = size
+    for seed in range(1, 11):
+        random.seed(seed)
+        state = GameState()
+        state.player_rect = pygame.Rect((w - 28) // 2, (h - 28) // 2, 28, 28)
+        state.level, state.teleporter_pads = game._build_level(w, h, state.player_rect)
+        state.level_context = {
+            "width": w,
+            "height": h,
+            "difficulty": "NORMAL",
+            "spawn_sampler": SpawnSampler(w, h, seed=seed),
+            "telemetry": None,
+            "telemetry_enabled": False,
+            "base_enemies_per_wave": 12,
+            "enemy_spawn_multiplier": 3.5,
+        }
+        start_wave(1, state)
+        pending = state.spawn_queue
+        placed = set()
+        for _ in range(100):
+            placed.update(id(e) for e in state.enemies)
+            if not wave_spawning(state):
+                break
+            if state.enemies:
+                state.enemies.pop(0)  # one kill per step frees space for what was deferred
+            spawn_update(state, 1 / 60)
+        assert not wave_spawning(state)
+        assert state.spawns_dropped == 0
+        assert all(id(e) in placed for e in pending.built)  # large enemies wait for space instead of being dropped
+        geometry = [r for key, r in iter_spawn_obstacles(state) if key != "player"]
+        for e in pending.built:
+            assert e["rect"].collidelist(geometry) == -1
+
+
+def test_wave_ends_when_enemies_never_fit():
+    state = GameState()
+    state.current_level = 1
+    state.max_level = 3
+    state.player_rect = pygame.Rect(10, 10, 28, 28)
+    strip = 20  # free band along the top, thinner than any enemy
+    state.level = LevelState(static_blocks=[{"rect": pygame.Rect(0, strip, 800, 600 - strip)}], trapezoid_blocks=[],
+                             triangle_blocks=[], destructible_blocks=[], moveable_blocks=[], giant_blocks=[],
+                             super_giant_blocks=[], hazard_obstacles=[])
+    state.level_context = {
+        "width": 800,
+        "height": 600,
+        "difficulty": "NORMAL",
+        "spawn_sampler": SpawnSampler(800, 600, seed=1),
+        "telemetry": None,
+        "telemetry_enabled": False,
+    }
+    start_wave(1, state)
+    queued = queued_enemies(state)  # the whole wave plus its ambient enemies
+    assert queued > len(state.spawn_queue.built)
+    for _ in range(WAVE_DEFER_STEPS + 20):
+        if not wave_spawning(state):
+            break
+        spawn_update(state, 1 / 60)
+    assert not wave_spawning(state)
+    assert state.enemies == []
+    assert state.spawns_dropped == queued
+    for _ in range(4 * 60):  # next-wave countdown
+        spawn_update(state, 1 / 60)
+    assert state.wave_number == 2
+
+
+def test_stale_free_cells_do_not_use_up_sample_tries():
+    sampler = SpawnSampler(800, 600, cell_size=40, seed=2)
+    sampler.sync([])
+    assert sampler.sample((40, 40)) is not None  # builds the free list for one-cell spawns
+    # Everything but the bottom-right cell is now taken: 299 of the 300 listed cells are stale
+    sampler.sync([("wall", pygame.Rect(0, 0, 800, 560)), ("floor", pygame.Rect(0, 560, 760, 40))])
+    assert sampler.sample((40, 40)) == pygame.Rect(760, 560, 40, 40)
+
+
+def test_ambient_enemies_without_space_are_deferred_not_skipped():
+    state = GameState()
+    state.current_level = 1
+    state.max_level = 3
+    state.player_rect = pygame.Rect(10, 10, 28, 28)
+    blocker = {"rect": pygame.Rect(0, 20, 800, 580)}  # only a strip too thin for any enemy is free
+    state.level = LevelState(static_blocks=[blocker], trapezoid_blocks=[], triangle_blocks=[], destructible_blocks=[],
+                             moveable_blocks=[], giant_blocks=[], super_giant_blocks=[], hazard_obstacles=[])
+    state.level_context = {
+        "width": 800,
+        "height": 600,
+        "difficulty": "NORMAL",
+        "spawn_sampler": SpawnSampler(800, 600, seed=1),
+        "telemetry": None,
+        "telemetry_enabled": False,
+    }
+    start_wave(3, state)  # boss wave: no regular wave is queued to carry the deferred ambients
+    assert wave_spawning(state)
+    ambient = [e for e in state.spawn_queue.deferred if e["type"] == "ambient"]
+    assert len(ambient) >= 3
+    state.level.static_blocks.clear()  # the space opens up
+    state.enemies.clear()
+    spawn_update(state, 1 / 60)
+    assert not wave_spawning(state)
+    assert all(any(e is a for e in state.enemies) for a in ambient)
+    assert state.spawns_dropped == 0
@@ -129,3 +129,121 @@ class TestSpawnUpdateNoCrash:
 
         # Should not raise; may start next-wave countdown or leave state unchanged
         spawn_update(state, 0.016)
+
+
+class TestSizeClassCounts:
+    """Size-class counts are maintained on spawn/death and recover from direct list edits."""
+
+    def test_counts_track_spawns_and_kills(self, game_state_wave1):
+        from systems.spawn_system import note_enemy_removed, size_class_counts
+
+        random.seed(7)
+        state = game_state_wave1
+        start_wave(1, state)
+        expected = {}
+        for e in state.enemies:
+            expected[e.get("enemy_size_class")] = expected.get(e.get("enemy_size_class"), 0) + 1
+        assert state.enemy_size_class_counts == expected
+
+        victim = state.enemies.pop()
+        note_enemy_removed(state, victim)
+        sc = victim.get("enemy_size_class")
+        assert size_class_counts(state)[sc] == expected[sc] - 1
+
+        state.enemies.pop()  # removed without bookkeeping: recount kicks in
+        assert sum(size_class_counts(state).values()) == len(state.enemies)
+
+
+class TestAmortizedWaveSpawning:
+    """Regular waves are pre-built during the countdown and placed over wave_spawn_steps steps."""
+
+    def _drain(self, state):
+        from systems.spawn_system import wave_spawning
+
+        steps = 0
+        while wave_spawning(state):
+            spawn_update(state, 1 / 60)
+            steps += 1
+        return steps
+
+    def test_wave_is_placed_over_configured_steps(self, game_state_wave1, spawn_ctx):
+        random.seed(5)
+        state = game_state_wave1
+        spawn_ctx["wave_spawn_steps"] = 4
+        start_wave(1, state)
+        pending = state.spawn_queue
+        total = len(pending.built)
+        assert 0 < pending.placed < total
+        assert pending.per_step == -(-total // 4)
+
+        # Killing the first batch does not end the wave while enemies are still queued
+        state.enemies.clear()
+        spawn_update(state, 1 / 60)
+        assert state.time_to_next_wave == 0.0
+        assert self._drain(state) <= 3
+        assert state.spawn_queue is None
+
+    def test_queued_enemies_counts_the_unplaced_rest(self, game_state_wave1, spawn_ctx):
+        from systems.spawn_system import queued_enemies
+
+        random.seed(5)
+        state = game_state_wave1
+        spawn_ctx["wave_spawn_steps"] = 4
+        start_wave(1, state)
+        placed = len(state.enemies)
+        total = placed + queued_enemies(state)
+        assert queued_enemies(state) > 0
+        self._drain(state)
+        assert queued_enemies(state) == 0
+        assert len(state.enemies) == total
+
+    def test_single_step_places_whole_wave(self, game_state_wave1, spawn_ctx):
+        random.seed(5)
+        spawn_ctx["wave_spawn_steps"] = 1
+        start_wave(1, game_state_wave1)
+        assert game_state_wave1.spawn_queue is None
+        assert len(game_state_wave1.enemies) > 10
+
+    def test_countdown_prebuilds_next_wave(self, game_state_wave1, spawn_ctx):
+        random.seed(5)
+        state = game_state_wave1
+        spawn_ctx["wave_prebuild_budget_s"] = 0.0  # one enemy per step
+        start_wave(1, state)
+        self._drain(state)
+        state.enemies.clear()
+        spawn_update(state, 1 / 60)  # countdown starts: wave 2 is planned
+        pending = state.spawn_queue
+        assert pending.wave_num == 2 and pending.per_step == 0
+        spawn_update(state, 1 / 60)
+        assert len(pending.built) == 1
+        spawn_update(state, 1 / 60)
+        assert len(pending.built) == 2
+        prebuilt = list(pending.built)
+
+        spawn_update(state, 3.0)  # countdown ends: wave 2 starts from the pre-built enemies
+        assert state.wave_number == 2
+        assert pending.per_step > 0
+        assert all(any(e is p for e in pending.built) for p in prebuilt)  # placed largest first
+
+    @pytest.mark.parametrize("budget", [0.0, 10.0])
+    def test_prebuild_pace_does_not_change_the_wave(self, spawn_ctx, budget):
+        def run(budget_s):
+            st = GameState()
+            st.enemies = []
+            st.wave_number = 1
+            st.wave_in_level = 1
+            st.current_level = 1
+            st.max_level = 3
+            st.player_rect = pygame.Rect(400, 300, 40, 40)
+            st.level_context = dict(spawn_ctx, wave_prebuild_budget_s=budget_s)
+            st.level_context["random_spawn_position"] = _make_deterministic_random_spawn()
+            random.seed(21)
+            start_wave(1, st)
+            self._drain(st)
+            st.enemies.clear()
+            for _ in range(200):  # countdown (3 s) then wave 2 placement
+                spawn_update(st, 1 / 60)
+            assert st.wave_number == 2
+            return [(e["type"], e["hp"], round(e["time_since_shot"], 9), tuple(e["rect"])) for e in st.enemies]
+
+        assert run(budget) == run(None)
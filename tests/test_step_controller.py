@@ -0,0 +1,97 @@
+"""Tests for fixed-step overload controllers and their use in game._step_simulation."""
+import pytest
+
+from step_controller import (
+    AdaptiveStepController,
+    ClampDropController,
+    TimeDilationController,
+    make_step_controller,
+)
+
+FIXED_DT = 1.0 / 60.0
+
+
+def _run_frames(controller, frame_dts, step_cost=0.0):
+    """Drive a controller like _step_simulation; returns steps run per frame."""
+    acc = 0.0
+    per_frame = []
+    for dt in frame_dts:
+        acc, budget = controller.plan(acc, dt, FIXED_DT)
+        steps = 0
+        while acc >= FIXED_DT and steps < budget:
+            acc -= FIXED_DT
+            steps += 1
+        acc = controller.settle(acc, steps, FIXED_DT, steps * step_cost)
+        per_frame.append(steps)
+    return per_frame
+
+
+HITCH = [FIXED_DT] * 5 + [0.5] + [FIXED_DT] * 10
+
+
+def test_clamp_drop_recovers_after_one_frame():
+    c = ClampDropController(max_steps=6)
+    steps = _run_frames(c, HITCH)
+    assert steps[5] == 6
+    assert steps[6:] == [1] * 10  # no catch-up burst after the hitch
+    m = c.metrics
+    assert m.dropped_time == pytest.approx(0.5 - 6 * FIXED_DT, abs=FIXED_DT)
+    assert m.overload_frames == 1
+    assert m.overload_episodes == 1
+    assert m.max_steps_in_frame == 6
+
+
+def test_overload_episodes_count_runs_not_frames():
+    c = ClampDropController(max_steps=2)
+    _run_frames(c, [FIXED_DT, 0.2, 0.2, FIXED_DT, 0.2, FIXED_DT])
+    assert c.metrics.overload_frames == 3
+    assert c.metrics.overload_episodes == 2
+
+
+def test_time_dilation_slows_instead_of_dropping_and_recovers():
+    c = TimeDilationController(max_steps=6, min_scale=0.25, recovery_per_s=2.0)
+    steps = _run_frames(c, [FIXED_DT] * 3 + [0.2] + [FIXED_DT] * 60)
+    assert steps[3] == 6
+    assert c.metrics.dropped_time == pytest.approx(0.0, abs=1e-9)
+    assert c.metrics.dilated_time > 0.09
+    assert c.metrics.time_scale == pytest.approx(1.0)
+    assert sum(steps[4:]) < 60  # recovery frames run in slow motion, never a burst
+    assert max(steps[4:]) <= 1
+
+
+def test_adaptive_lowers_budget_when_steps_are_expensive():
+    c = AdaptiveStepController(max_steps=6, frame_budget=FIXED_DT)
+    steps = _run_frames(c, [0.1] * 10, step_cost=FIXED_DT / 2)
+    assert c.current_budget() == 2
+    assert steps[-1] == 2
+    assert c.metrics.dropped_time > 0
+
+
+def test_factory_policies():
+    assert isinstance(make_step_controller("dilate"), TimeDilationController)
+    assert isinstance(make_step_controller("adaptive"), AdaptiveStepController)
+    assert type(make_step_controller("unknown")) is ClampDropController
+
+
+def test_step_simulation_uses_controller():
+    import game
+    from scenes.base import SceneStack
+
+    calls = []
+    controller = ClampDropController(max_steps=6)
+    acc = 0.0
+    for dt in HITCH:
+        before = len(calls)
+        acc, quit_ = game._step_simulation(
+            acc, dt, FIXED_DT, 6, lambda d, gs, ctx: calls.append(d), None, None, SceneStack(), {}, controller
+        )
+        assert not quit_
+        assert len(calls) - before <= 6
+    assert acc < FIXED_DT
+    assert controller.metrics.steps == len(calls)
+    assert controller.metrics.overload_episodes == 1
+
+
+def test_factory_passes_render_frame_budget():
+    c = make_step_controller("adaptive", 6, 1.0 / 60.0)
+    assert c.frame_budget == 1.0 / 60.0
@@ -0,0 +1,78 @@
+"""Tests for materialized cross-run analytics (per-run / per-wave aggregates, watermark)."""
+from telemetry import analytics
+from telemetry.events import EnemyHitEvent, PlayerDamageEvent, ShotEvent, WaveEvent, WeaponSwitchEvent
+from telemetry.writer import Telemetry
+
+
+def _play_run(tel: Telemetry, score: int) -> int:
+    run_id = tel.start_run("2026-01-01T00:00:00", 100)
+    tel.log_weapon_switch(WeaponSwitchEvent(t=0.0, weapon_mode="basic"))
+    tel.log_wave(WaveEvent(t=0.0, wave_number=1, event_type="start", enemies_spawned=3, hp_scale=1.0, speed_scale=1.0))
+    tel.log_shot(ShotEvent(t=1.0, origin_x=0, origin_y=0, target_x=1, target_y=0, dir_x=1.0, dir_y=0.0))
+    tel.log_enemy_hit(EnemyHitEvent(t=1.1, enemy_type="grunt", enemy_x=5, enemy_y=5, damage=10, enemy_hp_after=0, killed=True))
+    tel.log_wave(WaveEvent(t=5.0, wave_number=2, event_type="start", enemies_spawned=4, hp_scale=1.1, speed_scale=1.0))
+    tel.log_weapon_switch(WeaponSwitchEvent(t=5.5, weapon_mode="laser"))
+    tel.log_shot(ShotEvent(t=6.0, origin_x=0, origin_y=0, target_x=1, target_y=0, dir_x=1.0, dir_y=0.0))
+    tel.log_shot(ShotEvent(t=6.5, origin_x=0, origin_y=0, target_x=1, target_y=0, dir_x=1.0, dir_y=0.0))
+    tel.log_player_damage(PlayerDamageEvent(t=7.0, amount=15, source_type="enemy", source_enemy_type="grunt",
+                                            player_x=0, player_y=0, player_hp_after=85))
+    tel.end_run(
+        "2026-01-01T00:00:10", seconds_survived=10.0, player_hp_end=85, shots_fired=3, hits=1,
+        damage_taken=15, damage_dealt=10, enemies_spawned=7, enemies_killed=1, deaths=0,
+        max_wave=2, final_score=score,
+    )
+    return run_id
+
+
+def test_end_run_materializes_run_and_wave_aggregates(tmp_path):
+    tel = Telemetry(db_path=str(tmp_path / "t.db"))
+    run_id = _play_run(tel, score=500)
+
+    row = tel.conn.execute(
+        "SELECT final_score, accuracy_pct, dps FROM run_aggregates WHERE run_id = ?;", (run_id,)
+    ).fetchone()
+    assert row[0] == 500
+    assert abs(row[1] - 100.0 / 3.0) < 1e-9
+    assert abs(row[2] - 1.0) < 1e-9
+
+    waves = tel.conn.execute(
+        "SELECT wave_number, end_time, enemies_killed, damage_dealt, damage_taken, shots "
+        "FROM wave_aggregates WHERE run_id = ? ORDER BY wave_number;",
+        (run_id,),
+    ).fetchall()
+    assert waves == [(1, 5.0, 1, 10, 0, 1), (2, 10.0, 0, 0, 15, 2)]
+    assert dict(analytics.weapon_shot_totals(tel.conn)) == {"basic": 1, "laser": 2}
+    assert analytics.get_watermark(tel.conn) == run_id
+    tel.close()
+
+
+def test_refresh_processes_only_runs_past_watermark(tmp_path):
+    tel = Telemetry(db_path=str(tmp_path / "t.db"))
+    first = _play_run(tel, score=100)
+    second = _play_run(tel, score=300)
+    tel.conn.execute("DELETE FROM run_aggregates;")
+    tel.conn.execute("UPDATE analytics_watermark SET last_run_id = ?;", (first,))
+    tel.conn.commit()
+
+    assert analytics.refresh(tel.conn) == 1
+    assert analytics.refresh(tel.conn) == 0
+    assert [r[0] for r in analytics.top_runs(tel.conn)] == [second]
+    tel.close()
+
+
+def test_end_run_aggregates_older_unaggregated_runs(tmp_path):
+    tel = Telemetry(db_path=str(tmp_path / "t.db"))
+    older = [_play_run(tel, score=100 * i) for i in range(1, 4)]
+    # As if runs 1-3 were written before analytics existed
+    tel.conn.execute("DELETE FROM run_aggregates;")
+    tel.conn.execute("DELETE FROM wave_aggregates;")
+    tel.conn.execute("DELETE FROM analytics_watermark;")
+    tel.conn.commit()
+
+    latest = _play_run(tel, score=50)
+    aggregated = [r[0] for r in tel.conn.execute("SELECT run_id FROM run_aggregates ORDER BY run_id;")]
+    assert aggregated == older + [latest]
+    assert tel.conn.execute("SELECT COUNT(DISTINCT run_id) FROM wave_aggregates;").fetchone()[0] == 4
+    assert analytics.get_watermark(tel.conn) == latest
+    assert analytics.refresh(tel.conn) == 0
+    tel.close()
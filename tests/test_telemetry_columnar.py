@@ -0,0 +1,73 @@
+"""Tests for columnar run export/import (lossless round trip, dictionary and delta encoding)."""
+import os
+
+from telemetry import columnar
+from telemetry.events import EnemyPositionEvent, PlayerActionEvent, PlayerPosEvent, ZoneVisitEvent
+from telemetry.writer import Telemetry
+
+
+def _rows(conn, table, run_id):
+    cols = [c for c in columnar._table_columns(conn, table) if c not in ("id", "run_id", "zone_id")]
+    return conn.execute(f"SELECT {', '.join(cols)} FROM {table} WHERE run_id = ? ORDER BY id;", (run_id,)).fetchall()
+
+
+def _record_run(tel: Telemetry, n: int) -> int:
+    run_id = tel.start_run("2026-01-01T00:00:00", 100)
+    tel.conn.execute(
+        "INSERT INTO zones (zone_name, zone_type, x_min, x_max, y_min, y_max) VALUES ('spawn', 'safe', 0, 10, 0, 10);"
+    )
+    for i in range(n):
+        t = i * (1.0 / 60.0)
+        tel.log_player_position(PlayerPosEvent(t=t, x=i % 800, y=(i * 3) % 600))
+        tel.log_enemy_position(EnemyPositionEvent(
+            t=t, enemy_type=("grunt", "tank", "queen")[i % 3], x=i % 700, y=i % 500,
+            speed=1.5, vel_x=0.25, vel_y=-0.5,
+        ))
+    tel.log_player_action(PlayerActionEvent(t=1.0, action_type="dash", x=1, y=2, duration=None, success=True))
+    tel.log_zone_visit(ZoneVisitEvent(t=2.0, zone_id=0, zone_name="spawn", zone_type="safe", event_type="enter", x=3, y=4))
+    tel.end_run(
+        "2026-01-01T00:01:00", seconds_survived=60.0, player_hp_end=50, shots_fired=0, hits=0,
+        damage_taken=50, damage_dealt=0, enemies_spawned=0, enemies_killed=0, deaths=0, final_score=42,
+    )
+    return run_id
+
+
+def test_export_import_round_trip_is_lossless(tmp_path):
+    src = Telemetry(db_path=str(tmp_path / "src.db"))
+    run_id = _record_run(src, 500)
+    archive = str(tmp_path / "run.tcol")
+    columnar.export_run(src.conn, run_id, archive)
+
+    dst = Telemetry(db_path=str(tmp_path / "dst.db"))
+    dst.start_run("2025-01-01T00:00:00", 10)  # occupy id 1 so ids must be remapped
+    new_id = columnar.import_run(dst.conn, archive)
+    assert new_id != run_id
+
+    for table in columnar.event_tables(src.conn):
+        assert _rows(dst.conn, table, new_id) == _rows(src.conn, table, run_id), table
+    zone = dst.conn.execute(
+        "SELECT z.zone_name FROM player_zone_visits v JOIN zones z ON z.id = v.zone_id WHERE v.run_id = ?;", (new_id,)
+    ).fetchone()
+    assert zone == ("spawn",)
+    assert dst.conn.execute("SELECT final_score FROM run_aggregates WHERE run_id = ?;", (new_id,)).fetchone() == (42,)
+    src.close()
+    dst.close()
+
+
+def test_archive_is_dictionary_and_delta_encoded_and_compact(tmp_path):
+    db_path = str(tmp_path / "src.db")
+    src = Telemetry(db_path=db_path)
+    run_id = _record_run(src, 5000)
+    archive = str(tmp_path / "run.tcol")
+    manifest = columnar.export_run(src.conn, run_id, archive)
+    src.close()
+
+    cols = {c["name"]: c for c in manifest["tables"]["enemy_positions"]["columns"]}
+    assert cols["enemy_type"]["dictionary"] == ["grunt", "tank", "queen"]
+    assert cols["t"].get("delta") is True
+    assert os.path.getsize(archive) * 10 < os.path.getsize(db_path)
+
+    series = columnar.load_columns(archive, "player_positions", ["t", "x"])
+    assert list(series) == ["t", "x"]
+    assert series["x"][799] == 799
+    assert series["t"][60] == 60 * (1.0 / 60.0)
@@ -0,0 +1,71 @@
+"""Tests for the Telemetry flush plan: generated INSERTs, empty-table skipping, adaptive batching, perf metrics."""
+from telemetry import perf
+from telemetry.events import PlayerPosEvent, ScoreEvent
+from telemetry.schema import get_columns
+from telemetry.writer import FLUSH_PLAN, Telemetry
+
+
+def test_flush_plan_covers_every_buffer_and_matches_schema(tmp_path):
+    tel = Telemetry(db_path=str(tmp_path / "t.db"))
+    buffers = {name for name in vars(tel) if name.endswith("_buf")}
+    assert {attr for attr, _ in FLUSH_PLAN} == buffers
+    for _, sql in FLUSH_PLAN:
+        table = sql.split()[2]
+        cols = sql[sql.index("(") + 1:sql.index(")")].split(", ")
+        assert set(cols) <= get_columns(tel.conn, table), table
+    tel.close()
+
+
+def test_flush_skips_when_nothing_buffered(tmp_path):
+    tel = Telemetry(db_path=str(tmp_path / "t.db"))
+    tel.start_run("2026-01-01T00:00:00", 100)
+    before = tel.conn.total_changes
+    tel.flush()
+    assert tel.conn.total_changes == before
+    assert tel.last_flush_s == 0.0
+    tel.close()
+
+
+def test_flush_writes_all_tables(tmp_path):
+    tel = Telemetry(db_path=str(tmp_path / "t.db"))
+    run_id = tel.start_run("2026-01-01T00:00:00", 100)
+    tel.log_player_position(PlayerPosEvent(t=0.5, x=1, y=2))
+    tel.log_score(ScoreEvent(t=0.6, score=10, score_change=10, source="grunt"))
+    tel.flush()
+    assert tel.conn.execute("SELECT x, y FROM player_positions WHERE run_id = ?;", (run_id,)).fetchall() == [(1, 2)]
+    assert tel.conn.execute("SELECT source FROM score_events WHERE run_id = ?;", (run_id,)).fetchall() == [("grunt",)]
+    assert not tel._pos_buf and not tel._score_buf
+    tel.close()
+
+
+def test_adaptive_policy_shrinks_on_slow_flushes_and_grows_on_cheap_ones(tmp_path):
+    tel = Telemetry(db_path=str(tmp_path / "t.db"), flush_interval_s=0.5, max_buffer=400, flush_budget_s=0.0)
+    tel.start_run("2026-01-01T00:00:00", 100)
+    tel.log_player_position(PlayerPosEvent(t=0.0, x=0, y=0))
+    tel.flush()
+    assert tel.flush_interval_s < 0.5
+    assert tel.max_buffer < 400
+
+    tel.flush_budget_s = 10.0
+    for i in range(20):
+        tel.log_player_position(PlayerPosEvent(t=float(i), x=0, y=0))
+        tel.flush()
+    assert tel.flush_interval_s == 2.0  # capped at 4x the configured interval
+    assert tel.max_buffer == 1600
+    tel.close()
+
+
+def test_flush_durations_reach_perf_stats(tmp_path, monkeypatch):
+    monkeypatch.setattr(perf, "_DEBUG_PERF", True)
+    perf.clear()
+    tel = Telemetry(db_path=str(tmp_path / "t.db"))
+    tel.start_run("2026-01-01T00:00:00", 100)
+    for i in range(3):
+        tel.log_player_position(PlayerPosEvent(t=float(i), x=0, y=0))
+    tel.flush()
+    stats = perf.get_flush_stats()
+    assert stats["count"] == 1
+    assert stats["rows"] == 3
+    assert stats["max_ms"] >= stats["mean_ms"] > 0.0
+    tel.close()
+    perf.clear()
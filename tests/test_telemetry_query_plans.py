@@ -0,0 +1,89 @@
+"""Query-plan regression tests: shipped telemetry queries must not full-scan per-event tables."""
+import ast
+import re
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from telemetry import analytics
+from telemetry.schema import get_columns, init_schema
+
+ROOT = Path(__file__).resolve().parent.parent
+QUERY_SOURCES = sorted(ROOT.glob("telemetry_viz/*.py")) + [ROOT / "telemetry" / "analytics.py"]
+SQL_FILES = sorted((ROOT / "telemetry" / "sql").glob("*.sql"))
+
+_ALIAS_RE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+_SCAN_RE = re.compile(r"^SCAN (\w+)")
+
+
+def _schema_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    init_schema(conn)
+    analytics.init_analytics_schema(conn)
+    return conn
+
+
+def _event_tables(conn: sqlite3.Connection) -> set[str]:
+    """Per-event tables (run_id + t columns): these grow with play time and must be searched by index."""
+    names = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table';")]
+    return {n for n in names if {"run_id", "t"} <= get_columns(conn, n)}
+
+
+def _shipped_queries() -> list[tuple[str, str]]:
+    """Literal SELECT/WITH statements in reader modules plus every statement in telemetry/sql/*.sql."""
+    queries = []
+    for path in QUERY_SOURCES:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        # f-string fragments are not complete statements; their tables are covered elsewhere.
+        fragments = {id(v) for n in ast.walk(tree) if isinstance(n, ast.JoinedStr) for v in n.values}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in fragments:
+                if re.match(r"\s*(SELECT|WITH)\b", node.value, re.IGNORECASE):
+                    queries.append((f"{path.name}:{node.lineno}", node.value))
+    for path in SQL_FILES:
+        lines = [ln for ln in path.read_text(encoding="utf-8").splitlines() if not ln.strip().startswith("--")]
+        for i, stmt in enumerate("\n".join(lines).split(";")):
+            if stmt.strip():
+                queries.append((f"{path.name}#{i}", stmt))
+    return queries
+
+
+def _full_scans(conn: sqlite3.Connection, sql: str, large: set[str]) -> list[str]:
+    aliases = {}
+    for table, alias in _ALIAS_RE.findall(sql):
+        aliases[table] = table
+        if alias and alias.upper() not in ("WHERE", "ON", "LEFT", "JOIN", "GROUP", "ORDER", "INNER", "LIMIT"):
+            aliases[alias] = table
+    rows = conn.execute("EXPLAIN QUERY PLAN " + sql, [None] * sql.count("?")).fetchall()
+    bad = []
+    for row in rows:
+        detail = row[3]
+        m = _SCAN_RE.match(detail)
+        if m and "INDEX" not in detail and aliases.get(m.group(1), m.group(1)) in large:
+            bad.append(detail)
+    return bad
+
+
+def test_shipped_queries_are_collected():
+    labels = [label for label, _ in _shipped_queries()]
+    assert any(label.startswith("plots_misc.py") for label in labels)
+    assert any(label.startswith("weapon_accuracy.sql") for label in labels)
+
+
+@pytest.mark.parametrize("label,sql", _shipped_queries(), ids=lambda v: v if ":" in v or "#" in v else "")
+def test_shipped_query_does_not_full_scan_event_tables(label, sql):
+    conn = _schema_conn()
+    try:
+        bad = _full_scans(conn, sql, _event_tables(conn))
+    finally:
+        conn.close()
+    assert not bad, f"{label} full-scans event tables: {bad}"
+
+
+def test_detector_flags_unindexed_scan():
+    conn = _schema_conn()
+    conn.execute("DROP INDEX idx_enemy_positions_run_t;")
+    bad = _full_scans(conn, "SELECT x, y FROM enemy_positions WHERE run_id = ?;", _event_tables(conn))
+    conn.close()
+    assert bad == ["SCAN enemy_positions"]
@@ -0,0 +1,196 @@
+"""Wave-beam geometry and collision. Used by game.py (generate_wave_beam_points, check_wave_beam_collision).
+
+With NumPy the beam is a cached (N, 2) polyline: the phase-independent sin/cos basis is computed
+once per (length, frequency) and each frame only combines it with the current phase. Collision is a
+vectorized segment-vs-rect (Liang-Barsky) test behind a bounding-box early-out. Without NumPy the
+original per-point Python path is used.
+"""
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+import pygame
+
+from geometry_utils import line_rect_intersection
+
+# Optional NumPy for vectorized beams; per-point Python path is used when unavailable.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+WAVE_VALUE_CLAMP = 10.0
+_NEAR_ZERO = 0.01
+
+
+def _num_points(length: int) -> int:
+    return max(200, length // 5)  # Enough points for a smooth solid line
+
+
+def _wave_value(pattern: str, angle: float) -> float:
+    if pattern == "sine":
+        return math.sin(angle)
+    if pattern == "cosine":
+        return math.cos(angle)
+    if pattern == "tangent":
+        return max(-WAVE_VALUE_CLAMP, min(WAVE_VALUE_CLAMP, math.tan(angle)))
+    if pattern == "cotangent":
+        if abs(math.sin(angle)) > _NEAR_ZERO:
+            return max(-WAVE_VALUE_CLAMP, min(WAVE_VALUE_CLAMP, math.cos(angle) / math.sin(angle)))
+        return 0.0
+    if pattern == "secant":
+        if abs(math.cos(angle)) > _NEAR_ZERO:
+            return max(-WAVE_VALUE_CLAMP, min(WAVE_VALUE_CLAMP, 1.0 / math.cos(angle)))
+        return 0.0
+    if pattern == "cosecant":
+        if abs(math.sin(angle)) > _NEAR_ZERO:
+            return max(-WAVE_VALUE_CLAMP, min(WAVE_VALUE_CLAMP, 1.0 / math.sin(angle)))
+        return 0.0
+    return 0.0
+
+
+def _wave_beam_points_py(start_pos, direction, pattern, length, amplitude, frequency, time_offset) -> list[tuple[float, float]]:
+    perp_x, perp_y = -direction.y, direction.x
+    num_points = _num_points(length)
+    step = length / num_points
+    undulation_phase = time_offset * 4 * math.pi  # 0.5 second undulation period
+    points = []
+    for i in range(num_points + 1):
+        t = i * step
+        offset = _wave_value(pattern, t * frequency * 2 * math.pi + undulation_phase) * amplitude
+        points.append((start_pos.x + direction.x * t + perp_x * offset, start_pos.y + direction.y * t + perp_y * offset))
+    return points
+
+
+@lru_cache(maxsize=64)
+def _beam_basis(length: int, frequency: float):
+    """Phase-independent arrays for a beam: distance along the beam, sin and cos of the base angle."""
+    num_points = _num_points(length)
+    t = np.arange(num_points + 1, dtype=np.float64) * (length / num_points)
+    base = t * frequency * 2 * math.pi
+    return t, np.sin(base), np.cos(base)
+
+
+def _wave_values_np(pattern: str, sin_base, cos_base, phase: float):
+    """Wave values at base + phase via the angle-sum identities (no per-point trig)."""
+    sp, cp = math.sin(phase), math.cos(phase)
+    s = sin_base * cp + cos_base * sp
+    c = cos_base * cp - sin_base * sp
+    if pattern == "sine":
+        return s
+    if pattern == "cosine":
+        return c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if pattern == "tangent":
+            return np.clip(s / c, -WAVE_VALUE_CLAMP, WAVE_VALUE_CLAMP)
+        if pattern == "cotangent":
+            return np.where(np.abs(s) > _NEAR_ZERO, np.clip(c / s, -WAVE_VALUE_CLAMP, WAVE_VALUE_CLAMP), 0.0)
+        if pattern == "secant":
+            return np.where(np.abs(c) > _NEAR_ZERO, np.clip(1.0 / c, -WAVE_VALUE_CLAMP, WAVE_VALUE_CLAMP), 0.0)
+        if pattern == "cosecant":
+            return np.where(np.abs(s) > _NEAR_ZERO, np.clip(1.0 / s, -WAVE_VALUE_CLAMP, WAVE_VALUE_CLAMP), 0.0)
+    return np.zeros_like(s)
+
+
+def wave_beam_polyline(start_pos: pygame.Vector2, direction: pygame.Vector2, pattern: str, length: int,
+                       amplitude: float = 50.0, frequency: float = 0.02, time_offset: float = 0.0):
+    """Beam polyline: an (N, 2) float array with NumPy, otherwise a list of (x, y) tuples."""
+    if np is None:
+        return _wave_beam_points_py(start_pos, direction, pattern, length, amplitude, frequency, time_offset)
+    t, sin_base, cos_base = _beam_basis(int(length), float(frequency))
+    offset = _wave_values_np(pattern, sin_base, cos_base, time_offset * 4 * math.pi) * amplitude
+    pts = np.empty((t.shape[0], 2), dtype=np.float64)
+    pts[:, 0] = start_pos.x + direction.x * t - direction.y * offset
+    pts[:, 1] = start_pos.y + direction.y * t + direction.x * offset
+    return pts
+
+
+def generate_wave_beam_points(start_pos: pygame.Vector2, direction: pygame.Vector2, pattern: str, length: int, amplitude: float = 50.0, frequency: float = 0.02, time_offset: float = 0.0) -> list[pygame.Vector2]:
+    """Generate points along a wave pattern beam.
+
+    Args:
+        start_pos: Starting position of the beam
+        direction: Normalized direction vector
+        pattern: Wave pattern type ("sine", "cosine", "tangent", etc.)
+        length: Length of the beam in pixels
+        amplitude: Amplitude of the wave (pixels)
+        frequency: Frequency of the wave (cycles per pixel)
+        time_offset: Time-based phase offset for undulation (in seconds)
+
+    Returns:
+        List of points along the wave path
+    """
+    poly = wave_beam_polyline(start_pos, direction, pattern, length, amplitude, frequency, time_offset)
+    return [pygame.Vector2(float(x), float(y)) for x, y in poly]
+
+
+def _segments_vs_rect_np(poly, rect: pygame.Rect):
+    """Liang-Barsky over all segments at once. Returns (hit_x, hit_y) of the closest entry or None."""
+    # Pixel rect in float space: pygame truncates to ints, so x in [left, right) lands inside.
+    lo_x, hi_x = rect.left, rect.right
+    lo_y, hi_y = rect.top, rect.bottom
+    mins = poly.min(axis=0)
+    maxs = poly.max(axis=0)
+    if maxs[0] < lo_x or mins[0] > hi_x or maxs[1] < lo_y or mins[1] > hi_y:
+        return None
+    p1 = poly[:-1]
+    d = poly[1:] - p1
+    t_enter = np.zeros(len(p1))
+    t_exit = np.ones(len(p1))
+    valid = np.ones(len(p1), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for axis, lo, hi in ((0, lo_x, hi_x), (1, lo_y, hi_y)):
+            p = p1[:, axis]
+            dd = d[:, axis]
+            parallel = dd == 0.0
+            valid &= ~parallel | ((p >= lo) & (p <= hi))
+            ta = (lo - p) / dd
+            tb = (hi - p) / dd
+            t_enter = np.where(parallel, t_enter, np.maximum(t_enter, np.minimum(ta, tb)))
+            t_exit = np.where(parallel, t_exit, np.minimum(t_exit, np.maximum(ta, tb)))
+    valid &= t_enter <= t_exit
+    if not valid.any():
+        return None
+    hits = p1[valid] + d[valid] * t_enter[valid][:, None]
+    dist_sq = ((hits - poly[0]) ** 2).sum(axis=1)
+    k = int(np.argmin(dist_sq))
+    return hits[k]
+
+
+def _wave_beam_hit_py(points, rect: pygame.Rect) -> tuple[pygame.Vector2 | None, float]:
+    pts = [pygame.Vector2(p[0], p[1]) for p in points]
+    closest_hit = None
+    closest_dist = float("inf")
+    for i in range(len(pts) - 1):
+        hit = line_rect_intersection(pts[i], pts[i + 1], rect)
+        if hit:
+            dist = (hit - pts[0]).length()
+            if dist < closest_dist:
+                closest_dist = dist
+                closest_hit = hit
+    for point in pts:
+        if rect.collidepoint(point.x, point.y):
+            dist = (point - pts[0]).length()
+            if dist < closest_dist:
+                closest_dist = dist
+                closest_hit = point
+    return (closest_hit, closest_dist)
+
+
+def check_wave_beam_collision(points, rect: pygame.Rect, width: int) -> tuple[pygame.Vector2 | None, float]:
+    """Check if a wave beam (list of points or polyline array) collides with a rectangle.
+
+    Returns:
+        Tuple of (closest_hit_point, distance) or (None, infinity) if no collision
+    """
+    if len(points) == 0:
+        return (None, float("inf"))
+    if np is None:
+        return _wave_beam_hit_py(points, rect)
+    poly = points if isinstance(points, np.ndarray) else np.array([(p[0], p[1]) for p in points], dtype=np.float64)
+    hit = _segments_vs_rect_np(poly, rect)
+    if hit is None:
+        return (None, float("inf"))
+    hit_v = pygame.Vector2(float(hit[0]), float(hit[1]))
+    return (hit_v, hit_v.distance_to((float(poly[0][0]), float(poly[0][1]))))